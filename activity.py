@@ -0,0 +1,228 @@
+"""Режим «не спать, пока машина занята»: дешевый замер загрузки системы.
+
+В Linux счетчики читаются из /proc/stat, /proc/diskstats и /proc/net/dev:
+файлы открываются один раз и перечитываются pread'ом в те же буферы. Из
+разностей счетчиков получаются загрузка CPU, байты/с диска и сети, которые
+сглаживаются экспоненциальным средним (EWMA). В Windows загрузка CPU берется
+из GetSystemTimes; диск и сеть там не учитываются.
+
+Удерживается только ES_SYSTEM_REQUIRED: пока хоть одна величина выше порога
+и еще quiet секунд после того, как все они опустились ниже.
+"""
+import math
+import os
+import sys
+import threading
+import time
+
+from metrics import registry
+
+SAMPLER_WAKEUPS = registry.counter("nosleep_thread_wakeups_total",
+                                   "Пробуждения фоновых потоков", thread="activity")
+SAMPLE_SECONDS = registry.histogram("nosleep_activity_sample_seconds",
+                                    "Длительность одного замера загрузки")
+
+SECTOR_SIZE = 512  # /proc/diskstats считает в секторах по 512 байт
+
+
+class ProcFile:
+    """Файл /proc, открытый один раз и перечитываемый в один и тот же буфер"""
+
+    def __init__(self, path, size=4096):
+        self._fd = os.open(path, os.O_RDONLY)
+        self._buffer = bytearray(size)
+
+    def read(self, head=False):
+        """Содержимое файла; head=True - только начало размером с буфер"""
+        while True:
+            size = os.preadv(self._fd, [self._buffer], 0)
+            if head or size < len(self._buffer):
+                return bytes(memoryview(self._buffer)[:size])
+            self._buffer = bytearray(len(self._buffer) * 2)
+
+    def close(self):
+        os.close(self._fd)
+
+
+class LinuxCounters:
+    """Накопительные счетчики CPU, диска и сети из /proc"""
+
+    def __init__(self):
+        self._stat = ProcFile("/proc/stat", 512)
+        self._disks = ProcFile("/proc/diskstats", 16384)
+        self._net = ProcFile("/proc/net/dev", 8192)
+        # Только целые физические диски: разделы и устройства поверх них
+        # (dm, md, loop) посчитали бы те же байты повторно
+        self._disk_names = {name.encode() for name in os.listdir("/sys/block")
+                            if os.path.exists(f"/sys/block/{name}/device")}
+
+    def read(self):
+        """(занятые тики CPU, все тики CPU, байты диска, байты сети)"""
+        data = self._stat.read(head=True)
+        fields = data[:data.find(b"\n")].split()
+        ticks = [int(value) for value in fields[1:9]]
+        total = sum(ticks)
+        busy = total - ticks[3] - ticks[4]  # Без idle и iowait
+
+        sectors = 0
+        for line in self._disks.read().splitlines():
+            fields = line.split()
+            if fields[2] in self._disk_names:
+                sectors += int(fields[5]) + int(fields[9])
+
+        net = 0
+        for line in self._net.read().splitlines()[2:]:
+            name, _, data = line.partition(b":")
+            if name.strip() != b"lo":
+                fields = data.split()
+                net += int(fields[0]) + int(fields[8])
+        return busy, total, sectors * SECTOR_SIZE, net
+
+    def close(self):
+        for proc_file in (self._stat, self._disks, self._net):
+            proc_file.close()
+
+
+class WindowsCounters:
+    """Счетчики CPU из GetSystemTimes; диск и сеть не учитываются"""
+
+    def __init__(self):
+        import ctypes
+        from ctypes import wintypes
+
+        self._times = [wintypes.FILETIME() for _ in range(3)]
+        self._refs = [ctypes.byref(value) for value in self._times]
+        self._get_system_times = ctypes.windll.kernel32.GetSystemTimes
+
+    def read(self):
+        if not self._get_system_times(*self._refs):
+            raise OSError("GetSystemTimes завершился с ошибкой")
+        idle, kernel, user = ((value.dwHighDateTime << 32) | value.dwLowDateTime
+                              for value in self._times)
+        total = kernel + user  # Время ядра включает простой
+        return total - idle, total, 0, 0
+
+    def close(self):
+        pass
+
+
+def make_counters():
+    """Счетчики загрузки для текущей платформы"""
+    if sys.platform == "win32":
+        return WindowsCounters()
+    return LinuxCounters()
+
+
+class ActivitySampler:
+    """Сглаженная загрузка: доля CPU и байты/с диска и сети
+
+    smoothing - постоянная времени EWMA в секундах; вес нового замера
+    зависит от прошедшего времени, поэтому пропущенные замеры не искажают
+    среднее.
+    """
+
+    def __init__(self, counters=None, smoothing=15.0, clock=time.monotonic):
+        self.counters = counters or make_counters()
+        self.smoothing = smoothing
+        self.clock = clock
+        self.cpu = 0.0
+        self.disk = 0.0
+        self.net = 0.0
+        self.samples = 0
+        self._last = None
+        self._last_time = 0.0
+
+    def sample(self):
+        """Новый замер; возвращает (cpu, disk, net) после сглаживания"""
+        with SAMPLE_SECONDS.time():
+            now = self.clock()
+            current = self.counters.read()
+            if self._last is not None and now > self._last_time:
+                elapsed = now - self._last_time
+                busy, total, disk, net = (new - old for new, old in zip(current, self._last))
+                weight = 1.0 - math.exp(-elapsed / self.smoothing)
+                self.cpu += weight * ((busy / total if total > 0 else 0.0) - self.cpu)
+                self.disk += weight * (disk / elapsed - self.disk)
+                self.net += weight * (net / elapsed - self.net)
+            self._last = current
+            self._last_time = now
+            self.samples += 1
+        return self.cpu, self.disk, self.net
+
+    def close(self):
+        self.counters.close()
+
+
+class ActivityMonitor:
+    """Решение «занята ли машина» с периодом тишины перед отпусканием
+
+    on_change(busy) вызывается из потока замеров при смене состояния.
+    Пороги: cpu - доля от 0 до 1, disk и net - байты в секунду.
+    """
+
+    def __init__(self, on_change=None, interval=5.0, quiet=300.0,
+                 cpu=0.2, disk=1024 * 1024, net=128 * 1024, sampler=None):
+        self.on_change = on_change
+        self.interval = interval
+        self.quiet = quiet
+        self.thresholds = (cpu, disk, net)
+        self.sampler = sampler
+        self.busy = False
+        self._last_busy = 0.0
+        self._stop = threading.Event()
+        self._thread = None
+
+    @property
+    def running(self):
+        return self._thread is not None
+
+    def step(self):
+        """Один замер и пересчет состояния; возвращает текущее состояние"""
+        if self.sampler is None:
+            self.sampler = ActivitySampler()
+        levels = self.sampler.sample()
+        now = self.sampler.clock()
+        if any(level >= threshold for level, threshold in zip(levels, self.thresholds)):
+            self._last_busy = now
+            if not self.busy:
+                self._set_busy(True)
+        elif self.busy and now - self._last_busy >= self.quiet:
+            self._set_busy(False)
+        return self.busy
+
+    def start(self):
+        """Запуск потока замеров"""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name="no-sleep-activity", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Остановка замеров; состояние сбрасывается в «не занята»"""
+        thread, self._thread = self._thread, None
+        if thread is None:
+            return
+        self._stop.set()
+        thread.join()
+        if self.busy:
+            self._set_busy(False)
+
+    def close(self):
+        """Остановка замеров и закрытие файлов счетчиков"""
+        self.stop()
+        if self.sampler is not None:
+            self.sampler.close()
+            self.sampler = None
+
+    def _loop(self):
+        while True:
+            self.step()
+            if self._stop.wait(self.interval):
+                return
+            SAMPLER_WAKEUPS.inc()
+
+    def _set_busy(self, busy):
+        self.busy = busy
+        if self.on_change is not None:
+            self.on_change(busy)
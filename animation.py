@@ -0,0 +1,158 @@
+"""Единый регулятор анимаций интерфейса.
+
+Все анимации виджетов регистрируются в одном регуляторе и запускаются
+через него. Кадры ведет один таймер с ограниченной частотой, а не общий
+таймер анимаций Qt (~60 кадров/с на каждую анимацию). Если окно скрыто
+или свернуто, машина работает от батареи или включен режим «меньше
+анимации», анимация сразу переходит в конечное состояние: промежуточные
+кадры не вычисляются и не рисуются, а только учитываются как пропущенные.
+"""
+import math
+import time
+
+from PyQt5.QtCore import QAbstractAnimation, Qt, QTimer
+
+from metrics import registry
+from power import on_battery
+from tracing import traced
+
+ANIMATION_FRAMES = registry.counter("nosleep_animation_frames_total", "Показанные кадры анимаций")
+SKIPPED_FRAMES = registry.counter("nosleep_animation_frames_skipped_total",
+                                  "Кадры анимаций, пропущенные регулятором")
+
+DEFAULT_FRAME_RATE = 60
+
+# Как долго доверять последней проверке питания от батареи, с
+BATTERY_CHECK_INTERVAL = 60.0
+
+
+class AnimationGovernor:
+    """Регулятор анимаций: частота кадров, видимость окна, экономия энергии
+
+    frame_rate - наибольшая частота кадров; 0 - все анимации мгновенные.
+    Пока окно не показано (visible=False), анимации тоже мгновенные.
+    """
+
+    def __init__(self, frame_rate=DEFAULT_FRAME_RATE, battery=on_battery, clock=time.monotonic):
+        self.frame_rate = frame_rate
+        self.battery = battery
+        self.clock = clock
+        self.reduced_motion = False
+        self.visible = False
+        self.frames = 0  # Показанные кадры
+        self.skipped = 0  # Пропущенные кадры
+        self._animations = []
+        self._running = {}  # Анимация -> момент запуска
+        self._timer = None
+        self._battery_state = False
+        self._battery_checked = None
+
+    def __len__(self):
+        return len(self._animations)
+
+    @property
+    def instant(self):
+        """Анимации сейчас выполняются мгновенно"""
+        return (not self.visible or self.reduced_motion or not self.frame_rate
+                or self.on_battery())
+
+    def on_battery(self):
+        now = self.clock()
+        if self._battery_checked is None or now - self._battery_checked >= BATTERY_CHECK_INTERVAL:
+            self._battery_checked = now
+            try:
+                self._battery_state = self.battery()
+            except OSError:
+                self._battery_state = False
+        return self._battery_state
+
+    def set_on_battery(self, on_battery):
+        """Источник питания по событию системы, без ожидания следующей проверки"""
+        self._battery_state = on_battery
+        self._battery_checked = self.clock()
+        if on_battery:
+            self.finish_all()
+
+    def register(self, animation):
+        """Регистрация анимации; возвращает ее же"""
+        self._animations.append(animation)
+        animation.destroyed.connect(lambda *_: self._forget(animation))
+        return animation
+
+    def start(self, animation):
+        """Запуск анимации с учетом текущих ограничений"""
+        if self.instant:
+            self._finish(animation)
+            return
+        # Приостановленную анимацию Qt не ведет; кадры задает таймер регулятора
+        animation.start()
+        animation.pause()
+        self._running[animation] = self.clock()
+        if self._timer is None:
+            self._timer = QTimer()
+            self._timer.setTimerType(Qt.PreciseTimer)
+            self._timer.timeout.connect(self._tick)
+        if not self._timer.isActive():
+            self._timer.start(round(1000 / self.frame_rate))
+
+    def finish_all(self):
+        """Мгновенное завершение всех идущих анимаций"""
+        for animation in list(self._running):
+            self._finish(animation)
+
+    def set_visible(self, visible):
+        """Окно показано или скрыто (свернуто)"""
+        self.visible = visible
+        if not visible:
+            self.finish_all()
+
+    def set_reduced_motion(self, enabled):
+        """Режим «меньше анимации»"""
+        self.reduced_motion = enabled
+        if enabled:
+            self.finish_all()
+
+    def set_frame_rate(self, frame_rate):
+        """Наибольшая частота кадров; 0 - без анимаций"""
+        self.frame_rate = max(0, frame_rate)
+        if not self.frame_rate:
+            self.finish_all()
+        elif self._timer is not None and self._timer.isActive():
+            self._timer.start(round(1000 / self.frame_rate))
+
+    def _finish(self, animation):
+        started = self._running.pop(animation, None)
+        elapsed = 0 if started is None else (self.clock() - started) * 1000
+        remaining = max(0.0, animation.duration() - elapsed)
+        frames = math.ceil(remaining * (self.frame_rate or DEFAULT_FRAME_RATE) / 1000)
+        self.skipped += frames
+        SKIPPED_FRAMES.inc(frames)
+        animation.stop()
+        # Конечное значение записывается сразу, без промежуточных кадров
+        # (остановленная анимация свойство не меняет)
+        animation.targetObject().setProperty(bytes(animation.propertyName()).decode(),
+                                             animation.endValue())
+
+    @traced()
+    def _tick(self):
+        now = self.clock()
+        for animation, started in list(self._running.items()):
+            if animation.state() != QAbstractAnimation.Paused:
+                del self._running[animation]  # Остановлена самим виджетом
+                continue
+            animation.setCurrentTime(min(animation.duration(), round((now - started) * 1000)))
+            self.frames += 1
+            ANIMATION_FRAMES.inc()
+            if animation.state() == QAbstractAnimation.Stopped:
+                del self._running[animation]
+        if not self._running:
+            self._timer.stop()
+
+    def _forget(self, animation):
+        self._running.pop(animation, None)
+        if animation in self._animations:
+            self._animations.remove(animation)
+
+
+# Общий регулятор для всех виджетов приложения
+governor = AnimationGovernor()
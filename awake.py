@@ -0,0 +1,121 @@
+"""Удержание системы из Python-кода, без GUI и Qt.
+
+    from awake import keep_awake
+
+    with keep_awake():                 # Только сон системы
+        run_batch()
+
+    @keep_awake(display=True)          # Сон системы и экран
+    def render(): ...
+
+    @keep_awake                        # Без скобок - как keep_awake()
+    def export(): ...
+
+    async with keep_awake():           # Не блокирует цикл событий
+        await job()
+
+Каждый вход - аренда общего leases.LeaseManager процесса. Вложенные и
+одновременные удержания из любых потоков и корутин сливаются в одно
+удержание: системный вызов делает один поток питания, и только когда
+меняется объединение флагов. Вход и выход лишь меняют счетчики под
+короткой блокировкой, поэтому async with обходится без потоков-исполнителей.
+
+Сам модуль почти ничего не импортирует: ядро удержания (power, leases,
+history) загружается при первом входе.
+"""
+import threading
+from functools import wraps
+
+_CO_COROUTINE = 0x80  # inspect.CO_COROUTINE без импорта inspect
+
+_core = None
+_holder = None
+_core_lock = threading.Lock()
+
+
+def core():
+    """Общий LeaseManager процесса; создается при первом удержании"""
+    global _core, _holder
+    if _core is None:
+        with _core_lock:
+            if _core is None:
+                import atexit
+
+                from history import default_history
+                from leases import LeaseManager
+                from power import PowerAssertionHolder
+
+                _holder = PowerAssertionHolder(history=default_history())
+                # Удержание снимается и отрезок истории дописывается при выходе
+                atexit.register(_holder.close)
+                _core = LeaseManager(on_change=_apply)
+    return _core
+
+
+def _apply(flags):
+    """Смена объединения флагов всех удержаний процесса"""
+    if flags:
+        _holder.hold(flags)
+    else:
+        _holder.release()
+
+
+def held_flags():
+    """Флаги ES_SYSTEM/ES_DISPLAY, которые процесс сейчас удерживает"""
+    return 0 if _core is None else _core.flags
+
+
+class keep_awake:
+    """Контекстный менеджер (with и async with) и декоратор удержания
+
+    По умолчанию удерживается только сон системы: пакетным заданиям экран
+    не нужен. Один объект можно использовать одновременно из нескольких
+    потоков и корутин: все его аренды с одними флагами, поэтому снимать их
+    можно в любом порядке.
+    """
+
+    def __new__(cls, system=True, display=False):
+        # @keep_awake без скобок: первым аргументом пришла сама функция
+        if callable(system):
+            return cls()(system)
+        return super().__new__(cls)
+
+    def __init__(self, system=True, display=False):
+        self.system = system
+        self.display = display
+        self._leases = []
+
+    @property
+    def flags(self):
+        from power import keep_awake_flags
+        return keep_awake_flags(system=self.system, display=self.display)
+
+    def __enter__(self):
+        self._leases.append(core().acquire(self.flags, owner="keep_awake"))
+        return self
+
+    def __exit__(self, *exc):
+        core().release(self._leases.pop())
+        return False
+
+    async def __aenter__(self):
+        return self.__enter__()
+
+    async def __aexit__(self, *exc):
+        return self.__exit__(*exc)
+
+    def __call__(self, func):
+        """Декоратор: удержание на время вызова функции или корутины"""
+        code = getattr(func, "__code__", None)
+        if code is not None and code.co_flags & _CO_COROUTINE:
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                async with self:
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with self:
+                return func(*args, **kwargs)
+        return wrapper
@@ -0,0 +1,73 @@
+"""Стоимость замера загрузки в режиме «пока машина занята».
+
+Сравнивает замер через открытые один раз файлы /proc с общими буферами и
+наивный вариант (открыть, прочитать и закрыть каждый файл на каждом
+замере), пересчитывает время CPU на замер в секунды CPU за час работы.
+
+Запуск: python benchmarks/bench_activity.py
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from activity import ActivitySampler, ActivityMonitor, LinuxCounters, SECTOR_SIZE
+
+SAMPLES = 20000
+
+
+class NaiveCounters(LinuxCounters):
+    """Прежний подход: каждый файл открывается и читается целиком заново"""
+
+    def __init__(self):
+        super().__init__()
+        super().close()
+
+    def read(self):
+        with open("/proc/stat") as stream:
+            ticks = [int(value) for value in stream.readline().split()[1:9]]
+        total = sum(ticks)
+        sectors = 0
+        with open("/proc/diskstats") as stream:
+            for line in stream:
+                fields = line.split()
+                if fields[2].encode() in self._disk_names:
+                    sectors += int(fields[5]) + int(fields[9])
+        net = 0
+        with open("/proc/net/dev") as stream:
+            for line in stream.readlines()[2:]:
+                name, _, data = line.partition(":")
+                if name.strip() != "lo":
+                    fields = data.split()
+                    net += int(fields[0]) + int(fields[8])
+        return total - ticks[3] - ticks[4], total, sectors * SECTOR_SIZE, net
+
+    def close(self):
+        pass
+
+
+def measure(counters):
+    sampler = ActivitySampler(counters)
+    sampler.sample()
+    wall, cpu = time.perf_counter(), time.process_time()
+    for _ in range(SAMPLES):
+        sampler.sample()
+    wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+    sampler.close()
+    return wall / SAMPLES, cpu / SAMPLES
+
+
+def main():
+    interval = ActivityMonitor().interval
+    per_hour = 3600 / interval
+    assert NaiveCounters().read()[1] > 0 and LinuxCounters().read()[1] > 0
+    for name, counters in (("наивный (open/read/close)", NaiveCounters()),
+                           ("файлы открыты, общие буферы", LinuxCounters())):
+        wall, cpu = measure(counters)
+        print(f"{name:<30} {wall * 1e6:6.1f} мкс/замер (CPU {cpu * 1e6:6.1f} мкс), "
+              f"за час при интервале {interval:.0f} с: {cpu * per_hour * 1e3:5.1f} мс CPU")
+
+
+if __name__ == "__main__":
+    main()
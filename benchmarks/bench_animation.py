@@ -0,0 +1,90 @@
+"""Работа анимаций в видимом и скрытом окне на платформе offscreen.
+
+Одна и та же серия событий (наведение на кнопки, переключение
+переключателей) проигрывается при показанном окне, при свернутом в трей и
+в режиме «меньше анимации». Для каждого случая выводятся кадры регулятора,
+пропущенные кадры, перерисовки виджетов и процессорное время цикла событий
+(строка «без событий» - собственная цена цикла опроса бенчмарка).
+
+Запуск: QT_QPA_PLATFORM=offscreen python benchmarks/bench_animation.py [повторов]
+"""
+import os
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+# Настройки не читаются из профиля пользователя и не пишутся в него
+os.environ["XDG_CONFIG_HOME"] = tempfile.mkdtemp(prefix="no-sleep-bench-")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt5.QtCore import QElapsedTimer
+from PyQt5.QtWidgets import QApplication
+
+import gui
+from animation import governor
+from metrics import registry
+
+
+def repaints():
+    return sum(registry.value("nosleep_repaints_total", widget=widget)
+               for widget in ("GlowButton", "ModernToggle", "AnimatedCard"))
+
+
+def run_events(app, milliseconds):
+    timer = QElapsedTimer()
+    timer.start()
+    while timer.elapsed() < milliseconds:
+        app.processEvents()
+        time.sleep(0.001)
+
+
+def scenario(app, window, rounds):
+    """Серия событий; возвращает (кадры, пропущено, перерисовки, мс CPU)"""
+    buttons = (window.toggle_btn, window.instructions_btn, window.tray_btn)
+    switches = (window.prevent_sleep_switch, window.prevent_display_switch)
+    frames, skipped, painted = governor.frames, governor.skipped, repaints()
+    cpu = time.process_time()
+    for _ in range(rounds):
+        for button in buttons:
+            button.enterEvent(None)
+            run_events(app, 50)
+            button.leaveEvent(None)
+        for switch in switches:
+            switch.setChecked(not switch.isChecked())
+        run_events(app, 550)
+    return (governor.frames - frames, governor.skipped - skipped, repaints() - painted,
+            (time.process_time() - cpu) * 1000)
+
+
+def main_bench():
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    registry.enable()
+    app = QApplication.instance() or QApplication(sys.argv)
+    app.setStyle("Fusion")
+    window = gui.NoSleepApp()
+    window.show()
+    run_events(app, 600)  # Анимация переключателей при запуске
+
+    cpu = time.process_time()
+    run_events(app, rounds * 700)
+    results = [("без событий", (0, 0, 0, (time.process_time() - cpu) * 1000)),
+               ("окно показано", scenario(app, window, rounds))]
+    window.hide()
+    app.processEvents()
+    results.append(("свернуто в трей", scenario(app, window, rounds)))
+    window.show()
+    governor.set_reduced_motion(True)
+    app.processEvents()
+    results.append(("меньше анимации", scenario(app, window, rounds)))
+    governor.set_reduced_motion(False)
+
+    print(f"{'':18}{'кадры':>8}{'пропущено':>11}{'перерисовки':>13}{'CPU, мс':>9}")
+    for title, (frames, skipped, painted, cpu) in results:
+        print(f"{title:18}{frames:8}{skipped:11}{painted:13}{cpu:9.0f}")
+    window.settings.close()
+    window.power.close()
+
+
+if __name__ == "__main__":
+    main_bench()
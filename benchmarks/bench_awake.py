@@ -0,0 +1,180 @@
+"""Импортируемое удержание awake.keep_awake на заглушке SetThreadExecutionState.
+
+- Время импорта awake в отдельном процессе (по -X importtime) и загрузки
+  ядра при первом входе; для сравнения - импорт gui с Qt.
+- Вложенные with: одно системное удержание на весь внешний блок.
+- 64 потока с декоратором и 2000 корутин с async with одновременно:
+  число системных вызовов, задержка входа и выхода в цикле событий,
+  удержание снято в конце.
+
+Запуск: python benchmarks/bench_awake.py
+"""
+import asyncio
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+os.environ["XDG_CONFIG_HOME"] = tempfile.mkdtemp(prefix="no-sleep-bench-")
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import power
+from fakes import FakeBackend
+
+# Заглушка kernel32: все удержания идут в FakeBackend
+BACKEND = FakeBackend()
+power.windows_backend = lambda: BACKEND
+
+from power import ES_CONTINUOUS, ES_DISPLAY_REQUIRED
+
+
+def import_ms(statement, module, runs=5):
+    """Медиана накопленного времени импорта module по -X importtime, мс"""
+    samples = []
+    for _ in range(runs):
+        result = subprocess.run([sys.executable, "-X", "importtime", "-c", statement],
+                                cwd=ROOT, capture_output=True, text=True,
+                                env=dict(os.environ, QT_QPA_PLATFORM="offscreen"))
+        for line in result.stderr.splitlines():
+            parts = [part.strip() for part in line.split("|")]
+            if len(parts) == 3 and parts[2] == module:
+                samples.append(int(parts[1]) / 1000)
+    samples.sort()
+    return samples[len(samples) // 2]
+
+
+def held():
+    """Состояние заглушки после выполнения всех команд потоку питания"""
+    import awake
+    awake._holder.wait()
+    return BACKEND.state & ~ES_CONTINUOUS
+
+
+def nested():
+    from awake import keep_awake
+
+    calls = BACKEND.calls
+    with keep_awake():
+        with keep_awake():
+            with keep_awake():
+                inner = held()
+        after_inner = held()
+        nested_calls = BACKEND.calls - calls
+    after = held()
+    return nested_calls, BACKEND.calls - calls, inner, after_inner, after
+
+
+def threads(count, rounds):
+    from awake import keep_awake
+
+    hold = keep_awake()
+    rng = random.Random(1)
+    delays = [[rng.uniform(0, 0.002) for _ in range(rounds)] for _ in range(count)]
+
+    @hold
+    def job(delay):
+        time.sleep(delay)
+
+    def worker(index):
+        for delay in delays[index]:
+            job(delay)
+
+    calls = BACKEND.calls
+    workers = [threading.Thread(target=worker, args=(i,)) for i in range(count)]
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    return BACKEND.calls - calls, held()
+
+
+async def coroutines(count):
+    from awake import keep_awake
+
+    latencies = []
+    displays = []
+
+    @keep_awake(display=True)
+    async def render():
+        await asyncio.sleep(0.02)
+        displays.append(held() & ES_DISPLAY_REQUIRED)
+
+    async def job(i):
+        hold = keep_awake()
+        t0 = time.perf_counter()
+        async with hold:
+            latencies.append(time.perf_counter() - t0)
+            await asyncio.sleep(random.uniform(0, 0.01))
+            if i % 100 == 0:
+                await render()
+            t0 = time.perf_counter()
+        latencies.append(time.perf_counter() - t0)
+
+    calls = BACKEND.calls
+    await asyncio.gather(*(job(i) for i in range(count)))
+    latencies.sort()
+    return (BACKEND.calls - calls, latencies[len(latencies) // 2],
+            latencies[int(len(latencies) * 0.99)], bool(displays) and all(displays))
+
+
+def main_bench():
+    print(f"импорт awake: {import_ms('import awake', 'awake'):.1f} мс "
+          f"(после threading и functools: "
+          f"{import_ms('import threading, functools; import awake', 'awake'):.2f} мс); "
+          f"импорт gui: {import_ms('import gui', 'gui'):.0f} мс")
+
+    import awake
+    t0 = time.perf_counter()
+    awake.core()
+    print(f"загрузка ядра при первом входе: {(time.perf_counter() - t0) * 1e3:.1f} мс")
+
+    nested_calls, calls, inner, after_inner, after = nested()
+    print(f"вложенные with: системных вызовов внутри внешнего блока {nested_calls}, "
+          f"всего {calls}, внутри {inner:#x}, после внутренних {after_inner:#x}, "
+          f"после внешнего {after:#x}")
+    # Внутренние with не вызывают систему; выход из внешнего - второй вызов
+    assert nested_calls == 1 and calls == 2, (nested_calls, calls)
+    assert inner == after_inner != 0 and after == 0, (inner, after_inner, after)
+
+    cycles = 100_000
+    hold = awake.keep_awake()
+    with awake.keep_awake():  # Удержание уже есть: вход и выход без системных вызовов
+        t0 = time.perf_counter()
+        for _ in range(cycles):
+            with hold:
+                pass
+        cycle_us = (time.perf_counter() - t0) / cycles * 1e6
+    print(f"вход и выход при уже идущем удержании: {cycle_us:.2f} мкс")
+
+    @awake.keep_awake
+    def bare(value):
+        return value, held()
+
+    async def bare_async():
+        return held()
+
+    bare_async = awake.keep_awake(bare_async)
+    inside = bare(7), asyncio.run(bare_async())
+    print(f"декоратор без скобок: результат и удержание внутри {inside}, после {held():#x}")
+    # Без скобок - только сон системы, как у keep_awake()
+    assert inside == ((7, 1), 1) and held() == 0, inside
+
+    calls, after = threads(64, 50)
+    print(f"64 потока x 50 вызовов декоратора: системных вызовов {calls}, в конце {after:#x}")
+    assert after == 0, after
+
+    calls, median, p99, display = asyncio.run(coroutines(2000))
+    after = held()
+    print(f"2000 корутин, каждая сотая с декоратором async def (экран): системных вызовов "
+          f"{calls}, экран удерживался: {display}, в конце {after:#x}")
+    assert display and after == 0, (display, after)
+    print(f"вход/выход async with в цикле событий: медиана {median * 1e6:.1f} мкс, "
+          f"p99 {p99 * 1e6:.1f} мкс")
+
+
+if __name__ == "__main__":
+    main_bench()
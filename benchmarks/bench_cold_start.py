@@ -0,0 +1,101 @@
+"""Холодный запуск и пиковое потребление памяти: режим без окна, GUI и
+повторный запуск, передающий аргументы уже работающему GUI.
+
+Каждый запуск - отдельный процесс; время считается от запуска интерпретатора
+до выхода, память - по ru_maxrss процесса. Вне Windows SetThreadExecutionState
+заменяется пустой функцией, каналы создаются во временном каталоге.
+
+Запуск: python benchmarks/bench_cold_start.py [повторов]
+"""
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PRELUDE = """
+import sys
+if sys.platform != "win32":
+    import power
+    power.windows_backend = lambda: (lambda flags: 0)
+"""
+
+HEADLESS = PRELUDE + """
+import main
+code = main.main(["--headless", "--for", "0s"])
+print("qt-loaded" if any(name.startswith("PyQt5") for name in sys.modules) else "qt-free")
+sys.exit(code)
+"""
+
+GUI = PRELUDE + """
+import gui
+_finish = gui.NoSleepApp.on_startup_finished
+def on_startup_finished(self):
+    _finish(self)
+    self.quit_application()
+gui.NoSleepApp.on_startup_finished = on_startup_finished
+import main
+sys.exit(main.main([]))
+"""
+
+
+FORWARD = PRELUDE + """
+import main
+code = main.main(["--show"])
+print("qt-loaded" if any(name.startswith("PyQt5") for name in sys.modules) else "qt-free")
+sys.exit(code)
+"""
+
+RUNNING = PRELUDE + """
+import main
+sys.exit(main.main([]))
+"""
+
+ENV = dict(os.environ, QT_QPA_PLATFORM=os.environ.get("QT_QPA_PLATFORM", "offscreen"),
+           XDG_RUNTIME_DIR=tempfile.mkdtemp(prefix="no-sleep-bench-"),
+           XDG_CONFIG_HOME=tempfile.mkdtemp(prefix="no-sleep-bench-"))
+
+
+def run(code):
+    env = ENV
+    t0 = time.perf_counter()
+    proc = subprocess.Popen([sys.executable, "-c", code], cwd=ROOT, env=env,
+                            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+    _, status, usage = os.wait4(proc.pid, 0)
+    elapsed = time.perf_counter() - t0
+    output = proc.stdout.read().decode().strip()
+    proc.stdout.close()
+    if os.waitstatus_to_exitcode(status) != 0:
+        raise RuntimeError(f"процесс завершился с ошибкой: {status}")
+    return elapsed, usage.ru_maxrss / 1024, output
+
+
+def measure(name, code, repeats):
+    results = [run(code) for _ in range(repeats)]
+    elapsed = statistics.median(r[0] for r in results)
+    rss = statistics.median(r[1] for r in results)
+    note = f"  [{results[0][2]}]" if results[0][2] else ""
+    print(f"{name:<10} запуск {elapsed * 1000:7.1f} мс   пиковый RSS {rss:6.1f} МБ{note}")
+
+
+def main():
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    measure("headless", HEADLESS, repeats)
+    measure("gui", GUI, repeats)
+
+    # Повторный запуск при работающем экземпляре GUI
+    running = subprocess.Popen([sys.executable, "-c", RUNNING], cwd=ROOT, env=ENV,
+                               stderr=subprocess.DEVNULL)
+    try:
+        time.sleep(3)
+        measure("повторный", FORWARD, repeats)
+    finally:
+        running.kill()
+        running.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""Нагрузочный тест канала управления службы с заглушкой питания.
+
+Несколько клиентов параллельно шлют команды start/stop/status/set-flags и
+ждут ответа на каждую; измеряются время ответа и пропускная способность.
+Затем клиент, который шлет команды и не читает ответы, не должен задерживать
+ответ другому клиенту.
+
+Запуск: python benchmarks/bench_daemon.py [клиентов] [команд на клиента]
+"""
+import os
+import socket
+import statistics
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from daemon import ControlClient, PowerService, make_server
+from power import ES_SYSTEM_REQUIRED, ES_DISPLAY_REQUIRED, PowerAssertionHolder
+from fakes import FakeBackend
+
+COMMANDS = [
+    ("start", (ES_SYSTEM_REQUIRED | ES_DISPLAY_REQUIRED,)),
+    ("status", ()),
+    ("set-flags", (ES_SYSTEM_REQUIRED,)),
+    ("stop", ()),
+]
+
+
+def test_address():
+    if sys.platform == "win32":
+        return rf"\\.\pipe\no-sleep-bench-{os.getpid()}"
+    return os.path.join(tempfile.mkdtemp(), "bench.sock")
+
+
+def client_loop(address, count, latencies, barrier):
+    client = ControlClient(address)
+    calls = {"start": client.start, "status": client.status,
+             "set-flags": client.set_flags, "stop": client.stop}
+    samples = []
+    barrier.wait()
+    for i in range(count):
+        name, args = COMMANDS[i % len(COMMANDS)]
+        t0 = time.perf_counter()
+        calls[name](*args)
+        samples.append(time.perf_counter() - t0)
+    client.close()
+    latencies.extend(samples)
+
+
+def stalled_client(address, commands=50_000):
+    """Время ответа клиенту, пока другой клиент не читает свои ответы, с"""
+    stalled = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stalled.connect(address)
+    stalled.setblocking(False)
+    request = b'{"cmd":"status"}\n' * commands
+    try:
+        while request:
+            request = request[stalled.send(request):]
+    except BlockingIOError:
+        pass  # Сервер перестал читать: ответы этому клиенту не уходят
+    time.sleep(0.1)
+    client = ControlClient(address)
+    t0 = time.perf_counter()
+    client.status()
+    elapsed = time.perf_counter() - t0
+    client.close()
+    stalled.close()
+    return elapsed
+
+
+def main():
+    clients = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    count = int(sys.argv[2]) if len(sys.argv) > 2 else 5000
+    backend = FakeBackend()
+    service = PowerService(PowerAssertionHolder(backend))
+    server = make_server(service, test_address())
+    if hasattr(server, "bind"):
+        server.bind()
+    server_thread = threading.Thread(target=server.serve_forever, daemon=True)
+    server_thread.start()
+
+    latencies = []
+    barrier = threading.Barrier(clients + 1)
+    threads = [threading.Thread(target=client_loop, args=(server.address, count, latencies, barrier))
+               for _ in range(clients)]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    t0 = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - t0
+
+    stalled = None
+    if sys.platform != "win32":  # Каналы Windows обслуживаются потоком на клиента
+        stalled = stalled_client(server.address)
+
+    server.shutdown()
+    server_thread.join()
+    service.close()
+
+    latencies.sort()
+    total = clients * count
+    print(f"{clients} клиентов x {count} команд: {total / elapsed:,.0f} команд/с")
+    print(f"время ответа: median {statistics.median(latencies) * 1e6:.1f} мкс, "
+          f"p99 {latencies[int(total * 0.99) - 1] * 1e6:.1f} мкс, max {latencies[-1] * 1e6:.1f} мкс")
+    print(f"вызовов SetThreadExecutionState: {backend.calls}")
+    if stalled is not None:
+        print(f"ответ, пока другой клиент не читает свои ответы: {stalled * 1e3:.2f} мс")
+        assert stalled < 0.1, stalled
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""Стоимость перерисовки виджетов со свечением на платформе offscreen.
+
+Измеряет синхронную перерисовку ModernToggle во время анимации кружка и
+GlowButton при наведении, а также счетчики кэша общего рендерера свечения.
+
+Запуск: QT_QPA_PLATFORM=offscreen python benchmarks/bench_glow.py
+"""
+import os
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+# Настройки не читаются из профиля пользователя и не пишутся в него
+os.environ["XDG_CONFIG_HOME"] = tempfile.mkdtemp(prefix="no-sleep-bench-")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt5.QtWidgets import QApplication
+
+import gui
+
+
+def per_frame(widget, frames, step):
+    t0 = time.perf_counter()
+    for i in range(frames):
+        step(i)
+        widget.repaint()
+    return (time.perf_counter() - t0) / frames
+
+
+def main_bench():
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 600
+    app = QApplication.instance() or QApplication(sys.argv)
+    app.setStyle("Fusion")
+    window = gui.NoSleepApp()
+    window.show()
+    app.processEvents()
+
+    toggle = window.prevent_sleep_switch
+    button = window.toggle_btn
+    toggle_cost = per_frame(toggle, frames, lambda i: toggle.set_circle_position(3 + i % 31))
+    button.enterEvent(None)
+    button_cost = per_frame(button, frames, lambda i: None)
+    print(f"ModernToggle: {toggle_cost * 1e6:.1f} мкс на кадр")
+    print(f"GlowButton (наведение): {button_cost * 1e6:.1f} мкс на кадр")
+
+    renderer = gui.glow_renderer
+    print(f"кэш свечения: попаданий {renderer.hits}, промахов {renderer.misses}, "
+          f"записей {len(renderer)}")
+    window.power.close()
+
+
+if __name__ == "__main__":
+    main_bench()
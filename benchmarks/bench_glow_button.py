@@ -0,0 +1,57 @@
+"""Стоимость одного кадра анимации цвета GlowButton на платформе offscreen.
+
+Запуск: QT_QPA_PLATFORM=offscreen python benchmarks/bench_glow_button.py
+"""
+import os
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt5.QtWidgets import QApplication
+from PyQt5.QtGui import QColor
+
+from gui import GlowButton
+
+
+def animation_colors(frames):
+    """Цвета кадров анимации наведения (300 мс при ~60 кадрах в секунду)"""
+    start, end = QColor("#27AE60"), QColor("#2ECC71")
+    colors = []
+    for i in range(frames):
+        k = i % 18 / 17
+        colors.append(QColor(
+            int(start.red() + (end.red() - start.red()) * k),
+            int(start.green() + (end.green() - start.green()) * k),
+            int(start.blue() + (end.blue() - start.blue()) * k)))
+    return colors
+
+
+def measure_frames(button, frames, repaint=True):
+    """Время кадра: установка анимируемого цвета и синхронная перерисовка"""
+    colors = animation_colors(frames)
+    t0 = time.perf_counter()
+    for color in colors:
+        button.color = color
+        if repaint:
+            button.repaint()
+    return (time.perf_counter() - t0) / frames
+
+
+def main():
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 600
+    app = QApplication.instance() or QApplication(sys.argv)
+    button = GlowButton("Запустить", color="#27AE60", hover_color="#2ECC71")
+    button.show()
+    app.processEvents()
+    measure_frames(button, 30)  # Прогрев
+    setter = measure_frames(button, frames, repaint=False)
+    app.processEvents()
+    per_frame = measure_frames(button, frames)
+    print(f"GlowButton: установка цвета {setter * 1e6:.1f} мкс, "
+          f"кадр с перерисовкой {per_frame * 1e6:.1f} мкс ({frames} кадров)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""История удержания на миллионах синтетических сеансов.
+
+Сеансы за десять лет ставятся в очередь через record() (как это делает
+поток питания), поток записи пишет их пачками. Затем новый экземпляр
+открывает историю и отвечает на запросы «по дням за год» и «итог за все
+время» по индексу; для сравнения те же итоги считаются полным чтением
+журнала. Второй прогон с ротацией по 1 МБ проверяет, что итоги индекса
+не теряются, когда старые части журнала удалены.
+
+Запуск: python benchmarks/bench_history.py [сеансов]
+"""
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from history import LOG_HEADER, RECORD, History, split_by_day
+
+
+def fill(history, count, seed=1):
+    """count сеансов подряд за десять лет; возвращает время постановки в очередь"""
+    rng = random.Random(seed)
+    start = time.time() - 10 * 365 * 86400
+    step = 10 * 365 * 86400 / count
+    t0 = time.perf_counter()
+    for _ in range(count):
+        length = rng.randint(60, int(step))
+        history.record(start, start + length, rng.choice((1, 2, 3)))
+        start += step
+    return time.perf_counter() - t0
+
+
+def full_scan(path):
+    """Итоги полным чтением журнала, без индекса"""
+    totals = {}
+    with open(path, "rb") as stream:
+        stream.seek(LOG_HEADER.size)
+        data = stream.read()
+    for start, length, flags in RECORD.iter_unpack(data):
+        for _, seconds in split_by_day(start, start + length):
+            totals[flags] = totals.get(flags, 0) + round(seconds)
+    return totals
+
+
+def run(count, max_bytes):
+    directory = tempfile.mkdtemp(prefix="no-sleep-history-")
+    try:
+        history = History(directory, delay=0.05, max_bytes=max_bytes)
+        queued = fill(history, count)
+        t0 = time.perf_counter()
+        history.close()
+        drained = time.perf_counter() - t0
+        size = sum(os.path.getsize(os.path.join(directory, name)) for name in os.listdir(directory))
+
+        reader = History(directory)
+        today = date.today()
+        t0 = time.perf_counter()
+        days = reader.daily(today - timedelta(days=364), today)
+        totals = reader.totals()
+        query = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        reader.daily(today - timedelta(days=364), today)
+        warm = time.perf_counter() - t0
+        result = {
+            "queued_us": queued / count * 1e6,
+            "drained_s": drained,
+            "bytes": size,
+            "index_bytes": os.path.getsize(reader.index_path),
+            "query_ms": query * 1000,
+            "warm_ms": warm * 1000,
+            "days": len(days),
+            "totals": {flags: seconds for flags, (_, seconds) in totals.items()},
+            "sessions": sum(sessions for sessions, _ in totals.values()),
+        }
+        if max_bytes >= size:
+            t0 = time.perf_counter()
+            result["scan"] = full_scan(reader.log_path)
+            result["scan_s"] = time.perf_counter() - t0
+        return result
+    finally:
+        shutil.rmtree(directory)
+
+
+def main_bench():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000_000
+    full = run(count, 1 << 40)
+    print(f"сеансов: {count}, журнал {full['bytes'] / 2**20:.1f} МБ, "
+          f"индекс {full['index_bytes'] / 2**10:.0f} КБ")
+    print(f"record(): {full['queued_us']:.2f} мкс на сеанс; "
+          f"дозапись очереди после close(): {full['drained_s']:.2f} с")
+    print(f"открытие + 365 дней + итог за все время по индексу: {full['query_ms']:.1f} мс "
+          f"(повторный запрос {full['warm_ms']:.2f} мс)")
+    print(f"те же итоги полным чтением журнала: {full['scan_s']:.1f} с, "
+          f"совпадают: {full['scan'] == full['totals']}")
+
+    rotated = run(count, 1024 * 1024)
+    print(f"с ротацией по 1 МБ: на диске {rotated['bytes'] / 2**20:.1f} МБ, "
+          f"сеансов в индексе {rotated['sessions']}, "
+          f"итоги совпадают: {rotated['totals'] == full['totals']}")
+
+
+if __name__ == "__main__":
+    main_bench()
@@ -0,0 +1,140 @@
+"""Аренды удержания: стоимость операций при десятках тысяч аренд.
+
+На виртуальных часах заказчики получают аренды со случайными флагами и
+сроками, продлевают их (heartbeat) и снимают, а часы идут так, что
+неподдержанные аренды истекают. Для каждого размера выводится среднее
+время операции: при куче оно растет как log n, а не как n.
+На малом наборе после каждой операции объединение флагов сверяется с
+перебором всех аренд.
+
+Затем служба PowerService с заглушкой SetThreadExecutionState проверяет,
+что система вызывается только при смене объединения флагов и что аренда
+без продления снимается потоком сроков сама.
+
+Запуск: python benchmarks/bench_leases.py
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+
+os.environ["XDG_CONFIG_HOME"] = tempfile.mkdtemp(prefix="no-sleep-bench-")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from daemon import PowerService
+from leases import LeaseManager
+from power import ES_CONTINUOUS, ES_SYSTEM_REQUIRED, ES_DISPLAY_REQUIRED, PowerAssertionHolder
+from fakes import FakeBackend
+
+FLAG_CHOICES = (ES_SYSTEM_REQUIRED, ES_DISPLAY_REQUIRED, ES_SYSTEM_REQUIRED | ES_DISPLAY_REQUIRED)
+
+
+class VirtualClock:
+    def __init__(self, now):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def expected_flags(manager):
+    flags = 0
+    for lease in manager._leases.values():
+        flags |= lease.flags
+    return flags
+
+
+def run(count, operations, verify, seed=1):
+    """count аренд, затем operations случайных операций; часы идут так, что
+    неподдержанные аренды истекают, а число живых остается около count"""
+    rng = random.Random(seed)
+    clock = VirtualClock(0.0)
+    changes = []
+    manager = LeaseManager(on_change=changes.append, clock=clock)
+    step = 60.0 / count  # Каждая аренда продлевается в среднем раз в 3 ее срока
+    ids = []  # Номера аренд; снятые и истекшие отбрасываются при выборе
+
+    def acquire():
+        ttl = rng.uniform(30, 90) if rng.random() < 0.9 else None
+        ids.append(manager.acquire(rng.choice(FLAG_CHOICES), ttl))
+
+    def pick():
+        while ids:
+            index = rng.randrange(len(ids))
+            ids[index], ids[-1] = ids[-1], ids[index]
+            if ids[-1] in manager:
+                return ids[-1]
+            ids.pop()
+        return None
+
+    for _ in range(count):
+        acquire()
+    t0 = time.perf_counter()
+    for _ in range(operations):
+        choice = rng.random()
+        if choice < 0.5:
+            manager.renew(pick())
+        elif choice < 0.6 or len(manager) < count:
+            acquire()
+        elif choice < 0.7:
+            manager.release(pick())
+        else:
+            clock.now += step
+            manager.advance()
+        if verify:
+            assert manager.flags == expected_flags(manager), "объединение флагов разошлось"
+    elapsed = time.perf_counter() - t0
+    return {"op_us": elapsed / operations * 1e6, "leases": len(manager),
+            "heap": len(manager._heap), "expired": manager.expired,
+            "changes": len(changes)}
+
+
+def service_check():
+    """Вызовы системы через PowerService: только при смене объединения флагов"""
+    backend = FakeBackend()
+    service = PowerService(PowerAssertionHolder(backend))
+    holder = service.holder
+    script = service.acquire(ES_SYSTEM_REQUIRED, ttl=0.3, owner="script")["lease"]
+    holder.wait()
+    calls = [backend.calls]
+    service.acquire(ES_SYSTEM_REQUIRED, owner="backup")  # Тот же флаг: без вызова
+    service.start(ES_SYSTEM_REQUIRED | ES_DISPLAY_REQUIRED)  # Добавляется экран
+    holder.wait()
+    calls.append(backend.calls)
+    service.stop()  # Экран снимается, сон системы держат аренды
+    holder.wait()
+    calls.append(backend.calls)
+    for _ in range(3):
+        time.sleep(0.2)
+        service.renew(script)  # Heartbeat: аренда не истекает
+    alive_after_heartbeats = script in service.leases
+    backup = [lease.id for lease in service.leases._leases.values() if lease.owner == "backup"]
+    service.release_lease(backup[0])
+    holder.wait()
+    calls.append(backend.calls)  # Сон держит еще аренда скрипта
+    time.sleep(0.5)  # Без продления аренда скрипта истекает
+    holder.wait()
+    calls.append(backend.calls)
+    released = backend.state == ES_CONTINUOUS and not service.leases
+    service.close()
+    return calls, alive_after_heartbeats, released
+
+
+def main_bench():
+    print(f"{'аренд':>8}{'живых':>8}{'операция, мкс':>16}{'в куче':>10}{'истекло':>10}"
+          f"{'смен флагов':>14}")
+    for count in (1_000, 10_000, 100_000):
+        result = run(count, 300_000, verify=False)
+        print(f"{count:8}{result['leases']:8}{result['op_us']:16.2f}{result['heap']:10}"
+              f"{result['expired']:10}{result['changes']:14}")
+    run(50, 20_000, verify=True)
+    print("сверка объединения флагов с перебором: ok")
+
+    calls, alive, released = service_check()
+    print(f"вызовы системы по шагам: {calls} (ожидается [1, 2, 3, 3, 4])")
+    print(f"аренда жива после heartbeat: {alive}; истекла и удержание снято: {released}")
+
+
+if __name__ == "__main__":
+    main_bench()
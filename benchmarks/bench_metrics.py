@@ -0,0 +1,68 @@
+"""Накладные расходы метрик: стоимость операций в выключенном и включенном
+состоянии и пробуждения потоков выгрузки.
+
+Запуск: python benchmarks/bench_metrics.py
+"""
+import os
+import sys
+import tempfile
+import time
+import urllib.request
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import metrics
+
+OPS = 1_000_000
+
+
+def per_op(fn):
+    t0 = time.perf_counter()
+    for _ in range(OPS):
+        fn()
+    return (time.perf_counter() - t0) / OPS * 1e9
+
+
+def empty():
+    pass
+
+
+def measure(registry):
+    counter = registry.counter("bench_total", "")
+    histogram = registry.histogram("bench_seconds", "")
+    base = per_op(empty)
+
+    def timed():
+        with histogram.time():
+            pass
+
+    return (per_op(counter.inc) - base,
+            per_op(lambda: histogram.observe(0.0003)) - per_op(lambda: empty()),
+            per_op(timed) - base)
+
+
+def main():
+    off = measure(metrics.Registry())
+    enabled = metrics.Registry()
+    enabled.enable()
+    on = measure(enabled)
+    for name, a, b in zip(("counter.inc", "histogram.observe", "with histogram.time()"), off, on):
+        print(f"{name:<22} выключено {a:6.1f} нс   включено {b:6.1f} нс")
+
+    path = os.path.join(tempfile.mkdtemp(), "nosleep.prom")
+    t0 = time.perf_counter()
+    enabled.write_textfile(path)
+    print(f"выгрузка в файл: {(time.perf_counter() - t0) * 1e6:.0f} мкс, "
+          f"{os.path.getsize(path)} байт; поток файла просыпается раз в интервал (60/ч по умолчанию)")
+
+    server = metrics.start_http_exporter(0, enabled)
+    port = server.server_address[1]
+    t0 = time.perf_counter()
+    for _ in range(100):
+        urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics").read()
+    print(f"HTTP-запрос метрик: {(time.perf_counter() - t0) * 10:.2f} мс; "
+          f"без запросов поток HTTP не просыпается")
+
+
+if __name__ == "__main__":
+    main()
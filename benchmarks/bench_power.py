@@ -0,0 +1,103 @@
+"""Микробенчмарк удержания питания: задержки start->held, stop->released
+и количество пробуждений рабочего потока в режиме ожидания. Ошибка
+системного вызова или обработчика on_change не останавливает рабочий поток.
+
+Запуск: python benchmarks/bench_power.py
+"""
+import os
+import statistics
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from power import ES_SYSTEM_REQUIRED, ES_DISPLAY_REQUIRED, PowerAssertionHolder
+from fakes import FakeBackend
+
+# Период обновления в прежнем цикле keep_awake_worker
+LEGACY_PERIOD = 30
+
+
+def measure_latency(rounds):
+    backend = FakeBackend()
+    holder = PowerAssertionHolder(backend)
+    start_lat, stop_lat = [], []
+    for _ in range(rounds):
+        backend.changed.clear()
+        t0 = time.perf_counter()
+        holder.hold(ES_SYSTEM_REQUIRED | ES_DISPLAY_REQUIRED)
+        backend.changed.wait()
+        start_lat.append(backend.stamp - t0)
+
+        backend.changed.clear()
+        t0 = time.perf_counter()
+        holder.release()
+        backend.changed.wait()
+        stop_lat.append(backend.stamp - t0)
+    threads = sum(1 for t in threading.enumerate() if t.name == "no-sleep-power")
+    holder.close()
+    return start_lat, stop_lat, threads
+
+
+def measure_idle_wakeups(seconds):
+    holder = PowerAssertionHolder(FakeBackend())
+    holder.hold(ES_SYSTEM_REQUIRED)
+    holder.wait()
+    before = holder.wakeups
+    time.sleep(seconds)
+    idle = holder.wakeups - before
+    holder.close()
+    return idle * 3600 / seconds
+
+
+def survive_errors():
+    """Команды после ошибки вызова и обработчика выполняются, close() не виснет"""
+    backend = FakeBackend()
+    failures = [OSError(5, "отказано в доступе")]
+
+    def flaky(flags):
+        if failures:
+            raise failures.pop()
+        return backend(flags)
+
+    def on_change(flags):
+        raise ValueError("ошибка обработчика")
+
+    holder = PowerAssertionHolder(flaky, on_change=on_change)
+    holder.hold(ES_SYSTEM_REQUIRED)
+    first = holder.wait(1.0)
+    holder.hold(ES_SYSTEM_REQUIRED | ES_DISPLAY_REQUIRED)
+    second = holder.wait(1.0) and holder.flags
+    holder.release()
+    third = holder.wait(1.0) and not holder.is_held
+    t0 = time.perf_counter()
+    holder.close()
+    closed = time.perf_counter() - t0
+    return first, second, third, closed
+
+
+def report(name, samples):
+    samples = sorted(samples)
+    p99 = samples[int(len(samples) * 0.99) - 1]
+    print(f"{name:<18} median {statistics.median(samples) * 1e6:8.1f} мкс   "
+          f"p99 {p99 * 1e6:8.1f} мкс   max {samples[-1] * 1e6:8.1f} мкс")
+
+
+def main():
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    start_lat, stop_lat, threads = measure_latency(rounds)
+    report("start -> held", start_lat)
+    report("stop -> released", stop_lat)
+    print(f"рабочих потоков после {rounds} переключений: {threads}")
+    print(f"пробуждений в час в режиме ожидания: {measure_idle_wakeups(3.0):.0f} "
+          f"(прежний цикл: {3600 // LEGACY_PERIOD}, задержка остановки до {LEGACY_PERIOD} с)")
+    first, second, third, closed = survive_errors()
+    print(f"после ошибок вызова и on_change: команда выполнена {first}, удерживается "
+          f"{second:#x}, снято {third}, close() за {closed * 1e3:.2f} мс")
+    assert first and second == ES_SYSTEM_REQUIRED | ES_DISPLAY_REQUIRED and third
+    assert closed < 0.5, closed
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""Поток питания и GUI: живые флаги, медленный системный вызов, зависший GUI.
+
+1. Переключатель «экран» меняется во время сеанса: время от setChecked до
+   вызова API питания с новыми флагами и до сигнала power_changed в GUI.
+2. Системный вызов занимает 20 мс: сколько поток GUI ждет в hold(), если
+   команда приходит во время вызова.
+3. Поток GUI занят 0.5 с сразу после команды: задержка удержания и его
+   снятия не зависит от цикла событий.
+
+Запуск: QT_QPA_PLATFORM=offscreen python benchmarks/bench_power_control.py [повторов]
+"""
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+# Настройки не читаются из профиля пользователя, служба не находится
+os.environ["XDG_CONFIG_HOME"] = tempfile.mkdtemp(prefix="no-sleep-bench-")
+os.environ["XDG_RUNTIME_DIR"] = tempfile.mkdtemp(prefix="no-sleep-bench-")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt5.QtWidgets import QApplication
+
+import gui
+from daemon import PowerService
+from power import ES_CONTINUOUS, ES_SYSTEM_REQUIRED, ES_DISPLAY_REQUIRED, PowerAssertionHolder
+from fakes import FakeBackend
+
+
+class SlowBackend(FakeBackend):
+    """Заглушка, у которой каждый вызов занимает delay секунд"""
+
+    def __init__(self, delay):
+        super().__init__()
+        self.delay = delay
+        self.entered = threading.Event()
+
+    def __call__(self, flags):
+        self.entered.set()
+        time.sleep(self.delay)
+        return super().__call__(flags)
+
+
+def live_switch(app, rounds):
+    """Смена переключателя во время сеанса -> API питания -> сигнал в GUI"""
+    backend = FakeBackend()
+    window = gui.NoSleepApp()
+    window.power = PowerService(PowerAssertionHolder(backend, on_change=window.power_changed.emit))
+    window.show()
+    window.start_keep_awake()
+    window.power.holder.wait()
+    applied, delivered, correct = [], [], True
+    for i in range(rounds):
+        display = i % 2 == 1
+        backend.changed.clear()
+        t0 = time.perf_counter()
+        window.prevent_display_switch.setChecked(display)
+        backend.changed.wait(1.0)
+        applied.append(backend.stamp - t0)
+        expected = ES_SYSTEM_REQUIRED | (ES_DISPLAY_REQUIRED if display else 0)
+        correct &= backend.state == ES_CONTINUOUS | expected
+        while window.held_flags != expected and time.perf_counter() - t0 < 1.0:
+            app.processEvents()
+        delivered.append(time.perf_counter() - t0)
+    window.stop_keep_awake()
+    window.settings.close()
+    window.power.close()
+    window.hide()
+    return applied, delivered, correct
+
+
+def slow_call(rounds):
+    """Время hold() в потоке GUI, пока рабочий поток ждет системный вызов"""
+    samples = []
+    for _ in range(rounds):
+        backend = SlowBackend(0.02)
+        holder = PowerAssertionHolder(backend)
+        holder.hold(ES_SYSTEM_REQUIRED)
+        backend.entered.wait()
+        t0 = time.perf_counter()
+        holder.hold(ES_SYSTEM_REQUIRED | ES_DISPLAY_REQUIRED)
+        samples.append(time.perf_counter() - t0)
+        holder.wait()
+        holder.close()
+    return samples
+
+
+def stalled_gui(app, rounds):
+    """Удержание применяется, пока поток GUI занят и не обрабатывает события"""
+    backend = FakeBackend()
+    window = gui.NoSleepApp()
+    window.power = PowerService(PowerAssertionHolder(backend, on_change=window.power_changed.emit))
+    start, stop = [], []
+    for _ in range(rounds):
+        backend.changed.clear()
+        t0 = time.perf_counter()
+        window.start_keep_awake()
+        time.sleep(0.5)  # Цикл событий стоит
+        start.append(backend.stamp - t0)
+
+        backend.changed.clear()
+        t0 = time.perf_counter()
+        window.stop_keep_awake()
+        time.sleep(0.5)
+        stop.append(backend.stamp - t0)
+        app.processEvents()
+    released = backend.state == ES_CONTINUOUS
+    window.settings.close()
+    window.power.close()
+    return start, stop, released
+
+
+def main_bench():
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    app = QApplication.instance() or QApplication(sys.argv)
+    app.setStyle("Fusion")
+
+    applied, delivered, correct = live_switch(app, rounds)
+    print(f"переключатель во время сеанса -> API питания: медиана "
+          f"{statistics.median(applied) * 1e6:.0f} мкс, макс. {max(applied) * 1e3:.2f} мс; "
+          f"флаги верны: {correct}")
+    print(f"-> сигнал power_changed в GUI: медиана {statistics.median(delivered) * 1e6:.0f} мкс")
+
+    samples = slow_call(min(rounds, 50))
+    print(f"hold() во время системного вызова 20 мс: медиана "
+          f"{statistics.median(samples) * 1e6:.0f} мкс, макс. {max(samples) * 1e3:.2f} мс")
+
+    start, stop, released = stalled_gui(app, 5)
+    print(f"GUI занят 0.5 с: удержание через {statistics.median(start) * 1e6:.0f} мкс, "
+          f"снятие через {statistics.median(stop) * 1e6:.0f} мкс; снято: {released}")
+
+
+if __name__ == "__main__":
+    main_bench()
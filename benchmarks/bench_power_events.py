@@ -0,0 +1,193 @@
+"""События питания: воспроизведение записанных потоков через ReplayPowerEvents.
+
+1. Записанный поток (JSON Lines): сеть -> батарея -> блокировка ->
+   разблокировка -> сон -> пробуждение -> сеть. После каждого события
+   проверяется, что удерживается в заглушке SetThreadExecutionState:
+   от батареи экран отпускается, сон системы держится; после пробуждения
+   флаги ставятся заново.
+2. Задержка от события до системного вызова (пробуждение, батарея).
+3. Простой: до следующей записи час, поток источника за секунду не
+   просыпается ни разу.
+4. Окно на платформе offscreen: пробуждение перепроверяет расписание,
+   батарея выключает анимации через governor, подсказка трея объясняет,
+   почему экран может гаснуть.
+
+Запуск: QT_QPA_PLATFORM=offscreen python benchmarks/bench_power_events.py
+"""
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+os.environ["XDG_CONFIG_HOME"] = tempfile.mkdtemp(prefix="no-sleep-bench-")
+os.environ["XDG_RUNTIME_DIR"] = tempfile.mkdtemp(prefix="no-sleep-bench-")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import power
+from fakes import FakeBackend
+
+# Заглушка kernel32: все удержания идут в FakeBackend
+BACKEND = FakeBackend()
+power.windows_backend = lambda: BACKEND
+
+from metrics import registry
+from power import ES_CONTINUOUS, ES_DISPLAY_REQUIRED, ES_SYSTEM_REQUIRED, PowerAssertionHolder
+from powerevents import (AC, BATTERY, LOCK, RESUME, SUSPEND, UNLOCK, WATCHER_WAKEUPS,
+                         PowerPolicy, ReplayPowerEvents, load_events)
+
+SYSTEM = ES_SYSTEM_REQUIRED
+BOTH = ES_SYSTEM_REQUIRED | ES_DISPLAY_REQUIRED
+
+# Записанный поток: секунды от начала, событие, ожидаемые флаги после него
+RECORDING = [
+    (0.0, AC, BOTH),
+    (12.0, BATTERY, SYSTEM),
+    (30.0, LOCK, SYSTEM),
+    (45.0, UNLOCK, SYSTEM),
+    (50.0, SUSPEND, SYSTEM),
+    (3600.0, RESUME, SYSTEM),
+    (3605.0, AC, BOTH),
+    (3700.0, LOCK, SYSTEM),
+    (3720.0, UNLOCK, BOTH),
+]
+
+
+def write_recording():
+    path = os.path.join(tempfile.mkdtemp(prefix="no-sleep-bench-"), "events.jsonl")
+    with open(path, "w", encoding="utf-8") as stream:
+        for at, kind, _ in RECORDING:
+            stream.write(json.dumps({"at": at, "event": kind}) + "\n")
+    return path
+
+
+def replay_recording(path):
+    holder = PowerAssertionHolder()
+    holder.hold(BOTH)
+    holder.wait()
+    observed = []
+
+    def on_event(event):
+        holder.wait()
+        observed.append((event.kind, BACKEND.state & ~ES_CONTINUOUS, BACKEND.calls))
+
+    source = ReplayPowerEvents(load_events(path), PowerPolicy(holder, on_event=on_event),
+                               speed=100_000)
+    source.start()
+    source.join()
+    holder.close()
+    return observed
+
+
+def latency(kind, rounds=500):
+    holder = PowerAssertionHolder()
+    holder.hold(BOTH)
+    holder.wait()
+    policy = PowerPolicy(holder)
+    samples = []
+    for i in range(rounds):
+        # Пробуждение - повторный вызов; батарея чередуется с сетью
+        event_kind = kind if kind == RESUME or i % 2 == 0 else AC
+        BACKEND.changed.clear()
+        source = ReplayPowerEvents([(0.0, event_kind)], policy)
+        t0 = time.perf_counter()
+        source.start()
+        BACKEND.changed.wait(1.0)
+        samples.append(BACKEND.stamp - t0)
+        source.stop()
+    holder.close()
+    return statistics.median(samples) * 1e6
+
+
+def idle(seconds=1.0):
+    wakeups = WATCHER_WAKEUPS.value
+    source = ReplayPowerEvents([(3600.0, RESUME)], lambda event: None)
+    source.start()
+    t0 = time.process_time()
+    time.sleep(seconds)
+    cpu = time.process_time() - t0
+    source.stop()
+    return WATCHER_WAKEUPS.value - wakeups, source.delivered, cpu
+
+
+def window_events():
+    from PyQt5.QtWidgets import QApplication, QSystemTrayIcon
+
+    import gui
+    from animation import governor
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    window = gui.NoSleepApp()
+    window.show()
+    if window.tray_icon is None:
+        window.tray_icon = QSystemTrayIcon(window)  # offscreen: трея нет, подсказка нужна
+    window.start_keep_awake()
+    window.power.holder.wait()
+    app.processEvents()
+
+    arms = []
+    arm = window.arm_schedule_timer
+    window.arm_schedule_timer = lambda: (arms.append(1), arm())
+    window.scheduler.on_reschedule = window.arm_schedule_timer
+
+    results = {}
+    for kind in (BATTERY, LOCK, RESUME, UNLOCK, AC):
+        source = ReplayPowerEvents([(0.0, kind)], window.power_policy)
+        source.start()
+        source.join()
+        app.processEvents()
+        window.power.holder.wait()
+        results[kind] = (BACKEND.state & ~ES_CONTINUOUS, governor.on_battery(),
+                         "Экран может гаснуть" in window.tray_icon.toolTip())
+    window.stop_keep_awake()
+    window.settings.close()
+    window.power.close()
+    return results, len(arms)
+
+
+def main_bench():
+    registry.enable()
+
+    path = write_recording()
+    observed = replay_recording(path)
+    expected = [(kind, flags) for _, kind, flags in RECORDING]
+    sequence = [(kind, flags) for kind, flags, _ in observed]
+    print(f"записанный поток ({len(observed)} событий, час сна сжат до "
+          f"{3720 / 100_000 * 1e3:.0f} мс), совпадает с ожидаемым: {sequence == expected}")
+    assert sequence == expected, sequence
+    previous = observed[0][2]
+    for kind, flags, calls in observed:
+        print(f"  {kind:<8} удерживается {flags:#x}, системных вызовов {calls - previous}")
+        # От батареи и блокировки экран отпускается, сон системы держится;
+        # пробуждение ставит флаги заново одним вызовом
+        if kind in (BATTERY, LOCK):
+            assert flags == SYSTEM, (kind, flags)
+        if kind == RESUME:
+            assert calls - previous == 1, (kind, calls - previous)
+        previous = calls
+    # Разблокировка от сети возвращает экран
+    assert observed[-1][:2] == (UNLOCK, BOTH), observed[-1]
+
+    print(f"задержка события до системного вызова: пробуждение {latency(RESUME):.0f} мкс, "
+          f"батарея/сеть {latency(BATTERY):.0f} мкс")
+
+    wakeups, delivered, cpu = idle()
+    print(f"простой 1 с: пробуждений потока {wakeups}, событий {delivered}, "
+          f"процессорного времени {cpu * 1e3:.2f} мс")
+    assert wakeups == 0 and delivered == 0, (wakeups, delivered)
+
+    results, arms = window_events()
+    for kind, (flags, battery, tooltip) in results.items():
+        print(f"окно, {kind:<8}: удерживается {flags:#x}, анимации от батареи: {battery}, "
+              f"подсказка про экран: {tooltip}")
+    print(f"перевзводов таймера расписания после пробуждения: {arms}")
+    assert results == {BATTERY: (SYSTEM, True, True), LOCK: (SYSTEM, True, True),
+                       RESUME: (SYSTEM, True, True), UNLOCK: (SYSTEM, True, True),
+                       AC: (BOTH, False, False)}, results
+    assert arms == 1, arms
+
+
+if __name__ == "__main__":
+    main_bench()
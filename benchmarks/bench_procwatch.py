@@ -0,0 +1,113 @@
+"""Слежение за процессами: потоки, пробуждения в простое, задержка
+обнаружения выхода и стоимость повторного просмотра таблицы процессов.
+
+Запускает сотни процессов sleep и следит за ними по шаблону имени. Затем
+процесс, запущенный после добавления шаблона: при уведомлениях ядра о
+запуске (proc connector) он находится без просмотра таблицы.
+
+Запуск: python benchmarks/bench_procwatch.py
+"""
+import os
+import statistics
+import subprocess
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from metrics import registry
+from procwatch import ProcessWatcher
+
+IDLE_SECONDS = 2.0
+
+
+def wakeups():
+    return registry.value("nosleep_thread_wakeups_total", thread="procwatch")
+
+
+def run(count):
+    exited = threading.Event()
+    watcher = ProcessWatcher(on_change=lambda alive: alive or exited.set())
+    children = [subprocess.Popen(["sleep", "1000"]) for _ in range(count)]
+    time.sleep(0.2)  # Дочерние процессы успевают выполнить exec
+    try:
+        t0 = time.perf_counter()
+        found = watcher.watch_name("sleep")
+        first_scan = time.perf_counter() - t0
+        threads = sum(1 for t in threading.enumerate() if t.name.startswith("no-sleep-procwatch"))
+
+        time.sleep(0.1)  # Поток ожидания принимает новые pidfd
+        before = wakeups()
+        time.sleep(IDLE_SECONDS)
+        idle = wakeups() - before
+
+        rescans = []
+        for _ in range(20):
+            t0 = time.perf_counter()
+            watcher.rescan()
+            rescans.append(time.perf_counter() - t0)
+
+        # Задержка от завершения процесса до его обработки потоком ожидания
+        latencies = []
+        for child in children[:-1][:50]:
+            t0 = time.perf_counter()
+            child.kill()
+            while child.pid in watcher.pids:
+                time.sleep(0)
+            latencies.append(time.perf_counter() - t0)
+
+        for child in children:
+            child.kill()
+        t0 = time.perf_counter()
+        exited.wait(10)
+        last = time.perf_counter() - t0
+    finally:
+        for child in children:
+            child.kill()
+            child.wait()
+        watcher.close()
+    print(f"{count:>4} процессов: найдено {found}, потоков ожидания {threads}, "
+          f"пробуждений в простое {idle * 60 / IDLE_SECONDS:.0f}/мин")
+    print(f"      первый просмотр {first_scan * 1e3:6.1f} мс, повторный {statistics.median(rescans) * 1e3:5.2f} мс, "
+          f"выход процесса {statistics.median(latencies) * 1e6:6.0f} мкс, "
+          f"выход последнего -> on_change {last * 1e3:5.2f} мс")
+
+
+def started_later():
+    """Задержка от запуска процесса до on_change и просмотры таблицы за это время"""
+    started = threading.Event()
+    watcher = ProcessWatcher(on_change=lambda alive: alive and started.set())
+    watcher.watch_name("sleep")
+    scans = registry.value("nosleep_process_scans_total")
+    t0 = time.perf_counter()
+    child = subprocess.Popen(["sleep", "1000"])
+    try:
+        found = started.wait(2.0)
+        latency = time.perf_counter() - t0
+        scans = registry.value("nosleep_process_scans_total") - scans
+        tracked = child.pid in watcher.pids
+        events = watcher.exec_events
+    finally:
+        child.kill()
+        child.wait()
+        watcher.close()
+    return events, found and tracked, latency, scans
+
+
+def main():
+    registry.enable()
+    for count in (100, 500):
+        run(count)
+    events, found, latency, scans = started_later()
+    if events:
+        print(f"процесс, запущенный после шаблона: найден через {latency * 1e3:.2f} мс, "
+              f"просмотров таблицы {scans}")
+        assert found and scans == 0, (found, scans)
+    else:
+        print("уведомления о запуске процессов недоступны (старое ядро без CAP_NET_ADMIN): "
+              "новые процессы находятся только просмотром таблицы")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,410 @@
+"""Правила удержания: инкрементальный пересчет на сотнях правил.
+
+1. Компиляция 600 правил (200 именованных промежуточных, 400 с hold) над
+   64 входами.
+2. 200 000 случайных смен входов: время на смену, число вычисленных
+   условий против полного пересчета, вызовы on_change; каждые 1000 смен
+   решение сверяется с правилами, скомпилированными заново.
+3. Решение в PowerAssertionHolder на заглушке SetThreadExecutionState:
+   системных вызовов не больше, чем смен решения.
+4. Окна window() через RuleInputs на подставных часах: неделя переходов.
+   Процессы process() по трем шаблонам: один наблюдатель и один поток
+   ожидания на все шаблоны, без потока периодического просмотра.
+5. Окно на платформе offscreen: правила из файла настроек, события батареи
+   и перезагрузка правил из файла меняют удержание через set_auto_source;
+   запуск с восстановленным ручным сеансом и правилами.
+
+Проверки (assert): после каждой из 20 000 смен входов значения всех правил
+и решение совпадают с полным пересчетом; ошибочные правила отвергаются
+с ValueError, а прежние остаются в силе; решение доходит до системы.
+
+Запуск: QT_QPA_PLATFORM=offscreen python benchmarks/bench_rules.py
+"""
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+os.environ["XDG_CONFIG_HOME"] = tempfile.mkdtemp(prefix="no-sleep-bench-")
+os.environ["XDG_RUNTIME_DIR"] = tempfile.mkdtemp(prefix="no-sleep-bench-")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import power
+from fakes import FakeBackend
+
+# Заглушка kernel32: все удержания идут в FakeBackend
+BACKEND = FakeBackend()
+power.windows_backend = lambda: BACKEND
+
+from datetime import datetime
+
+from power import ES_CONTINUOUS, ES_DISPLAY_REQUIRED, ES_SYSTEM_REQUIRED, PowerAssertionHolder
+from rules import RuleEngine, RuleInputs
+
+INPUT_KEYS = (["battery", "locked", "busy"]
+              + [f"process:app{i}" for i in range(61)])
+
+
+def make_rules(rng, named=200, holding=400):
+    """Случайный граф: условия над входами и ранее заданными правилами"""
+    specs = []
+
+    def term(names):
+        pool = INPUT_KEYS + names
+        key = rng.choice(pool)
+        text = f"process('{key[8:]}')" if key.startswith("process:") else key
+        return f"not {text}" if rng.random() < 0.3 else text
+
+    def condition(names, terms):
+        groups = []
+        for _ in range(rng.randint(1, 2)):
+            groups.append(" and ".join(term(names) for _ in range(rng.randint(*terms))))
+        return " or ".join(f"({group})" for group in groups)
+
+    names = []
+    for i in range(named):
+        specs.append({"name": f"r{i}", "when": condition(names[-40:], (1, 3))})
+        names.append(f"r{i}")
+    # Условия с hold строже: решение меняется, но не на каждую смену входа
+    for i in range(holding):
+        hold = rng.choice((["system"], ["display"], ["system", "display"]))
+        specs.append({"when": condition(names, (5, 8)), "hold": hold})
+    return specs
+
+
+def incremental(specs, changes=200_000):
+    rng = random.Random(2)
+    published = []
+    t0 = time.perf_counter()
+    engine = RuleEngine(specs, on_change=published.append)
+    compile_ms = (time.perf_counter() - t0) * 1e3
+    state = {key: False for key in INPUT_KEYS}
+    keys = [rng.choice(INPUT_KEYS) for _ in range(changes)]
+    evaluations = engine.evaluations
+    mismatches = 0
+    check_s = 0.0
+    t0 = time.perf_counter()
+    for step, key in enumerate(keys, 1):
+        state[key] = not state[key]
+        engine.set_input(key, state[key])
+        if step % 1000 == 0:
+            t1 = time.perf_counter()
+            fresh = RuleEngine(specs)
+            fresh.set_inputs(state)
+            mismatches += fresh.flags != engine.flags
+            check_s += time.perf_counter() - t1
+    per_change = (time.perf_counter() - t0 - check_s) / changes * 1e6
+    per_step = (engine.evaluations - evaluations) / changes
+    return compile_ms, per_change, per_step, len(published), mismatches
+
+
+def full_evaluation(engine, state):
+    """Значения правил и решение полным пересчетом всех условий по порядку"""
+    rules = engine._rules
+    values = [False] * len(engine._values)
+    for key, slot in engine._input_slots.items():
+        values[slot] = state.get(key, False)
+    flags = 0
+    for rule in rules:
+        values[rule.slot] = bool(rule.function(values))
+        if values[rule.slot]:
+            flags |= rule.hold
+    return values[:len(rules)], flags
+
+
+def check_every_change(specs, changes=20_000):
+    """Инкрементальный результат после каждой смены входа равен полному пересчету"""
+    rng = random.Random(4)
+    engine = RuleEngine(specs)
+    state = {key: False for key in INPUT_KEYS}
+    for step in range(changes):
+        if step % 7 == 0:
+            # Пачка смен через set_inputs
+            batch = {rng.choice(INPUT_KEYS): rng.random() < 0.5 for _ in range(4)}
+            state.update(batch)
+            engine.set_inputs(batch)
+        else:
+            key = rng.choice(INPUT_KEYS)
+            state[key] = not state[key]
+            engine.set_input(key, state[key])
+        values, flags = full_evaluation(engine, state)
+        assert engine._values[:len(values)] == values, f"значения правил разошлись на смене {step}"
+        assert engine.flags == flags, f"решение разошлось на смене {step}"
+    return changes
+
+
+# Ошибочные правила: compile() должен отвергнуть каждое с ValueError
+INVALID_RULES = [
+    [{"when": "battery and"}],
+    [{"when": "battery", "hold": ["system"]}, {"when": "(battery", "hold": ["system"]}],
+    [{"when": "battery)", "hold": ["system"]}],
+    [{"when": "nonsense", "hold": ["system"]}],
+    [{"when": "process(1)", "hold": ["system"]}],
+    [{"when": "process('x'", "hold": ["system"]}],
+    [{"when": "process('')", "hold": ["system"]}],
+    [{"when": "exec('x')", "hold": ["system"]}],
+    [{"when": "__import__('os')", "hold": ["system"]}],
+    [{"when": "battery.real", "hold": ["system"]}],
+    [{"when": "window('someday')", "hold": ["system"]}],
+    [{"when": "battery", "hold": ["cpu"]}],
+    [{"when": "battery", "hold": 5}],
+    [{"when": "battery", "hold": None}],
+    [{"when": 5, "hold": ["system"]}],
+    [{"hold": ["system"]}],
+    ["battery"],
+    [None],
+    [{"when": "battery"}],
+    [{"name": 5, "when": "battery"}],
+    [{"name": "battery", "when": "locked"}],
+    [{"name": "and", "when": "locked"}],
+    [{"name": "a b", "when": "locked"}],
+    [{"name": "a", "when": "locked"}, {"name": "a", "when": "busy"}],
+    [{"name": "a", "when": "b"}, {"name": "b", "when": "a"}, {"when": "a", "hold": ["system"]}],
+    [{"name": "a", "when": "a", "hold": ["system"]}],
+]
+
+
+def check_invalid():
+    """Ошибочные правила отвергаются, прежние правила и решение остаются"""
+    engine = RuleEngine([{"when": "not battery", "hold": ["display"]},
+                         {"when": "true", "hold": ["system"]}])
+    before = engine.flags
+    for specs in INVALID_RULES:
+        try:
+            engine.compile(specs)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError(f"правила приняты: {specs!r}")
+        assert len(engine) == 2 and engine.flags == before, specs
+        engine.set_input("battery", True)
+        assert engine.flags == ES_SYSTEM_REQUIRED, specs
+        engine.set_input("battery", False)
+        assert engine.flags == before, specs
+    return len(INVALID_RULES)
+
+
+def full_recompute_us(specs, samples=200):
+    """Для сравнения: пересчет всех правил на каждую смену входа"""
+    engine = RuleEngine(specs)
+    values = list(engine._values)
+    functions = [rule.function for rule in engine._rules]
+    t0 = time.perf_counter()
+    for _ in range(samples):
+        for function in functions:
+            function(values)
+    return (time.perf_counter() - t0) / samples * 1e6
+
+
+def to_holder(specs, changes=20_000):
+    holder = PowerAssertionHolder()
+    decisions = []
+
+    def apply(flags):
+        decisions.append(flags)
+        if flags:
+            holder.hold(flags)
+        else:
+            holder.release()
+
+    engine = RuleEngine(specs, on_change=apply)
+    rng = random.Random(3)
+    calls = BACKEND.calls
+    for _ in range(changes):
+        key = rng.choice(INPUT_KEYS)
+        engine.set_input(key, rng.random() < 0.5)
+        holder.wait()  # Каждое решение доходит до системы, без слияния команд
+    calls = BACKEND.calls - calls
+    applied = BACKEND.state & ~ES_CONTINUOUS == engine.flags
+    holder.close()
+    return len(decisions), calls, applied
+
+
+def windows_week():
+    now = [datetime(2026, 3, 2, 0, 0).timestamp()]  # Понедельник
+    changes = []
+    engine = RuleEngine([{"name": "work", "when": "window('mon-fri 09:00-18:00')"},
+                         {"when": "work and not battery", "hold": ["display"]},
+                         {"when": "window('daily 23:00-01:00') or work", "hold": ["system"]}],
+                        on_change=changes.append)
+    inputs = RuleInputs(engine, clock=lambda: now[0])
+    inputs.update()  # Без потока драйвера: часы двигает бенчмарк
+    if inputs._driver is not None:
+        inputs._driver.stop()
+        inputs._driver = None
+    inputs.scheduler.on_reschedule = None
+    log = []
+    for hour in range(7 * 24 + 1):
+        now[0] += 0 if hour == 0 else 3600
+        inputs.scheduler.advance(now[0])
+        log.append(engine.flags)
+    inputs.close()
+    return changes, log
+
+
+def process_rules():
+    """Входы process() от запущенного и завершенного процесса sleep"""
+    from metrics import registry
+
+    registry.enable()
+    engine = RuleEngine([{"when": "process('sleep')", "hold": ["system"]},
+                         {"when": "process('sl*p') and not process('no-such-*')",
+                          "hold": ["display"]}])
+    inputs = RuleInputs(engine)
+    child = subprocess.Popen(["sleep", "1000"])
+    time.sleep(0.2)  # Дочерний процесс успевает выполнить exec
+    scans = registry.value("nosleep_process_scans_total")
+    inputs.update()
+    scans = registry.value("nosleep_process_scans_total") - scans
+    threads = sorted(t.name for t in threading.enumerate()
+                     if t.name.startswith(("no-sleep-procwatch", "no-sleep-rules")))
+    running = engine.flags
+    child.kill()
+    child.wait()
+    deadline = time.monotonic() + 5
+    while engine.flags and time.monotonic() < deadline:
+        time.sleep(0.001)
+    exited = engine.flags
+    inputs.close()
+    return scans, threads, running, exited
+
+
+_app = None
+
+
+def application():
+    """Одно приложение Qt на все проверки с окном: вместе с удаленным
+    приложением пропали бы и таймеры регулятора анимаций"""
+    global _app
+    from PyQt5.QtWidgets import QApplication
+
+    if _app is None:
+        _app = QApplication.instance() or QApplication(sys.argv)
+    return _app
+
+
+def window_rules():
+    import gui
+    from powerevents import AC, BATTERY, PowerEvent
+    from settings import default_path
+
+    os.makedirs(os.path.dirname(default_path()), exist_ok=True)
+    with open(default_path(), "w", encoding="utf-8") as stream:
+        json.dump({"rules": [{"when": "not battery", "hold": ["display"]},
+                             {"when": "true", "hold": ["system"]}]}, stream)
+    app = application()
+    window = gui.NoSleepApp()
+    window.show()
+    window.power.holder.wait()
+
+    def step(name):
+        window.power.holder.wait()
+        steps.append((name, window.is_active, "rules" in window.source_leases,
+                      BACKEND.state & ~ES_CONTINUOUS))
+
+    steps = []
+    step("после загрузки")
+    for kind in (BATTERY, AC):
+        window.on_power_event(PowerEvent(kind))
+        step(kind)
+    # Ручной сеанс - своя аренда: его остановка не снимает аренду правил
+    window.switches = {"system": True, "display": False}
+    window.toggle_keep_awake()
+    step("ручной запуск")
+    window.toggle_keep_awake()
+    step("ручная остановка")
+    t0 = time.perf_counter()
+    window.on_settings_changed({"rules": [{"when": "locked", "hold": ["system"]}]})
+    window.power.holder.wait()
+    reload_ms = (time.perf_counter() - t0) * 1e3
+    step("правила заменены")
+    window.on_settings_changed({"rules": [{"when": "nonsense and", "hold": ["system"]}]})
+    step("ошибочные правила")
+    kept = len(window.rules)
+    window.quit_application()
+    return steps, reload_ms, kept
+
+
+def restored_session():
+    """Запуск с сеансом, включенным вручную при прошлом выходе, и правилами"""
+    from PyQt5.QtWidgets import QSystemTrayIcon
+
+    import gui
+    from settings import default_path
+
+    # offscreen: трея нет, а подсказку трея запуск обновляет до компиляции правил
+    QSystemTrayIcon.isSystemTrayAvailable = staticmethod(lambda: True)
+    with open(default_path(), "w", encoding="utf-8") as stream:
+        json.dump({"active": True, "system": True, "display": False,
+                   "rules": [{"when": "locked", "hold": ["display"]}]}, stream)
+    app = application()
+    window = gui.NoSleepApp()
+    window.power.holder.wait()
+    app.processEvents()
+    result = (window.is_active, sorted(window.source_leases), BACKEND.state & ~ES_CONTINUOUS,
+              window.tray_icon.toolTip())
+    window.quit_application()
+    return result
+
+
+def main_bench():
+    specs = make_rules(random.Random(1))
+    compile_ms, per_change, per_step, published, mismatches = incremental(specs)
+    print(f"компиляция {len(specs)} правил над {len(INPUT_KEYS)} входами: {compile_ms:.1f} мс")
+    print(f"200000 смен входов: {per_change:.2f} мкс на смену, условий на смену {per_step:.1f} "
+          f"из {len(specs)}; смен решения {published}; расхождений с полным пересчетом "
+          f"{mismatches} из 200")
+    assert mismatches == 0
+    print(f"полный пересчет всех правил: {full_recompute_us(specs):.1f} мкс на смену")
+
+    checked = check_every_change(specs)
+    print(f"сверка с полным пересчетом после каждой смены: {checked} смен, расхождений нет")
+    rejected = check_invalid()
+    print(f"ошибочные наборы правил: отвергнуто {rejected} из {len(INVALID_RULES)}, "
+          f"прежние правила в силе")
+
+    decisions, calls, applied = to_holder(specs)
+    print(f"20000 смен входов -> PowerAssertionHolder: смен решения {decisions}, "
+          f"системных вызовов {calls}; в системе решение правил: {applied}")
+    assert applied and calls == decisions
+
+    changes, log = windows_week()
+    names = {0: "-", ES_SYSTEM_REQUIRED: "S", ES_DISPLAY_REQUIRED: "D",
+             ES_SYSTEM_REQUIRED | ES_DISPLAY_REQUIRED: "SD"}
+    monday = " ".join(names[flags] for flags in log[:25])
+    print(f"неделя окон window(): смен решения {len(changes)}; понедельник по часам: {monday}")
+    assert monday == " ".join(["S"] + ["-"] * 8 + ["SD"] * 9 + ["-"] * 5 + ["S"] * 2)
+
+    if hasattr(os, "pidfd_open"):
+        scans, threads, running, exited = process_rules()
+        print(f"process() по трем шаблонам: потоки {threads}, просмотров таблицы {scans}, "
+              f"пока sleep работает {running:#x}, после выхода {exited:#x}")
+        assert threads == ["no-sleep-procwatch"] and scans == 1, (threads, scans)
+        assert running == ES_SYSTEM_REQUIRED | ES_DISPLAY_REQUIRED and exited == 0
+
+    steps, reload_ms, kept = window_rules()
+    for name, active, rules_lease, flags in steps:
+        print(f"окно, {name}: ручной сеанс {active}, аренда правил {rules_lease}, "
+              f"удерживается {flags:#x}")
+    print(f"перезагрузка правил из настроек: {reload_ms:.2f} мс; после ошибочных "
+          f"осталось прежних правил: {kept}")
+    both = ES_SYSTEM_REQUIRED | ES_DISPLAY_REQUIRED
+    assert [step[1:] for step in steps] == [
+        (False, True, both), (False, True, ES_SYSTEM_REQUIRED), (False, True, both),
+        (True, True, both), (False, True, both), (False, False, 0), (False, False, 0)]
+    assert kept == 1
+
+    active, sources, flags, tooltip = restored_session()
+    print(f"запуск с восстановленным сеансом и правилами: активно {active}, "
+          f"аренды источников {sources}, удерживается {flags:#x}")
+    assert active and sources == [] and flags == ES_SYSTEM_REQUIRED
+    assert tooltip.startswith("No-Sleep - активно")
+
+
+if __name__ == "__main__":
+    main_bench()
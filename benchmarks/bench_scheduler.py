@@ -0,0 +1,112 @@
+"""Планировщик на виртуальных часах: стоимость перехода при тысячах окон.
+
+Окна случайно разбросаны по году и перекрываются; часы переводятся прямо
+на ближайший переход, как это делает единственный таймер драйвера. На малом
+наборе объединение флагов после каждого перехода сверяется с перебором.
+
+Отдельно - SchedulerThread при переводе часов без resync(): окно через час
+по старым часам должно начаться не позже чем через max_wait после перевода.
+
+Запуск: python benchmarks/bench_scheduler.py
+"""
+import os
+import random
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from power import ES_SYSTEM_REQUIRED, ES_DISPLAY_REQUIRED
+from scheduler import Scheduler, SchedulerThread
+
+YEAR = 365 * 86400
+T0 = 1_800_000_000.0
+FLAG_CHOICES = (ES_SYSTEM_REQUIRED, ES_DISPLAY_REQUIRED, ES_SYSTEM_REQUIRED | ES_DISPLAY_REQUIRED)
+
+
+class VirtualClock:
+    def __init__(self, now):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def make_windows(rng, count):
+    windows = []
+    for _ in range(count):
+        start = T0 + rng.uniform(0, YEAR)
+        windows.append((start, start + rng.uniform(60, 6 * 3600), rng.choice(FLAG_CHOICES)))
+    return windows
+
+
+def expected_flags(windows, now):
+    flags = 0
+    for start, end, window_flags in windows:
+        if start <= now < end:
+            flags |= window_flags
+    return flags
+
+
+def run(count, recurring, verify, seed=1):
+    rng = random.Random(seed)
+    clock = VirtualClock(T0)
+    changes = []
+    scheduler = Scheduler(on_change=changes.append, clock=clock)
+    windows = make_windows(rng, count)
+    for start, end, flags in windows:
+        scheduler.add_once(start, end, flags)
+    for i in range(recurring):
+        scheduler.add_recurring({i % 7}, rng.randrange(0, 86400, 60), rng.randrange(0, 86400, 60),
+                                ES_SYSTEM_REQUIRED)
+
+    horizon = T0 + YEAR + 86400
+    t0 = time.perf_counter()
+    while True:
+        transition = scheduler.next_transition()
+        if transition is None or transition.when > horizon:
+            break
+        clock.now = transition.when
+        scheduler.advance()
+        if verify:
+            assert scheduler.flags == expected_flags(windows, clock.now), clock.now
+    elapsed = time.perf_counter() - t0
+    return scheduler.transitions, elapsed, len(changes)
+
+
+def clock_jump(max_wait=0.05):
+    """Задержка начала окна после перевода часов вперед без resync(), с;
+    None, если окно не началось за 0.25 с"""
+    clock = VirtualClock(T0)
+    started = threading.Event()
+    scheduler = Scheduler(on_change=lambda flags: flags and started.set(), clock=clock)
+    driver = SchedulerThread(scheduler, max_wait=max_wait)
+    driver.start()
+    scheduler.add_once(T0 + 3600, T0 + 7200, ES_SYSTEM_REQUIRED)
+    time.sleep(0.01)  # Драйвер уже ждет перехода по старым часам
+    clock.now = T0 + 3600
+    t0 = time.perf_counter()
+    ready = started.wait(0.25)
+    delay = time.perf_counter() - t0
+    driver.stop()
+    return delay if ready else None
+
+
+def main():
+    transitions, _, changes = run(500, 0, verify=True)
+    print(f"проверка перебором: 500 окон, {transitions} переходов, {changes} смен флагов - совпадает")
+    for count in (1_000, 10_000, 100_000):
+        transitions, elapsed, changes = run(count, 20, verify=False)
+        print(f"{count:>7} окон + 20 повторяющихся: {transitions:>7} переходов, "
+              f"{elapsed / transitions * 1e6:5.2f} мкс на переход, смен флагов {changes}")
+    delay = clock_jump()
+    assert delay is not None and delay < 0.1, delay
+    # Без ограничения драйвер ждал бы час по старым часам
+    assert clock_jump(max_wait=None) is None
+    print(f"перевод часов на час без resync(): окно началось через {delay * 1e3:.0f} мс "
+          f"(max_wait 50 мс)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Настройки: время синхронной загрузки, склейка частых изменений в одну
+запись и задержка применения внешнего изменения файла.
+
+Запуск: python benchmarks/bench_settings.py
+"""
+import json
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from metrics import registry
+from settings import Settings, SETTINGS_WRITES
+
+LOADS = 2000
+TOGGLES = 1000
+PUSHES = 50
+
+
+def main():
+    registry.enable()
+    path = os.path.join(tempfile.mkdtemp(prefix="no-sleep-bench-"), "settings.json")
+    settings = Settings(path, delay=0.5)
+    settings.update(window=[100, 200])
+    settings.flush()
+    size = os.path.getsize(path)
+
+    samples = []
+    for _ in range(LOADS):
+        t0 = time.perf_counter()
+        Settings(path).load()
+        samples.append(time.perf_counter() - t0)
+    print(f"загрузка ({size} байт): медиана {statistics.median(samples) * 1e6:.1f} мкс, "
+          f"максимум {max(samples) * 1e6:.1f} мкс")
+
+    writes = SETTINGS_WRITES.value
+    t0 = time.perf_counter()
+    for i in range(TOGGLES):
+        settings.update(system=bool(i % 2), display=not i % 3, window=[i, i])
+    update_cost = (time.perf_counter() - t0) / TOGGLES
+    time.sleep(settings.delay * 2)
+    print(f"{TOGGLES} изменений подряд: {SETTINGS_WRITES.value - writes} запись, "
+          f"{update_cost * 1e6:.1f} мкс на изменение")
+
+    # Внешний инструмент атомарно заменяет файл; замер до вызова on_change
+    applied = threading.Event()
+    settings.on_change = lambda changed: applied.set()
+    settings.watch()
+    latencies = []
+    for i in range(PUSHES):
+        applied.clear()
+        data = json.dumps({"system": True, "display": True, "active": False, "window": [i, -i]})
+        tmp_path = path + ".deploy"
+        with open(tmp_path, "w") as stream:
+            stream.write(data)
+        t0 = time.perf_counter()
+        os.replace(tmp_path, path)
+        if not applied.wait(2):
+            raise RuntimeError("внешнее изменение не применено")
+        latencies.append(time.perf_counter() - t0)
+    idle_before = registry.value("nosleep_thread_wakeups_total", thread="settings")
+    time.sleep(2)
+    idle = registry.value("nosleep_thread_wakeups_total", thread="settings") - idle_before
+    settings.close()
+    print(f"внешнее изменение -> on_change: медиана {statistics.median(latencies) * 1e6:.0f} мкс, "
+          f"максимум {max(latencies) * 1e6:.0f} мкс; пробуждений наблюдателя в простое: {idle}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,198 @@
+"""Сравнение старой монолитной таблицы стилей и ролевой темы.
+
+Измеряет синхронную перерисовку всего окна (window.repaint()) и смену
+статуса: прежде это был setStyleSheet на метке статуса, теперь - замена
+готовой палитры. Старая таблица, включая общее правило для QWidget,
+воспроизведена здесь дословно.
+
+Запуск: QT_QPA_PLATFORM=offscreen python benchmarks/bench_theme.py [повторов]
+"""
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+# Настройки не читаются из профиля пользователя и не пишутся в него
+os.environ["XDG_CONFIG_HOME"] = tempfile.mkdtemp(prefix="no-sleep-bench-")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt5.QtGui import QFont, QPalette
+from PyQt5.QtWidgets import QApplication, QWidget
+
+import gui
+from theme import theme
+
+LEGACY_STYLESHEET = """
+QMainWindow {
+    background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
+        stop: 0 #0C0C0E, stop: 1 #1A1A1F);
+}
+QLabel#titleLabel {
+    padding: 15px;
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #6A0DAD, stop:1 #8A2BE2);
+    border-radius: 15px;
+    color: white;
+    font-size: 28px;
+}
+QLabel#descriptionLabel {
+    color: #BB86FC;
+    padding: 10px;
+    font-weight: bold;
+    font-size: 12px;
+}
+QGroupBox#settingsGroup, QGroupBox#infoGroup {
+    font-weight: bold;
+    border: 2px solid #6A0DAD;
+    border-radius: 12px;
+    margin-top: 10px;
+    padding-top: 15px;
+    background: rgba(30, 30, 35, 200);
+    font-size: 12px;
+}
+QGroupBox#settingsGroup::title, QGroupBox#infoGroup::title {
+    subcontrol-origin: margin;
+    left: 10px;
+    padding: 0 8px 0 8px;
+    color: #BB86FC;
+    font-size: 12px;
+}
+QLabel#settingLabel {
+    color: #E0E0E0;
+    font-weight: bold;
+    font-size: 12px;
+}
+QLabel#infoLabel {
+    color: #E0E0E0;
+    padding: 8px;
+    font-size: 12px;
+}
+QLabel#statusLabel {
+    color: #E74C3C;
+    font-weight: bold;
+    padding: 8px;
+    font-size: 12px;
+}
+QScrollArea#scrollArea {
+    border: none;
+    background: transparent;
+}
+QScrollBar:vertical {
+    border: none;
+    background: #1E1E23;
+    width: 12px;
+    margin: 0px;
+}
+QScrollBar::handle:vertical {
+    background: #6A0DAD;
+    min-height: 30px;
+    border-radius: 6px;
+}
+QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
+    height: 0px;
+}
+QLabel#instructionsTitle {
+    padding: 15px;
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #6A0DAD, stop:1 #8A2BE2);
+    border-radius: 15px;
+    color: white;
+    font-size: 20px;
+}
+QFrame#separator {
+    background-color: #333;
+    margin: 15px 0;
+    max-height: 1px;
+}
+QLabel#sectionTitle {
+    color: #BB86FC;
+    margin-top: 10px;
+    font-size: 12px;
+}
+QLabel#sectionText {
+    color: #E0E0E0;
+    margin-bottom: 5px;
+    background: transparent;
+    font-size: 12px;
+}
+QWidget#instructionsContainer {
+    background-color: #1E1E1E;
+    border-radius: 8px;
+}
+QWidget {
+    background: rgba(30, 30, 35, 200);
+    border-radius: 8px;
+}
+"""
+
+LEGACY_STATUS = {
+    "active": "color: #27AE60; font-weight: bold; padding: 8px; font-size: 12px;",
+    "inactive": "color: #E74C3C; font-weight: bold; padding: 8px; font-size: 12px;",
+}
+
+
+def make_legacy(window):
+    """Окно в прежнем оформлении: без палитр и шрифтов ролей, одна таблица стилей"""
+    default_palette = QApplication.palette()
+    for widget in window.findChildren(QWidget):
+        widget.setPalette(default_palette)
+        widget.setFont(QApplication.font())
+        if widget.objectName() in ("titleLabel", "instructionsTitle"):
+            widget.setFont(QFont("Segoe UI", 28 if widget.objectName() == "titleLabel" else 20,
+                                 QFont.Bold))
+        elif widget.objectName() == "sectionTitle":
+            widget.setFont(QFont("Segoe UI", 12, QFont.Bold))
+        widget.setContentsMargins(0, 0, 0, 0)
+    window.setPalette(default_palette)
+    window.setStyleSheet(LEGACY_STYLESHEET)
+
+
+def median_us(action, rounds):
+    samples = []
+    for _ in range(rounds):
+        t0 = time.perf_counter()
+        action()
+        samples.append(time.perf_counter() - t0)
+    return statistics.median(samples) * 1e6
+
+
+def measure(window, restyle, rounds):
+    app = QApplication.instance()
+    window.show()
+    app.processEvents()
+    states = ["active", "inactive"]
+    repaint = median_us(window.repaint, rounds)
+    # Смена статуса вместе с перерисовкой метки, которую она вызывает
+    label = window.status_label
+    counter = iter(range(10 ** 9))
+
+    def toggle():
+        restyle(label, states[next(counter) % 2])
+        label.repaint()
+
+    toggle_cost = median_us(toggle, rounds)
+    window.hide()
+    return repaint, toggle_cost
+
+
+def main_bench():
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    app = QApplication.instance() or QApplication(sys.argv)
+    app.setStyle("Fusion")
+
+    legacy = gui.NoSleepApp()
+    make_legacy(legacy)
+    old = measure(legacy, lambda label, state: label.setStyleSheet(LEGACY_STATUS[state]), rounds)
+    legacy.power.close()
+
+    window = gui.NoSleepApp()
+    new = measure(window, theme.set_state, rounds)
+    window.power.close()
+
+    print(f"{'':24}{'таблица стилей':>16}{'роли':>10}")
+    print(f"{'перерисовка окна, мкс':24}{old[0]:16.0f}{new[0]:10.0f}")
+    print(f"{'смена статуса, мкс':24}{old[1]:16.1f}{new[1]:10.1f}")
+
+
+if __name__ == "__main__":
+    main_bench()
@@ -0,0 +1,111 @@
+"""Стоимость кадра анимации ModernToggle на платформе offscreen.
+
+Сравнивает прежнюю отрисовку (QPainter со сглаживанием, дорожка и кружок
+заново в каждом кадре) с выводом готовых pixmap, а затем считает
+перерисовки за одно переключение при разной частоте кадров анимации.
+
+Запуск: QT_QPA_PLATFORM=offscreen python benchmarks/bench_toggle.py [кадров]
+"""
+import os
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+# Настройки не читаются из профиля пользователя и не пишутся в него
+os.environ["XDG_CONFIG_HOME"] = tempfile.mkdtemp(prefix="no-sleep-bench-")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt5.QtCore import QElapsedTimer, QRect, Qt
+from PyQt5.QtGui import QColor, QImage, QPainter
+from PyQt5.QtWidgets import QApplication
+
+import gui
+from animation import governor
+from gui import GLOW_MARGIN, ModernToggle
+from metrics import registry
+
+
+class LegacyToggle(ModernToggle):
+    """Отрисовка кадра до кэша: все фигуры заново в каждом paintEvent"""
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        bg_rect = QRect(GLOW_MARGIN, GLOW_MARGIN, 60, 30)
+        glow_color = QColor(138, 43, 226, 150 if self.isChecked() else 100)
+        gui.glow_renderer.paint(painter, bg_rect, 15, self._glow_radius, glow_color)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(self._checked_bg_color if self.isChecked() else self._bg_color)
+        painter.drawRoundedRect(bg_rect, 15, 15)
+        painter.setBrush(self._circle_color)
+        painter.drawEllipse(QRect(GLOW_MARGIN + self._circle_position, GLOW_MARGIN + 3, 24, 24))
+
+
+def paint_cost(toggle, frames):
+    """Только paintEvent: отрисовка в изображение, без фона родителя"""
+    image = QImage(toggle.size(), QImage.Format_ARGB32_Premultiplied)
+    t0 = time.perf_counter()
+    for i in range(frames):
+        toggle._circle_position = 3 + i % 31
+        toggle.render(image)
+    return (time.perf_counter() - t0) / frames
+
+
+def repaint_cost(toggle, frames):
+    """Синхронная перерисовка в окне вместе с фоном группы под переключателем"""
+    t0 = time.perf_counter()
+    for i in range(frames):
+        toggle.set_circle_position(3 + i % 31)
+        toggle.repaint()
+    return (time.perf_counter() - t0) / frames
+
+
+def frames_per_switch(app, toggle, frame_rate):
+    """Перерисовки переключателя за одно переключение с анимацией"""
+    governor.set_frame_rate(frame_rate)
+    before = registry.value("nosleep_repaints_total", widget="ModernToggle")
+    toggle.setChecked(not toggle.isChecked())
+    timer = QElapsedTimer()
+    timer.start()
+    while timer.elapsed() < 700:
+        app.processEvents()
+        time.sleep(0.001)
+    return registry.value("nosleep_repaints_total", widget="ModernToggle") - before
+
+
+def main_bench():
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 3000
+    registry.enable()
+    app = QApplication.instance() or QApplication(sys.argv)
+    app.setStyle("Fusion")
+    window = gui.NoSleepApp()
+    window.show()
+    app.processEvents()
+
+    toggle = window.prevent_sleep_switch
+    legacy = LegacyToggle(toggle.parentWidget())
+    legacy.setChecked(toggle.isChecked())
+    legacy.move(toggle.pos())
+    legacy.show()
+    toggle.hide()
+    app.processEvents()
+    old = paint_cost(legacy, frames), repaint_cost(legacy, frames)
+    legacy.hide()
+    toggle.show()
+    app.processEvents()
+    new = paint_cost(toggle, frames), repaint_cost(toggle, frames)
+
+    print(f"{'мкс на кадр':24}{'прежняя':>10}{'pixmap':>10}")
+    print(f"{'paintEvent':24}{old[0] * 1e6:10.1f}{new[0] * 1e6:10.1f}")
+    print(f"{'repaint() в окне':24}{old[1] * 1e6:10.1f}{new[1] * 1e6:10.1f}")
+
+    for frame_rate, title in ((60, "60 кадров/с"), (30, "30 кадров/с"), (0, "без анимации")):
+        count = frames_per_switch(app, toggle, frame_rate)
+        print(f"перерисовок за переключение, {title}: {count}")
+    governor.set_frame_rate(60)
+    window.power.close()
+
+
+if __name__ == "__main__":
+    main_bench()
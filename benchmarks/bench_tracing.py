@@ -0,0 +1,158 @@
+"""Трассировка: цена выключенной и включенной записи и выгрузка для Chrome.
+
+1. Выключенная трассировка: кадр ModernToggle с оберткой @traced и без нее,
+   а также пустой метод с оберткой и без - разница на вызов.
+2. Включенная: цена одного отрезка; после 200 000 отрезков в буфере на
+   65 536 выгружаются последние записи по порядку.
+3. Окно на платформе offscreen с --trace: переключения кнопкой, наведение,
+   анимации; трассировка сохраняется по SIGUSR1 во время цикла Qt, и в
+   файле проверяются имена отрезков и потоки.
+
+Запуск: QT_QPA_PLATFORM=offscreen python benchmarks/bench_tracing.py
+"""
+import json
+import os
+import signal
+import statistics
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+os.environ["XDG_CONFIG_HOME"] = tempfile.mkdtemp(prefix="no-sleep-bench-")
+os.environ["XDG_RUNTIME_DIR"] = tempfile.mkdtemp(prefix="no-sleep-bench-")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import power
+from fakes import FakeBackend
+
+# Заглушка kernel32: все удержания идут в FakeBackend
+BACKEND = FakeBackend()
+power.windows_backend = lambda: BACKEND
+
+from PyQt5.QtCore import QEvent, QEventLoop, QPointF, QTimer
+from PyQt5.QtGui import QEnterEvent
+from PyQt5.QtWidgets import QApplication
+
+import gui
+from tracing import install_signal_handler, traced, tracer
+
+
+class Probe:
+    def plain(self):
+        pass
+
+    @traced()
+    def wrapped(self):
+        pass
+
+
+def per_call_ns(fn, calls=200_000, repeats=5):
+    samples = []
+    for _ in range(repeats):
+        t0 = time.perf_counter_ns()
+        for _ in range(calls):
+            fn()
+        samples.append((time.perf_counter_ns() - t0) / calls)
+    return statistics.median(samples)
+
+
+def run_loop(seconds):
+    loop = QEventLoop()
+    QTimer.singleShot(int(seconds * 1000), loop.quit)
+    loop.exec_()
+
+
+def toggle_frame_us(toggle, frames=2000):
+    def frame():
+        for i in range(frames):
+            toggle.set_circle_position(3 + i % 31)
+            toggle.repaint()
+    return per_call_ns(frame, calls=1, repeats=5) / frames / 1000
+
+
+def overhead_off(window):
+    probe = Probe()
+    plain = per_call_ns(probe.plain)
+    wrapped = per_call_ns(probe.wrapped)
+    toggle = window.prevent_sleep_switch
+    cls = type(toggle)
+    traced_paint = cls.paintEvent
+    raw, with_wrapper = [], []
+    for _ in range(5):  # Поочередно, чтобы прогрев не достался одному варианту
+        with_wrapper.append(toggle_frame_us(toggle))
+        cls.paintEvent = traced_paint.__wrapped__
+        raw.append(toggle_frame_us(toggle))
+        cls.paintEvent = traced_paint
+    return plain, wrapped, min(raw), min(with_wrapper)
+
+
+def overhead_on():
+    probe = Probe()
+    tracer.enable(65536)
+    plain = per_call_ns(probe.plain)
+    wrapped = per_call_ns(probe.wrapped, calls=200_000, repeats=1)
+    events = [event for event in tracer.events() if event["ph"] == "X"]
+    ordered = all(a["ts"] <= b["ts"] for a, b in zip(events, events[1:]))
+    tracer.disable()
+    return wrapped - plain, len(events), ordered
+
+
+def window_trace(app, window):
+    tracer.enable(65536)
+    saved = []
+    install_signal_handler(saved.append)
+    window.watch_signals()
+    governor = gui.governor
+    governor.set_visible(True)
+    for _ in range(10):
+        window.toggle_btn.click()
+        window.power.holder.wait()
+        app.sendEvent(window.toggle_btn, QEnterEvent(QPointF(5, 5), QPointF(5, 5), QPointF(5, 5)))
+        run_loop(0.05)
+        app.sendEvent(window.toggle_btn, QEvent(QEvent.Leave))
+        window.prevent_display_switch.click()
+        run_loop(0.05)
+    t0 = time.perf_counter()
+    os.kill(os.getpid(), signal.SIGUSR1)
+    while not saved and time.perf_counter() - t0 < 2.0:
+        app.processEvents()  # Цикл Qt без таймеров: будит только сокет пробуждения
+    latency = time.perf_counter() - t0
+    with open(saved[0], encoding="utf-8") as stream:
+        events = json.load(stream)["traceEvents"]
+    spans = {}
+    for event in events:
+        if event["ph"] == "X":
+            spans.setdefault(event["name"], []).append(event["dur"])
+    threads = sorted({event["args"]["name"] for event in events if event["ph"] == "M"})
+    return saved[0], latency, spans, threads
+
+
+def main_bench():
+    app = QApplication.instance() or QApplication(sys.argv)
+    app.setStyle("Fusion")
+    window = gui.NoSleepApp()
+    window.show()
+    app.processEvents()
+
+    plain, wrapped, raw_frame, traced_frame = overhead_off(window)
+    print(f"выключено: пустой метод {plain:.0f} нс, с @traced {wrapped:.0f} нс "
+          f"(+{wrapped - plain:.0f} нс); кадр ModernToggle {raw_frame:.2f} мкс без обертки, "
+          f"{traced_frame:.2f} мкс с оберткой")
+
+    cost, count, ordered = overhead_on()
+    print(f"включено: {cost:.0f} нс на отрезок; после 200000 отрезков выгружено {count}, "
+          f"по порядку: {ordered}")
+
+    path, latency, spans, threads = window_trace(app, window)
+    print(f"SIGUSR1 -> файл за {latency * 1e3:.1f} мс: {path}")
+    for name, durations in sorted(spans.items()):
+        print(f"  {name:<32}{len(durations):6} отрезков, медиана {statistics.median(durations):8.1f} мкс")
+    print(f"потоки: {', '.join(threads)}")
+    window.stop_keep_awake()
+    window.settings.close()
+    window.power.close()
+
+
+if __name__ == "__main__":
+    main_bench()
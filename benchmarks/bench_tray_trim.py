@@ -0,0 +1,100 @@
+"""Память в трее: окно показано и окно разобрано на платформе offscreen.
+
+Для каждого состояния выводятся RSS процесса, число живых виджетов и
+объектов Qt в дереве окна; затем - время повторной сборки окна из трея
+до первой отрисовки. Удержание включается, пока окно разобрано, и после
+сборки проверяется, что окно показывает активный сеанс с идущим временем.
+
+Запуск: QT_QPA_PLATFORM=offscreen python benchmarks/bench_tray_trim.py [повторов]
+"""
+import gc
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+# Настройки не читаются из профиля пользователя и не пишутся в него
+os.environ["XDG_CONFIG_HOME"] = tempfile.mkdtemp(prefix="no-sleep-bench-")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt5.QtCore import QEvent, QObject
+from PyQt5.QtWidgets import QApplication
+
+import gui
+from daemon import PowerService
+from power import PowerAssertionHolder
+from fakes import FakeBackend
+
+
+def rss_mb():
+    with open("/proc/self/status") as stream:
+        for line in stream:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) / 1024
+    return 0.0
+
+
+def settle(app):
+    for _ in range(3):
+        app.processEvents()
+        app.sendPostedEvents(None, QEvent.DeferredDelete)
+    gc.collect()
+
+
+def snapshot(app, window):
+    settle(app)
+    return rss_mb(), len(app.allWidgets()), len(window.findChildren(QObject))
+
+
+def main_bench():
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    app = QApplication.instance() or QApplication(sys.argv)
+    app.setStyle("Fusion")
+    window = gui.NoSleepApp()
+    window.power = PowerService(PowerAssertionHolder(FakeBackend()))
+    window.show()
+    # Обе страницы построены, как после обычной работы с окном
+    window.show_instructions()
+    settle(app)
+    window.show_main_page()
+    shown = snapshot(app, window)
+
+    window.hide()
+    window.release_view()
+    gui.trim_memory()
+    trimmed = snapshot(app, window)
+
+    # Сеанс начинается, пока окно разобрано
+    window.start_keep_awake()
+    time.sleep(1.1)
+
+    latencies = []
+    for i in range(rounds):
+        t0 = time.perf_counter()
+        window.show()  # Как show_from_tray(), без raise(): offscreen его не умеет
+        window.repaint()
+        latencies.append((time.perf_counter() - t0) * 1000)
+        if i == 0:
+            status = window.status_label.text()
+            uptime = window.uptime_label.text()
+            timer = window.timer.isActive()
+        if i < rounds - 1:
+            window.hide()
+            window.release_view()
+            settle(app)
+
+    print(f"{'':16}{'RSS, МБ':>9}{'виджеты':>9}{'объекты окна':>14}")
+    print(f"{'окно показано':16}{shown[0]:9.1f}{shown[1]:9}{shown[2]:14}")
+    print(f"{'окно разобрано':16}{trimmed[0]:9.1f}{trimmed[1]:9}{trimmed[2]:14}")
+    print(f"сборка из трея: медиана {statistics.median(latencies):.1f} мс, "
+          f"первая {latencies[0]:.1f} мс")
+    print(f"после сборки: {status!r}, {uptime!r}, таймер времени работы: {timer}")
+    window.stop_keep_awake()
+    window.settings.close()
+    window.power.close()
+
+
+if __name__ == "__main__":
+    main_bench()
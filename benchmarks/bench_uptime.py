@@ -0,0 +1,67 @@
+"""Проверка таймера времени работы: пробуждения в трее и точность после зависания.
+
+1. Окно видно: таймер срабатывает раз в секунду на границе секунды.
+2. Окно скрыто (режим трея): ни одного срабатывания таймера.
+3. Цикл событий GUI блокируется на несколько секунд: после него время
+   работы совпадает с реальным, а не отстает на пропущенные тики.
+
+Запуск: QT_QPA_PLATFORM=offscreen python benchmarks/bench_uptime.py
+"""
+import os
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+# Настройки не читаются из профиля пользователя и не пишутся в него
+os.environ["XDG_CONFIG_HOME"] = tempfile.mkdtemp(prefix="no-sleep-bench-")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt5.QtWidgets import QApplication
+from PyQt5.QtCore import QEventLoop, QTimer
+
+import gui
+from daemon import PowerService
+from power import PowerAssertionHolder
+from fakes import FakeBackend
+
+
+def run_loop(seconds):
+    loop = QEventLoop()
+    QTimer.singleShot(int(seconds * 1000), loop.quit)
+    loop.exec_()
+
+
+def main():
+    app = QApplication.instance() or QApplication(sys.argv)
+    window = gui.NoSleepApp()
+    window.power = PowerService(PowerAssertionHolder(FakeBackend()))
+    ticks = []
+    window.timer.timeout.connect(lambda: ticks.append(time.monotonic()))
+
+    window.show()
+    window.start_keep_awake()
+    run_loop(3.2)
+    visible_ticks = len(ticks)
+    offsets = [(t - window.session_started) % 1 for t in ticks]
+    print(f"окно видно 3.2 с: срабатываний {visible_ticks}, "
+          f"смещение от границы секунды до {max(offsets) * 1000:.1f} мс")
+
+    window.hide()
+    ticks.clear()
+    run_loop(5.0)
+    print(f"окно скрыто 5 с: срабатываний {len(ticks)}")
+
+    window.show()
+    app.processEvents()
+    time.sleep(2.5)  # Зависание цикла событий
+    app.processEvents()
+    real = time.monotonic() - window.session_started
+    print(f"после зависания 2.5 с: показано {window.uptime_label.text()!r}, "
+          f"реально {real:.2f} с, расхождение {int(real) - window.uptime_seconds} с")
+
+    window.quit_application()
+
+
+if __name__ == "__main__":
+    main()
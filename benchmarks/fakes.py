@@ -0,0 +1,22 @@
+"""Общие заглушки для бенчмарков."""
+import threading
+import time
+
+from power import ES_CONTINUOUS
+
+
+class FakeBackend:
+    """Замена SetThreadExecutionState, фиксирующая момент каждого вызова"""
+
+    def __init__(self):
+        self.calls = 0
+        self.state = ES_CONTINUOUS
+        self.changed = threading.Event()
+        self.stamp = 0.0
+
+    def __call__(self, flags):
+        self.calls += 1
+        self.state = flags
+        self.stamp = time.perf_counter()
+        self.changed.set()
+        return ES_CONTINUOUS
@@ -0,0 +1,118 @@
+"""Гонка одновременных запусков: выживает ровно один экземпляр GUI.
+
+В каждом раунде одновременно стартуют N процессов main.py. Ожидается, что
+N-1 из них передадут аргументы через канал экземпляра и завершатся с кодом 0,
+не загрузив Qt, а работающий экземпляр примет ровно N-1 команд. Выживший
+завершается через SIGKILL, поэтому следующий раунд проверяет и захват
+канала после упавшего экземпляра (зависшие сокет и файл блокировки).
+Отдельно: экземпляр, который отвечает ошибкой или закрывает соединение,
+не дав ответа, - повторный запуск завершается с кодом 1 без трассировки.
+
+Запуск: python benchmarks/race_single_instance.py [раундов] [процессов]
+"""
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+RUNTIME_DIR = tempfile.mkdtemp(prefix="no-sleep-race-")
+os.environ["XDG_RUNTIME_DIR"] = RUNTIME_DIR
+os.environ["XDG_CONFIG_HOME"] = tempfile.mkdtemp(prefix="no-sleep-race-")
+
+from daemon import ControlClient
+from instance import forward, instance_address
+
+LAUNCH = """
+import sys, time
+t0 = time.perf_counter()
+if sys.platform != "win32":
+    import power
+    power.windows_backend = lambda: (lambda flags: 0)
+import main
+code = main.main(["--show"])
+qt = any(name.startswith("PyQt5") for name in sys.modules)
+print(f"{(time.perf_counter() - t0) * 1e3:.2f} {'qt' if qt else 'qt-free'}")
+sys.exit(code)
+"""
+
+
+def run_round(count):
+    env = dict(os.environ, QT_QPA_PLATFORM=os.environ.get("QT_QPA_PLATFORM", "offscreen"))
+    procs = [subprocess.Popen([sys.executable, "-c", LAUNCH], cwd=ROOT, env=env,
+                              stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+             for _ in range(count)]
+    deadline = time.monotonic() + 30
+    while sum(proc.poll() is None for proc in procs) > 1 and time.monotonic() < deadline:
+        time.sleep(0.05)
+    alive = [proc for proc in procs if proc.poll() is None]
+    exited = [proc for proc in procs if proc.poll() is not None]
+    codes = [proc.returncode for proc in exited]
+    outputs = [proc.stdout.read().decode().split() for proc in exited]
+
+    client = ControlClient(instance_address())
+    try:
+        status = client.request("status")
+    finally:
+        client.close()
+    for proc in alive:
+        proc.kill()
+        proc.wait()
+    for proc in procs:
+        proc.stdout.close()
+
+    assert len(alive) == 1, f"живых экземпляров: {len(alive)}"
+    assert status["pid"] == alive[0].pid, "на канал ответил не выживший процесс"
+    assert codes == [0] * (count - 1), f"коды возврата: {codes}"
+    assert all(output[1] == "qt-free" for output in outputs), "повторный запуск загрузил Qt"
+    assert status["commands"] == count - 1, f"принято команд: {status['commands']}"
+    return [float(output[0]) for output in outputs]
+
+
+def bad_peer(reply):
+    """Код возврата forward() экземпляру, который читает команду и отвечает reply"""
+    address = os.path.join(tempfile.mkdtemp(prefix="no-sleep-race-"), "bad.sock")
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    listener.bind(address)
+    listener.listen(1)
+
+    def serve():
+        conn, _ = listener.accept()
+        conn.recv(65536)
+        conn.sendall(reply)
+        conn.close()
+
+    thread = threading.Thread(target=serve)
+    thread.start()
+    try:
+        return forward(["--show"], address=address, timeout=2.0)
+    finally:
+        thread.join()
+        listener.close()
+
+
+def main():
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    count = int(sys.argv[2]) if len(sys.argv) > 2 else 16
+    timings = []
+    for number in range(1, rounds + 1):
+        round_timings = run_round(count)
+        timings += round_timings
+        print(f"раунд {number}: {count} запусков, выжил 1, переданных команд {count - 1}, "
+              f"повторный запуск до выхода: медиана {statistics.median(round_timings):.1f} мс")
+    print(f"итого {rounds} раундов: от main() до выхода повторного запуска "
+          f"медиана {statistics.median(timings):.1f} мс, максимум {max(timings):.1f} мс")
+    if sys.platform != "win32":
+        codes = [bad_peer(b'{"ok": false, "error": "x"}\n'), bad_peer(b""), bad_peer(b"{\n")]
+        print(f"экземпляр с ошибкой, обрывом и не-JSON в ответ: коды возврата {codes}")
+        assert codes == [1, 1, 1], codes
+
+
+if __name__ == "__main__":
+    main()
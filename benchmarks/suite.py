@@ -0,0 +1,255 @@
+"""Воспроизводимый набор бенчмарков No-Sleep.
+
+Работает в Linux на платформе Qt offscreen; SetThreadExecutionState
+заменяется заглушкой, канал службы направляется во временный каталог.
+Измеряет:
+
+- время создания NoSleepApp и первой отрисовки;
+- задержку toggle_keep_awake до вызова API питания (запуск и остановка);
+- стоимость кадра и смены цветов GlowButton, кадра ModernToggle;
+- пробуждения в минуту в режиме трея (таймеры Qt и фоновые потоки);
+- потребление памяти (RSS).
+
+Результаты сохраняются в JSON; при сравнении с базовым прогоном рост любой
+метрики сверх порога считается регрессией (код возврата 1).
+
+Запуск:
+    python benchmarks/suite.py --output run.json
+    python benchmarks/suite.py --baseline run.json --threshold 0.25
+"""
+import argparse
+import json
+import os
+import platform
+import resource
+import statistics
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+os.environ["XDG_RUNTIME_DIR"] = tempfile.mkdtemp(prefix="no-sleep-bench-")
+os.environ["XDG_CONFIG_HOME"] = tempfile.mkdtemp(prefix="no-sleep-bench-")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import power
+from fakes import FakeBackend
+
+# Заглушка kernel32: все удержания идут в FakeBackend
+BACKEND = FakeBackend()
+power.windows_backend = lambda: BACKEND
+
+from PyQt5.QtWidgets import QApplication
+from PyQt5.QtCore import QEventLoop, QObject, QTimer, QEvent, QT_VERSION_STR
+from PyQt5.QtGui import QColor
+
+import gui
+from metrics import registry
+
+# Все метрики набора: чем меньше, тем лучше
+UNITS = {
+    "construct_ms": "мс",
+    "first_paint_ms": "мс",
+    "toggle_start_us": "мкс",
+    "toggle_stop_us": "мкс",
+    "glow_button_frame_us": "мкс",
+    "glow_button_restyle_us": "мкс",
+    "toggle_frame_us": "мкс",
+    "tray_wakeups_per_min": "1/мин",
+    "rss_mb": "МБ",
+    "peak_rss_mb": "МБ",
+}
+
+
+class TimerEventCounter(QObject):
+    """Фильтр событий, считающий все срабатывания таймеров Qt в приложении"""
+
+    def __init__(self):
+        super().__init__()
+        self.count = 0
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Timer:
+            self.count += 1
+        return False
+
+
+def run_loop(seconds):
+    loop = QEventLoop()
+    QTimer.singleShot(int(seconds * 1000), loop.quit)
+    loop.exec_()
+
+
+def median_time(fn, repeats):
+    samples = []
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - t0)
+    return statistics.median(samples)
+
+
+def current_rss_mb():
+    try:
+        with open("/proc/self/statm") as stream:
+            pages = int(stream.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / 2 ** 20
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def bench_construct(app, repeats):
+    windows = []
+
+    def construct():
+        windows.append(gui.NoSleepApp())
+
+    construct_s = median_time(construct, repeats)
+
+    def first_paint():
+        window = windows.pop()
+        window.show()
+        window.repaint()
+        app.processEvents()
+        window.hide()
+
+    paint_s = median_time(first_paint, min(repeats, len(windows)))
+    return {"construct_ms": construct_s * 1e3, "first_paint_ms": paint_s * 1e3}
+
+
+def bench_toggle(window, repeats):
+    start, stop = [], []
+    holder = window.power.holder
+    for _ in range(repeats):
+        BACKEND.changed.clear()
+        t0 = time.perf_counter()
+        window.toggle_keep_awake()
+        holder.wait()
+        start.append(BACKEND.stamp - t0)
+
+        BACKEND.changed.clear()
+        t0 = time.perf_counter()
+        window.toggle_keep_awake()
+        holder.wait()
+        stop.append(BACKEND.stamp - t0)
+    return {"toggle_start_us": statistics.median(start) * 1e6,
+            "toggle_stop_us": statistics.median(stop) * 1e6}
+
+
+def bench_paint(window, frames):
+    button = window.toggle_btn
+    colors = [QColor(39 + i % 18, 174, 96) for i in range(frames)]
+
+    def button_frames():
+        for color in colors:
+            button.color = color
+            button.repaint()
+
+    def restyle():
+        for i in range(frames):
+            button.set_colors("#E74C3C", "#C0392B") if i % 2 else button.set_colors("#27AE60", "#2ECC71")
+
+    toggle = window.prevent_sleep_switch
+
+    def toggle_frames():
+        for i in range(frames):
+            toggle.set_circle_position(3 + i % 31)
+            toggle.repaint()
+
+    return {"glow_button_frame_us": median_time(button_frames, 3) / frames * 1e6,
+            "glow_button_restyle_us": median_time(restyle, 3) / frames * 1e6,
+            "toggle_frame_us": median_time(toggle_frames, 3) / frames * 1e6}
+
+
+def bench_tray_wakeups(app, window, seconds):
+    counter = TimerEventCounter()
+    app.installEventFilter(counter)
+    window.start_keep_awake()
+    window.hide()
+    run_loop(1.0)  # Завершение анимаций после запуска
+    counter.count = 0
+    threads_before = registry.value("nosleep_thread_wakeups_total", thread="power")
+    run_loop(seconds)
+    thread_wakeups = registry.value("nosleep_thread_wakeups_total", thread="power") - threads_before
+    app.removeEventFilter(counter)
+    window.stop_keep_awake()
+    # Срабатывание таймера, завершающего run_loop, не считается
+    timer_wakeups = max(0, counter.count - 1)
+    return {"tray_wakeups_per_min": (timer_wakeups + thread_wakeups) * 60 / seconds}
+
+
+def run_suite(quick=False):
+    registry.enable()
+    app = QApplication.instance() or QApplication(sys.argv)
+    app.setStyle("Fusion")
+    repeats = 5 if quick else 20
+    results = {}
+    results.update(bench_construct(app, repeats))
+
+    window = gui.NoSleepApp()
+    window.show()
+    app.processEvents()
+    results.update(bench_toggle(window, 50 if quick else 500))
+    results.update(bench_paint(window, 100 if quick else 600))
+    results.update(bench_tray_wakeups(app, window, 2.0 if quick else 10.0))
+    results["rss_mb"] = current_rss_mb()
+    results["peak_rss_mb"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    window.quit_application()
+    return results
+
+
+def compare(results, baseline, threshold):
+    """Список регрессий: метрики, выросшие больше чем на threshold"""
+    regressions = []
+    for name, value in results.items():
+        base = baseline.get(name)
+        if base is None:
+            continue
+        # Для нулевой базы (пробуждения) допускается рост до 1
+        limit = base * (1 + threshold) if base > 0 else 1.0
+        if value > limit:
+            regressions.append((name, base, value))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Бенчмарки No-Sleep")
+    parser.add_argument("--output", help="файл для сохранения результатов (JSON)")
+    parser.add_argument("--baseline", help="результаты базового прогона для сравнения")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="допустимый относительный рост метрик (по умолчанию 0.25)")
+    parser.add_argument("--quick", action="store_true", help="короткий прогон")
+    args = parser.parse_args()
+
+    results = run_suite(args.quick)
+    report = {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "qt": QT_VERSION_STR,
+            "platform": platform.platform(),
+            "qpa": os.environ["QT_QPA_PLATFORM"],
+            "quick": args.quick,
+        },
+        "results": results,
+    }
+    for name, value in results.items():
+        print(f"{name:<24} {value:12.2f} {UNITS[name]}")
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as stream:
+            json.dump(report, stream, ensure_ascii=False, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as stream:
+            baseline = json.load(stream)["results"]
+        regressions = compare(results, baseline, args.threshold)
+        for name, base, value in regressions:
+            print(f"РЕГРЕССИЯ {name}: {base:.2f} -> {value:.2f} {UNITS.get(name, '')}")
+        if regressions:
+            return 1
+        print(f"регрессий нет (порог {args.threshold:.0%})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,399 @@
+"""Разбор аргументов командной строки и режим без окна (--headless).
+
+Модуль не импортирует Qt: в режиме без окна загружаются только ctypes и
+стандартная библиотека.
+"""
+import argparse
+import re
+import signal
+import sys
+import threading
+import time
+
+from history import default_history
+from power import PowerAssertionHolder, keep_awake_flags
+from scheduler import Scheduler, SchedulerThread, next_time_of_day, parse_window
+from tracing import DEFAULT_SIZE as DEFAULT_TRACE_SIZE
+
+_DURATION_RE = re.compile(r"(\d+(?:\.\d+)?)([hms])")
+_UNIT_SECONDS = {"h": 3600, "m": 60, "s": 1}
+
+# В Windows ожидание события не прерывается по Ctrl+C, поэтому там ждем частями
+_WAIT_SLICE = 1.0 if sys.platform == "win32" else None
+
+
+def parse_duration(text):
+    """Длительность вида 2h, 90m, 1h30m, 45s; число без единицы - минуты"""
+    text = text.strip().lower()
+    if re.fullmatch(r"\d+(?:\.\d+)?", text):
+        return float(text) * 60
+    pos, total = 0, 0.0
+    for match in _DURATION_RE.finditer(text):
+        if match.start() != pos:
+            break
+        total += float(match.group(1)) * _UNIT_SECONDS[match.group(2)]
+        pos = match.end()
+    if pos != len(text) or not text:
+        raise argparse.ArgumentTypeError(f"неверная длительность: {text!r}")
+    return total
+
+
+def parse_until(text):
+    """Время окончания "ЧЧ:ММ" -> метка time.time() ближайшего такого момента"""
+    try:
+        return next_time_of_day(text)
+    except ValueError as error:
+        raise argparse.ArgumentTypeError(str(error))
+
+
+def parse_window_arg(text):
+    """Повторяющееся окно "mon-fri 09:00-18:00" """
+    try:
+        return parse_window(text)
+    except ValueError as error:
+        raise argparse.ArgumentTypeError(str(error))
+
+
+def build_parser():
+    """Парсер аргументов No-Sleep"""
+    parser = argparse.ArgumentParser(
+        prog="no-sleep",
+        description="Предотвращение сна и отключения экрана Windows")
+    parser.add_argument("--headless", action="store_true",
+                        help="работать без окна и трея (для скриптов и планировщика)")
+    parser.add_argument("--daemon", action="store_true",
+                        help="запустить фоновую службу с каналом управления")
+    parser.add_argument("--status", action="store_true",
+                        help="показать состояние запущенной службы и выйти")
+    parser.add_argument("--history", nargs="?", const=7, type=int, metavar="ДНЕЙ",
+                        help="показать историю удержания за последние дни (по умолчанию 7) и выйти")
+    parser.add_argument("--show", action="store_true",
+                        help="показать окно (если программа уже запущена - ее окно)")
+    parser.add_argument("--toggle", action="store_true",
+                        help="запустить или остановить удержание в запущенной программе")
+    parser.add_argument("--system", action="store_true",
+                        help="предотвращать спящий режим")
+    parser.add_argument("--display", action="store_true",
+                        help="предотвращать отключение дисплея")
+    parser.add_argument("--metrics-file", metavar="ПУТЬ",
+                        help="включить метрики и выгружать их в файл (формат Prometheus)")
+    parser.add_argument("--metrics-port", type=int, metavar="ПОРТ",
+                        help="включить метрики и отдавать их на http://127.0.0.1:ПОРТ")
+    parser.add_argument("--trace", nargs="?", const=DEFAULT_TRACE_SIZE, type=int, metavar="ОТРЕЗКОВ",
+                        help="записывать трассировку горячих путей в кольцевой буфер "
+                             f"(по умолчанию {DEFAULT_TRACE_SIZE} отрезков); сохраняется из меню "
+                             "трея или по сигналу SIGUSR1")
+    parser.add_argument("--power-events", metavar="ФАЙЛ",
+                        help="воспроизвести записанные события питания (JSON Lines) "
+                             "вместо системных уведомлений")
+    parser.add_argument("--for", dest="duration", type=parse_duration, metavar="ВРЕМЯ",
+                        help="удерживать указанное время (2h, 90m, 1h30m), затем выйти")
+    parser.add_argument("--until", type=parse_until, metavar="ЧЧ:ММ",
+                        help="удерживать до указанного времени суток")
+    parser.add_argument("--window", action="append", type=parse_window_arg, metavar="ОКНО",
+                        help='повторяющееся окно удержания, например "mon-fri 09:00-18:00" '
+                             "(можно указать несколько раз)")
+    parser.add_argument("--pid", action="append", type=int, metavar="PID",
+                        help="удерживать, пока работает процесс (можно указать несколько раз)")
+    parser.add_argument("--process", action="append", metavar="ИМЯ",
+                        help='удерживать, пока работают процессы с таким именем, например '
+                             '"blender" или "rsync*" (можно указать несколько раз)')
+    parser.add_argument("--while-busy", action="store_true",
+                        help="не давать системе заснуть, пока загружены CPU, диск или сеть")
+    parser.add_argument("--quiet", type=parse_duration, default=300.0, metavar="ВРЕМЯ",
+                        help="период тишины перед отпусканием в режиме --while-busy "
+                             "(по умолчанию 5m)")
+    parser.add_argument("--cpu-threshold", type=float, default=20.0, metavar="ПРОЦЕНТ",
+                        help="порог загрузки CPU, %% (по умолчанию 20)")
+    parser.add_argument("--disk-threshold", type=float, default=1024.0, metavar="КБ/С",
+                        help="порог обмена с диском, КБ/с (по умолчанию 1024)")
+    parser.add_argument("--net-threshold", type=float, default=128.0, metavar="КБ/С",
+                        help="порог сетевого трафика, КБ/с (по умолчанию 128)")
+    parser.add_argument("--animation-fps", type=int, metavar="КАДРОВ",
+                        help="наибольшая частота кадров анимаций (по умолчанию 60); 0 - без анимации")
+    return parser
+
+
+def parse_args(argv=None):
+    """Разбор аргументов; неизвестные аргументы остаются для Qt"""
+    args, _ = build_parser().parse_known_args(argv)
+    return args
+
+
+def selected_flags(args):
+    """Флаги из аргументов; без --system и --display удерживается и то и другое"""
+    if not args.system and not args.display:
+        return keep_awake_flags(system=True, display=True)
+    return keep_awake_flags(system=args.system, display=args.display)
+
+
+def start_metrics(args):
+    """Включение метрик и их выгрузки, если это запрошено аргументами"""
+    if args.metrics_file is None and args.metrics_port is None:
+        return
+    import metrics
+
+    metrics.registry.enable()
+    if args.metrics_file is not None:
+        metrics.start_textfile_exporter(args.metrics_file)
+    if args.metrics_port is not None:
+        metrics.start_http_exporter(args.metrics_port)
+
+
+def start_tracing(args):
+    """Включение трассировки и ее сохранения по сигналу, если это запрошено"""
+    if args.trace is None:
+        return
+    from tracing import install_signal_handler, tracer
+
+    tracer.enable(args.trace)
+    install_signal_handler(lambda path: print(f"Трассировка сохранена: {path}", file=sys.stderr))
+
+
+def start_power_events(args, on_event):
+    """Запуск источника событий питания; None, если источника нет"""
+    from powerevents import make_source
+
+    try:
+        source = make_source(on_event, args.power_events)
+        if source is not None:
+            source.start()
+    except (OSError, ValueError) as error:
+        print(f"События питания недоступны: {error}", file=sys.stderr)
+        return None
+    return source
+
+
+def schedule_from_args(args, scheduler, flags):
+    """Окна расписания из --for, --until и --window; True, если они заданы"""
+    now = scheduler.clock()
+    if args.duration is not None:
+        scheduler.add_once(now, now + args.duration, flags)
+    if args.until is not None:
+        scheduler.add_once(now, args.until, flags)
+    for days, start, end in args.window or ():
+        scheduler.add_recurring(days, start, end, flags)
+    return len(scheduler) > 0
+
+
+def watch_from_args(args, watcher):
+    """Процессы из --pid и --process; возвращает PID, которых не оказалось"""
+    missing = [pid for pid in args.pid or () if not watcher.watch_pid(pid)]
+    for pattern in args.process or ():
+        watcher.watch_name(pattern)
+    return missing
+
+
+def configure_activity(args, monitor):
+    """Пороги и период тишины режима --while-busy"""
+    monitor.quiet = args.quiet
+    monitor.thresholds = (args.cpu_threshold / 100, args.disk_threshold * 1024,
+                          args.net_threshold * 1024)
+
+
+def format_hms(seconds):
+    """Длительность в виде ЧЧ:ММ:СС"""
+    seconds = int(seconds)
+    return f"{seconds // 3600:02d}:{seconds % 3600 // 60:02d}:{seconds % 60:02d}"
+
+
+def print_status(args):
+    """Вывод состояния службы без запуска GUI"""
+    from daemon import ControlClient
+
+    try:
+        client = ControlClient()
+    except OSError:
+        print("Служба No-Sleep не запущена")
+        return 1
+    try:
+        status = client.status()
+    finally:
+        client.close()
+    if not status["active"]:
+        print("Неактивно")
+        return 0
+    modes = [name for name, on in (("сон", status["system"]), ("дисплей", status["display"])) if on]
+    print(f"Активно {format_hms(status['uptime'])} ({', '.join(modes) or 'без флагов'})")
+    return 0
+
+
+FLAG_NAMES = {1: "сон", 2: "дисплей", 3: "сон+дисплей"}
+
+
+def format_history(history, days=7, today=None):
+    """Строки сводки истории: по дням за последние days дней и итог"""
+    from datetime import date, timedelta
+
+    today = today or date.today()
+    first = today - timedelta(days=days - 1)
+    lines = []
+    for day, per_flags in history.daily(first, today):
+        parts = [f"{FLAG_NAMES[flags]} {format_hms(seconds)}"
+                 for flags, seconds in sorted(per_flags.items())]
+        lines.append(f"{day:%Y-%m-%d}  {', '.join(parts) or '-'}")
+    totals = history.totals(first, today)
+    total = sum(seconds for _, seconds in totals.values())
+    count = sum(sessions for sessions, _ in totals.values())
+    lines.append(f"Итого: {format_hms(total)}, сеансов: {count}")
+    return lines
+
+
+def print_history(args):
+    """Вывод истории удержания из индекса, без чтения журнала целиком"""
+    for line in format_history(default_history(), max(1, args.history)):
+        print(line)
+    return 0
+
+
+def wait_for_stop(duration=None, stop=None):
+    """Ожидание SIGINT/SIGTERM, события stop или истечения duration секунд"""
+    stop = stop or threading.Event()
+
+    def on_signal(signum, frame):
+        stop.set()
+
+    signal.signal(signal.SIGINT, on_signal)
+    signal.signal(signal.SIGTERM, on_signal)
+    try:
+        deadline = None if duration is None else time.monotonic() + duration
+        while not stop.is_set():
+            timeout = None if deadline is None else deadline - time.monotonic()
+            if timeout is not None and timeout <= 0:
+                break
+            if _WAIT_SLICE is not None:
+                timeout = _WAIT_SLICE if timeout is None else min(timeout, _WAIT_SLICE)
+            stop.wait(timeout)
+    except KeyboardInterrupt:
+        pass
+
+
+def run_headless(args, holder=None):
+    """Удержание без графического интерфейса до истечения времени или сигнала"""
+    from powerevents import PowerPolicy
+
+    holder = holder or PowerAssertionHolder(history=default_history())
+    policy = PowerPolicy(holder)
+    events = start_power_events(args, policy)
+    try:
+        if args.pid or args.process:
+            return run_watched(args, holder)
+        if args.while_busy:
+            return run_busy(args, holder)
+        if args.until is not None or args.window:
+            return run_scheduled(args, holder, policy)
+        return run_held(args, holder)
+    finally:
+        if events is not None:
+            events.stop()
+
+
+def run_held(args, holder):
+    """Удержание до истечения --for или сигнала"""
+    holder.hold(selected_flags(args))
+    holder.wait()
+    limit = f" на {args.duration:.0f} с" if args.duration is not None else ""
+    print(f"No-Sleep активирован{limit}. Для остановки нажмите Ctrl+C", file=sys.stderr)
+    try:
+        wait_for_stop(args.duration)
+    finally:
+        holder.release()
+        holder.close()
+    print("No-Sleep деактивирован. Нормальный режим сна восстановлен", file=sys.stderr)
+    return 0
+
+
+def run_scheduled(args, holder, policy=None):
+    """Удержание по расписанию (--until, --window): выход, когда активных окон
+    и будущих переходов не осталось, или по сигналу"""
+    from powerevents import RESUME
+
+    stop = threading.Event()
+
+    def on_power_event(event):
+        # Во сне монотонное ожидание драйвера стоит: переходы перепроверяются
+        if event.kind == RESUME:
+            scheduler.resync()
+
+    def on_change(flags):
+        if flags:
+            holder.hold(flags)
+            print("No-Sleep активирован по расписанию", file=sys.stderr)
+        else:
+            holder.release()
+            # on_change вызывается после обработки всех наступивших переходов
+            if scheduler.next_transition() is None:
+                stop.set()
+            else:
+                print("No-Sleep деактивирован по расписанию", file=sys.stderr)
+
+    scheduler = Scheduler(on_change=on_change)
+    driver = SchedulerThread(scheduler)
+    if policy is not None:
+        policy.on_event = on_power_event
+    schedule_from_args(args, scheduler, selected_flags(args))
+    driver.start()
+    print("No-Sleep работает по расписанию. Для остановки нажмите Ctrl+C", file=sys.stderr)
+    try:
+        wait_for_stop(stop=stop)
+    finally:
+        driver.stop()
+        holder.close()  # Снимает удержание, если оно было
+    print("No-Sleep деактивирован. Нормальный режим сна восстановлен", file=sys.stderr)
+    return 0
+
+
+def run_watched(args, holder):
+    """Удержание, пока работают процессы из --pid и --process"""
+    from procwatch import ProcessWatcher
+
+    stop = threading.Event()
+    flags = selected_flags(args)
+
+    def on_change(alive):
+        if alive:
+            holder.hold(flags)
+        else:
+            stop.set()
+
+    watcher = ProcessWatcher(on_change=on_change)
+    try:
+        for pid in watch_from_args(args, watcher):
+            print(f"Процесс {pid} не найден", file=sys.stderr)
+        if not watcher.alive:
+            print("Нет работающих процессов для слежения", file=sys.stderr)
+            return 1
+        print(f"No-Sleep активирован, пока работают процессы ({len(watcher.pids)}). "
+              "Для остановки нажмите Ctrl+C", file=sys.stderr)
+        wait_for_stop(stop=stop)
+    finally:
+        watcher.close()
+        holder.close()  # Снимает удержание, если оно было
+    print("No-Sleep деактивирован. Нормальный режим сна восстановлен", file=sys.stderr)
+    return 0
+
+
+def run_busy(args, holder):
+    """Удержание сна системы, пока машина занята, до сигнала"""
+    from activity import ActivityMonitor
+    from power import ES_SYSTEM_REQUIRED
+
+    def on_change(busy):
+        if busy:
+            holder.hold(ES_SYSTEM_REQUIRED)
+            print("Система занята: сон запрещен", file=sys.stderr)
+        else:
+            holder.release()
+            print("Система затихла: обычный режим сна", file=sys.stderr)
+
+    monitor = ActivityMonitor(on_change=on_change)
+    configure_activity(args, monitor)
+    print("No-Sleep следит за нагрузкой. Для остановки нажмите Ctrl+C", file=sys.stderr)
+    monitor.start()
+    try:
+        wait_for_stop(args.duration)
+    finally:
+        monitor.close()
+        holder.close()  # Снимает удержание, если оно было
+    print("No-Sleep деактивирован. Нормальный режим сна восстановлен", file=sys.stderr)
+    return 0
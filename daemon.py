@@ -0,0 +1,616 @@
+"""Фоновая служба No-Sleep с локальным каналом управления.
+
+Команды передаются построчно в JSON: {"cmd": "start", "system": true,
+"display": false}, {"cmd": "stop"}, {"cmd": "status"}, {"cmd": "set-flags",
+...}. Ответ - одна строка JSON с полем "ok" и текущим состоянием, включая
+длительность сеанса "uptime" в секундах.
+
+Кроме ручного сеанса, скрипты и задания могут держать свои аренды:
+{"cmd": "acquire", "system": true, "ttl": 30, "owner": "backup"} отвечает
+номером "lease", {"cmd": "renew", "lease": N} продлевает аренду,
+{"cmd": "release", "lease": N} снимает ее. Удерживается объединение флагов
+ручного сеанса и всех аренд.
+
+В Linux канал - Unix-сокет, в Windows - именованный канал. Модуль не
+импортирует Qt.
+"""
+import json
+import os
+import selectors
+import socket
+import sys
+import threading
+import time
+
+from history import default_history
+from leases import LeaseManager
+from metrics import registry
+from power import (ES_SYSTEM_REQUIRED, ES_DISPLAY_REQUIRED, PowerAssertionHolder,
+                   keep_awake_flags)
+from scheduler import SchedulerThread
+
+# Предел длины одной команды; более длинная строка разрывает соединение
+MAX_LINE = 64 * 1024
+
+CONTROL_COMMANDS = registry.counter("nosleep_control_commands_total",
+                                    "Команды канала управления")
+CONTROL_COMMAND_SECONDS = registry.histogram("nosleep_control_command_seconds",
+                                             "Время обработки команды канала управления")
+
+
+def default_address():
+    """Адрес канала управления для текущего пользователя"""
+    if sys.platform == "win32":
+        return r"\\.\pipe\no-sleep-" + os.environ.get("USERNAME", "user")
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if not runtime_dir:
+        import tempfile  # Нужен редко, а импортируется заметное время
+        runtime_dir = tempfile.gettempdir()
+    return os.path.join(runtime_dir, f"no-sleep-{os.getuid()}.sock")
+
+
+class PowerService:
+    """Обработчик команд поверх PowerAssertionHolder
+
+    Используется и службой, и графическим интерфейсом без службы, поэтому
+    у него тот же набор методов, что и у ControlClient. Ручной сеанс - одна
+    из аренд LeaseManager; система вызывается, только когда меняется
+    объединение флагов всех аренд.
+
+    on_change(flags) передается потоку питания, в том числе переданному
+    holder; у него не должно быть другого обработчика.
+    """
+
+    def __init__(self, holder=None, on_change=None):
+        if holder is None:
+            holder = PowerAssertionHolder(history=default_history(), on_change=on_change)
+        elif on_change is not None:
+            if holder.on_change not in (None, on_change):
+                raise ValueError("у потока питания уже есть обработчик on_change")
+            holder.on_change = on_change
+        self.holder = holder
+        self._lock = threading.Lock()
+        self.leases = LeaseManager(on_change=self._apply)
+        self._driver = None  # Поток сроков аренд; запускается с первой арендой со сроком
+        self._session = None  # Номер аренды ручного сеанса
+        self._flags = keep_awake_flags()
+        self._started = 0.0  # time.monotonic() начала сеанса удержания
+
+    def start(self, flags=None):
+        """Начать удержание (с новыми флагами, если они переданы)"""
+        with self._lock:
+            if flags is not None:
+                self._flags = flags
+            if self._session is None:
+                self._started = time.monotonic()
+                self._session = self.leases.acquire(self._flags, owner="session")
+            else:
+                self.leases.update(self._session, self._flags)
+            return self._status()
+
+    def stop(self):
+        """Снять удержание"""
+        with self._lock:
+            if self._session is not None:
+                self.leases.release(self._session)
+                self._session = None
+            return self._status()
+
+    def set_flags(self, flags):
+        """Сменить флаги; при активном удержании они применяются сразу"""
+        with self._lock:
+            self._flags = flags
+            if self._session is not None:
+                self.leases.update(self._session, flags)
+            return self._status()
+
+    def acquire(self, flags, ttl=None, owner=""):
+        """Аренда удержания для скрипта или задания; истекает через ttl секунд
+        без продления"""
+        with self._lock:
+            if ttl is not None and self._driver is None:
+                # Сроки аренд по монотонным часам: перевод часов их не сдвигает
+                self._driver = SchedulerThread(self.leases, name="no-sleep-leases",
+                                               max_wait=None)
+                self._driver.start()
+            lease_id = self.leases.acquire(flags, ttl, owner)
+            return dict(self._status(), lease=lease_id)
+
+    def renew(self, lease_id, ttl=None):
+        """Продление аренды"""
+        with self._lock:
+            if not self.leases.renew(lease_id, ttl):
+                raise ValueError(f"нет аренды {lease_id}")
+            return self._status()
+
+    def release_lease(self, lease_id):
+        """Снятие аренды"""
+        with self._lock:
+            if not self.leases.release(lease_id):
+                raise ValueError(f"нет аренды {lease_id}")
+            return self._status()
+
+    def status(self):
+        """Текущее состояние"""
+        with self._lock:
+            return self._status()
+
+    def session_seconds(self):
+        """Длительность текущего сеанса удержания по монотонным часам"""
+        with self._lock:
+            return time.monotonic() - self._started if self._session is not None else 0.0
+
+    def close(self):
+        """Снять удержание и завершить поток питания"""
+        if self._driver is not None:
+            self._driver.stop()
+        self.holder.close()
+
+    def _apply(self, flags):
+        """Смена объединения флагов аренд"""
+        if flags:
+            self.holder.hold(flags)
+        else:
+            self.holder.release()
+
+    def handle(self, request):
+        """Выполнение одной команды канала управления"""
+        cmd = request.get("cmd")
+        if cmd == "status":
+            return self.status()
+        if cmd == "stop":
+            return self.stop()
+        if cmd == "acquire":
+            flags = request_flags(request)
+            if not flags:
+                raise ValueError("для acquire нужны system и/или display")
+            return self.acquire(flags, request_ttl(request), str(request.get("owner", "")))
+        if cmd in ("renew", "release"):
+            lease_id = request.get("lease")
+            if not isinstance(lease_id, int):
+                raise ValueError(f"для {cmd} нужен номер аренды lease")
+            if cmd == "renew":
+                return self.renew(lease_id, request_ttl(request))
+            return self.release_lease(lease_id)
+        if cmd in ("start", "set-flags"):
+            flags = request_flags(request)
+            if cmd == "start":
+                return self.start(flags)
+            if flags is None:
+                raise ValueError("для set-flags нужны system и/или display")
+            return self.set_flags(flags)
+        raise ValueError(f"неизвестная команда: {cmd!r}")
+
+    def _status(self):
+        active = self._session is not None
+        return {"ok": True, "active": active,
+                "system": bool(self._flags & ES_SYSTEM_REQUIRED),
+                "display": bool(self._flags & ES_DISPLAY_REQUIRED),
+                "uptime": time.monotonic() - self._started if active else 0.0,
+                "leases": len(self.leases), "held": self.leases.flags}
+
+
+def request_flags(request):
+    """Флаги из полей system/display команды (None, если их нет)"""
+    if "system" not in request and "display" not in request:
+        return None
+    return keep_awake_flags(system=bool(request.get("system")),
+                            display=bool(request.get("display")))
+
+
+def request_ttl(request):
+    """Срок аренды из поля ttl команды (None - бессрочно)"""
+    ttl = request.get("ttl")
+    if ttl is None:
+        return None
+    if isinstance(ttl, bool) or not isinstance(ttl, (int, float)) or ttl <= 0:
+        raise ValueError("ttl должен быть положительным числом секунд")
+    return float(ttl)
+
+
+def handle_line(service, line):
+    """Разбор строки команды и формирование строки ответа"""
+    CONTROL_COMMANDS.inc()
+    with CONTROL_COMMAND_SECONDS.time():
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise ValueError("команда должна быть объектом JSON")
+            response = service.handle(request)
+        except Exception as exc:
+            response = {"ok": False, "error": str(exc)}
+    return json.dumps(response, ensure_ascii=False).encode("utf-8") + b"\n"
+
+
+class UnixControlServer:
+    """Сервер канала управления на Unix-сокете
+
+    Все соединения обслуживает один поток через selectors, без потока на
+    каждого клиента. Ответы отправляются без блокировки: то, что не ушло
+    сразу, дописывается, когда сокет готов к записи, а команды этого
+    клиента до тех пор не читаются. Клиент, который не читает ответы,
+    задерживает только себя.
+    """
+
+    def __init__(self, service, address=None):
+        self.service = service
+        self.address = address or default_address()
+        self._selector = selectors.DefaultSelector()
+        self._outgoing = {}  # Соединение -> неотправленные ответы
+        self._listener = None
+        self._wakeup_r, self._wakeup_w = socket.socketpair()
+        self._lock_fd = None
+        self._closed = False
+
+    def bind(self):
+        """Создание сокета под блокировкой flock рядом с ним
+
+        Блокировка держится все время работы сервера и снимается ядром при
+        падении процесса, поэтому из одновременно запущенных серверов
+        сокет создаст ровно один, а оставшийся файл сокета - всегда зависший.
+        """
+        import fcntl
+
+        lock_fd = os.open(self.address + ".lock", os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(lock_fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(lock_fd)
+            raise RuntimeError(f"служба уже запущена: {self.address}")
+        self._lock_fd = lock_fd
+        try:
+            os.unlink(self.address)
+        except FileNotFoundError:
+            pass
+        listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        listener.bind(self.address)
+        os.chmod(self.address, 0o600)
+        listener.listen(64)
+        listener.setblocking(False)
+        self._listener = listener
+        self._selector.register(listener, selectors.EVENT_READ, None)
+        self._selector.register(self._wakeup_r, selectors.EVENT_READ, None)
+
+    def serve_forever(self):
+        """Цикл обработки соединений до вызова shutdown()"""
+        if self._listener is None:
+            self.bind()
+        buffers = {}
+        try:
+            while not self._closed:
+                for key, events in self._selector.select():
+                    sock = key.fileobj
+                    if sock is self._wakeup_r:
+                        continue
+                    if sock is self._listener:
+                        conn, _ = sock.accept()
+                        conn.setblocking(False)
+                        buffers[conn] = bytearray()
+                        self._selector.register(conn, selectors.EVENT_READ, None)
+                        continue
+                    if events & selectors.EVENT_WRITE:
+                        self._write(sock, buffers)
+                    else:
+                        self._read(sock, buffers)
+        finally:
+            for conn in list(buffers):
+                self._drop(conn, buffers)
+            self._selector.close()
+            self._listener.close()
+            self._wakeup_r.close()
+            self._wakeup_w.close()
+            try:
+                os.unlink(self.address)
+            except OSError:
+                pass
+            # Файл блокировки не удаляется: иначе новый сервер мог бы
+            # заблокировать другой файл с тем же именем
+            os.close(self._lock_fd)
+
+    def shutdown(self):
+        """Остановка цикла из другого потока или обработчика сигнала"""
+        self._closed = True
+        try:
+            self._wakeup_w.send(b"\0")
+        except OSError:
+            pass
+
+    def _read(self, conn, buffers):
+        try:
+            data = conn.recv(65536)
+        except (BlockingIOError, InterruptedError):
+            return
+        except OSError:
+            data = b""
+        if not data:
+            self._drop(conn, buffers)
+            return
+        buffer = buffers[conn]
+        buffer += data
+        replies = []
+        while True:
+            end = buffer.find(b"\n")
+            if end < 0:
+                break
+            line = bytes(buffer[:end])
+            del buffer[:end + 1]
+            if line.strip():
+                replies.append(handle_line(self.service, line))
+        if len(buffer) > MAX_LINE:
+            self._drop(conn, buffers)
+            return
+        if replies:
+            self._outgoing[conn] = bytearray(b"".join(replies))
+            self._write(conn, buffers)
+
+    def _write(self, conn, buffers):
+        """Отправка ответов без ожидания; остаток - по готовности сокета"""
+        pending = self._outgoing[conn]
+        try:
+            sent = conn.send(pending)
+        except (BlockingIOError, InterruptedError):
+            sent = 0
+        except OSError:
+            self._drop(conn, buffers)
+            return
+        del pending[:sent]
+        writing = self._selector.get_key(conn).events & selectors.EVENT_WRITE
+        if pending:
+            if not writing:
+                self._selector.modify(conn, selectors.EVENT_WRITE, None)
+        else:
+            del self._outgoing[conn]
+            if writing:
+                self._selector.modify(conn, selectors.EVENT_READ, None)
+
+    def _drop(self, conn, buffers):
+        buffers.pop(conn, None)
+        self._outgoing.pop(conn, None)
+        try:
+            self._selector.unregister(conn)
+        except (KeyError, ValueError):
+            pass
+        conn.close()
+
+
+class PipeControlServer:
+    """Сервер канала управления на именованном канале Windows (pywin32)"""
+
+    def __init__(self, service, address=None):
+        self.service = service
+        self.address = address or default_address()
+        self._first_pipe = None
+        self._closed = False
+
+    def bind(self):
+        """Создание первого экземпляра канала; второй сервер получит ошибку доступа"""
+        import pywintypes
+        import win32file
+
+        try:
+            self._first_pipe = self._create_pipe(win32file.FILE_FLAG_FIRST_PIPE_INSTANCE)
+        except pywintypes.error as exc:
+            raise RuntimeError(f"служба уже запущена: {self.address}") from exc
+
+    def serve_forever(self):
+        """Цикл ожидания клиентов; каждый клиент обслуживается своим потоком"""
+        import pywintypes
+        import win32pipe
+        import win32file
+
+        if self._first_pipe is None:
+            self.bind()
+        while not self._closed:
+            pipe, self._first_pipe = self._first_pipe or self._create_pipe(), None
+            try:
+                win32pipe.ConnectNamedPipe(pipe, None)
+            except pywintypes.error:
+                win32file.CloseHandle(pipe)
+                continue
+            if self._closed:
+                win32file.CloseHandle(pipe)
+                break
+            threading.Thread(target=self._serve_client, args=(pipe,), daemon=True).start()
+
+    def _create_pipe(self, extra_mode=0):
+        import win32pipe
+
+        return win32pipe.CreateNamedPipe(
+            self.address, win32pipe.PIPE_ACCESS_DUPLEX | extra_mode,
+            win32pipe.PIPE_TYPE_BYTE | win32pipe.PIPE_READMODE_BYTE
+            | win32pipe.PIPE_WAIT | win32pipe.PIPE_REJECT_REMOTE_CLIENTS,
+            win32pipe.PIPE_UNLIMITED_INSTANCES, 65536, 65536, 0, None)
+
+    def shutdown(self):
+        """Остановка: пробное подключение будит ожидающий ConnectNamedPipe"""
+        self._closed = True
+        try:
+            with open(self.address, "r+b", buffering=0):
+                pass
+        except OSError:
+            pass
+
+    def _serve_client(self, pipe):
+        import pywintypes
+        import win32file
+
+        buffer = bytearray()
+        try:
+            while True:
+                _, data = win32file.ReadFile(pipe, 65536)
+                buffer += data
+                replies = []
+                while True:
+                    end = buffer.find(b"\n")
+                    if end < 0:
+                        break
+                    line = bytes(buffer[:end])
+                    del buffer[:end + 1]
+                    if line.strip():
+                        replies.append(handle_line(self.service, line))
+                if len(buffer) > MAX_LINE:
+                    break
+                if replies:
+                    win32file.WriteFile(pipe, b"".join(replies))
+        except pywintypes.error:
+            pass
+        finally:
+            win32file.CloseHandle(pipe)
+
+
+def make_server(service, address=None):
+    """Сервер канала управления для текущей платформы"""
+    if sys.platform == "win32":
+        return PipeControlServer(service, address)
+    return UnixControlServer(service, address)
+
+
+class ControlClient:
+    """Клиент канала управления с тем же набором методов, что у PowerService"""
+
+    def __init__(self, address=None, timeout=2.0):
+        self.address = address or default_address()
+        self._sock = None
+        if sys.platform == "win32":
+            self._stream = open(self.address, "r+b", buffering=0)
+            self._send = self._stream.write
+            self._recv = self._stream.read
+        else:
+            self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self._sock.settimeout(timeout)
+            try:
+                self._sock.connect(self.address)
+            except OSError:
+                self._sock.close()
+                raise
+            self._send = self._sock.sendall
+            self._recv = self._sock.recv
+        self._buffer = bytearray()
+        self._lock = threading.Lock()
+
+    def request(self, cmd, **params):
+        """Отправка команды и ожидание ответа"""
+        params["cmd"] = cmd
+        line = json.dumps(params).encode("utf-8") + b"\n"
+        with self._lock:
+            self._send(line)
+            reply = self._readline()
+        if not reply:
+            raise ConnectionError("служба закрыла соединение")
+        response = json.loads(reply)
+        if not response.get("ok"):
+            raise RuntimeError(response.get("error", "ошибка службы"))
+        return response
+
+    def start(self, flags=None):
+        """Начать удержание"""
+        if flags is None:
+            return self.request("start")
+        return self.request("start", **flags_params(flags))
+
+    def stop(self):
+        """Снять удержание"""
+        return self.request("stop")
+
+    def set_flags(self, flags):
+        """Сменить флаги удержания"""
+        return self.request("set-flags", **flags_params(flags))
+
+    def acquire(self, flags, ttl=None, owner=""):
+        """Аренда удержания в службе; номер аренды - в поле lease ответа"""
+        params = flags_params(flags)
+        if ttl is not None:
+            params["ttl"] = ttl
+        return self.request("acquire", owner=owner, **params)
+
+    def renew(self, lease_id, ttl=None):
+        """Продление аренды"""
+        if ttl is None:
+            return self.request("renew", lease=lease_id)
+        return self.request("renew", lease=lease_id, ttl=ttl)
+
+    def release_lease(self, lease_id):
+        """Снятие аренды"""
+        return self.request("release", lease=lease_id)
+
+    def status(self):
+        """Состояние службы"""
+        return self.request("status")
+
+    def session_seconds(self):
+        """Длительность текущего сеанса удержания в службе"""
+        return self.status()["uptime"]
+
+    def close(self):
+        """Закрытие соединения (удержание в службе не снимается)"""
+        if self._sock is not None:
+            self._sock.close()
+        else:
+            self._stream.close()
+
+    def _readline(self):
+        while True:
+            end = self._buffer.find(b"\n")
+            if end >= 0:
+                line = bytes(self._buffer[:end])
+                del self._buffer[:end + 1]
+                return line
+            chunk = self._recv(65536)
+            if not chunk:
+                return b""
+            self._buffer += chunk
+
+
+def flags_params(flags):
+    """Поля system/display для команды по флагам"""
+    return {"system": bool(flags & ES_SYSTEM_REQUIRED),
+            "display": bool(flags & ES_DISPLAY_REQUIRED)}
+
+
+def is_running(address=None):
+    """Отвечает ли служба по указанному адресу"""
+    try:
+        client = ControlClient(address, timeout=0.5)
+    except OSError:
+        return False
+    client.close()
+    return True
+
+
+def connect_or_local(address=None, on_change=None):
+    """Клиент запущенной службы или локальный PowerService, если ее нет
+
+    on_change(flags) передается потоку питания локального обработчика.
+    """
+    try:
+        return ControlClient(address)
+    except OSError:
+        return PowerService(on_change=on_change)
+
+
+def run_daemon(args):
+    """Запуск службы до SIGINT/SIGTERM"""
+    from cli import start_power_events, wait_for_stop
+    from powerevents import PowerPolicy
+
+    service = PowerService()
+    server = make_server(service)
+    try:
+        server.bind()
+    except RuntimeError as exc:
+        service.close()
+        print(f"No-Sleep: {exc}", file=sys.stderr)
+        return 1
+    thread = threading.Thread(target=server.serve_forever, name="no-sleep-control")
+    thread.start()
+    events = start_power_events(args, PowerPolicy(service.holder))
+    print(f"Служба No-Sleep слушает {server.address}", file=sys.stderr)
+    try:
+        wait_for_stop()
+    finally:
+        if events is not None:
+            events.stop()
+        server.shutdown()
+        thread.join()
+        service.close()
+    return 0
@@ -0,0 +1,97 @@
+from collections import OrderedDict
+
+from PyQt5.QtWidgets import QGraphicsScene, QGraphicsPixmapItem, QGraphicsBlurEffect
+from PyQt5.QtCore import Qt, QRectF, QPointF
+from PyQt5.QtGui import QImage, QPainter, QPixmap
+
+from tracing import traced
+
+
+class GlowRenderer:
+    """Общий рендерер свечения вместо QGraphicsDropShadowEffect
+
+    Размытая тень скругленного прямоугольника рисуется один раз и хранится
+    в ограниченном LRU-кэше по размеру, радиусам и цвету. В paintEvent
+    виджета остается только вывести готовый pixmap.
+    """
+
+    def __init__(self, capacity=64):
+        self.capacity = capacity
+        self.hits = 0
+        self.misses = 0
+        self._cache = OrderedDict()
+
+    def __len__(self):
+        return len(self._cache)
+
+    def clear(self):
+        """Очистка кэша и счетчиков"""
+        self._cache.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def shadow(self, width, height, corner_radius, blur_radius, color, dpr=1.0):
+        """Pixmap свечения для фигуры width x height с полем blur_radius по краям"""
+        key = (width, height, corner_radius, blur_radius, color.rgba(), dpr)
+        pixmap = self._cache.get(key)
+        if pixmap is not None:
+            self.hits += 1
+            self._cache.move_to_end(key)
+            return pixmap
+
+        self.misses += 1
+        pixmap = self._render(width, height, corner_radius, blur_radius, color, dpr)
+        self._cache[key] = pixmap
+        if len(self._cache) > self.capacity:
+            self._cache.popitem(last=False)
+        return pixmap
+
+    def paint(self, painter, rect, corner_radius, blur_radius, color, offset=(0, 0)):
+        """Вывод свечения под фигурой rect"""
+        dpr = painter.device().devicePixelRatioF()
+        pixmap = self.shadow(rect.width(), rect.height(), corner_radius,
+                             blur_radius, color, dpr)
+        painter.drawPixmap(QPointF(rect.x() - blur_radius + offset[0],
+                                   rect.y() - blur_radius + offset[1]), pixmap)
+
+    @traced('GlowRenderer.render')
+    def _render(self, width, height, corner_radius, blur_radius, color, dpr):
+        """Отрисовка фигуры и размытие тем же фильтром, что у эффектов Qt"""
+        full_width = width + 2 * blur_radius
+        full_height = height + 2 * blur_radius
+
+        shape = QImage(round(full_width * dpr), round(full_height * dpr),
+                       QImage.Format_ARGB32_Premultiplied)
+        shape.fill(Qt.transparent)
+        painter = QPainter(shape)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.scale(dpr, dpr)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(color)
+        painter.drawRoundedRect(QRectF(blur_radius, blur_radius, width, height),
+                                corner_radius, corner_radius)
+        painter.end()
+
+        # Размытие через сцену с QGraphicsBlurEffect
+        scene = QGraphicsScene()
+        item = QGraphicsPixmapItem(QPixmap.fromImage(shape))
+        effect = QGraphicsBlurEffect()
+        effect.setBlurRadius(blur_radius * dpr)
+        effect.setBlurHints(QGraphicsBlurEffect.QualityHint)
+        item.setGraphicsEffect(effect)
+        scene.addItem(item)
+
+        blurred = QImage(shape.size(), QImage.Format_ARGB32_Premultiplied)
+        blurred.fill(Qt.transparent)
+        target = QRectF(0, 0, shape.width(), shape.height())
+        painter = QPainter(blurred)
+        scene.render(painter, target, target)
+        painter.end()
+
+        pixmap = QPixmap.fromImage(blurred)
+        pixmap.setDevicePixelRatio(dpr)
+        return pixmap
+
+
+# Общий экземпляр для всех виджетов приложения
+renderer = GlowRenderer()
@@ -0,0 +1,1387 @@
+import ctypes
+import sys
+import time
+from ctypes import wintypes
+from datetime import timedelta
+
+# Момент импорта модуля для журнала этапов (main.py передает более ранний)
+_STARTUP_T0 = time.perf_counter()
+
+from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
+                             QHBoxLayout, QLabel, QPushButton, QFrame, QSystemTrayIcon, 
+                             QMenu, QAction, QMessageBox, QCheckBox, QGroupBox, 
+                             QStackedWidget, QScrollArea, QSizePolicy, QSpacerItem,
+                             QInputDialog)
+from PyQt5.QtCore import (Qt, QTimer, QPropertyAnimation, QEasingCurve, 
+                         pyqtProperty, pyqtSignal, QRect, QSize, QPoint, QEvent,
+                         QSocketNotifier)
+from PyQt5.QtGui import (QIcon, QPainter, QColor, QFont, QPalette, QLinearGradient, 
+                        QBrush, QPixmap, QFontDatabase, QPen)
+
+import resources_rc  # Встроенные ресурсы (иконка)
+from glow import renderer as glow_renderer
+from history import default_history
+from daemon import ControlClient, PowerService, connect_or_local
+from metrics import registry
+import cli
+from activity import ActivityMonitor
+from animation import governor
+from power import ES_SYSTEM_REQUIRED, ES_DISPLAY_REQUIRED, keep_awake_flags
+from powerevents import AC, BATTERY, LOCK, RESUME, UNLOCK, PowerPolicy
+from rules import RuleEngine, RuleInputs
+from procwatch import ProcessWatcher
+from scheduler import BEGIN, MAX_WAIT, Scheduler
+from settings import Settings
+from theme import theme
+from tracing import traced, tracer
+
+# Поле вокруг кнопок и переключателей, в котором рисуется свечение
+GLOW_MARGIN = 6
+
+# Источники автоматического удержания в подсказке трея
+SOURCE_NAMES = {"schedule": "расписание", "processes": "процессы",
+                "activity": "нагрузка", "rules": "правила"}
+
+# Метрики интерфейса
+UPTIME_TIMER_WAKEUPS = registry.counter("nosleep_timer_wakeups_total",
+                                        "Срабатывания таймеров GUI", timer="uptime")
+SCHEDULE_TIMER_WAKEUPS = registry.counter("nosleep_timer_wakeups_total",
+                                          "Срабатывания таймеров GUI", timer="schedule")
+GLOW_BUTTON_REPAINTS = registry.counter("nosleep_repaints_total",
+                                        "Перерисовки виджетов", widget="GlowButton")
+TOGGLE_REPAINTS = registry.counter("nosleep_repaints_total",
+                                   "Перерисовки виджетов", widget="ModernToggle")
+CARD_REPAINTS = registry.counter("nosleep_repaints_total",
+                                 "Перерисовки виджетов", widget="AnimatedCard")
+registry.gauge_function("nosleep_glow_cache_hits", "Попадания в кэш свечения",
+                        lambda: glow_renderer.hits)
+registry.gauge_function("nosleep_glow_cache_misses", "Промахи кэша свечения",
+                        lambda: glow_renderer.misses)
+
+_app_icon = None
+
+def trim_memory():
+    """Возврат освобожденной памяти системе после разбора окна"""
+    if sys.platform == "win32":
+        # Свои экземпляры библиотек, чтобы не менять прототипы ctypes.windll
+        kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+        psapi = ctypes.WinDLL("psapi", use_last_error=True)
+        kernel32.GetCurrentProcess.restype = wintypes.HANDLE
+        psapi.EmptyWorkingSet.argtypes = [wintypes.HANDLE]
+        psapi.EmptyWorkingSet(kernel32.GetCurrentProcess())
+        return
+    malloc_trim = getattr(ctypes.CDLL(None), "malloc_trim", None)  # Только glibc
+    if malloc_trim is not None:
+        malloc_trim(0)
+
+
+def app_icon():
+    """Иконка приложения из встроенного ресурса (декодируется один раз)"""
+    global _app_icon
+    if _app_icon is None:
+        _app_icon = QIcon(":/icon.ico")
+    return _app_icon
+
+class StartupTimeline:
+    """Журнал этапов запуска: время от старта процесса до готовности окна"""
+    
+    def __init__(self, t0):
+        self.t0 = t0
+        self.marks = []
+        self.reported = False
+        
+    def mark(self, name):
+        """Отметка этапа запуска"""
+        self.marks.append((name, time.perf_counter()))
+        
+    def first_paint(self, on_ready):
+        """Отметка первой отрисовки (одна на процесс); on_ready вызывается,
+        когда цикл событий освободится"""
+        if any(name == "первая отрисовка" for name, _ in self.marks):
+            return
+        self.mark("первая отрисовка")
+        QTimer.singleShot(0, on_ready)
+        
+    def report(self):
+        """Вывод журнала в stderr (один раз за запуск)"""
+        if self.reported or sys.stderr is None:
+            return
+        self.reported = True
+        stages = ", ".join(f"{name} {(stamp - self.t0) * 1000:.0f} мс" for name, stamp in self.marks)
+        print(f"Запуск: {stages}", file=sys.stderr, flush=True)
+
+startup_timeline = StartupTimeline(_STARTUP_T0)
+startup_timeline.mark("импорт")
+
+class GlowButton(QPushButton):
+    """Кнопка с эффектом свечения при наведении"""
+    
+    def __init__(self, text, parent=None, color="#8A2BE2", hover_color="#9b59b6"):
+        super().__init__(text, parent)
+        self._normal_color = QColor(color)
+        self._hover_color = QColor(hover_color)
+        self._pressed_color = QColor("#6A0DAD")
+        self._current_color = self._normal_color
+        self._animation = governor.register(QPropertyAnimation(self, b"color"))
+        self._animation.setDuration(300)
+        self.setMinimumSize(160 + 2 * GLOW_MARGIN, 50 + 2 * GLOW_MARGIN)
+        self.setCursor(Qt.PointingHandCursor)
+        
+        # Шрифт задается напрямую, без таблицы стилей
+        font = QFont("Segoe UI")
+        font.setPixelSize(12)
+        font.setBold(True)
+        self.setFont(font)
+        
+        # Параметры свечения (рисуется общим рендерером из кэша)
+        self._glow_radius = 15
+        self._glow_color = QColor(138, 43, 226, 150)
+        
+    @traced()
+    def set_colors(self, color, hover_color):
+        """Смена цветов кнопки (обычного и при наведении)"""
+        self._animation.stop()
+        self._normal_color = QColor(color)
+        self._hover_color = QColor(hover_color)
+        self._current_color = self._hover_color if self.underMouse() else self._normal_color
+        self.update()
+        
+    def sizeHint(self):
+        """Размер по тексту с отступами 12px 25px"""
+        metrics = self.fontMetrics()
+        return QSize(metrics.horizontalAdvance(self.text()) + 50 + 2 * GLOW_MARGIN,
+                     metrics.height() + 24 + 2 * GLOW_MARGIN)
+        
+    @traced()
+    def paintEvent(self, event):
+        """Отрисовка фона и текста кнопки без таблицы стилей"""
+        GLOW_BUTTON_REPAINTS.inc()
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        body = self.rect().adjusted(GLOW_MARGIN, GLOW_MARGIN, -GLOW_MARGIN, -GLOW_MARGIN)
+        glow_renderer.paint(painter, body, 12, self._glow_radius, self._glow_color)
+        painter.setPen(Qt.NoPen)
+        
+        pressed = self.isDown()
+        painter.setBrush(self._pressed_color if pressed else self._current_color)
+        painter.drawRoundedRect(body, 12, 12)
+        
+        # При нажатии текст смещается на 1px вниз
+        text_rect = body.translated(0, 1) if pressed else body
+        painter.setPen(Qt.white)
+        painter.drawText(text_rect, Qt.AlignCenter, self.text())
+        
+    def enterEvent(self, event):
+        """Обработчик наведения курсора на кнопку"""
+        self._animation.stop()
+        self._animation.setStartValue(self._normal_color)
+        self._animation.setEndValue(self._hover_color)
+        governor.start(self._animation)
+        
+        # Усиливаем свечение при наведении
+        self._glow_radius = 25
+        self._glow_color = QColor(138, 43, 226, 200)
+        super().enterEvent(event)
+        
+    def leaveEvent(self, event):
+        """Обработчик выхода курсора из кнопки"""
+        self._animation.stop()
+        self._animation.setStartValue(self._hover_color)
+        self._animation.setEndValue(self._normal_color)
+        governor.start(self._animation)
+        
+        # Возвращаем обычное свечение
+        self._glow_radius = 15
+        self._glow_color = QColor(138, 43, 226, 150)
+        super().leaveEvent(event)
+        
+    def get_color(self):
+        """Получение текущего цвета кнопки"""
+        return self._current_color
+        
+    def set_color(self, color):
+        """Установка цвета кнопки"""
+        self._current_color = color
+        self.update()
+        
+    color = pyqtProperty(QColor, get_color, set_color)
+
+class ModernToggle(QCheckBox):
+    """Современный переключатель с плавными анимациями
+    
+    Дорожка со свечением и кружок рисуются один раз на состояние и
+    масштаб экрана; кадр анимации только выводит два готовых pixmap.
+    """
+    
+    # (включен, масштаб экрана) -> (дорожка со свечением, кружок)
+    _sprites = {}
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setCursor(Qt.PointingHandCursor)
+        self.setFixedSize(60 + 2 * GLOW_MARGIN, 30 + 2 * GLOW_MARGIN)
+        
+        # Цвета для переключателя
+        self._bg_color = QColor("#2D2D30")
+        self._checked_bg_color = QColor("#8A2BE2")
+        self._circle_color = QColor("#FFFFFF")
+        self._circle_position = 3
+        
+        # Анимация движения кружка
+        self._animation = governor.register(QPropertyAnimation(self, b"circle_position"))
+        self._animation.setDuration(500)  # Увеличиваем длительность анимации
+        self._animation.setEasingCurve(QEasingCurve.OutBounce)  # Добавляем эффект "пружины"
+        
+        # Радиус свечения; его цвет зависит от состояния
+        self._glow_radius = 10
+        
+        # Обработка изменения состояния
+        self.stateChanged.connect(self.on_state_change)
+        
+    @traced()
+    def paintEvent(self, event):
+        """Отрисовка переключателя из готовых pixmap"""
+        TOGGLE_REPAINTS.inc()
+        track, circle = self.sprites(self.isChecked(), self.devicePixelRatioF())
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, track)
+        painter.drawPixmap(GLOW_MARGIN + self._circle_position, GLOW_MARGIN + 3, circle)
+        
+    def sprites(self, checked, dpr):
+        """Дорожка и кружок для состояния checked (рисуются при первом запросе)"""
+        key = (checked, dpr)
+        sprites = self._sprites.get(key)
+        if sprites is None:
+            track = self._new_pixmap(self.size(), dpr)
+            painter = QPainter(track)
+            painter.setRenderHint(QPainter.Antialiasing)
+            bg_rect = QRect(GLOW_MARGIN, GLOW_MARGIN, 60, 30)
+            glow_color = QColor(138, 43, 226, 150 if checked else 100)
+            glow_renderer.paint(painter, bg_rect, 15, self._glow_radius, glow_color)
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(self._checked_bg_color if checked else self._bg_color)
+            painter.drawRoundedRect(bg_rect, 15, 15)
+            painter.end()
+            
+            circle = self._new_pixmap(QSize(24, 24), dpr)
+            painter = QPainter(circle)
+            painter.setRenderHint(QPainter.Antialiasing)
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(self._circle_color)
+            painter.drawEllipse(QRect(0, 0, 24, 24))
+            painter.end()
+            sprites = self._sprites[key] = (track, circle)
+        return sprites
+        
+    @staticmethod
+    def _new_pixmap(size, dpr):
+        pixmap = QPixmap(round(size.width() * dpr), round(size.height() * dpr))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.transparent)
+        return pixmap
+        
+    def on_state_change(self, state):
+        """Обработка изменения состояния переключателя"""
+        if state == Qt.Checked:
+            self._animation.setStartValue(3)
+            self._animation.setEndValue(33)
+        else:
+            self._animation.setStartValue(33)
+            self._animation.setEndValue(3)
+        governor.start(self._animation)
+        
+    def mousePressEvent(self, event):
+        """Переопределение метода для обработки клика"""
+        self.setChecked(not self.isChecked())
+        
+    def get_circle_position(self):
+        """Получение позиции кружка"""
+        return self._circle_position
+        
+    def set_circle_position(self, pos):
+        """Установка позиции кружка"""
+        self._circle_position = pos
+        self.update()
+        
+    circle_position = pyqtProperty(int, get_circle_position, set_circle_position)
+
+class AnimatedCard(QFrame):
+    """Анимированная карточка с эффектом при наведении"""
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setObjectName("animatedCard")
+        self.setFrameShape(QFrame.StyledPanel)
+        self.setLineWidth(0)
+        
+        # Тень рисуется внутри карточки, поэтому оставляем под нее поля
+        self.setContentsMargins(GLOW_MARGIN, GLOW_MARGIN, GLOW_MARGIN, GLOW_MARGIN)
+        self._shadow_radius = 15
+        self._shadow_color = QColor(138, 43, 226, 80)
+        
+        # Анимация тени
+        self.shadow_animation = governor.register(QPropertyAnimation(self, b"shadow_radius"))
+        self.shadow_animation.setDuration(300)
+        
+    @traced()
+    def paintEvent(self, event):
+        """Отрисовка тени из кэша под содержимым карточки"""
+        CARD_REPAINTS.inc()
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        body = self.rect().adjusted(GLOW_MARGIN, GLOW_MARGIN, -GLOW_MARGIN, -GLOW_MARGIN)
+        glow_renderer.paint(painter, body, 8, self._shadow_radius, self._shadow_color, (0, 5))
+        painter.end()
+        super().paintEvent(event)
+        
+    def enterEvent(self, event):
+        """Анимация при наведении"""
+        self.shadow_animation.stop()
+        self.shadow_animation.setStartValue(self._shadow_radius)
+        self.shadow_animation.setEndValue(25)
+        governor.start(self.shadow_animation)
+        
+        # Усиление тени
+        self._shadow_color = QColor(138, 43, 226, 120)
+        super().enterEvent(event)
+        
+    def leaveEvent(self, event):
+        """Анимация при выходе"""
+        self.shadow_animation.stop()
+        self.shadow_animation.setStartValue(self._shadow_radius)
+        self.shadow_animation.setEndValue(15)
+        governor.start(self.shadow_animation)
+        
+        # Возврат тени
+        self._shadow_color = QColor(138, 43, 226, 80)
+        super().leaveEvent(event)
+        
+    def get_shadow_radius(self):
+        """Получение радиуса тени"""
+        return self._shadow_radius
+        
+    def set_shadow_radius(self, radius):
+        """Установка радиуса тени"""
+        self._shadow_radius = radius
+        self.update()
+        
+    shadow_radius = pyqtProperty(int, get_shadow_radius, set_shadow_radius)
+
+class NoSleepApp(QMainWindow):
+    """Основной класс приложения с улучшенным интерфейсом"""
+    
+    # Смена состояния отслеживаемых процессов (из потока ожидания)
+    processes_changed = pyqtSignal(bool)
+    # Смена состояния «машина занята» (из потока замеров)
+    activity_changed = pyqtSignal(bool)
+    # Аргументы повторного запуска программы (из потока канала экземпляра)
+    instance_command = pyqtSignal(list)
+    # Настройки, измененные в файле извне (из потока наблюдения)
+    settings_changed = pyqtSignal(dict)
+    # Флаги, установленные в системе (из потока питания)
+    power_changed = pyqtSignal(int)
+    # События питания и сеанса (из потока событий)
+    power_event = pyqtSignal(object)
+    # Решение правил удержания (из потоков источников правил)
+    rules_changed = pyqtSignal(int)
+    
+    def __init__(self):
+        super().__init__()
+        
+        # Настройки читаются синхронно до построения интерфейса
+        self.settings = Settings(on_change=self.settings_changed.emit)
+        self.settings.load()
+        
+        # Инициализация переменных
+        self.is_active = False
+        self.held_flags = 0  # Флаги, которые сейчас удерживаются в системе
+        # Клиент фоновой службы, если она запущена, иначе локальный обработчик;
+        # все системные вызовы делает его поток питания, а не поток GUI
+        self.power_changed.connect(self.on_power_changed)
+        self.power = connect_or_local(on_change=self.power_changed.emit)
+        # Реакция на сон, батарею и блокировку; удержанием службы в другом
+        # процессе управляет сама служба
+        self.power_policy = PowerPolicy(on_event=self.power_event.emit)
+        if isinstance(self.power, PowerService):
+            self.power_policy.attach(self.power.holder)
+        self.power_event.connect(self.on_power_event)
+        self.power_events = None
+        self.tray_icon = None
+        self.busy_action = None
+        self.busy_mode = False
+        self.motion_action = None
+        self._first_paint_done = False
+        governor.set_reduced_motion(self.settings["reduced_motion"])
+        
+        # Настройка главного окна
+        self.setWindowTitle("No-Sleep - Контроль сна Windows")
+        # Сводке метрик нужны две дополнительные строки
+        self.setFixedSize(500, 760 if registry.enabled else 700)
+        self.setWindowIcon(app_icon())
+        self.restore_position()
+        
+        # Установка шрифта
+        self.setFont(QFont("Segoe UI", 10))
+        
+        # Состояние переключателей хранится отдельно от виджетов: в трее
+        # окно разбирается, а флаги удержания нужны по-прежнему
+        self.switches = {"system": self.settings["system"], "display": self.settings["display"]}
+        
+        # Страницы окна; строятся в build_view() и разбираются в трее
+        self.stacked_widget = None
+        self.main_page = None
+        self.instructions_page = None
+        
+        # Таймер обновления времени работы: однократный, перезапускается на
+        # границе следующей секунды и не работает, пока окно скрыто
+        self.timer = QTimer()
+        self.timer.setSingleShot(True)
+        self.timer.setTimerType(Qt.PreciseTimer)
+        self.timer.timeout.connect(self.on_uptime_timer)
+        self.uptime_seconds = 0
+        self.session_started = 0.0  # time.monotonic() начала сеанса
+        
+        # Источники автоматического удержания (расписание, процессы,
+        # нагрузка, правила): у каждого своя аренда в службе питания, имя ->
+        # (флаги, номер аренды). Ручной сеанс - отдельная аренда, поэтому
+        # источники и кнопка не включают и не выключают друг друга
+        self.source_leases = {}
+        
+        # Расписание: один однократный таймер на ближайший переход
+        self.schedule_timer = QTimer()
+        self.schedule_timer.setSingleShot(True)
+        self.schedule_timer.timeout.connect(self.on_schedule_timer)
+        self.scheduler = Scheduler(on_change=self.on_schedule_change,
+                                   on_reschedule=self.arm_schedule_timer)
+        
+        # Слежение за процессами: удержание, пока они работают
+        self.processes_changed.connect(self.on_processes_change)
+        self.process_watcher = ProcessWatcher(on_change=self.processes_changed.emit)
+        
+        # Режим «пока машина занята»: замеры загрузки в отдельном потоке
+        self.activity_changed.connect(self.on_activity_change)
+        self.activity_monitor = ActivityMonitor(on_change=self.activity_changed.emit)
+        
+        self.instance_command.connect(self.on_instance_command)
+        
+        # Правила удержания: решение идет тем же путем, что и расписание.
+        # Движок нужен до восстановления сеанса: его читает подсказка трея
+        self.rules_changed.connect(self.on_rules_change)
+        self.rules = RuleEngine(on_change=self.rules_changed.emit)
+        self.rules.set_inputs({"battery": governor.on_battery(), "locked": False,
+                               "busy": self.activity_monitor.busy})
+        self.rule_inputs = RuleInputs(self.rules)
+        
+        # Создание системного трея
+        self.setup_tray()
+        
+        # Применение темной фиолетовой темы
+        self.apply_dark_purple_theme()
+        
+        # Если служба уже удерживает систему, показываем это в окне;
+        # иначе восстанавливаем удержание, включенное при прошлом выходе
+        status = self.power_command("status")
+        if status["active"]:
+            self.switches = {"system": status["system"], "display": status["display"]}
+            self.start_keep_awake()
+        elif self.settings["active"]:
+            self.start_keep_awake()
+        
+        self.load_rules(self.settings["rules"])
+        
+        self.settings_changed.connect(self.on_settings_changed)
+        self.build_view()
+        
+    @traced()
+    def build_view(self):
+        """Построение страниц окна по текущему состоянию"""
+        if self.main_page is not None:
+            return
+        central_widget = QWidget()
+        main_layout = QVBoxLayout(central_widget)
+        main_layout.setContentsMargins(20, 20, 20, 20)
+        main_layout.setSpacing(20)
+        
+        # Создание стека для переключения между страницами
+        self.stacked_widget = QStackedWidget()
+        main_layout.addWidget(self.stacked_widget)
+        
+        # Создание основной страницы; страница инструкции строится
+        # при первом открытии
+        self.main_page = QWidget()
+        self.setup_main_page()
+        self.stacked_widget.addWidget(self.main_page)
+        self.setCentralWidget(central_widget)
+        
+        # Изменения переключателей сохраняются (с задержкой, одной записью)
+        self.prevent_sleep_switch.stateChanged.connect(self.save_switches)
+        self.prevent_display_switch.stateChanged.connect(self.save_switches)
+        self.refresh_view()
+        
+    def release_view(self):
+        """Разбор окна в трее: остаются только удержание, источники и значок
+        
+        Виджеты страниц освобождаются; show() строит окно заново. Общие кэши
+        отрисовки (свечение, спрайты переключателя) не трогаются: ими
+        пользуются и другие виджеты процесса.
+        """
+        if self.main_page is None or self.isVisible():
+            return
+        governor.finish_all()
+        self.timer.stop()
+        # deleteLater: разбор может начаться из обработчика кнопки этого окна
+        self.takeCentralWidget().deleteLater()
+        self.stacked_widget = self.main_page = self.instructions_page = None
+        self.prevent_sleep_switch = self.prevent_display_switch = None
+        self.uptime_label = self.status_label = self.stats_label = None
+        self.toggle_btn = self.instructions_btn = self.tray_btn = self.back_btn = None
+        QTimer.singleShot(0, trim_memory)
+        
+    @traced()
+    def refresh_view(self):
+        """Приведение виджетов в соответствие с состоянием удержания"""
+        if self.main_page is None:
+            return
+        if self.is_active:
+            self.toggle_btn.setText("Остановить")
+            self.toggle_btn.set_colors("#E74C3C", "#C0392B")
+            self.status_label.setText("Статус: активно")
+            theme.set_state(self.status_label, "active")
+            self.update_uptime()
+        else:
+            self.toggle_btn.setText("Запустить")
+            self.toggle_btn.set_colors("#27AE60", "#2ECC71")
+            self.status_label.setText("Статус: неактивно")
+            theme.set_state(self.status_label, "inactive")
+            self.update_stats()
+        
+    def setVisible(self, visible):
+        """Перед показом разобранное в трее окно строится заново"""
+        if visible:
+            self.build_view()
+        super().setVisible(visible)
+        
+    def setup_main_page(self):
+        """Настройка главной страницы приложения"""
+        layout = QVBoxLayout(self.main_page)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(20)
+        
+        # Заголовок
+        title = QLabel("No-Sleep")
+        title.setAlignment(Qt.AlignCenter)
+        theme.apply(title, "titleLabel")
+        layout.addWidget(title)
+        
+        # Описание
+        description = QLabel("Программа предотвращает отключение экрана\nи переход в спящий режим Windows")
+        description.setAlignment(Qt.AlignCenter)
+        theme.apply(description, "descriptionLabel")
+        description.setWordWrap(True)
+        layout.addWidget(description)
+        
+        # Группа настроек
+        settings_group = QGroupBox("Настройки")
+        theme.apply(settings_group, "settingsGroup")
+        settings_layout = QVBoxLayout(settings_group)
+        settings_layout.setSpacing(15)
+        
+        # Настройка предотвращения сна
+        sleep_layout = QHBoxLayout()
+        sleep_label = QLabel("Предотвращать спящий режим")
+        theme.apply(sleep_label, "settingLabel")
+        self.prevent_sleep_switch = ModernToggle()
+        sleep_layout.addWidget(sleep_label)
+        sleep_layout.addStretch()
+        sleep_layout.addWidget(self.prevent_sleep_switch)
+        self.prevent_sleep_switch.setChecked(self.switches["system"])
+        settings_layout.addLayout(sleep_layout)
+        
+        # Настройка предотвращения отключения дисплея
+        display_layout = QHBoxLayout()
+        display_label = QLabel("Предотвращать отключение дисплея")
+        theme.apply(display_label, "settingLabel")
+        self.prevent_display_switch = ModernToggle()
+        display_layout.addWidget(display_label)
+        display_layout.addStretch()
+        display_layout.addWidget(self.prevent_display_switch)
+        self.prevent_display_switch.setChecked(self.switches["display"])
+        settings_layout.addLayout(display_layout)
+        
+        layout.addWidget(settings_group)
+        
+        # Информационная группа
+        info_group = QGroupBox("Информация")
+        theme.apply(info_group, "infoGroup")
+        info_layout = QVBoxLayout(info_group)
+        info_layout.setSpacing(10)
+        
+        # Время работы
+        self.uptime_label = QLabel("Время работы: 00:00:00")
+        theme.apply(self.uptime_label, "infoLabel")
+        info_layout.addWidget(self.uptime_label)
+        
+        # Статус
+        self.status_label = QLabel("Статус: неактивно")
+        theme.apply(self.status_label, "statusLabel")
+        info_layout.addWidget(self.status_label)
+        
+        # Сводка метрик (видна, только если метрики включены)
+        self.stats_label = QLabel()
+        theme.apply(self.stats_label, "infoLabel")
+        self.stats_label.setWordWrap(True)
+        self.stats_label.setVisible(registry.enabled)
+        info_layout.addWidget(self.stats_label)
+        self.update_stats()
+        
+        layout.addWidget(info_group)
+        
+        # Кнопки; поля свечения входят в их размер, поэтому промежуток меньше
+        buttons_layout = QVBoxLayout()
+        buttons_layout.setSpacing(20 - 2 * GLOW_MARGIN)
+        
+        # Кнопка управления
+        self.toggle_btn = GlowButton("Запустить", color="#27AE60", hover_color="#2ECC71")
+        self.toggle_btn.clicked.connect(lambda checked=False: self.toggle_keep_awake())
+        buttons_layout.addWidget(self.toggle_btn)
+        
+        # Кнопка инструкции
+        self.instructions_btn = GlowButton("Инструкция", color="#3498DB", hover_color="#5DADE2")
+        self.instructions_btn.clicked.connect(self.show_instructions)
+        buttons_layout.addWidget(self.instructions_btn)
+        
+        # Кнопка сворачивания в трей
+        self.tray_btn = GlowButton("Свернуть в трей", color="#8A2BE2", hover_color="#9b59b6")
+        self.tray_btn.clicked.connect(self.hide_to_tray)
+        buttons_layout.addWidget(self.tray_btn)
+        
+        layout.addLayout(buttons_layout)
+        
+        # Добавляем растягивающийся элемент для выравнивания
+        layout.addStretch()
+        
+    def setup_instructions_page(self):
+        """Настройка страницы с инструкцией"""
+        self.instructions_page = QWidget()
+        layout = QVBoxLayout(self.instructions_page)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(20)
+        
+        # Заголовок
+        title = QLabel("Инструкция по использованию")
+        title.setAlignment(Qt.AlignCenter)
+        theme.apply(title, "instructionsTitle")
+        layout.addWidget(title)
+        
+        # Область с прокруткой для инструкции
+        scroll_area = QScrollArea()
+        scroll_area.setWidgetResizable(True)
+        scroll_area.setFrameShape(QFrame.NoFrame)
+        theme.apply(scroll_area, "scrollArea")
+        
+        # Контейнер для инструкции
+        instructions_container = QWidget()
+        theme.apply(instructions_container, "instructionsContainer")
+        instructions_layout = QVBoxLayout(instructions_container)
+        instructions_layout.setContentsMargins(15, 15, 15, 15)
+        
+        # Текст инструкции
+        instructions = [
+            ("🎯 Назначение программы", 
+             "No-Sleep предназначена для предотвращения перехода компьютера в спящий режим и отключения экрана. "
+             "Это полезно при длительных загрузках, просмотре видео или других задачах, требующих непрерывной работы компьютера."),
+            
+            ("🚀 Как использовать", 
+             "1. Выберите нужные настройки (предотвращение сна, отключения дисплея или оба варианта)\n"
+             "2. Нажмите кнопку 'Запустить' для активации\n"
+             "3. Для остановки нажмите кнопку 'Остановить'\n"
+             "4. Вы можете свернуть программу в системный трей\n"
+             "5. Для выхода из программы используйте меню в трее"),
+            
+            ("📌 Работа в системном трее", 
+             "При сворачивании в трей программа продолжает работать в фоновом режиме. "
+             "Для управления программой из трея:\n"
+             "• Двойной клик по иконке - открыть программу\n"
+             "• Правый клик по иконке - открыть контекстное меню\n"
+             "• В контекстном меню можно управлять режимом работы и выйти из программы"),
+            
+            ("🖥️ Системные требования", 
+             "• Windows 7/8/10/11\n"
+             "• Python 3.6+\n"
+             "• Библиотека PyQt5"),
+            
+            ("📥 Установка", 
+             "1. Установите Python с официального сайта\n"
+             "2. Установите необходимые зависимости: pip install pyqt5\n"
+             "3. Запустите файл программы: python no_sleep.py"),
+            
+            ("🔒 Безопасность", 
+             "Программа использует только официальные API Windows и не представляет угрозы для вашей системы. "
+             "Исходный код открыт для проверки."),
+            
+            ("💡 Примечания", 
+             "• Программа не требует административных прав для работы\n"
+             "• При закрытии основного окна программа продолжает работать в трее\n"
+             "• Для полного выхода из программы используйте меню в трее\n"
+             "• Программа автоматически восстанавливает нормальные настройки сна при выходе")
+        ]
+        
+        for i, (section_title, section_text) in enumerate(instructions):
+            if i > 0:
+                # Добавляем разделитель между секциями
+                separator = QFrame()
+                separator.setFrameShape(QFrame.HLine)
+                theme.apply(separator, "separator")
+                instructions_layout.addWidget(separator)
+                
+            # Заголовок секции
+            section_title_label = QLabel(section_title)
+            theme.apply(section_title_label, "sectionTitle")
+            instructions_layout.addWidget(section_title_label)
+            
+            # Текст секции
+            section_text_label = QLabel(section_text)
+            section_text_label.setWordWrap(True)
+            theme.apply(section_text_label, "sectionText")
+            section_text_label.setTextInteractionFlags(Qt.TextSelectableByMouse)
+            instructions_layout.addWidget(section_text_label)
+        
+        # Добавляем растягивающийся элемент в конец
+        instructions_layout.addStretch()
+        
+        # Устанавливаем контейнер в область прокрутки
+        scroll_area.setWidget(instructions_container)
+        layout.addWidget(scroll_area)
+        
+        # Кнопка возврата
+        self.back_btn = GlowButton("Назад", color="#8A2BE2", hover_color="#9b59b6")
+        self.back_btn.clicked.connect(self.show_main_page)
+        layout.addWidget(self.back_btn)
+        
+    def apply_dark_purple_theme(self):
+        """Применение темной фиолетовой темы"""
+        theme.apply_window(self)
+        
+    def setup_tray(self):
+        """Настройка системного трея"""
+        if QSystemTrayIcon.isSystemTrayAvailable():
+            self.tray_icon = QSystemTrayIcon(self)
+            self.tray_icon.setIcon(app_icon())
+            
+            # Создание контекстного меню для трея
+            tray_menu = QMenu()
+            
+            toggle_action = QAction("Запустить/Остановить", self)
+            toggle_action.triggered.connect(lambda checked=False: self.toggle_keep_awake())
+            tray_menu.addAction(toggle_action)
+            
+            show_action = QAction("Показать", self)
+            show_action.triggered.connect(self.show_from_tray)
+            tray_menu.addAction(show_action)
+            
+            timer_menu = tray_menu.addMenu("Таймер")
+            for title, seconds in (("На 1 час", 3600), ("На 3 часа", 3 * 3600)):
+                timer_action = QAction(title, self)
+                timer_action.triggered.connect(lambda checked=False, s=seconds: self.keep_awake_for(s))
+                timer_menu.addAction(timer_action)
+            timer_menu.addSeparator()
+            cancel_action = QAction("Отменить таймеры", self)
+            cancel_action.triggered.connect(self.scheduler.clear)
+            timer_menu.addAction(cancel_action)
+            
+            process_menu = tray_menu.addMenu("Процессы")
+            watch_action = QAction("Следить за процессом...", self)
+            watch_action.triggered.connect(self.ask_process_to_watch)
+            process_menu.addAction(watch_action)
+            rescan_action = QAction("Найти новые процессы", self)
+            rescan_action.triggered.connect(self.rescan_processes)
+            process_menu.addAction(rescan_action)
+            unwatch_action = QAction("Перестать следить", self)
+            unwatch_action.triggered.connect(self.process_watcher.clear)
+            process_menu.addAction(unwatch_action)
+            
+            self.busy_action = QAction("Не спать при нагрузке", self)
+            self.busy_action.setCheckable(True)
+            self.busy_action.toggled.connect(self.set_busy_mode)
+            tray_menu.addAction(self.busy_action)
+            
+            self.motion_action = QAction("Меньше анимации", self)
+            self.motion_action.setCheckable(True)
+            self.motion_action.setChecked(governor.reduced_motion)
+            self.motion_action.toggled.connect(self.set_reduced_motion)
+            tray_menu.addAction(self.motion_action)
+            
+            history_action = QAction("История...", self)
+            history_action.triggered.connect(self.show_history)
+            tray_menu.addAction(history_action)
+            
+            if tracer.enabled:
+                trace_action = QAction("Сохранить трассировку", self)
+                trace_action.triggered.connect(self.save_trace)
+                tray_menu.addAction(trace_action)
+            
+            tray_menu.addSeparator()
+            
+            quit_action = QAction("Выход", self)
+            quit_action.triggered.connect(self.quit_application)
+            tray_menu.addAction(quit_action)
+            
+            self.tray_icon.setContextMenu(tray_menu)
+            self.tray_icon.activated.connect(self.tray_icon_activated)
+            
+            # Установка всплывающей подсказки
+            self.tray_icon.setToolTip("No-Sleep - неактивно")
+            self.tray_icon.show()
+            
+    @traced()
+    def toggle_keep_awake(self):
+        """Переключение режима предотвращения сна"""
+        if not self.is_active:
+            self.start_keep_awake()
+        else:
+            self.stop_keep_awake()
+        self.settings.update(active=self.is_active)
+    
+    def save_switches(self):
+        """Сохранение состояния переключателей и применение флагов на лету"""
+        self.switches = {"system": self.prevent_sleep_switch.isChecked(),
+                         "display": self.prevent_display_switch.isChecked()}
+        self.settings.update(**self.switches)
+        self.apply_switches()
+    
+    def apply_switches(self):
+        """Новые флаги переключателей для идущего сеанса, без перезапуска"""
+        if self.is_active:
+            self.power_command("set_flags", self.keep_awake_flags())
+        if "processes" in self.source_leases:
+            self.set_auto_source("processes", self.keep_awake_flags())
+    
+    def restore_position(self):
+        """Положение окна из настроек, если эта точка есть на одном из экранов"""
+        position = self.settings["window"]
+        if position is not None and QApplication.screenAt(QPoint(*position)) is not None:
+            self.move(*position)
+    
+    def on_settings_changed(self, changed):
+        """Применение настроек, измененных в файле извне"""
+        for key in ("system", "display"):
+            if key in changed:
+                self.switches[key] = changed[key]
+        if self.main_page is not None:
+            self.prevent_sleep_switch.setChecked(self.switches["system"])
+            self.prevent_display_switch.setChecked(self.switches["display"])
+        if "system" in changed or "display" in changed:
+            self.apply_switches()
+        if "active" in changed:
+            if changed["active"] and not self.is_active:
+                self.start_keep_awake()
+            elif not changed["active"] and self.is_active:
+                self.stop_keep_awake()
+        if "window" in changed:
+            self.restore_position()
+        if "reduced_motion" in changed:
+            self.set_reduced_motion(changed["reduced_motion"])
+        if "rules" in changed:
+            self.load_rules(changed["rules"])
+    
+    @traced()
+    def start_keep_awake(self, flags=None):
+        """Активирует предотвращение сна (по умолчанию - с флагами переключателей)"""
+        self.is_active = True
+        
+        # Удержание выполняет отдельный поток, чтобы не блокировать GUI
+        status = self.power_command("start", flags or self.keep_awake_flags())
+        
+        # Время считается от начала сеанса (служба могла начать его раньше)
+        self.session_started = time.monotonic() - status["uptime"]
+        self.refresh_view()
+        
+        # Обновление иконки в трее
+        if self.tray_icon:
+            self.update_tray_tooltip()
+            self.show_notification("No-Sleep активирован", "Программа предотвращает сон и отключение экрана")
+    
+    @traced()
+    def stop_keep_awake(self):
+        """Деактивирует предотвращение сна"""
+        self.is_active = False
+        
+        # Восстановление нормальных настроек питания
+        self.power_command("stop")
+        
+        # Остановка таймера
+        self.timer.stop()
+        self.refresh_view()
+        
+        # Обновление иконки в трее
+        if self.tray_icon:
+            self.update_tray_tooltip()
+            self.show_notification("No-Sleep деактивирован", "Нормальный режим сна восстановлен")
+    
+    def power_command(self, name, *args):
+        """Команда службе питания; если служба пропала, работаем локально"""
+        try:
+            status = getattr(self.power, name)(*args)
+        except OSError:
+            self.power = PowerService(on_change=self.power_changed.emit)
+            self.power_policy.attach(self.power.holder)
+            # Аренды источников пропали вместе со службой
+            for source, (flags, _) in list(self.source_leases.items()):
+                self.source_leases[source] = (flags, self.power.acquire(flags, owner=source)["lease"])
+            status = getattr(self.power, name)(*args)
+        if isinstance(self.power, ControlClient):
+            # Поток питания службы в другом процессе: состояние из ответа
+            self.on_power_changed(status.get("held", self.held_flags))
+        return status
+    
+    def on_power_changed(self, flags):
+        """Поток питания установил флаги flags в системе"""
+        if flags == self.held_flags:
+            return
+        self.held_flags = flags
+        self.update_tray_tooltip()
+    
+    def on_power_event(self, event):
+        """Событие питания или сеанса (реакция удержания уже применена)"""
+        if event.kind == RESUME:
+            # Таймеры Qt во сне стоят: переходы расписания перепроверяются
+            self.scheduler.resync()
+            if self.is_active:
+                self.update_uptime()
+        elif event.kind in (AC, BATTERY):
+            governor.set_on_battery(event.kind == BATTERY)
+            self.rules.set_input("battery", event.kind == BATTERY)
+        elif event.kind in (LOCK, UNLOCK):
+            self.rules.set_input("locked", event.kind == LOCK)
+        if event.kind in (RESUME, UNLOCK):
+            # За время сна или блокировки могли запуститься процессы из правил
+            self.rule_inputs.resync()
+            self.rule_inputs.rescan()
+        self.update_tray_tooltip()
+    
+    def keep_awake_flags(self):
+        """Флаги удержания по текущим настройкам"""
+        return keep_awake_flags(**self.switches)
+    
+    @traced()
+    def update_uptime(self):
+        """Обновление времени работы по монотонным часам"""
+        elapsed = time.monotonic() - self.session_started
+        self.uptime_seconds = int(elapsed)
+        
+        # Следующее обновление - на границе секунды, только если окно видно
+        if self.is_active and self.isVisible() and not self.isMinimized():
+            self.timer.start(max(1, int(1000 - (elapsed % 1) * 1000)))
+        hours = self.uptime_seconds // 3600
+        minutes = (self.uptime_seconds % 3600) // 60
+        seconds = self.uptime_seconds % 60
+        if self.main_page is None:
+            return
+        self.uptime_label.setText(f"Время работы: {hours:02d}:{minutes:02d}:{seconds:02d}")
+        self.update_stats()
+    
+    def on_uptime_timer(self):
+        """Срабатывание таймера времени работы"""
+        UPTIME_TIMER_WAKEUPS.inc()
+        self.update_uptime()
+    
+    def update_stats(self):
+        """Обновление сводки метрик в группе «Информация»"""
+        if not registry.enabled or self.main_page is None:
+            return
+        wakeups = (registry.value("nosleep_thread_wakeups_total", thread="power")
+                   + UPTIME_TIMER_WAKEUPS.value)
+        repaints = GLOW_BUTTON_REPAINTS.value + TOGGLE_REPAINTS.value + CARD_REPAINTS.value
+        self.stats_label.setText(f"Вызовы API: {registry.value('nosleep_power_calls_total')} · "
+                                 f"пробуждения: {wakeups} · перерисовки: {repaints} · "
+                                 f"кадры анимаций: {governor.frames} "
+                                 f"(пропущено {governor.skipped})")
+    
+    def keep_awake_for(self, seconds):
+        """Удержание на seconds секунд; текущий сеанс переходит под таймер"""
+        now = time.time()
+        self.scheduler.add_once(now, now + seconds, self.keep_awake_flags())
+        self.scheduler.advance()
+        self.arm_schedule_timer()
+        if self.is_active:
+            # Аренда расписания уже взята: ручной сеанс снимается без разрыва
+            self.is_active = False
+            self.power_command("stop")
+            self.timer.stop()
+            self.refresh_view()
+            self.settings.update(active=False)
+            self.update_tray_tooltip()
+    
+    def set_auto_source(self, name, flags):
+        """Источник автоматического удержания включился (flags), сменил флаги
+        или выключился (0)
+        
+        Новая аренда берется до снятия прежней, поэтому при смене флагов
+        объединение в службе не проваливается в ноль.
+        """
+        previous = self.source_leases.pop(name, None)
+        if previous is not None and previous[0] == flags:
+            self.source_leases[name] = previous
+            return
+        if flags:
+            status = self.power_command("acquire", flags, None, name)
+            self.source_leases[name] = (flags, status["lease"])
+        if previous is not None:
+            try:
+                self.power_command("release_lease", previous[1])
+            except (ValueError, RuntimeError):
+                pass  # Аренды уже нет: служба перезапускалась
+        self.update_tray_tooltip()
+    
+    def load_rules(self, specs):
+        """Компиляция правил удержания; ошибочные правила не заменяют прежние"""
+        try:
+            self.rules.compile(specs)
+        except ValueError as error:
+            print(f"Правила удержания не применены: {error}", file=sys.stderr)
+            self.show_notification("No-Sleep", f"Правила удержания не применены: {error}")
+            return False
+        self.rule_inputs.update()
+        # Вход busy нужен правилам и без режима «не спать при нагрузке»
+        if "busy" in self.rules.inputs:
+            self.activity_monitor.start()
+        elif not self.busy_mode:
+            self.activity_monitor.stop()
+        return True
+    
+    def on_rules_change(self, flags):
+        """Смена объединения флагов истинных правил"""
+        self.set_auto_source("rules", flags)
+    
+    def on_schedule_change(self, flags):
+        """Смена объединения флагов активных окон расписания"""
+        self.set_auto_source("schedule", flags)
+    
+    def arm_schedule_timer(self):
+        """Перевзвод таймера расписания на ближайший переход"""
+        transition = self.scheduler.next_transition()
+        if transition is None:
+            self.schedule_timer.stop()
+        else:
+            # Таймер Qt отмеряет время не по настенным часам: после их перевода
+            # переход наступит не позже чем через MAX_WAIT
+            delay = min(max(0.0, transition.when - time.time()), MAX_WAIT)
+            self.schedule_timer.start(int(delay * 1000) + 1)
+        self.update_tray_tooltip()
+    
+    def on_schedule_timer(self):
+        """Срабатывание таймера расписания"""
+        SCHEDULE_TIMER_WAKEUPS.inc()
+        self.scheduler.advance()
+        self.arm_schedule_timer()
+    
+    def watch_processes(self, pids=(), patterns=()):
+        """Удержание, пока работают процессы с указанными PID или именами"""
+        try:
+            missing = [pid for pid in pids if not self.process_watcher.watch_pid(pid)]
+            for pattern in patterns:
+                self.process_watcher.watch_name(pattern)
+        except OSError as error:
+            self.show_notification("No-Sleep", f"Слежение за процессами недоступно: {error}")
+            return
+        if missing:
+            self.show_notification("No-Sleep", "Процессы не найдены: " + ", ".join(map(str, missing)))
+        self.update_tray_tooltip()
+    
+    def ask_process_to_watch(self):
+        """Запрос PID или шаблона имени процесса для слежения"""
+        text, ok = QInputDialog.getText(self, "Слежение за процессом",
+                                        "PID или имя процесса (допускаются * и ?):")
+        text = text.strip()
+        if ok and text:
+            if text.isdigit():
+                self.watch_processes(pids=[int(text)])
+            else:
+                self.watch_processes(patterns=[text])
+    
+    def on_processes_change(self, alive):
+        """Появился первый или завершился последний отслеживаемый процесс"""
+        self.set_auto_source("processes", self.keep_awake_flags() if alive else 0)
+    
+    def rescan_processes(self):
+        """Поиск новых процессов по шаблонам слежения и правил"""
+        self.process_watcher.rescan()
+        self.rule_inputs.rescan()
+    
+    def set_busy_mode(self, enabled):
+        """Режим «пока машина занята»: удерживается только сон системы"""
+        self.busy_mode = enabled
+        if enabled:
+            self.activity_monitor.start()
+        elif "busy" in self.rules.inputs:
+            self.set_auto_source("activity", 0)  # Замеры остаются для правил
+        else:
+            self.activity_monitor.stop()
+        if self.busy_action is not None:
+            self.busy_action.setChecked(enabled)
+        self.update_tray_tooltip()
+    
+    def set_reduced_motion(self, enabled):
+        """Режим «меньше анимации»: переходы виджетов без промежуточных кадров"""
+        governor.set_reduced_motion(enabled)
+        self.settings.update(reduced_motion=enabled)
+        if self.motion_action is not None:
+            self.motion_action.setChecked(enabled)
+    
+    def on_activity_change(self, busy):
+        """Машина стала занятой или затихла на период тишины"""
+        self.rules.set_input("busy", busy)
+        self.set_auto_source("activity", ES_SYSTEM_REQUIRED if busy and self.busy_mode else 0)
+    
+    def apply_args(self, args, forwarded=False):
+        """Аргументы командной строки - при запуске или от повторного запуска"""
+        if cli.schedule_from_args(args, self.scheduler, cli.selected_flags(args)):
+            self.on_schedule_timer()
+        if args.pid or args.process:
+            self.watch_processes(args.pid or (), args.process or ())
+        if args.while_busy:
+            cli.configure_activity(args, self.activity_monitor)
+            self.set_busy_mode(True)
+        if args.toggle:
+            self.toggle_keep_awake()
+        commanded = (args.duration is not None or args.until is not None or args.window
+                     or args.pid or args.process or args.while_busy or args.toggle)
+        # Повторный запуск без команд просто показывает окно
+        if args.show or (forwarded and not commanded):
+            self.show_from_tray()
+    
+    def on_instance_command(self, argv):
+        """Команда от повторного запуска программы"""
+        try:
+            args = cli.parse_args(argv)
+        except SystemExit:
+            return  # Ошибку разбора argparse уже вывел
+        self.apply_args(args, forwarded=True)
+    
+    def update_tray_tooltip(self):
+        """Подсказка трея: состояние и ближайший переход расписания"""
+        if not self.tray_icon:
+            return
+        if self.is_active:
+            text = "No-Sleep - активно"
+        elif self.source_leases:
+            text = "No-Sleep - автоматически: " + ", ".join(
+                SOURCE_NAMES[name] for name in sorted(self.source_leases))
+        else:
+            text = "No-Sleep - неактивно"
+        if self.held_flags:
+            held = [name for bit, name in ((ES_SYSTEM_REQUIRED, "сон системы"),
+                                           (ES_DISPLAY_REQUIRED, "экран"))
+                    if self.held_flags & bit]
+            text += "\nУдерживается: " + ", ".join(held)
+        if self.is_active and not self.power_policy.mask & ES_DISPLAY_REQUIRED:
+            reason = "питание от батареи" if self.power_policy.on_battery else "сеанс заблокирован"
+            text += f"\nЭкран может гаснуть: {reason}"
+        transition = self.scheduler.next_transition()
+        if transition is not None:
+            when = time.localtime(transition.when)
+            moment = time.strftime("%H:%M" if transition.when - time.time() < 86400 else "%d.%m %H:%M", when)
+            kind = "начало окна" if transition.kind == BEGIN else "конец окна"
+            text += f"\nДалее: {moment} - {kind}"
+        if self.rules.flags:
+            held = [name for bit, name in ((ES_SYSTEM_REQUIRED, "сон системы"),
+                                           (ES_DISPLAY_REQUIRED, "экран"))
+                    if self.rules.flags & bit]
+            text += "\nПо правилам: " + ", ".join(held)
+        if self.activity_monitor.running:
+            text += "\nПри нагрузке: " + ("занята" if self.activity_monitor.busy else "ожидание")
+        watched = len(self.process_watcher.pids)
+        if watched:
+            text += f"\nОтслеживаемые процессы: {watched}"
+        self.tray_icon.setToolTip(text)
+    
+    def show_history(self):
+        """Сводка истории удержания за неделю (из индекса, без чтения журнала)"""
+        QMessageBox.information(self, "История удержания",
+                                "\n".join(cli.format_history(default_history())))
+    
+    def save_trace(self):
+        """Сохранение кольцевого буфера трассировки в файл для chrome://tracing"""
+        try:
+            path = tracer.dump()
+        except OSError as error:
+            self.show_notification("No-Sleep", f"Трассировка не сохранена: {error}")
+            return
+        self.show_notification("No-Sleep", f"Трассировка сохранена: {path}")
+    
+    def watch_signals(self):
+        """Обработка сигналов сразу по приходу, а не при следующем вызове Python
+        
+        Пока работает цикл Qt, обработчики сигналов Python ждут, когда
+        интерпретатор получит управление; байт в сокете пробуждения будит
+        QSocketNotifier без опроса по таймеру.
+        """
+        import signal
+        import socket
+        
+        self._signal_read, self._signal_write = socket.socketpair()
+        self._signal_write.setblocking(False)
+        signal.set_wakeup_fd(self._signal_write.fileno())
+        self._signal_notifier = QSocketNotifier(self._signal_read.fileno(), QSocketNotifier.Read, self)
+        self._signal_notifier.activated.connect(lambda: self._signal_read.recv(64))
+    
+    def show_instructions(self):
+        """Показать страницу с инструкцией"""
+        if self.instructions_page is None:
+            self.setup_instructions_page()
+            self.stacked_widget.addWidget(self.instructions_page)
+        self.stacked_widget.setCurrentWidget(self.instructions_page)
+    
+    def show_main_page(self):
+        """Показать главную страницу"""
+        self.stacked_widget.setCurrentIndex(0)
+    
+    def hide_to_tray(self):
+        """Сворачивание приложения в системный трей"""
+        if self.tray_icon:
+            self.hide()
+            QTimer.singleShot(0, self.release_view)
+            self.show_notification("No-Sleep", "Приложение свернуто в трей. Вы можете управлять им оттуда.")
+    
+    def show_from_tray(self):
+        """Восстановление приложения из трея"""
+        self.show()
+        self.activateWindow()
+        self.raise_()
+    
+    def show_notification(self, title, message):
+        """Показать уведомление"""
+        if self.tray_icon:
+            # Для Windows 10/11
+            try:
+                self.tray_icon.showMessage(title, message, QSystemTrayIcon.Information, 3000)
+            except:
+                # Fallback для старых версий Windows
+                pass
+    
+    def tray_icon_activated(self, reason):
+        """Обработка активации иконки в трее"""
+        if reason == QSystemTrayIcon.DoubleClick:
+            self.show_from_tray()
+    
+    def quit_application(self):
+        """Корректный выход из приложения"""
+        # Удержание, включенное вручную, восстановится при следующем запуске
+        active = self.is_active
+        if self.is_active:
+            self.stop_keep_awake()
+        # Служба в другом процессе сама аренды окна не снимет
+        for name in list(self.source_leases):
+            self.set_auto_source(name, 0)
+        self.settings.update(active=active)
+        self.settings.close()
+        self.process_watcher.close()
+        self.rule_inputs.close()
+        self.activity_monitor.close()
+        if self.power_events is not None:
+            self.power_events.stop()
+        self.power.close()
+        QApplication.quit()
+    
+    def moveEvent(self, event):
+        """Перемещение окна: положение сохраняется после остановки"""
+        super().moveEvent(event)
+        if self.isVisible():
+            self.settings.update(window=[self.x(), self.y()])
+    
+    def showEvent(self, event):
+        """Окно снова видно: обновляем время работы и выравниваем таймер,
+        анимации снова разрешены"""
+        super().showEvent(event)
+        governor.set_visible(not self.isMinimized())
+        if self.is_active:
+            self.update_uptime()
+    
+    def hideEvent(self, event):
+        """Окно скрыто: таймер времени работы и анимации не нужны"""
+        super().hideEvent(event)
+        governor.set_visible(False)
+        self.timer.stop()
+    
+    def changeEvent(self, event):
+        """Сворачивание и разворачивание окна"""
+        super().changeEvent(event)
+        if event.type() == QEvent.WindowStateChange:
+            governor.set_visible(self.isVisible() and not self.isMinimized())
+            if self.isMinimized():
+                self.timer.stop()
+            elif self.is_active and self.isVisible():
+                self.update_uptime()
+    
+    @traced()
+    def paintEvent(self, event):
+        """Отрисовка окна; первая отрисовка отмечается в журнале запуска"""
+        super().paintEvent(event)
+        if not self._first_paint_done:
+            self._first_paint_done = True
+            startup_timeline.first_paint(self.on_startup_finished)
+    
+    def on_startup_finished(self):
+        """Цикл событий свободен после первой отрисовки - окно готово к работе"""
+        startup_timeline.mark("готово к работе")
+        startup_timeline.report()
+    
+    def closeEvent(self, event):
+        """Обработка события закрытия окна"""
+        if self.tray_icon and self.tray_icon.isVisible():
+            event.ignore()
+            self.hide()
+            QTimer.singleShot(0, self.release_view)
+            self.show_notification("No-Sleep", "Приложение продолжает работать в фоновом режиме. Для выхода используйте меню в трее.")
+        else:
+            self.quit_application()
+
+def run(args=None, started=None, instance_server=None):
+    """Запуск графического интерфейса"""
+    if started is not None:
+        startup_timeline.t0 = started
+    
+    # Создание экземпляра приложения
+    app = QApplication(sys.argv)
+    app.setQuitOnLastWindowClosed(False)
+    app.setStyle('Fusion')  # Установка современного стиля
+    
+    # Установка иконки приложения
+    app.setWindowIcon(app_icon())
+    
+    if args is not None and args.animation_fps is not None:
+        governor.set_frame_rate(args.animation_fps)
+    
+    # Инициализация и отображение главного окна
+    window = NoSleepApp()
+    startup_timeline.mark("окно создано")
+    
+    if args is not None:
+        window.apply_args(args)
+    window.show()
+    try:
+        window.settings.watch()
+    except OSError:
+        pass  # Без уведомлений ОС настройки просто не перечитываются на лету
+    
+    # Уведомления о сне, батарее и блокировке (или записанный поток событий)
+    window.power_events = cli.start_power_events(args or cli.parse_args([]),
+                                                 window.power_policy)
+    
+    # Сигнал сохранения трассировки
+    if tracer.enabled:
+        window.watch_signals()
+    
+    # Аргументы повторных запусков приходят из потока канала экземпляра
+    if instance_server is not None:
+        instance_server.service.attach(window.instance_command.emit)
+    
+    # Запуск основного цикла приложения
+    try:
+        return app.exec_()
+    finally:
+        if instance_server is not None:
+            instance_server.shutdown()
+
+if __name__ == "__main__":
+    sys.exit(run())
@@ -0,0 +1,325 @@
+"""История удержания: журнал сеансов и суточные итоги по флагам.
+
+Журнал - файл только для дозаписи из записей фиксированной длины (9 байт:
+начало, длительность, флаги). Сеансом считается непрерывный отрезок с
+одними и теми же флагами: смена флагов закрывает отрезок и открывает новый.
+При превышении размера журнал переименовывается, старые части удаляются.
+
+Рядом хранится индекс: секунды и число сеансов по дням и флагам и позиция
+журнала, до которой он учтен. Индекс обновляется после каждой пачки
+записей, поэтому итоги за годы берутся из него без перечитывания журнала,
+а при открытии дочитывается только хвост. Записью занимается отдельный
+поток: пачка пишется через delay секунд после первого сеанса в ней.
+"""
+import os
+import struct
+import sys
+import threading
+import time
+from datetime import date, datetime, timedelta
+
+from metrics import registry
+
+HISTORY_WRITES = registry.counter("nosleep_history_writes_total", "Записанные пачки истории")
+HISTORY_RECORDS = registry.counter("nosleep_history_records_total", "Записанные сеансы истории")
+
+RECORD = struct.Struct("<IIB")  # Начало (секунды UNIX), длительность, флаги
+LOG_HEADER = struct.Struct("<4sQ")  # Сигнатура, номер части журнала
+INDEX_HEADER = struct.Struct("<4sQQI")  # Сигнатура, часть и позиция журнала, записей
+INDEX_ENTRY = struct.Struct("<IBII")  # День (ordinal), флаги, сеансов, секунд
+LOG_MAGIC = b"NSH1"
+INDEX_MAGIC = b"NSI1"
+
+MAX_LOG_BYTES = 1024 * 1024  # ~116 тысяч сеансов в одной части
+BACKUPS = 3
+
+
+def default_directory():
+    """Каталог истории рядом с файлом настроек"""
+    from settings import default_path
+    return os.path.join(os.path.dirname(default_path()), "history")
+
+
+def split_by_day(start, end):
+    """Разбиение отрезка [start, end) по местным суткам: (день, секунды)"""
+    moment = datetime.fromtimestamp(start)
+    while start < end:
+        midnight = datetime.combine(moment.date() + timedelta(days=1), datetime.min.time())
+        boundary = min(end, midnight.timestamp())
+        yield moment.date().toordinal(), boundary - start
+        start, moment = boundary, midnight
+
+
+class _FileLock:
+    """Межпроцессная блокировка: журнал может вести и служба, и CLI"""
+
+    def __init__(self, path):
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+
+    def __enter__(self):
+        if sys.platform == "win32":
+            import msvcrt
+            msvcrt.locking(self._fd, msvcrt.LK_LOCK, 1)
+        else:
+            import fcntl
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+        return self
+
+    def __exit__(self, *exc):
+        if sys.platform == "win32":
+            import msvcrt
+            os.lseek(self._fd, 0, os.SEEK_SET)
+            msvcrt.locking(self._fd, msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    def close(self):
+        os.close(self._fd)
+
+
+class History:
+    """Журнал сеансов с суточным индексом
+
+    record() только ставит сеанс в очередь; запись, обновление индекса и
+    ротация выполняются потоком записи пачками.
+    """
+
+    def __init__(self, directory=None, delay=2.0, max_bytes=MAX_LOG_BYTES, backups=BACKUPS):
+        self.directory = directory or default_directory()
+        self.delay = delay
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.log_path = os.path.join(self.directory, "sessions.log")
+        self.index_path = os.path.join(self.directory, "index.bin")
+        self._cond = threading.Condition()
+        self._pending = []
+        self._deadline = 0.0
+        self._writer = None
+        self._closed = False
+        self._lock = None  # Межпроцессная блокировка записи
+        self._state = threading.RLock()  # Индекс в памяти: поток записи и запросы
+        self._totals = {}  # (день, флаги) -> [сеансов, секунд]
+        self._part = 0  # Номер текущей части журнала
+        self._offset = LOG_HEADER.size  # Учтенная позиция в текущей части
+        self._loaded = False
+
+    def record(self, start, end, flags):
+        """Сеанс [start, end) в метках time.time() с флагами flags"""
+        if end <= start or not flags:
+            return
+        with self._cond:
+            if self._closed:
+                return
+            if not self._pending:
+                self._deadline = time.monotonic() + self.delay
+            self._pending.append(RECORD.pack(int(start), round(end - start), flags))
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._write_loop,
+                                                name="no-sleep-history", daemon=True)
+                self._writer.start()
+            self._cond.notify()
+
+    def flush(self):
+        """Немедленная запись очереди"""
+        with self._cond:
+            batch, self._pending = self._pending, []
+        if batch:
+            self._write(batch)
+
+    def close(self):
+        """Запись очереди и остановка потока записи"""
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        # Пачка, уже взятая потоком записи, дописывается до закрытия блокировки
+        if self._writer is not None:
+            self._writer.join()
+        self.flush()
+        if self._lock is not None:
+            self._lock.close()
+            self._lock = None
+
+    def daily(self, first, last):
+        """Итоги по дням [first, last]: список (дата, {флаги: секунды})"""
+        result = []
+        with self._state:
+            self._refresh()
+            for ordinal in range(first.toordinal(), last.toordinal() + 1):
+                per_flags = {}
+                for flags in (1, 2, 3):
+                    entry = self._totals.get((ordinal, flags))
+                    if entry is not None:
+                        per_flags[flags] = entry[1]
+                result.append((date.fromordinal(ordinal), per_flags))
+        return result
+
+    def totals(self, first=None, last=None):
+        """Сумма секунд и сеансов по флагам за период (по умолчанию - за все время)"""
+        low = first.toordinal() if first is not None else 0
+        high = last.toordinal() if last is not None else 1 << 32
+        result = {}
+        with self._state:
+            self._refresh()
+            for (ordinal, flags), (count, seconds) in self._totals.items():
+                if low <= ordinal <= high:
+                    total = result.setdefault(flags, [0, 0])
+                    total[0] += count
+                    total[1] += seconds
+        return {flags: tuple(total) for flags, total in result.items()}
+
+    def recent(self, limit=10):
+        """Последние сеансы текущей части журнала: (начало, конец, флаги)"""
+        try:
+            with open(self.log_path, "rb") as stream:
+                size = stream.seek(0, os.SEEK_END)
+                count = max(0, size - LOG_HEADER.size) // RECORD.size
+                skip = max(0, count - limit)
+                stream.seek(LOG_HEADER.size + skip * RECORD.size)
+                data = stream.read((count - skip) * RECORD.size)
+        except OSError:
+            return []
+        return [(start, start + length, flags)
+                for start, length, flags in RECORD.iter_unpack(data)][::-1]
+
+    def _refresh(self):
+        """Индекс с диска и дочитывание хвоста журнала (для чтения из другого процесса)"""
+        if self._writer is not None and self._loaded:
+            return  # Индекс этого процесса и так актуален
+        self._load()
+
+    def _write_loop(self):
+        while True:
+            with self._cond:
+                while not self._pending and not self._closed:
+                    self._cond.wait()
+                if self._closed:
+                    return
+                remaining = self._deadline - time.monotonic()
+                if remaining > 0:
+                    self._cond.wait(remaining)
+                    continue
+                batch, self._pending = self._pending, []
+            self._write(batch)
+
+    def _write(self, batch):
+        os.makedirs(self.directory, exist_ok=True)
+        if self._lock is None:
+            self._lock = _FileLock(os.path.join(self.directory, "history.lock"))
+        with self._lock, self._state:
+            self._load()  # Другой процесс мог дописать журнал
+            self._ensure_log()
+            position = 0
+            while position < len(batch):
+                # Часть журнала не превышает max_bytes и при большой пачке
+                room = max(1, (self.max_bytes - self._offset) // RECORD.size)
+                data = b"".join(batch[position:position + room])
+                position += room
+                with open(self.log_path, "ab") as stream:
+                    stream.write(data)
+                    stream.flush()
+                    os.fsync(stream.fileno())
+                self._apply(data)
+                self._offset += len(data)
+                self._save_index()
+                if self._offset >= self.max_bytes:
+                    self._rotate()
+        HISTORY_WRITES.inc()
+        HISTORY_RECORDS.inc(len(batch))
+
+    def _apply(self, data):
+        """Учет записей в итогах; сеанс считается в день своего начала"""
+        totals = self._totals
+        for start, length, flags in RECORD.iter_unpack(data):
+            first = 1
+            for ordinal, seconds in split_by_day(start, start + length):
+                entry = totals.get((ordinal, flags))
+                if entry is None:
+                    totals[(ordinal, flags)] = [first, round(seconds)]
+                else:
+                    entry[0] += first
+                    entry[1] += round(seconds)
+                first = 0
+
+    def _load(self):
+        """Чтение индекса и учет записей журнала после учтенной позиции"""
+        part, offset, totals = 0, LOG_HEADER.size, {}
+        try:
+            with open(self.index_path, "rb") as stream:
+                magic, part, offset, count = INDEX_HEADER.unpack(stream.read(INDEX_HEADER.size))
+                if magic != INDEX_MAGIC:
+                    raise ValueError("неизвестный формат индекса")
+                if (self._loaded and (part, offset) == (self._part, self._offset)
+                        and self._log_size() == offset):
+                    return  # Ни индекс, ни журнал не менялись
+                data = stream.read(count * INDEX_ENTRY.size)
+            for ordinal, flags, sessions, seconds in INDEX_ENTRY.iter_unpack(data):
+                totals[(ordinal, flags)] = [sessions, seconds]
+        except (OSError, ValueError, struct.error):
+            part, offset, totals = 0, LOG_HEADER.size, {}
+        self._part, self._offset, self._totals = part, offset, totals
+        try:
+            with open(self.log_path, "rb") as stream:
+                magic, log_part = LOG_HEADER.unpack(stream.read(LOG_HEADER.size))
+                if magic == LOG_MAGIC and log_part >= part:
+                    if log_part > part:
+                        # Ротация прошла после записи индекса: новая часть учитывается целиком
+                        self._part, self._offset = log_part, LOG_HEADER.size
+                    stream.seek(self._offset)
+                    tail = stream.read()
+                    tail = tail[:len(tail) - len(tail) % RECORD.size]  # Недописанная запись
+                    self._apply(tail)
+                    self._offset += len(tail)
+        except (OSError, struct.error):
+            pass
+        self._loaded = True
+
+    def _log_size(self):
+        try:
+            return os.path.getsize(self.log_path)
+        except OSError:
+            return None
+
+    def _ensure_log(self):
+        if not os.path.exists(self.log_path):
+            with open(self.log_path, "wb") as stream:
+                stream.write(LOG_HEADER.pack(LOG_MAGIC, self._part))
+            self._offset = LOG_HEADER.size
+
+    def _save_index(self):
+        parts = [INDEX_HEADER.pack(INDEX_MAGIC, self._part, self._offset, len(self._totals))]
+        parts.extend(INDEX_ENTRY.pack(ordinal, flags, sessions, seconds)
+                     for (ordinal, flags), (sessions, seconds) in sorted(self._totals.items()))
+        tmp_path = f"{self.index_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as stream:
+            stream.write(b"".join(parts))
+            stream.flush()
+            os.fsync(stream.fileno())
+        os.replace(tmp_path, self.index_path)
+
+    def _rotate(self):
+        """Переименование заполненной части; индекс уже учел ее целиком"""
+        for number in range(self.backups, 0, -1):
+            source = self.log_path if number == 1 else f"{self.log_path}.{number - 1}"
+            if os.path.exists(source):
+                os.replace(source, f"{self.log_path}.{number}")
+        if not self.backups:
+            os.remove(self.log_path)
+        self._part += 1
+        with open(self.log_path, "wb") as stream:
+            stream.write(LOG_HEADER.pack(LOG_MAGIC, self._part))
+        self._offset = LOG_HEADER.size
+        self._save_index()
+
+
+_default = None
+_default_lock = threading.Lock()
+
+
+def default_history():
+    """Общий журнал истории процесса"""
+    global _default
+    with _default_lock:
+        if _default is None:
+            _default = History()
+        return _default
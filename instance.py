@@ -0,0 +1,101 @@
+"""Единственный экземпляр графического интерфейса.
+
+Первый запуск захватывает локальный канал экземпляра (тот же построчный JSON
+и сервер, что у фоновой службы, но по отдельному адресу). Повторный запуск
+захватить его не может: он передает свои аргументы работающему экземпляру
+и сразу завершается, не загружая Qt и не создавая виджетов.
+"""
+import os
+import sys
+import threading
+import time
+
+from daemon import ControlClient, make_server
+
+# Сколько ждать, пока только что запущенный экземпляр начнет принимать команды
+FORWARD_TIMEOUT = 5.0
+
+
+def instance_address():
+    """Адрес канала экземпляра GUI для текущего пользователя"""
+    if sys.platform == "win32":
+        return r"\\.\pipe\no-sleep-gui-" + os.environ.get("USERNAME", "user")
+    from daemon import default_address
+    return os.path.join(os.path.dirname(default_address()), f"no-sleep-gui-{os.getuid()}.sock")
+
+
+class InstanceService:
+    """Обработчик канала экземпляра: принимает аргументы повторных запусков
+
+    Пока интерфейс не подключил обработчик через attach(), команды
+    копятся в очереди, поэтому ранние повторные запуски не теряются.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._handler = None
+        self._queued = []
+        self.commands = 0  # Принятые команды activate
+
+    def attach(self, handler):
+        """Подключение обработчика handler(argv) и передача накопленных команд"""
+        with self._lock:
+            self._handler = handler
+            queued, self._queued = self._queued, []
+        for argv in queued:
+            handler(argv)
+
+    def handle(self, request):
+        cmd = request.get("cmd")
+        if cmd == "activate":
+            argv = request.get("argv", [])
+            if not isinstance(argv, list) or not all(isinstance(arg, str) for arg in argv):
+                raise ValueError("argv должен быть списком строк")
+            with self._lock:
+                self.commands += 1
+                handler = self._handler
+                if handler is None:
+                    self._queued.append(argv)
+            if handler is not None:
+                handler(argv)
+            return {"ok": True, "pid": os.getpid()}
+        if cmd == "status":
+            return {"ok": True, "pid": os.getpid(), "commands": self.commands}
+        raise ValueError(f"неизвестная команда: {cmd!r}")
+
+
+def claim(address=None):
+    """Захват канала экземпляра: сервер или None, если экземпляр уже запущен"""
+    server = make_server(InstanceService(), address or instance_address())
+    try:
+        server.bind()
+    except RuntimeError:
+        return None
+    threading.Thread(target=server.serve_forever, name="no-sleep-instance", daemon=True).start()
+    return server
+
+
+def forward(argv, address=None, timeout=FORWARD_TIMEOUT):
+    """Передача аргументов работающему экземпляру; код возврата процесса"""
+    address = address or instance_address()
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            client = ControlClient(address, timeout=timeout)
+        except OSError:
+            # Экземпляр уже захватил канал, но еще не начал принимать команды
+            if time.monotonic() >= deadline:
+                print("No-Sleep уже запущен, но не отвечает", file=sys.stderr)
+                return 1
+            time.sleep(0.01)
+            continue
+        try:
+            client.request("activate", argv=list(argv))
+        except (OSError, RuntimeError, ValueError) as error:
+            # Экземпляр отклонил команду, закрыл соединение на полуслове или
+            # ответил не JSON: сообщение вместо трассировки
+            print(f"No-Sleep уже запущен, но не принял команду: {error}", file=sys.stderr)
+            return 1
+        finally:
+            client.close()
+        return 0
@@ -0,0 +1,206 @@
+"""Аренды удержания: много независимых причин не засыпать одновременно.
+
+Каждый заказчик (ручной сеанс, скрипт, задание) получает аренду со своими
+флагами и, при желании, сроком жизни: аренда истекает, если ее не продлили
+(heartbeat). Флаги удержания - объединение флагов живых аренд; система
+вызывается только при смене этого объединения, для чего по каждому флагу
+ведется счетчик аренд.
+
+Сроки истечения лежат в куче, поэтому получение, продление, снятие и
+истечение аренды стоят O(log n) без просмотра всех аренд. Продление не
+ищет старую запись в куче: она отбрасывается при извлечении, а когда
+устаревших записей становится больше живых, куча перестраивается.
+
+Интерфейс ожидания тот же, что у scheduler.Scheduler (advance,
+next_transition, on_reschedule, clock), поэтому сроки ведет тот же
+драйвер scheduler.SchedulerThread с одним ожиданием до ближайшего.
+"""
+import heapq
+import itertools
+import threading
+import time
+
+from metrics import registry
+from power import ES_SYSTEM_REQUIRED, ES_DISPLAY_REQUIRED
+from scheduler import END, Transition
+
+ACTIVE_LEASES = registry.gauge("nosleep_leases", "Живые аренды удержания")
+EXPIRED_LEASES = registry.counter("nosleep_leases_expired_total",
+                                  "Аренды, истекшие без продления")
+
+
+class Lease:
+    """Аренда удержания"""
+
+    __slots__ = ("id", "owner", "flags", "ttl", "expires")
+
+    def __init__(self, lease_id, owner, flags, ttl, expires):
+        self.id = lease_id
+        self.owner = owner
+        self.flags = flags
+        self.ttl = ttl  # Срок жизни после получения или продления, с (None - бессрочно)
+        self.expires = expires  # Момент истечения по clock (None - бессрочно)
+
+
+class LeaseManager:
+    """Аренды удержания с объединением флагов
+
+    on_change(flags) вызывается, только когда меняется объединение флагов
+    живых аренд; on_reschedule() - когда мог измениться ближайший срок.
+    Время - монотонные часы clock: сроки аренд не зависят от перевода часов.
+    """
+
+    def __init__(self, on_change=None, on_reschedule=None, clock=time.monotonic):
+        self.on_change = on_change
+        self.on_reschedule = on_reschedule
+        self.clock = clock
+        self.expired = 0  # Истекло аренд
+        self._lock = threading.RLock()
+        self._heap = []  # (момент истечения, порядковый номер, аренда)
+        self._seq = itertools.count()
+        self._ids = itertools.count(1)
+        self._leases = {}
+        self._counts = {ES_SYSTEM_REQUIRED: 0, ES_DISPLAY_REQUIRED: 0}
+        self._flags = 0
+
+    @property
+    def flags(self):
+        """Объединение флагов живых аренд"""
+        return self._flags
+
+    def __len__(self):
+        return len(self._leases)
+
+    def __contains__(self, lease_id):
+        return lease_id in self._leases
+
+    def get(self, lease_id):
+        """Аренда по номеру или None"""
+        return self._leases.get(lease_id)
+
+    def acquire(self, flags, ttl=None, owner=""):
+        """Новая аренда с флагами flags; без продления истекает через ttl секунд"""
+        if ttl is not None and ttl <= 0:
+            raise ValueError("срок аренды должен быть больше нуля")
+        with self._lock:
+            expires = None if ttl is None else self.clock() + ttl
+            lease = Lease(next(self._ids), owner, flags, ttl, expires)
+            self._leases[lease.id] = lease
+            self._count(flags, 1)
+            if expires is not None:
+                self._push(lease)
+            ACTIVE_LEASES.set(len(self._leases))
+            self._publish()
+        if expires is not None:
+            self._changed()
+        return lease.id
+
+    def renew(self, lease_id, ttl=None):
+        """Продление аренды на ttl секунд (по умолчанию - на ее срок)"""
+        with self._lock:
+            lease = self._leases.get(lease_id)
+            if lease is None:
+                return False
+            if ttl is not None:
+                if ttl <= 0:
+                    raise ValueError("срок аренды должен быть больше нуля")
+                lease.ttl = ttl
+            if lease.ttl is None:
+                return True
+            earlier = lease.expires is None or self.clock() + lease.ttl < lease.expires
+            lease.expires = self.clock() + lease.ttl
+            self._push(lease)
+        if earlier:
+            self._changed()
+        return True
+
+    def update(self, lease_id, flags):
+        """Смена флагов живой аренды"""
+        with self._lock:
+            lease = self._leases.get(lease_id)
+            if lease is None:
+                return False
+            self._count(lease.flags, -1)
+            lease.flags = flags
+            self._count(flags, 1)
+            self._publish()
+        return True
+
+    def release(self, lease_id):
+        """Снятие аренды; ее флаги снимаются сразу"""
+        with self._lock:
+            lease = self._leases.pop(lease_id, None)
+            if lease is None:
+                return False
+            # Запись в куче отбрасывается при извлечении
+            self._count(lease.flags, -1)
+            lease.expires = None
+            ACTIVE_LEASES.set(len(self._leases))
+            self._publish()
+        return True
+
+    def clear(self):
+        """Снятие всех аренд"""
+        with self._lock:
+            for lease_id in list(self._leases):
+                self.release(lease_id)
+
+    def next_transition(self):
+        """Ближайшее истечение аренды или None"""
+        with self._lock:
+            self._drop_stale()
+            if not self._heap:
+                return None
+            when, _, lease = self._heap[0]
+            return Transition(when, END, lease.id)
+
+    def advance(self, now=None):
+        """Снятие всех аренд, истекших к моменту now"""
+        with self._lock:
+            now = self.clock() if now is None else now
+            expired = 0
+            while self._heap and self._heap[0][0] <= now:
+                when, _, lease = heapq.heappop(self._heap)
+                if lease.expires != when:
+                    continue  # Аренда снята или продлена
+                del self._leases[lease.id]
+                self._count(lease.flags, -1)
+                lease.expires = None
+                expired += 1
+            if expired:
+                self.expired += expired
+                EXPIRED_LEASES.inc(expired)
+                ACTIVE_LEASES.set(len(self._leases))
+                self._publish()
+            return expired
+
+    def _count(self, flags, delta):
+        for bit in self._counts:
+            if flags & bit:
+                self._counts[bit] += delta
+
+    def _publish(self):
+        flags = 0
+        for bit, count in self._counts.items():
+            if count:
+                flags |= bit
+        if flags != self._flags:
+            self._flags = flags
+            if self.on_change is not None:
+                self.on_change(flags)
+
+    def _push(self, lease):
+        heapq.heappush(self._heap, (lease.expires, next(self._seq), lease))
+        if len(self._heap) > 64 and len(self._heap) > 2 * len(self._leases):
+            # Устаревшие записи продлений вытесняют живые: перестройка за O(n)
+            # раз в n продлений, то есть O(1) в среднем на продление
+            self._heap = [entry for entry in self._heap if entry[2].expires == entry[0]]
+            heapq.heapify(self._heap)
+
+    def _drop_stale(self):
+        while self._heap and self._heap[0][2].expires != self._heap[0][0]:
+            heapq.heappop(self._heap)
+
+    def _changed(self):
+        if self.on_reschedule is not None:
+            self.on_reschedule()
@@ -0,0 +1,293 @@
+"""Встроенные метрики No-Sleep: счетчики, датчики и гистограммы задержек.
+
+По умолчанию метрики выключены: методы inc/set/observe заменены пустой
+функцией, поэтому инструментированный код почти ничего не платит. После
+registry.enable() значения копятся и выгружаются в текстовом формате
+Prometheus - в файл или на локальный HTTP-порт.
+"""
+import os
+import threading
+import time
+from bisect import bisect_left
+
+# Границы корзин гистограмм задержек, в секундах
+LATENCY_BUCKETS = (0.00001, 0.00005, 0.0001, 0.0005, 0.001, 0.005,
+                   0.01, 0.05, 0.1, 0.5, 1.0)
+
+
+def _noop(*args, **kwargs):
+    pass
+
+
+class _NullTimer:
+    """Пустой замер времени для выключенных метрик"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class _Timer:
+    """Замер времени блока with в гистограмму"""
+
+    __slots__ = ("_histogram", "_start")
+
+    def __init__(self, histogram):
+        self._histogram = histogram
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self._histogram._observe(time.perf_counter() - self._start)
+        return False
+
+
+class Metric:
+    """Общая часть метрик: имя, описание, метки и переключение вкл/выкл"""
+
+    kind = "untyped"
+
+    def __init__(self, name, help_text, labels):
+        self.name = name
+        self.help = help_text
+        self.labels = labels
+        self._lock = threading.Lock()
+        self._set_enabled(False)
+
+    def _set_enabled(self, enabled):
+        raise NotImplementedError
+
+    def label_text(self, extra=None):
+        """Метки в формате Prometheus: {a="1",b="2"}"""
+        labels = dict(self.labels)
+        if extra:
+            labels.update(extra)
+        if not labels:
+            return ""
+        return "{" + ",".join(f'{key}="{value}"' for key, value in sorted(labels.items())) + "}"
+
+
+class Counter(Metric):
+    """Монотонно растущий счетчик"""
+
+    kind = "counter"
+
+    def __init__(self, name, help_text, labels):
+        self.value = 0
+        super().__init__(name, help_text, labels)
+
+    def _set_enabled(self, enabled):
+        self.inc = self._inc if enabled else _noop
+
+    def _inc(self, amount=1):
+        with self._lock:
+            self.value += amount
+
+    def samples(self):
+        yield self.name, self.label_text(), self.value
+
+
+class Gauge(Metric):
+    """Значение, которое может расти и убывать"""
+
+    kind = "gauge"
+
+    def __init__(self, name, help_text, labels):
+        self.value = 0
+        super().__init__(name, help_text, labels)
+
+    def _set_enabled(self, enabled):
+        self.set = self._set if enabled else _noop
+        self.inc = self._inc if enabled else _noop
+
+    def _set(self, value):
+        self.value = value
+
+    def _inc(self, amount=1):
+        with self._lock:
+            self.value += amount
+
+    def samples(self):
+        yield self.name, self.label_text(), self.value
+
+
+class GaugeFunction(Metric):
+    """Датчик, значение которого вычисляется в момент выгрузки"""
+
+    kind = "gauge"
+
+    def __init__(self, name, help_text, labels, fn):
+        self.fn = fn
+        super().__init__(name, help_text, labels)
+
+    def _set_enabled(self, enabled):
+        pass
+
+    @property
+    def value(self):
+        return self.fn()
+
+    def samples(self):
+        yield self.name, self.label_text(), self.fn()
+
+
+class Histogram(Metric):
+    """Гистограмма с фиксированными корзинами"""
+
+    kind = "histogram"
+
+    def __init__(self, name, help_text, labels, buckets=LATENCY_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        super().__init__(name, help_text, labels)
+
+    def _set_enabled(self, enabled):
+        self.observe = self._observe if enabled else _noop
+        self.time = self._time if enabled else self._null_time
+
+    def _observe(self, value):
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.count += 1
+            self.sum += value
+
+    def _time(self):
+        return _Timer(self)
+
+    @staticmethod
+    def _null_time():
+        return _NULL_TIMER
+
+    def samples(self):
+        cumulative = 0
+        for bound, count in zip(self.buckets, self.counts):
+            cumulative += count
+            yield self.name + "_bucket", self.label_text({"le": repr(bound)}), cumulative
+        yield self.name + "_bucket", self.label_text({"le": "+Inf"}), self.count
+        yield self.name + "_sum", self.label_text(), self.sum
+        yield self.name + "_count", self.label_text(), self.count
+
+
+class Registry:
+    """Реестр метрик процесса"""
+
+    def __init__(self):
+        self.enabled = False
+        self._metrics = {}
+        self._lock = threading.Lock()
+
+    def counter(self, name, help_text, **labels):
+        """Счетчик (повторный вызов с теми же именем и метками вернет его же)"""
+        return self._get(Counter, name, help_text, labels)
+
+    def gauge(self, name, help_text, **labels):
+        """Датчик"""
+        return self._get(Gauge, name, help_text, labels)
+
+    def gauge_function(self, name, help_text, fn, **labels):
+        """Датчик, вычисляемый функцией fn при выгрузке"""
+        return self._get(GaugeFunction, name, help_text, labels, fn)
+
+    def histogram(self, name, help_text, buckets=LATENCY_BUCKETS, **labels):
+        """Гистограмма задержек"""
+        return self._get(Histogram, name, help_text, labels, buckets)
+
+    def enable(self):
+        """Включение сбора значений всеми метриками"""
+        with self._lock:
+            self.enabled = True
+            for metric in self._metrics.values():
+                metric._set_enabled(True)
+
+    def value(self, name, **labels):
+        """Текущее значение счетчика или датчика (0, если метрики нет)"""
+        metric = self._metrics.get((name, tuple(sorted(labels.items()))))
+        return metric.value if metric is not None else 0
+
+    def render(self):
+        """Все метрики в текстовом формате Prometheus"""
+        lines = []
+        described = set()
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda m: m.name)
+        for metric in metrics:
+            if metric.name not in described:
+                described.add(metric.name)
+                lines.append(f"# HELP {metric.name} {metric.help}")
+                lines.append(f"# TYPE {metric.name} {metric.kind}")
+            for name, labels, value in metric.samples():
+                lines.append(f"{name}{labels} {value}")
+        return "\n".join(lines) + "\n"
+
+    def write_textfile(self, path):
+        """Атомарная запись метрик в файл (временный файл и переименование)"""
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as stream:
+            stream.write(self.render())
+        os.replace(tmp_path, path)
+
+    def _get(self, cls, name, help_text, labels, *args):
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            metric = self._metrics.get(key)
+            if metric is None:
+                metric = cls(name, help_text, labels, *args)
+                metric._set_enabled(self.enabled)
+                self._metrics[key] = metric
+            return metric
+
+
+# Общий реестр процесса
+registry = Registry()
+
+
+def start_textfile_exporter(path, interval=60.0, target=registry):
+    """Периодическая выгрузка метрик в файл; поток спит весь интервал"""
+    stop = threading.Event()
+
+    def loop():
+        while True:
+            target.write_textfile(path)
+            if stop.wait(interval):
+                target.write_textfile(path)
+                return
+
+    threading.Thread(target=loop, name="no-sleep-metrics-file", daemon=True).start()
+    return stop
+
+
+def start_http_exporter(port, target=registry):
+    """HTTP-выгрузка метрик только на 127.0.0.1; без запросов поток не просыпается"""
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            body = target.render().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = HTTPServer(("127.0.0.1", port), Handler)
+    server.timeout = None
+
+    def loop():
+        while True:
+            server.handle_request()
+
+    threading.Thread(target=loop, name="no-sleep-metrics-http", daemon=True).start()
+    return server
@@ -0,0 +1,248 @@
+import ctypes
+import sys
+import threading
+import time
+
+from metrics import registry
+from tracing import tracer
+
+# Константы для работы с системными настройками питания
+ES_CONTINUOUS = 0x80000000
+ES_SYSTEM_REQUIRED = 0x00000001
+ES_DISPLAY_REQUIRED = 0x00000002
+
+POWER_CALLS = registry.counter("nosleep_power_calls_total",
+                               "Вызовы SetThreadExecutionState")
+POWER_CALL_SECONDS = registry.histogram("nosleep_power_call_seconds",
+                                        "Длительность вызова SetThreadExecutionState")
+POWER_FLAGS = registry.gauge("nosleep_power_flags",
+                             "Удерживаемые флаги ES_SYSTEM/ES_DISPLAY")
+POWER_ERRORS = registry.counter("nosleep_power_errors_total",
+                                "Ошибки SetThreadExecutionState и обработчика on_change")
+WORKER_WAKEUPS = registry.counter("nosleep_thread_wakeups_total",
+                                  "Пробуждения фоновых потоков", thread="power")
+
+
+def keep_awake_flags(system=True, display=True):
+    """Флаги удержания: system - не засыпать, display - не гасить экран"""
+    flags = 0
+    if system:
+        flags |= ES_SYSTEM_REQUIRED
+    if display:
+        flags |= ES_DISPLAY_REQUIRED
+    return flags
+
+
+def _report(message, error):
+    """Ошибка потока питания: в stderr и в метрику, поток продолжает работу"""
+    POWER_ERRORS.inc()
+    print(f"No-Sleep: {message}: {error!r}", file=sys.stderr)
+
+
+def windows_backend():
+    """Функция SetThreadExecutionState из kernel32"""
+    if sys.platform != "win32":
+        raise OSError("SetThreadExecutionState доступен только в Windows")
+    return ctypes.windll.kernel32.SetThreadExecutionState
+
+
+class _SystemPowerStatus(ctypes.Structure):
+    _fields_ = [("ACLineStatus", ctypes.c_ubyte), ("BatteryFlag", ctypes.c_ubyte),
+                ("BatteryLifePercent", ctypes.c_ubyte), ("SystemStatusFlag", ctypes.c_ubyte),
+                ("BatteryLifeTime", ctypes.c_ulong), ("BatteryFullLifeTime", ctypes.c_ulong)]
+
+
+def on_battery():
+    """Работает ли машина от батареи (False, если это не удалось узнать)"""
+    if sys.platform == "win32":
+        status = _SystemPowerStatus()
+        if not ctypes.windll.kernel32.GetSystemPowerStatus(ctypes.byref(status)):
+            return False
+        return status.ACLineStatus == 0
+    import os
+
+    base = "/sys/class/power_supply"
+    try:
+        supplies = os.listdir(base)
+    except OSError:
+        return False
+    discharging = False
+    for name in supplies:
+        try:
+            with open(f"{base}/{name}/type") as stream:
+                kind = stream.read().strip()
+            if kind == "Mains":
+                with open(f"{base}/{name}/online") as stream:
+                    if stream.read().strip() == "1":
+                        return False
+            elif kind == "Battery":
+                with open(f"{base}/{name}/status") as stream:
+                    discharging |= stream.read().strip() == "Discharging"
+        except OSError:
+            continue
+    return discharging
+
+
+class PowerAssertionHolder:
+    """Удержание системы в активном состоянии одним долгоживущим потоком
+
+    Поток устанавливает флаги один раз и спит на условной переменной до
+    следующей команды, поэтому в режиме ожидания нет ни одного пробуждения,
+    а остановка снимает удержание сразу. Сколько бы раз ни переключали
+    режим, рабочий поток всегда один.
+
+    Если передан history (history.History), каждый непрерывный отрезок
+    удержания с одними флагами записывается в историю. on_change(flags)
+    вызывается рабочим потоком после того, как флаги установлены в системе.
+
+    Системный вызов выполняется без блокировки команд: hold() и release()
+    не ждут медленного вызова, а новая команда, пришедшая во время него,
+    выполняется сразу после.
+    """
+
+    def __init__(self, set_state=None, history=None, on_change=None):
+        self._set_state = set_state
+        self.history = history
+        self.on_change = on_change
+        self._segment = None  # (флаги, time.time(), time.monotonic()) текущего отрезка
+        self._cond = threading.Condition()
+        self._wanted = 0  # Флаги, которые нужно удерживать (0 - без удержания)
+        self._mask = ES_SYSTEM_REQUIRED | ES_DISPLAY_REQUIRED  # Разрешенные флаги
+        self._force = False  # Установить флаги заново, даже если они не менялись
+        self._applied = 0  # Флаги, установленные в системе
+        self._generation = 0  # Номер последней команды
+        self._done = 0  # Номер последней выполненной команды
+        self._closed = False
+        self._thread = None
+        self.wakeups = 0  # Количество пробуждений рабочего потока
+
+    @property
+    def flags(self):
+        """Флаги, которые удерживаются в данный момент"""
+        return self._applied
+
+    @property
+    def is_held(self):
+        """Удерживается ли сейчас состояние питания"""
+        return self._applied != 0
+
+    def hold(self, flags):
+        """Начать удержание с указанными флагами ES_SYSTEM/ES_DISPLAY"""
+        self._command(flags & (ES_SYSTEM_REQUIRED | ES_DISPLAY_REQUIRED))
+
+    def release(self):
+        """Снять удержание и вернуть обычный режим сна"""
+        self._command(0)
+
+    def restrict(self, mask):
+        """Удерживать только флаги из mask (например, без экрана от батареи)
+
+        Запрошенные флаги не забываются: при расширении маски они
+        возвращаются.
+        """
+        with self._cond:
+            if mask == self._mask:
+                return
+            self._mask = mask
+            if self._thread is not None and not self._closed:
+                self._generation += 1
+                self._cond.notify_all()
+
+    def reassert(self):
+        """Установить текущие флаги заново (после выхода из сна)"""
+        with self._cond:
+            if self._thread is None or self._closed or not self._wanted:
+                return
+            self._force = True
+            self._generation += 1
+            self._cond.notify_all()
+
+    def wait(self, timeout=None):
+        """Дождаться выполнения последней команды рабочим потоком"""
+        with self._cond:
+            target = self._generation
+            return self._cond.wait_for(lambda: self._done >= target, timeout)
+
+    def close(self, timeout=1.0):
+        """Снять удержание и завершить рабочий поток"""
+        with self._cond:
+            if self._thread is None:
+                return
+            self._closed = True
+            self._cond.notify_all()
+            thread = self._thread
+            self._record(0)
+        thread.join(timeout)
+        if self.history is not None:
+            self.history.flush()
+
+    def _command(self, flags):
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("Удержание питания уже завершено")
+            self._wanted = flags
+            self._generation += 1
+            if self._thread is None:
+                if self._set_state is None:
+                    self._set_state = windows_backend()
+                self._thread = threading.Thread(target=self._worker,
+                                                name="no-sleep-power", daemon=True)
+                self._thread.start()
+            self._cond.notify_all()
+            self._record(flags)
+
+    def _record(self, flags):
+        """Закрытие отрезка истории при смене флагов и открытие нового"""
+        if self.history is None:
+            return
+        segment = self._segment
+        if segment is not None and segment[0] == flags:
+            return
+        if segment is not None:
+            old_flags, started, started_mono = segment
+            self.history.record(started, started + time.monotonic() - started_mono, old_flags)
+        self._segment = (flags, time.time(), time.monotonic()) if flags else None
+
+    def _worker(self):
+        """Рабочий поток: все вызовы SetThreadExecutionState идут отсюда,
+        так как состояние выполнения привязано к потоку"""
+        with self._cond:
+            while True:
+                while self._done == self._generation and not self._closed:
+                    self._cond.wait()
+                    self.wakeups += 1
+                    WORKER_WAKEUPS.inc()
+                wanted = 0 if self._closed else self._wanted & self._mask
+                generation = self._generation
+                force, self._force = self._force, False
+                failed = False
+                if wanted != self._applied or force:
+                    self._cond.release()
+                    # Ошибка не останавливает поток: иначе wait(), release() и
+                    # close() ждали бы его вечно. Неудавшийся вызов повторится
+                    # со следующей командой
+                    try:
+                        # ES_CONTINUOUS без других флагов снимает удержание
+                        with POWER_CALL_SECONDS.time(), tracer.span("SetThreadExecutionState"):
+                            self._set_state(ES_CONTINUOUS | wanted)
+                    except Exception as error:
+                        failed = True
+                        _report("SetThreadExecutionState не выполнен", error)
+                    else:
+                        POWER_CALLS.inc()
+                        POWER_FLAGS.set(wanted)
+                        if self.on_change is not None:
+                            try:
+                                self.on_change(wanted)
+                            except Exception as error:
+                                _report("ошибка в обработчике on_change", error)
+                    finally:
+                        self._cond.acquire()
+                    if not failed:
+                        self._applied = wanted
+                self._done = generation
+                self._cond.notify_all()
+                if self._closed and (not self._applied or failed):
+                    # Если close() пришел во время вызова, удержание снимается
+                    # следующим проходом
+                    return
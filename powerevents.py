@@ -0,0 +1,370 @@
+"""События питания и сеанса: сон и пробуждение, сеть и батарея, блокировка, крышка.
+
+Источник событий вызывает on_event(PowerEvent) из своего потока:
+
+- в Windows - скрытое окно, которому система присылает WM_POWERBROADCAST
+  (сон, пробуждение, смена источника питания и положения крышки через
+  RegisterPowerSettingNotification) и WM_WTSSESSION_CHANGE (блокировка);
+- в других системах и для проверки - воспроизведение записанного потока
+  событий (JSON Lines: {"at": секунды от начала, "event": "battery"}).
+
+Поток источника все время спит в GetMessage или на ожидании до следующей
+записи, поэтому без событий он не просыпается ни разу.
+
+PowerPolicy - реакция удержания на события: после пробуждения флаги
+устанавливаются заново, от батареи и при заблокированном сеансе экрану
+разрешается гаснуть, а сон системы по-прежнему удерживается.
+"""
+import ctypes
+import json
+import sys
+import threading
+import time
+
+from metrics import registry
+from power import ES_SYSTEM_REQUIRED, ES_DISPLAY_REQUIRED
+
+POWER_EVENTS = registry.counter("nosleep_power_events_total", "События питания и сеанса")
+WATCHER_WAKEUPS = registry.counter("nosleep_thread_wakeups_total",
+                                   "Пробуждения фоновых потоков", thread="powerevents")
+
+SUSPEND = "suspend"
+RESUME = "resume"
+AC = "ac"
+BATTERY = "battery"
+LOCK = "lock"
+UNLOCK = "unlock"
+LID_CLOSED = "lid-closed"
+LID_OPEN = "lid-open"
+KINDS = (SUSPEND, RESUME, AC, BATTERY, LOCK, UNLOCK, LID_CLOSED, LID_OPEN)
+
+
+class PowerEvent:
+    """Событие питания или сеанса"""
+
+    __slots__ = ("kind", "time")
+
+    def __init__(self, kind, when=None):
+        if kind not in KINDS:
+            raise ValueError(f"неизвестное событие питания: {kind!r}")
+        self.kind = kind
+        self.time = time.time() if when is None else when
+
+    def __repr__(self):
+        return f"PowerEvent({self.kind!r})"
+
+
+class PowerPolicy:
+    """Реакция удержания PowerAssertionHolder на события питания
+
+    on_event(event) вызывается после применения реакции (например, чтобы
+    перепроверить расписание после пробуждения).
+    """
+
+    def __init__(self, holder=None, display_on_battery=False, display_when_locked=False,
+                 on_event=None):
+        self.holder = holder  # None - удержание в службе другого процесса
+        self.display_on_battery = display_on_battery
+        self.display_when_locked = display_when_locked
+        self.on_event = on_event
+        self.on_battery = False
+        self.locked = False
+        self.suspended = False
+
+    def __call__(self, event):
+        kind = event.kind
+        if kind == SUSPEND:
+            self.suspended = True
+        elif kind == RESUME:
+            self.suspended = False
+            # Удержание могло потеряться во время сна: флаги ставятся заново
+            if self.holder is not None:
+                self.holder.reassert()
+        elif kind in (AC, BATTERY):
+            self.on_battery = kind == BATTERY
+            self._restrict()
+        elif kind in (LOCK, UNLOCK):
+            self.locked = kind == LOCK
+            self._restrict()
+        if self.on_event is not None:
+            self.on_event(event)
+
+    @property
+    def mask(self):
+        """Флаги, которые разрешено удерживать в текущем состоянии"""
+        mask = ES_SYSTEM_REQUIRED | ES_DISPLAY_REQUIRED
+        if (self.on_battery and not self.display_on_battery) or \
+                (self.locked and not self.display_when_locked):
+            mask &= ~ES_DISPLAY_REQUIRED
+        return mask
+
+    def attach(self, holder):
+        """Новое удержание под теми же правилами (например, после пропажи службы)"""
+        self.holder = holder
+        self._restrict()
+
+    def _restrict(self):
+        if self.holder is not None:
+            self.holder.restrict(self.mask)
+
+
+class ReplayPowerEvents:
+    """Воспроизведение записанного потока событий в отдельном потоке
+
+    events - последовательность (секунды от начала, вид события); speed
+    ускоряет воспроизведение.
+    """
+
+    def __init__(self, events, on_event, speed=1.0):
+        self.events = sorted(events, key=lambda item: item[0])
+        self.on_event = on_event
+        self.speed = speed
+        self.delivered = 0
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="no-sleep-powerevents", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def join(self, timeout=None):
+        """Ожидание конца записи"""
+        self._thread.join(timeout)
+
+    def _run(self):
+        started = time.monotonic()
+        for at, kind in self.events:
+            delay = at / self.speed - (time.monotonic() - started)
+            if delay > 0 and self._stop.wait(delay):
+                return
+            if self._stop.is_set():
+                return
+            WATCHER_WAKEUPS.inc()
+            POWER_EVENTS.inc()
+            self.delivered += 1
+            self.on_event(PowerEvent(kind))
+
+
+def load_events(path):
+    """Записанный поток событий из файла JSON Lines: [(секунды, вид)]"""
+    events = []
+    with open(path, encoding="utf-8") as stream:
+        for number, line in enumerate(stream, 1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+                kind = record["event"]
+                if kind not in KINDS:
+                    raise ValueError(f"неизвестное событие {kind!r}")
+                events.append((float(record.get("at", 0.0)), kind))
+            except (ValueError, KeyError, TypeError) as exc:
+                raise ValueError(f"{path}:{number}: неверная запись события: {exc}") from exc
+    return events
+
+
+# Windows: сообщения и уведомления питания
+WM_DESTROY = 0x0002
+WM_CLOSE = 0x0010
+WM_POWERBROADCAST = 0x0218
+WM_WTSSESSION_CHANGE = 0x02B1
+PBT_APMSUSPEND = 0x0004
+PBT_APMRESUMEAUTOMATIC = 0x0012
+PBT_POWERSETTINGCHANGE = 0x8013
+WTS_SESSION_LOCK = 0x7
+WTS_SESSION_UNLOCK = 0x8
+NOTIFY_FOR_THIS_SESSION = 0
+DEVICE_NOTIFY_WINDOW_HANDLE = 0
+
+
+class _GUID(ctypes.Structure):
+    _fields_ = [("Data1", ctypes.c_ulong), ("Data2", ctypes.c_ushort),
+                ("Data3", ctypes.c_ushort), ("Data4", ctypes.c_ubyte * 8)]
+
+    @classmethod
+    def parse(cls, text):
+        import uuid
+
+        value = uuid.UUID(text)
+        return cls(value.time_low, value.time_mid, value.time_hi_version,
+                   (ctypes.c_ubyte * 8)(*value.bytes[8:]))
+
+
+GUID_ACDC_POWER_SOURCE = "5d3e9a59-e9d5-4b00-a6bd-ff34ff516548"  # 0 - сеть, 1 - батарея, 2 - ИБП
+GUID_LIDSWITCH_STATE_CHANGE = "ba3e0f4d-b817-4094-a2d1-d56379e6a0f3"  # 0 - закрыта, 1 - открыта
+
+
+class _PowerBroadcastSetting(ctypes.Structure):
+    _fields_ = [("PowerSetting", _GUID), ("DataLength", ctypes.c_ulong),
+                ("Data", ctypes.c_ubyte * 4)]
+
+
+class WindowsPowerEvents:
+    """События питания и сеанса Windows через скрытое окно
+
+    Окно не message-only: широковещательный WM_POWERBROADCAST (сон и
+    пробуждение) такие окна не получают. Окно никогда не показывается.
+    """
+
+    def __init__(self, on_event):
+        self.on_event = on_event
+        self._hwnd = None
+        self._user32 = None
+        self._ready = threading.Event()
+        self._thread = None
+        self._error = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="no-sleep-powerevents", daemon=True)
+        self._thread.start()
+        self._ready.wait()
+        if self._error is not None:
+            raise OSError(f"уведомления питания недоступны: {self._error}")
+
+    def stop(self):
+        if self._hwnd is not None:
+            self._user32.PostMessageW(self._hwnd, WM_CLOSE, 0, 0)
+        if self._thread is not None:
+            self._thread.join()
+
+    def _emit(self, kind):
+        WATCHER_WAKEUPS.inc()
+        POWER_EVENTS.inc()
+        self.on_event(PowerEvent(kind))
+
+    def _run(self):
+        from ctypes import wintypes
+
+        # Свои экземпляры библиотек: прототипы на общих ctypes.windll.*
+        # поменяли бы вызовы тех же функций в других модулях процесса
+        user32 = self._user32 = ctypes.WinDLL("user32", use_last_error=True)
+        kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+        wtsapi32 = ctypes.WinDLL("wtsapi32", use_last_error=True)
+        LRESULT = ctypes.c_ssize_t
+        WNDPROC = ctypes.WINFUNCTYPE(LRESULT, wintypes.HWND, wintypes.UINT,
+                                     wintypes.WPARAM, wintypes.LPARAM)
+        user32.DefWindowProcW.restype = LRESULT
+        user32.DefWindowProcW.argtypes = (wintypes.HWND, wintypes.UINT,
+                                          wintypes.WPARAM, wintypes.LPARAM)
+        # Дескрипторы 64-битные: без прототипов ctypes усекал бы их до int
+        kernel32.GetModuleHandleW.restype = wintypes.HMODULE
+        kernel32.GetModuleHandleW.argtypes = (wintypes.LPCWSTR,)
+        user32.CreateWindowExW.restype = wintypes.HWND
+        user32.CreateWindowExW.argtypes = (wintypes.DWORD, wintypes.LPCWSTR, wintypes.LPCWSTR,
+                                           wintypes.DWORD, ctypes.c_int, ctypes.c_int,
+                                           ctypes.c_int, ctypes.c_int, wintypes.HWND,
+                                           wintypes.HMENU, wintypes.HINSTANCE, wintypes.LPVOID)
+        user32.DestroyWindow.restype = wintypes.BOOL
+        user32.DestroyWindow.argtypes = (wintypes.HWND,)
+        user32.PostMessageW.restype = wintypes.BOOL
+        user32.PostMessageW.argtypes = (wintypes.HWND, wintypes.UINT,
+                                        wintypes.WPARAM, wintypes.LPARAM)
+        wtsapi32.WTSRegisterSessionNotification.argtypes = (wintypes.HWND, wintypes.DWORD)
+        wtsapi32.WTSUnRegisterSessionNotification.argtypes = (wintypes.HWND,)
+        user32.RegisterPowerSettingNotification.restype = wintypes.HANDLE
+        user32.RegisterPowerSettingNotification.argtypes = (wintypes.HANDLE, ctypes.c_void_p,
+                                                            wintypes.DWORD)
+        user32.UnregisterPowerSettingNotification.argtypes = (wintypes.HANDLE,)
+
+        acdc = _GUID.parse(GUID_ACDC_POWER_SOURCE)
+        lid = _GUID.parse(GUID_LIDSWITCH_STATE_CHANGE)
+
+        def on_setting(setting):
+            if setting.DataLength < 4:
+                return
+            value = int.from_bytes(bytes(setting.Data), "little")
+            if bytes(setting.PowerSetting) == bytes(acdc):
+                self._emit(AC if value == 0 else BATTERY)
+            elif bytes(setting.PowerSetting) == bytes(lid):
+                self._emit(LID_CLOSED if value == 0 else LID_OPEN)
+
+        def window_proc(hwnd, message, wparam, lparam):
+            if message == WM_POWERBROADCAST:
+                if wparam == PBT_APMSUSPEND:
+                    self._emit(SUSPEND)
+                elif wparam == PBT_APMRESUMEAUTOMATIC:
+                    # Приходит при любом пробуждении; PBT_APMRESUMESUSPEND -
+                    # только если разбудил пользователь
+                    self._emit(RESUME)
+                elif wparam == PBT_POWERSETTINGCHANGE and lparam:
+                    on_setting(_PowerBroadcastSetting.from_address(lparam))
+                return 1
+            if message == WM_WTSSESSION_CHANGE:
+                if wparam == WTS_SESSION_LOCK:
+                    self._emit(LOCK)
+                elif wparam == WTS_SESSION_UNLOCK:
+                    self._emit(UNLOCK)
+                return 0
+            if message == WM_DESTROY:
+                for handle in registrations:
+                    user32.UnregisterPowerSettingNotification(handle)
+                wtsapi32.WTSUnRegisterSessionNotification(hwnd)
+                user32.PostQuitMessage(0)
+                return 0
+            return user32.DefWindowProcW(hwnd, message, wparam, lparam)
+
+        class WNDCLASSW(ctypes.Structure):
+            _fields_ = [("style", wintypes.UINT), ("lpfnWndProc", WNDPROC),
+                        ("cbClsExtra", ctypes.c_int), ("cbWndExtra", ctypes.c_int),
+                        ("hInstance", wintypes.HINSTANCE), ("hIcon", wintypes.HICON),
+                        ("hCursor", wintypes.HANDLE), ("hbrBackground", wintypes.HBRUSH),
+                        ("lpszMenuName", wintypes.LPCWSTR), ("lpszClassName", wintypes.LPCWSTR)]
+
+        user32.RegisterClassW.restype = wintypes.ATOM
+        user32.RegisterClassW.argtypes = (ctypes.POINTER(WNDCLASSW),)
+        user32.UnregisterClassW.restype = wintypes.BOOL
+        user32.UnregisterClassW.argtypes = (wintypes.LPCWSTR, wintypes.HINSTANCE)
+
+        proc = WNDPROC(window_proc)  # Ссылка держится до конца цикла сообщений
+        instance = kernel32.GetModuleHandleW(None)
+        window_class = WNDCLASSW(lpfnWndProc=proc, hInstance=instance,
+                                 lpszClassName="NoSleepPowerEvents")
+        registrations = []
+        hwnd = None
+        try:
+            if not user32.RegisterClassW(ctypes.byref(window_class)):
+                raise ctypes.WinError(ctypes.get_last_error())
+            hwnd = user32.CreateWindowExW(0, window_class.lpszClassName, "No-Sleep power events",
+                                          0, 0, 0, 0, 0, None, None, instance, None)
+            if not hwnd:
+                raise ctypes.WinError(ctypes.get_last_error())
+            wtsapi32.WTSRegisterSessionNotification(hwnd, NOTIFY_FOR_THIS_SESSION)
+            # Текущее значение настройки приходит сразу после регистрации
+            for guid in (acdc, lid):
+                handle = user32.RegisterPowerSettingNotification(
+                    hwnd, ctypes.byref(guid), DEVICE_NOTIFY_WINDOW_HANDLE)
+                if handle:
+                    registrations.append(handle)
+        except OSError as exc:
+            if hwnd:
+                user32.DestroyWindow(hwnd)
+            user32.UnregisterClassW(window_class.lpszClassName, instance)
+            self._error = exc
+            self._ready.set()
+            return
+        self._hwnd = hwnd
+        self._ready.set()
+
+        message = wintypes.MSG()
+        while user32.GetMessageW(ctypes.byref(message), None, 0, 0) > 0:
+            user32.TranslateMessage(ctypes.byref(message))
+            user32.DispatchMessageW(ctypes.byref(message))
+        user32.UnregisterClassW(window_class.lpszClassName, instance)
+        self._hwnd = None
+
+
+def make_source(on_event, replay=None, speed=1.0):
+    """Источник событий: запись replay, если она задана, иначе системный
+
+    Возвращает None, если на этой платформе системного источника нет.
+    """
+    if replay is not None:
+        return ReplayPowerEvents(load_events(replay), on_event, speed)
+    if sys.platform == "win32":
+        return WindowsPowerEvents(on_event)
+    return None
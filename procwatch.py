@@ -0,0 +1,673 @@
+"""Удержание, пока работают выбранные процессы (рендер, резервное копирование).
+
+Выход процесса ожидается уведомлением ядра, без опроса таблицы процессов:
+в Linux - poll() по pidfd, в Windows - WaitForMultipleObjects по дескрипторам
+процессов. Сотни процессов ожидает один поток (в Windows - по 63 процесса на
+поток: 64-й дескриптор занят событием пробуждения).
+
+Процессы выбираются по PID или шаблону имени ("blender", "rsync*"). Таблица
+процессов читается только при добавлении шаблона, по запросу и при выходе
+найденного по шаблону процесса, причем имена читаются лишь у новых PID.
+
+Запуск новых процессов по шаблону в Linux приходит уведомлением ядра (proc
+connector, событие exec по netlink): тот же поток ожидания читает имя только
+запустившегося PID. На старых ядрах подписка требует CAP_NET_ADMIN; без
+нее, как и в Windows, где такое уведомление есть лишь у WMI
+(Win32_ProcessStartTrace, нужны COM и права администратора), процесс,
+запущенный позже, находится только перечисленными выше просмотрами.
+"""
+import errno
+import fnmatch
+import os
+import select
+import socket
+import struct
+import sys
+import threading
+
+from metrics import registry
+
+WATCHER_WAKEUPS = registry.counter("nosleep_thread_wakeups_total",
+                                   "Пробуждения фоновых потоков", thread="procwatch")
+WATCHED_PROCESSES = registry.gauge("nosleep_watched_processes",
+                                   "Отслеживаемые процессы")
+PROCESS_SCANS = registry.counter("nosleep_process_scans_total",
+                                 "Просмотры таблицы процессов")
+
+# Linux proc connector: netlink NETLINK_CONNECTOR, группа CN_IDX_PROC
+NETLINK_CONNECTOR = 11
+CN_IDX_PROC = CN_VAL_PROC = 1
+PROC_CN_MCAST_LISTEN = 1
+PROC_EVENT_NONE = 0  # Подтверждение подписки; data - код ошибки
+PROC_EVENT_EXEC = 2
+_NLMSG_DONE = 3
+_NLMSGHDR = struct.Struct("=IHHII")
+_CN_MSG = struct.Struct("=IIIIHH")
+_PROC_EVENT = struct.Struct("=IIQII")  # what, cpu, timestamp, pid/err, tgid
+
+# Windows: один дескриптор в WaitForMultipleObjects занят событием пробуждения
+MAXIMUM_WAIT_OBJECTS = 64
+HANDLES_PER_THREAD = MAXIMUM_WAIT_OBJECTS - 1
+
+
+def matches(name, pattern):
+    """Совпадение имени процесса с шаблоном без учета регистра и суффикса .exe"""
+    name = name.lower()
+    pattern = pattern.lower()
+    if fnmatch.fnmatchcase(name, pattern):
+        return True
+    return name.endswith(".exe") and fnmatch.fnmatchcase(name[:-4], pattern)
+
+
+class ProcessTable:
+    """Таблица процессов, которая при обновлении читает имена только новых PID"""
+
+    def __init__(self):
+        self._names = {}
+
+    def refresh(self):
+        """Обновление; возвращает {pid: имя} появившихся с прошлого раза процессов"""
+        PROCESS_SCANS.inc()
+        if sys.platform == "win32":
+            current = dict(_windows_processes())
+            new = {pid: name for pid, name in current.items() if self._names.get(pid) != name}
+            self._names = current
+            return new
+        pids = {int(entry) for entry in os.listdir("/proc") if entry.isdigit()}
+        for pid in self._names.keys() - pids:
+            del self._names[pid]
+        new = {}
+        for pid in pids - self._names.keys():
+            name = _linux_process_name(pid)
+            if name is not None:
+                new[pid] = self._names[pid] = name
+        return new
+
+    def note(self, pid):
+        """Имя одного процесса (после exec оно новое); None, если его уже нет"""
+        name = _linux_process_name(pid)
+        if name is not None:
+            self._names[pid] = name
+        return name
+
+
+def _linux_process_name(pid):
+    """Имя исполняемого файла из argv[0]; для потоков ядра - comm"""
+    try:
+        with open(f"/proc/{pid}/cmdline", "rb") as stream:
+            argv0 = stream.read(4096).split(b"\0", 1)[0]
+        if argv0:
+            return os.path.basename(argv0.decode("utf-8", "replace"))
+        with open(f"/proc/{pid}/comm", "rb") as stream:
+            return stream.read().strip().decode("utf-8", "replace")
+    except OSError:
+        return None
+
+
+def _windows_processes():
+    """(pid, имя) всех процессов из снимка Toolhelp32"""
+    import ctypes
+    from ctypes import wintypes
+
+    class PROCESSENTRY32W(ctypes.Structure):
+        _fields_ = [("dwSize", wintypes.DWORD), ("cntUsage", wintypes.DWORD),
+                    ("th32ProcessID", wintypes.DWORD), ("th32DefaultHeapID", ctypes.c_void_p),
+                    ("th32ModuleID", wintypes.DWORD), ("cntThreads", wintypes.DWORD),
+                    ("th32ParentProcessID", wintypes.DWORD), ("pcPriClassBase", wintypes.LONG),
+                    ("dwFlags", wintypes.DWORD), ("szExeFile", wintypes.WCHAR * 260)]
+
+    kernel32 = _kernel32()
+    snapshot = kernel32.CreateToolhelp32Snapshot(0x00000002, 0)  # TH32CS_SNAPPROCESS
+    if snapshot == wintypes.HANDLE(-1).value:
+        raise ctypes.WinError(ctypes.get_last_error())
+    try:
+        entry = PROCESSENTRY32W()
+        entry.dwSize = ctypes.sizeof(entry)
+        ok = kernel32.Process32FirstW(snapshot, ctypes.byref(entry))
+        while ok:
+            yield entry.th32ProcessID, entry.szExeFile
+            ok = kernel32.Process32NextW(snapshot, ctypes.byref(entry))
+    finally:
+        kernel32.CloseHandle(snapshot)
+
+
+_kernel32_dll = None
+
+
+def _kernel32():
+    """kernel32 с прототипами нужных функций (загружается при первом вызове)"""
+    global _kernel32_dll
+    if _kernel32_dll is None:
+        import ctypes
+        from ctypes import wintypes
+
+        dll = ctypes.WinDLL("kernel32", use_last_error=True)
+        dll.CreateToolhelp32Snapshot.restype = wintypes.HANDLE
+        dll.CreateToolhelp32Snapshot.argtypes = [wintypes.DWORD, wintypes.DWORD]
+        dll.Process32FirstW.argtypes = [wintypes.HANDLE, ctypes.c_void_p]
+        dll.Process32NextW.argtypes = [wintypes.HANDLE, ctypes.c_void_p]
+        dll.OpenProcess.restype = wintypes.HANDLE
+        dll.OpenProcess.argtypes = [wintypes.DWORD, wintypes.BOOL, wintypes.DWORD]
+        dll.CreateEventW.restype = wintypes.HANDLE
+        dll.CreateEventW.argtypes = [ctypes.c_void_p, wintypes.BOOL, wintypes.BOOL, wintypes.LPCWSTR]
+        dll.SetEvent.argtypes = [wintypes.HANDLE]
+        dll.CloseHandle.argtypes = [wintypes.HANDLE]
+        dll.WaitForMultipleObjects.restype = wintypes.DWORD
+        dll.WaitForMultipleObjects.argtypes = [wintypes.DWORD, ctypes.POINTER(wintypes.HANDLE),
+                                               wintypes.BOOL, wintypes.DWORD]
+        _kernel32_dll = dll
+    return _kernel32_dll
+
+
+def open_exec_events():
+    """Подписанный на события процессов сокет proc connector (Linux)
+
+    Ошибка подписки без прав приходит позже подтверждением в самом сокете.
+    """
+    sock = socket.socket(socket.AF_NETLINK, socket.SOCK_DGRAM, NETLINK_CONNECTOR)
+    try:
+        # Событие - на каждый fork, exec и выход в системе; очередь с запасом
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 1 << 20)
+        sock.bind((0, CN_IDX_PROC))
+        op = struct.pack("=I", PROC_CN_MCAST_LISTEN)
+        message = _CN_MSG.pack(CN_IDX_PROC, CN_VAL_PROC, 0, 0, len(op), 0) + op
+        sock.send(_NLMSGHDR.pack(_NLMSGHDR.size + len(message), _NLMSG_DONE, 0, 0, 0) + message)
+        sock.setblocking(False)
+    except OSError:
+        sock.close()
+        raise
+    return sock
+
+
+def read_exec_events(sock):
+    """(PID процессов, выполнивших exec; были ли потеряны события) из всех
+    пришедших сообщений
+
+    None, если ядро отказало в подписке.
+    """
+    pids = []
+    lost = False
+    offset = _NLMSGHDR.size + _CN_MSG.size
+    while True:
+        try:
+            data = sock.recv(4096)
+        except (BlockingIOError, InterruptedError):
+            return pids, lost
+        except OSError as error:
+            if error.errno != errno.ENOBUFS:
+                raise
+            lost = True  # Очередь переполнилась: часть запусков не дошла
+            continue
+        if len(data) < offset + _PROC_EVENT.size:
+            continue
+        what, _, _, pid, tgid = _PROC_EVENT.unpack_from(data, offset)
+        if what == PROC_EVENT_EXEC:
+            pids.append(tgid)
+        elif what == PROC_EVENT_NONE and pid:
+            return None
+
+
+class PidfdWaiter:
+    """Linux: один поток ждет выхода всех процессов через poll() по pidfd
+
+    on_exit(pids) получает все PID, завершившиеся к одному пробуждению. Тот
+    же поток по listen_exec() ждет и уведомлений о запуске процессов.
+    """
+
+    def __init__(self, on_exit):
+        self.on_exit = on_exit
+        self.on_exec = None
+        self._lock = threading.Lock()
+        self._pending = []  # (pid, pidfd) для добавления и (pid, None) для удаления
+        self._exec_sock = None  # Сокет proc connector, еще не принятый потоком
+        self._closed = False
+        self._wake_r, self._wake_w = os.pipe()
+        self._thread = threading.Thread(target=self._loop, name="no-sleep-procwatch", daemon=True)
+        self._thread.start()
+
+    def add(self, pid):
+        """Начать ожидание процесса; False, если его уже нет"""
+        try:
+            pidfd = os.pidfd_open(pid)
+        except ProcessLookupError:
+            return False
+        self._send((pid, pidfd))
+        return True
+
+    def discard(self, pid):
+        """Перестать ждать процесс"""
+        self._send((pid, None))
+
+    def listen_exec(self, on_exec):
+        """on_exec(pids, lost) - о запуске процессов (exec); lost - часть
+        уведомлений потеряна. False, если ядро не дает подписаться;
+        on_exec=None снимает подписку."""
+        sock = None
+        if on_exec is not None:
+            try:
+                sock = open_exec_events()
+            except OSError:
+                return False
+        with self._lock:
+            self.on_exec = on_exec
+            if self._exec_sock:
+                self._exec_sock.close()
+            # Пустая строка - снять подписку в потоке
+            self._exec_sock = sock if sock is not None else ""
+        os.write(self._wake_w, b"\0")
+        return True
+
+    def close(self):
+        with self._lock:
+            self._closed = True
+        os.write(self._wake_w, b"\0")
+        self._thread.join()
+
+    def _send(self, item):
+        # Регистрацией в poll занимается сам поток ожидания
+        with self._lock:
+            self._pending.append(item)
+        os.write(self._wake_w, b"\0")
+
+    def _loop(self):
+        poller = select.poll()
+        poller.register(self._wake_r, select.POLLIN)
+        by_fd, by_pid = {}, {}
+        exec_sock = None
+        try:
+            while True:
+                events = poller.poll()
+                WATCHER_WAKEUPS.inc()
+                exited = []
+                for fd, _ in events:
+                    if fd == self._wake_r:
+                        os.read(self._wake_r, 4096)
+                        continue
+                    if exec_sock is not None and fd == exec_sock.fileno():
+                        result = read_exec_events(exec_sock)
+                        if result is None:  # Нет прав: остаются просмотры таблицы
+                            poller.unregister(exec_sock)
+                            exec_sock.close()
+                            exec_sock = None
+                        elif (result[0] or result[1]) and self.on_exec is not None:
+                            self.on_exec(*result)
+                        continue
+                    pid = by_fd.pop(fd)
+                    del by_pid[pid]
+                    poller.unregister(fd)
+                    os.close(fd)
+                    exited.append(pid)
+                if exited:
+                    self.on_exit(exited)
+                with self._lock:
+                    pending, self._pending = self._pending, []
+                    new_sock, self._exec_sock = self._exec_sock, None
+                    if self._closed:
+                        for _, pidfd in pending:
+                            if pidfd is not None:
+                                os.close(pidfd)
+                        if new_sock:
+                            new_sock.close()
+                        return
+                if new_sock is not None:
+                    if exec_sock is not None:
+                        poller.unregister(exec_sock)
+                        exec_sock.close()
+                    exec_sock = new_sock or None
+                    if exec_sock is not None:
+                        poller.register(exec_sock, select.POLLIN)
+                for pid, pidfd in pending:
+                    old = by_pid.pop(pid, None)
+                    if old is not None:
+                        del by_fd[old]
+                        poller.unregister(old)
+                        os.close(old)
+                    if pidfd is not None:
+                        by_fd[pidfd] = pid
+                        by_pid[pid] = pidfd
+                        poller.register(pidfd, select.POLLIN)
+        finally:
+            for fd in by_fd:
+                os.close(fd)
+            if exec_sock is not None:
+                exec_sock.close()
+            os.close(self._wake_r)
+            os.close(self._wake_w)
+
+
+class HandleWaiter:
+    """Windows: WaitForMultipleObjects по дескрипторам процессов группами по 63"""
+
+    def __init__(self, on_exit):
+        self.on_exit = on_exit
+        self._lock = threading.Lock()
+        self._groups = []
+        self._group_of = {}  # pid -> группа
+
+    def add(self, pid):
+        """Начать ожидание процесса; False, если его уже нет или нет доступа"""
+        handle = _kernel32().OpenProcess(0x00100000, False, pid)  # SYNCHRONIZE
+        if not handle:
+            return False
+        with self._lock:
+            group = next((group for group in self._groups if group.free > 0), None)
+            if group is None:
+                group = _HandleGroup(self._exited, len(self._groups))
+                self._groups.append(group)
+            self._group_of[pid] = group
+            group.send(pid, handle)
+        return True
+
+    def discard(self, pid):
+        """Перестать ждать процесс"""
+        with self._lock:
+            group = self._group_of.pop(pid, None)
+            if group is not None:
+                group.send(pid, None)
+
+    def listen_exec(self, on_exec):
+        """Уведомления о запуске в Windows есть только у WMI: не поддерживаются"""
+        return on_exec is None
+
+    def close(self):
+        with self._lock:
+            groups, self._groups = self._groups, []
+        for group in groups:
+            group.close()
+
+    def _exited(self, pids):
+        with self._lock:
+            for pid in pids:
+                self._group_of.pop(pid, None)
+        self.on_exit(pids)
+
+
+class _HandleGroup:
+    """Поток, ожидающий до 63 процессов и событие пробуждения"""
+
+    def __init__(self, on_exit, index):
+        self.on_exit = on_exit
+        self._lock = threading.Lock()
+        self._pending = []
+        self._count = 0  # Процессы в группе с учетом еще не принятых потоком
+        self._closed = False
+        self._event = _kernel32().CreateEventW(None, False, False, None)
+        self._thread = threading.Thread(target=self._loop, name=f"no-sleep-procwatch-{index}",
+                                        daemon=True)
+        self._thread.start()
+
+    @property
+    def free(self):
+        return HANDLES_PER_THREAD - self._count
+
+    def send(self, pid, handle):
+        with self._lock:
+            self._pending.append((pid, handle))
+            self._count += 1 if handle is not None else -1
+        _kernel32().SetEvent(self._event)
+
+    def close(self):
+        with self._lock:
+            self._closed = True
+        _kernel32().SetEvent(self._event)
+        self._thread.join()
+
+    def _loop(self):
+        import ctypes
+        from ctypes import wintypes
+
+        kernel32 = _kernel32()
+        pids = {}  # дескриптор -> pid
+        handles = (wintypes.HANDLE * MAXIMUM_WAIT_OBJECTS)(self._event)
+        try:
+            while True:
+                with self._lock:
+                    pending, self._pending = self._pending, []
+                    if self._closed:
+                        return
+                for pid, handle in pending:
+                    if handle is not None:
+                        pids[handle] = pid
+                        continue
+                    for old, old_pid in list(pids.items()):
+                        if old_pid == pid:
+                            del pids[old]
+                            kernel32.CloseHandle(old)
+                order = list(pids)
+                for i, handle in enumerate(order, 1):
+                    handles[i] = handle
+                result = kernel32.WaitForMultipleObjects(len(order) + 1, handles, False, 0xFFFFFFFF)
+                WATCHER_WAKEUPS.inc()
+                if result == 0xFFFFFFFF:  # WAIT_FAILED
+                    raise ctypes.WinError(ctypes.get_last_error())
+                if 1 <= result <= len(order):  # WAIT_OBJECT_0 + i
+                    handle = order[result - 1]
+                    pid = pids.pop(handle)
+                    kernel32.CloseHandle(handle)
+                    with self._lock:
+                        self._count -= 1
+                    self.on_exit([pid])
+        finally:
+            for handle in pids:
+                kernel32.CloseHandle(handle)
+            kernel32.CloseHandle(self._event)
+
+
+def make_waiter(on_exit):
+    """Ожидание выхода процессов для текущей платформы"""
+    if sys.platform == "win32":
+        return HandleWaiter(on_exit)
+    if hasattr(os, "pidfd_open"):
+        return PidfdWaiter(on_exit)
+    raise OSError("ожидание процессов поддерживается только в Linux (pidfd) и Windows")
+
+
+class ProcessWatcher:
+    """Слежение за процессами по PID и шаблонам имен
+
+    on_change(alive) вызывается, когда появляется первый или завершается
+    последний отслеживаемый процесс; on_pattern_change(pattern, alive) - то
+    же для каждого шаблона отдельно, поэтому один наблюдатель (один поток
+    ожидания и один просмотр таблицы) обслуживает много независимых шаблонов.
+    Оба вызываются из потока ожидания или из вызывающего метода.
+    """
+
+    def __init__(self, on_change=None, waiter_factory=make_waiter, on_pattern_change=None):
+        self.on_change = on_change
+        self.on_pattern_change = on_pattern_change
+        self._lock = threading.RLock()
+        # pid -> шаблоны, по которым он найден (None в множестве - задан по PID)
+        self._pids = {}
+        self._patterns = []
+        self._matched = {}  # Шаблон -> число найденных по нему процессов
+        self._table = ProcessTable()
+        self._waiter_factory = waiter_factory
+        self._waiter = None
+        self._exec_events = False  # Подписка потока ожидания на запуск процессов
+        self._alive = False
+        self._published = {}  # Шаблон -> последнее переданное on_pattern_change
+
+    @property
+    def alive(self):
+        """Работает ли хотя бы один отслеживаемый процесс"""
+        return self._alive
+
+    @property
+    def pids(self):
+        """PID отслеживаемых процессов"""
+        with self._lock:
+            return set(self._pids)
+
+    @property
+    def patterns(self):
+        with self._lock:
+            return list(self._patterns)
+
+    @property
+    def exec_events(self):
+        """Приходят ли уведомления ядра о запуске процессов"""
+        return self._exec_events
+
+    def pattern_alive(self, pattern):
+        """Работает ли хотя бы один процесс, найденный по шаблону"""
+        with self._lock:
+            return self._matched.get(pattern, 0) > 0
+
+    def watch_pid(self, pid):
+        """Следить за процессом по PID; False, если процесса нет"""
+        with self._lock:
+            added = self._add(pid, None)
+            self._publish()
+            return added
+
+    def watch_name(self, pattern):
+        """Следить за процессами, имя которых подходит под шаблон; число найденных"""
+        return self.watch_names([pattern])
+
+    def watch_names(self, patterns):
+        """Следить за несколькими шаблонами сразу: таблица просматривается один раз"""
+        with self._lock:
+            found = 0
+            for pattern in patterns:
+                if pattern not in self._patterns:
+                    self._patterns.append(pattern)
+                    self._matched[pattern] = 0
+                # Уже известные PID таблица не вернет, поэтому сначала сверяем их
+                found += sum(self._add(pid, pattern) for pid, name in self._table._names.items()
+                             if matches(name, pattern))
+            found += self._scan()
+            if self._patterns and not self._exec_events:
+                self._exec_events = self._get_waiter().listen_exec(self._started)
+            self._publish()
+            return found
+
+    def unwatch_name(self, pattern):
+        """Перестать следить за шаблоном; процессы, найденные только по нему,
+        больше не ожидаются"""
+        with self._lock:
+            if pattern not in self._patterns:
+                return
+            self._patterns.remove(pattern)
+            del self._matched[pattern]
+            for pid, reasons in list(self._pids.items()):
+                reasons.discard(pattern)
+                if not reasons:
+                    del self._pids[pid]
+                    self._waiter.discard(pid)
+            if not self._patterns and self._exec_events:
+                self._waiter.listen_exec(None)
+                self._exec_events = False
+            WATCHED_PROCESSES.set(len(self._pids))
+            self._publish()
+
+    def rescan(self):
+        """Поиск новых процессов по шаблонам; число найденных"""
+        with self._lock:
+            found = self._scan()
+            self._publish()
+            return found
+
+    def clear(self):
+        """Перестать следить за всеми процессами и шаблонами"""
+        with self._lock:
+            for pattern in list(self._patterns):
+                self.unwatch_name(pattern)
+            for pid in list(self._pids):
+                self._waiter.discard(pid)
+            self._pids.clear()
+            WATCHED_PROCESSES.set(0)
+            self._publish()
+
+    def close(self):
+        with self._lock:
+            waiter, self._waiter = self._waiter, None
+            self._exec_events = False
+            self._pids.clear()
+            self._patterns.clear()
+            self._matched.clear()
+        if waiter is not None:
+            waiter.close()
+
+    def _scan(self):
+        if not self._patterns:
+            return 0
+        found = 0
+        for pid, name in self._table.refresh().items():
+            added = False
+            for pattern in self._patterns:
+                if matches(name, pattern):
+                    added |= self._add(pid, pattern)
+            found += added
+        return found
+
+    def _add(self, pid, reason):
+        """Ожидание pid по шаблону reason (None - по PID); True, если pid
+        добавлен по этой причине впервые"""
+        reasons = self._pids.get(pid)
+        if reasons is not None:
+            if reason in reasons:
+                return False
+            reasons.add(reason)
+            if reason is not None:
+                self._matched[reason] += 1
+            return True
+        if pid == os.getpid():
+            return False
+        if not self._get_waiter().add(pid):
+            return False
+        self._pids[pid] = {reason}
+        if reason is not None:
+            self._matched[reason] += 1
+        WATCHED_PROCESSES.set(len(self._pids))
+        return True
+
+    def _get_waiter(self):
+        if self._waiter is None:
+            self._waiter = self._waiter_factory(self._exited)
+        return self._waiter
+
+    def _started(self, pids, lost):
+        """Уведомление о запуске: имена читаются только у этих PID; после
+        потери уведомлений таблица просматривается целиком"""
+        with self._lock:
+            if lost:
+                self._scan()
+            for pid in pids:
+                name = self._table.note(pid)
+                if name is None:
+                    continue
+                for pattern in self._patterns:
+                    if matches(name, pattern):
+                        self._add(pid, pattern)
+            self._publish()
+
+    def _exited(self, pids):
+        with self._lock:
+            rescan = False
+            for pid in pids:
+                for reason in self._pids.pop(pid, ()):
+                    if reason is not None:
+                        self._matched[reason] -= 1
+                        rescan = True
+            WATCHED_PROCESSES.set(len(self._pids))
+            # Процесс из шаблона мог запустить преемника (следующий этап рендера);
+            # таблица просматривается один раз на пачку завершившихся
+            if rescan:
+                self._scan()
+            self._publish()
+
+    def _publish(self):
+        if self.on_pattern_change is not None:
+            published = self._published
+            for pattern, count in self._matched.items():
+                if (count > 0) != published.get(pattern, False):
+                    published[pattern] = count > 0
+                    self.on_pattern_change(pattern, count > 0)
+            for pattern in [pattern for pattern in published if pattern not in self._matched]:
+                if published.pop(pattern):
+                    self.on_pattern_change(pattern, False)
+        alive = bool(self._pids)
+        if alive != self._alive:
+            self._alive = alive
+            if self.on_change is not None:
+                self.on_change(alive)
@@ -0,0 +1,588 @@
+# -*- coding: utf-8 -*-
+
+# Resource object code
+#
+# Created by: The Resource Compiler for PyQt5 (Qt v5.15.14)
+#
+# WARNING! All changes made in this file will be lost!
+
+from PyQt5 import QtCore
+
+qt_resource_data = b"\
+\x00\x00\x21\xaa\
+\x00\
+\x01\x97\xae\x78\x9c\xed\x9d\x09\x54\x14\x57\xba\xc7\xc9\x49\xce\
+\xcc\x99\x39\x6f\x96\x2c\x33\x2f\xdb\xcb\xc4\xb0\x76\xb3\xf4\x06\
+\xdd\xb8\xa1\xd9\x34\x99\xe4\xbd\x79\xc9\x9b\x4c\xf2\x66\xc9\xcc\
+\x9b\x25\x93\x18\x15\x41\x36\x59\x44\xd4\x68\xd4\x30\x71\x21\x71\
+\x01\x35\x46\x01\x31\xa8\xe0\xae\xa8\x28\x28\xfb\xa2\x6c\x22\x8b\
+\x80\x88\x5b\x14\xd7\xa8\x13\x93\xe6\xd5\x05\xcb\x29\x6f\xdf\x7b\
+\xeb\xde\x5b\xd5\x4d\x1b\xab\x72\xbe\x54\x75\xd1\xdd\x74\x7f\xfc\
+\xfc\x7f\xdb\xad\x6e\x0f\x8f\xfb\x84\xff\x56\xae\xf4\x10\xfe\xff\
+\xb4\xc7\x92\xc5\xf7\x79\xfc\xdc\xc3\xc3\xc3\x4f\x30\xe1\x94\x47\
+\xd8\x7d\x03\xe7\xc1\xf6\xc0\xbc\xfb\x3c\xa2\x1e\xf2\xe8\x37\x6d\
+\xd3\x36\x6d\xd3\x36\x6d\x23\x6f\x1d\x2b\x43\x1e\xed\x5a\x66\xf0\
+\x3f\xb2\x24\x24\xb8\x73\x49\xe0\xf3\x1d\x4b\x03\x5f\x3e\xb2\xc8\
+\x3c\xb6\x35\xcd\xf4\x52\xdd\x7c\xdb\x8b\x2d\x9f\x98\xc7\xd4\x2f\
+\xb0\x3e\xdb\xf6\xa9\xf9\xb9\xfa\x45\x96\xd1\xad\x0b\xcc\xcf\xd6\
+\xa5\x86\x8e\x6a\x5f\x68\x7c\xa1\xe3\x13\xc3\xb3\xd5\xb3\x87\x86\
+\x35\xa5\x06\x8f\x2a\x17\xf6\x75\x73\x82\x47\x55\x7d\x38\x7c\x04\
+\xb0\x16\xe1\xb8\xf6\x83\xd0\xe1\xe5\x33\x86\x86\xd5\xcf\xb1\x3e\
+\x5b\x96\x14\x36\x12\x58\xfd\x0c\xdb\xe8\xaa\xe4\xe1\x23\x4a\x13\
+\x86\x8f\x38\x98\x30\x32\xac\x36\x65\xd8\xb3\xe5\xc9\x23\xc3\x2a\
+\x93\x87\x8f\x6e\x98\x61\x7d\xae\x22\x69\xc4\xa8\x12\xc1\xc0\x79\
+\x70\x1f\x60\x8d\x33\x42\xc2\x6a\x92\x87\x0e\x13\xce\x0f\x3f\x9c\
+\x3c\x34\x4c\x78\xdc\xb0\x03\x49\x61\x43\x9b\x53\x42\x87\x57\x26\
+\x8d\xb0\x95\xc5\x0f\x0f\xad\x17\x7e\x5e\x2a\x1c\x97\xc4\x8f\xb4\
+\x36\x25\x5b\x43\x6b\x92\x86\x86\x54\x26\x8f\xb4\x36\xa6\xd8\x6c\
+\xc2\xde\x5c\x91\x18\x66\xaa\x9b\x3e\xc2\x52\x9d\x3c\x22\xa8\x3c\
+\x79\x98\xb1\x69\xa6\x35\xb4\x3a\x79\x58\x70\x71\xc2\xa8\xd1\xe5\
+\x89\xb6\x3f\x15\xc7\x3f\xf7\xf2\xba\x37\xde\xb8\x1f\xe7\x27\xf0\
+\xb3\xe2\x84\x11\x2f\x54\x4c\xb5\xfe\x01\xbc\xa6\xea\xa4\x11\x96\
+\x7a\xe1\xf7\x97\x09\x7b\x60\x75\x29\xc3\x86\x82\xe7\x03\xbf\xb3\
+\x7e\xc6\xd0\x61\xe2\xeb\x3a\x24\xbc\x57\x70\x5c\x2e\xbc\xde\x86\
+\x19\x36\xe1\x71\xc3\x86\x82\xd7\x5e\x2b\x3c\xb6\xf4\xd6\xf9\x66\
+\x70\x5e\x78\x7c\x85\xf0\xbe\x0e\xa7\x0c\x1b\x59\x16\x3f\x2a\x14\
+\xbc\x47\x70\x7f\xc1\x57\xa1\xc0\xc4\xf7\x27\x3e\xb6\x4a\x78\x6e\
+\x60\xf5\x12\x1f\x00\x1f\x55\x0a\xef\x1f\x58\x53\x4a\x48\xff\xeb\
+\xa9\x48\x0a\x0b\x39\x2c\x3c\xbe\x3c\x7e\x58\x30\x78\x9d\xcd\x29\
+\xc1\x21\xb5\xc2\xfb\x07\x3e\x38\x9c\x1c\x6a\xae\x4c\x0c\x0b\x04\
+\x56\x3f\xdd\x6a\xa8\x4d\x1c\xee\x5f\x91\x3c\x34\xa0\x2e\xd9\x16\
+\x54\x9a\x18\xa6\xab\x4a\x1e\xe5\x57\x3d\xdd\xa6\x6b\x48\x1e\xfe\
+\x54\xd3\xac\x90\x87\x95\xb2\x76\x3c\x35\xf4\x07\x1d\x4b\x83\xde\
+\xba\x90\x66\x2d\x38\x9b\x1d\xd0\xdd\xbe\xc2\xff\x5a\xfd\x7c\x43\
+\x1f\xb0\xe6\xf4\x80\x3e\xf1\x18\x67\x55\x33\x2d\x77\x1c\x93\xac\
+\x3c\xde\x7a\x7b\xef\xee\x26\x70\x7c\xaa\x2c\xd9\xfa\x63\x9c\xdf\
+\xb6\x46\x9b\x67\x0f\xf6\x6b\x1c\x2c\xab\x48\xb0\x7e\x7d\x38\xc9\
+\x7a\xe1\xd8\x4c\x5b\x5b\xf5\x47\x96\x65\x02\x93\xa1\xa4\x7f\xa7\
+\xa8\xad\x79\x59\xd0\x90\x0b\xcb\x2d\x25\x80\x31\xd1\x78\xb8\x93\
+\xee\x45\x43\xb1\x28\xb2\x87\xe3\xef\x40\x94\xed\xf6\x7e\xb0\xad\
+\x3a\x36\xf4\x52\x71\xdc\x88\x07\x71\xbe\xcb\x1c\x67\xca\x74\x97\
+\xd7\x3a\xd8\x56\x9b\x18\x72\xa5\x62\x6e\xf0\xe2\xaa\x58\xcb\x4f\
+\x68\xb8\x6b\x5f\x6a\xf9\xc9\x97\x2b\x0d\xad\x52\xee\x9c\xc1\x20\
+\x8d\xfe\x81\x63\x91\x3b\x98\xc5\x41\x63\x2f\x2e\xf4\x22\x89\xbd\
+\xb5\x13\x4c\x2b\x07\xfb\x35\xba\x93\x15\x47\xd9\xec\x67\x66\x0f\
+\xdb\x5d\x12\x11\xfa\x03\x12\x77\x7d\xeb\xde\xb8\xff\xc2\x12\xeb\
+\x66\x1c\x77\x22\x6f\xf0\x9e\x25\xee\x92\x18\x44\xe9\x9f\xf4\x58\
+\xca\xa1\xbb\xb2\x97\x3b\xd1\x94\xae\xb1\x77\xa7\x01\x7f\x14\xcd\
+\x0e\xce\x2c\x4c\x1e\xf5\x00\xce\x6f\x5d\x2b\x82\xde\x6c\x5f\xa3\
+\x27\x32\xc7\xcb\x1f\xcc\x1d\x29\xf6\xc2\xcc\xb9\x53\x0c\x96\x63\
+\x2f\x6f\x92\x79\x91\xc6\x1e\x86\xc1\xa4\x90\x77\x71\x7e\xbb\x9c\
+\x69\x38\x0c\xd8\x93\xf2\x87\x62\x11\x66\x8e\x47\xff\x68\xe2\x2e\
+\x4e\xff\x06\x53\xfb\x00\x7b\xb5\xe1\x86\x9f\xe2\x7c\xb8\x25\xc2\
+\x9c\xaa\xb1\x87\xb6\xa3\xc9\xa1\x6d\x2d\x13\x5e\xfa\xbe\x83\xe6\
+\x65\xf9\x3e\xde\x9d\xad\xfb\x4a\x64\x0d\xa7\x7f\x4a\xf9\xa3\x89\
+\xbd\x72\xf5\x47\xff\xbf\xa1\x41\xe2\xaf\x4a\xa6\xd6\xd8\x1a\x69\
+\x99\xab\xb1\x87\xb6\xda\x24\xeb\xd5\xf2\xa8\x90\x47\x61\x9f\x9d\
+\xc8\xd2\x99\x3a\xb3\x74\x5f\x8b\xdc\xc1\xec\x49\x6f\x93\x62\x2e\
+\x89\x41\x96\xfc\x8f\xa4\x7f\x52\xf6\x5c\xcd\x60\x55\x9c\xed\x32\
+\x89\xbd\xed\x51\xe6\x0f\x35\xf6\xd0\x56\x99\x60\xfd\xba\x24\x3e\
+\xd4\xec\xa0\x7b\xd9\xfe\x63\xda\x33\xf5\xdf\x4a\xb9\x63\xd1\x3e\
+\x9a\xba\x57\x49\xed\x8b\x8a\xbf\x22\x83\xd2\xbd\xb3\xad\x22\xc6\
+\x76\x85\xc4\xde\xb6\xc9\xe6\x39\x1a\x7b\x18\x9b\x6c\xfb\xb6\x3a\
+\xd1\xf6\x5f\xb0\xcf\xda\x3f\xf7\xff\x0b\xcc\x9d\x9c\xfe\xa9\xd9\
+\x77\xa1\xa9\x7f\xe5\x7a\x9b\xae\x61\xcf\x7a\xa5\x24\x22\x14\x3b\
+\x11\xd7\xd8\xc3\x1b\xf0\x4b\x75\xa2\xf5\xcf\xb0\xcf\x7a\xf2\x02\
+\xe2\x60\xde\x68\xf4\x8f\xb7\xfe\xa5\xd5\x3e\x9a\xda\x43\x7c\x5f\
+\xae\xf8\x9b\x57\xc4\xda\xae\x92\xd8\xd3\xf2\x3d\x32\x7b\xe5\x09\
+\x21\x13\x60\x9f\x75\xac\x0f\x98\x23\x72\xd7\x9d\xe7\x43\xd4\x3f\
+\xb9\xda\x97\xb5\xef\xc2\xc3\xe1\x60\xf5\x5e\xca\x65\xd8\xd3\x74\
+\x8f\xcc\xde\xc1\xb8\xe0\x28\xd8\x67\x6d\xeb\x02\xd2\x50\xba\x47\
+\x9b\xfb\xa9\x55\xff\xb2\xf4\xfe\xe0\xbc\xcf\x15\xda\x57\x1e\x63\
+\xfb\x8a\xc4\x9e\x56\x6b\xc8\xd8\x94\xe0\x78\xd8\x67\x47\xb2\x03\
+\xd2\xa5\xec\xa1\xb4\x8f\x36\xfe\x2a\xcd\xfd\x58\x6a\x60\x57\xd7\
+\xbe\xe5\x31\xd6\x6b\xe5\x71\xf8\xb5\x1a\x1a\x7b\x04\xdf\x01\xdd\
+\x8b\x37\x27\xc1\x3e\x6b\xcc\xd1\xaf\x92\xb2\x07\x1b\x9c\xff\xb1\
+\x30\xc8\xc2\xa1\x5c\xfc\x95\xcb\xff\xc4\xf7\x28\xdd\x6b\xec\xb9\
+\x87\xf5\xfb\x25\x3e\x38\xd9\x81\xbd\x75\xba\x2c\x51\xeb\xa4\xba\
+\x87\xe3\x90\x25\xee\xd2\xf6\xfd\x50\xac\xb1\xd4\xbf\xae\x98\x7d\
+\x94\x47\x5b\xaf\x6b\xec\xf1\xb3\xb7\x3f\x2e\x24\x05\xf6\x59\xfd\
+\x5a\x7d\x0e\xe0\x0d\xc5\x1c\x1c\x7f\x79\x6b\x60\x5a\x53\x52\xff\
+\xa2\x6a\x5f\x35\x59\x00\xec\x15\x46\x5a\x1e\xc1\xb2\x37\x79\x60\
+\xfd\xde\x60\xff\x9d\xdd\xd5\x8a\xe2\x82\x67\xc0\x3e\x3b\x9c\xad\
+\xcb\x15\x19\x23\x69\x1e\xab\xfe\xc1\xba\xa7\xd6\xdc\x43\x8e\x3f\
+\x38\x07\x54\xcb\x77\x65\x1a\x7b\xdc\xd6\xaf\x7b\x53\x82\x67\xc2\
+\x3e\x3b\x94\xad\xdf\x28\xd5\x3d\x39\x0e\x59\xeb\x60\x56\xfe\x68\
+\xeb\x5f\x39\x06\xa5\xfc\xa9\xc1\x44\x59\x8c\xf5\x06\x89\xbd\x1d\
+\x51\x96\x59\x1a\x7b\x04\xf6\xe2\x2c\x1f\xc0\x3e\xab\xc9\xd4\xe5\
+\xa3\xd8\x23\xe5\x7f\x38\xe6\xe0\x73\x6a\xd7\xbf\x3c\xb9\x9f\xf8\
+\xde\x5d\xc0\xde\x07\x1a\x7b\x78\xf6\xf6\xc5\x04\xcf\x86\x7d\x56\
+\x9d\xa9\xdb\xcc\xa2\x7b\x38\xfd\x63\x8d\xc1\x2c\xb5\xaf\xbb\xcc\
+\xde\x8a\x26\x18\x7f\x86\x63\x6f\x67\xb4\x79\xa6\xc6\x1e\xde\x0a\
+\x63\x83\xe7\xc0\x3e\xab\x5c\xa3\xdf\x22\xb2\x47\xe2\x8f\xa4\x7f\
+\x34\xb3\x5f\x96\xfe\x33\x8f\xfe\xc9\xc5\x5e\xe9\x9e\xd7\xf6\x47\
+\x06\xff\x07\x8e\xbd\x5d\x51\xc1\x33\x34\xf6\xd0\x06\xfc\xb2\x37\
+\xd6\x32\xcf\x81\xbd\xd5\xfa\x6d\x28\xf6\x68\x63\x30\x4b\xdf\x8f\
+\x87\x3f\x39\xed\xa3\x99\xfb\xaa\xa5\x81\x85\xe1\xb6\xa7\xb1\xec\
+\x45\x07\x4f\xd7\xd8\xc3\xb3\x27\xe8\x5e\x2a\xec\xb3\x8a\xd5\xba\
+\x1d\x52\xf6\x50\x5a\xa7\x56\xfc\xe5\xcd\xff\x58\x6b\x0f\x1c\x77\
+\xa2\x1f\x78\x7d\x58\x30\x29\xf8\x19\x8d\x3d\x3e\xf6\x0a\xa2\x2d\
+\x1f\xc3\x3e\x2b\xff\x5c\xb7\x13\x66\x8f\x25\xfe\xb2\xcc\x3d\x78\
+\x66\xbf\xb8\xf8\x0b\xf3\x07\x73\x47\xa3\x81\x6a\xb2\x57\x10\x65\
+\x49\xd1\xd8\xc3\x9b\xf0\x6f\x73\x01\xec\xb3\xb2\x55\xfa\x5d\xac\
+\xec\xe1\x62\x30\x4f\xfd\xa1\x76\xfd\x2b\xd7\x7b\x86\xfb\x2f\x2c\
+\xfe\xdb\x13\x65\xf6\xc4\xb2\x17\x6d\x99\xa6\xb1\x87\xb6\x01\xdd\
+\x33\x2f\x72\x60\xef\x73\x7d\x01\x8e\x3d\x96\xda\x83\xd4\xf7\x13\
+\x8f\xa5\x79\x1f\x69\x0e\xc7\x32\xf7\xa0\x8d\xbf\xf0\x9e\x87\xbf\
+\x7d\x13\x6d\xde\x1a\x7b\x7c\xec\xed\x8a\xb2\x7c\x82\x63\xef\xcc\
+\x6e\x4f\x66\xfe\x58\xe3\xaf\xf4\x36\xcb\xdc\x03\xa5\x7d\x34\xf5\
+\x2f\x6d\xcd\x41\xcb\x4c\x41\x64\x88\x0f\x8e\xbd\xdd\x31\xc1\xc9\
+\x1a\x7b\x78\xf6\x76\x46\x99\x17\xc3\x3e\xab\xc8\x1c\xc8\xf7\x48\
+\xec\xb1\xf6\xfe\x58\xe6\x1e\xac\xf1\x97\x26\xf7\xc3\x69\x9d\x94\
+\x43\xd1\x27\x2c\xda\xb7\x27\x3c\xd8\x57\x63\x8f\xcf\xb6\x47\x5a\
+\x96\xc2\x3e\xab\xce\xd1\xed\x10\xb9\xe3\xe5\x8f\x27\xfe\xca\xd5\
+\xbe\x6a\xf6\xfe\x48\xb5\x07\x0b\x83\x44\xf6\xa2\x83\xa7\x6a\xec\
+\xa1\x0d\xf8\x65\x47\x94\x39\x1d\xf6\x59\xd5\x5a\xbf\xed\x52\xe6\
+\x70\xfc\xa1\xfa\x7e\xce\x98\x7d\xf0\x68\x1f\x29\x06\xb3\xf4\xff\
+\x44\x3f\xe1\x7c\x58\x18\x69\xf1\xd3\xd8\xe3\x63\x6f\x7b\x94\x39\
+\xc3\x51\xf7\xfc\xb6\xd1\xea\x1e\xa9\x07\xa8\x06\x7f\x2c\x0c\xb2\
+\xf6\xfe\xd4\xa8\x7d\x35\xf6\xf8\xd9\xdb\x3a\xd9\xbc\x1c\xf6\x59\
+\xed\x3a\xbf\xad\x80\x39\x1a\xed\x93\x9b\x7d\x28\x59\xfb\x02\xd7\
+\xc0\x3c\xf5\x07\x0f\x7f\x38\xfd\x63\x65\x6f\x4f\x8c\x39\x49\x63\
+\x0f\x6f\x9b\x27\x59\x56\xb2\xb2\x07\x73\x88\x62\x4d\x6e\xee\xc6\
+\x53\x77\xa8\x91\xff\x91\x6a\x10\x52\xcc\xc5\x31\x48\xca\xf7\x34\
+\xf6\xf0\xd6\xaf\x7b\x91\xa6\xcf\x60\x9f\xd5\x7c\xa1\xdb\x22\xb2\
+\xa7\x96\xfe\xb1\xc4\x5f\x12\x8f\x6a\xcc\x3f\x68\x6b\x5f\x98\x45\
+\xd1\x67\x1a\x7b\xae\x67\x4f\xed\xda\x97\x55\x03\xd5\x9a\x7b\xd0\
+\x70\x28\x35\x70\x4e\xf4\x17\xac\x7f\xa4\xfe\xde\x9e\x58\x4b\xa2\
+\xc6\x1e\x9e\xbd\x2d\x91\xe6\x55\x24\xf6\x44\xd6\x60\xde\x68\xfb\
+\xce\x34\xf1\x17\xee\x3f\x3b\x63\xf6\x0b\xd7\x20\xac\x35\x30\xac\
+\x7b\xe2\xbe\x48\x63\x8f\xdb\xf2\x23\xcc\x9f\xc3\x3e\x3b\x84\xd0\
+\x3d\x94\xfe\xd1\xd6\xc1\x4a\x7a\xcf\xa4\x1a\x04\xe6\x8c\x94\xff\
+\xa9\xd5\xfb\x83\x6d\x5f\x34\x7e\xa6\xa6\xb1\x87\x37\xe0\x97\xcd\
+\x08\xf6\x6a\x73\x75\x9b\x69\x99\x93\xd3\x3f\x9a\xf8\x8b\x9a\xbb\
+\xd1\xc4\x5f\xd6\xd9\x2f\x4b\xfd\x4b\xdb\x7b\x3e\x40\x58\x4b\xa0\
+\xb1\xc7\xce\x5e\xdd\x06\xbf\x4d\x38\xdd\x23\xc5\x5f\xb9\x1e\x34\
+\x4b\xed\xe1\xac\xfc\x8f\x65\xfe\x41\x93\xff\x15\xc7\xe1\xd7\x50\
+\x69\xec\x91\xd9\xcb\x0f\x47\xb0\xb7\xd1\x2f\xff\xfc\x81\x21\xc4\
+\x98\x8b\xd3\x43\x35\xea\x0f\x5c\xef\x19\xc7\x22\xad\x06\xa2\xea\
+\x0f\x39\x06\x49\xf9\x1f\xb0\xfd\x93\xad\x43\x34\xf6\xf8\x0c\xc5\
+\x5e\x7d\x9e\x5f\x1e\x8e\x3d\x5c\xcf\x45\x09\x7f\x4a\x66\x1f\xac\
+\xb1\x57\x8d\xd9\x87\xa6\x7b\xca\x0d\x17\x73\x1b\xf2\x7c\x37\x02\
+\xf6\xe4\xf8\x63\xa9\x7d\x69\x7b\xd1\xb8\x79\x87\x9a\x0c\xb2\xcc\
+\x3e\xe4\x66\xbf\x24\xf6\xf6\xc6\x58\x12\x34\xf6\xd8\xd8\x6b\xcc\
+\xf7\xdd\x20\x72\x47\xcb\x1f\x4f\xce\x87\xd2\x3e\x9c\x1e\xca\xc5\
+\x5e\x38\xf7\xe3\xe5\x8f\x35\xff\xd3\xd8\xe3\x67\x0f\x15\x73\x1b\
+\x37\xf9\xac\xa7\xd1\x3d\x9e\xde\x1f\x4b\x0c\x46\xd5\xbf\xb4\xf3\
+\x37\xb5\xf3\x3f\x9c\xfe\x69\x31\x97\xdf\x36\x4d\x32\xaf\x86\x7d\
+\xd6\xb4\xd9\x27\x57\x64\x8f\x36\xf6\xb2\xf6\xfe\x68\x6a\x0f\x38\
+\x0e\xf3\xf6\x9e\xe5\x7a\x7f\x28\xde\xe4\x18\xa4\x89\xb9\x1a\x7b\
+\x78\x03\x7e\xd9\x14\xe9\xc8\x5e\xf3\x16\x9f\x2f\x58\xd8\x43\xe9\
+\x9f\xda\xb5\x07\x6f\x0d\xc2\xd2\x8b\x61\xe9\xbd\x88\x0c\x16\x27\
+\x13\xd8\xd3\xe6\xb9\x64\xf6\x22\x4c\x6b\x60\x9f\x1d\xdd\xea\xbb\
+\x0e\x66\x8f\x37\xef\x73\xd6\xec\x97\x94\xff\xd1\xce\x3b\x48\x73\
+\x0f\xda\x1c\x90\xc4\xde\xee\x38\xb3\xb6\x66\x9e\xc0\x5e\x7e\xb8\
+\x23\x7b\x6d\x3b\xbd\x73\x50\xec\xd1\xc6\x5e\x39\xfd\x13\xd9\xa2\
+\xd1\x3f\xe9\x6d\x5c\x0d\xcc\x12\x83\x79\x6a\x10\x52\xfd\x4b\xd4\
+\xbd\xd8\x81\xeb\xd4\x34\xfe\xd0\x96\x37\xc9\x9c\x05\xfb\xac\x7d\
+\x97\xd7\xda\x2b\x87\xfe\x03\xc9\x9e\x92\xf8\xcb\x93\xff\xb1\xc4\
+\x5d\x5c\xfd\xcb\x32\x73\x63\xad\x7d\x89\xec\xc5\x0d\x5c\x1b\xae\
+\xb1\xe7\x68\xc0\x27\x79\x11\x08\xf6\x76\x93\xd9\x53\xab\xef\x82\
+\xd2\x41\xda\x5e\x8c\x92\xde\x33\x6b\xed\x4b\x62\xf1\xc0\x0c\xfc\
+\x3c\x77\xf7\x14\xf3\x74\xda\xf5\xcf\xf7\x9a\xf5\xc7\xdc\x49\xe6\
+\x6c\x1e\xf6\x78\x6a\x5f\x9e\x1c\x50\x8d\xba\x83\x55\xff\xe0\xd9\
+\x07\x49\x03\x49\xec\xed\xbd\x95\xef\x39\xae\x3f\x18\xfc\xbf\xfd\
+\x60\x1b\xf0\xc3\xc6\x70\x7e\xf6\xe4\x18\xc4\xf1\xc6\x1a\x7b\x59\
+\xf4\x8f\x26\xee\xaa\xa9\x7f\x44\xf6\x12\xcc\x53\x35\xdd\xc3\xdb\
+\x86\x89\xe6\xb5\x0e\xec\x15\x78\x65\x03\xf6\x68\xb5\x8f\x35\x06\
+\xab\x99\xfb\xb1\xe6\x7f\x3c\xb3\x5f\x92\xf6\x55\x90\xf2\xbd\x78\
+\x53\x8a\xdc\xba\xe7\x7b\xd5\xfa\xf3\xbd\x49\x08\xf6\xf6\xfc\x8b\
+\x3d\x5a\xfd\x53\x9b\x3b\x5a\x0d\xe4\xa9\x7d\x51\xbd\x17\xb9\xde\
+\x33\x4e\xfb\xca\x66\x04\xe1\xd7\xb1\x48\x6a\x0d\x2d\xf6\xf2\xb1\
+\xa7\x06\x7f\xae\xac\x7d\xa5\xfc\x49\x8f\x79\xfa\xcd\x72\xfa\x47\
+\x62\xaf\x30\x7e\xa0\xb7\x8c\x32\xd1\xff\x83\xcd\xc0\x60\xb2\x87\
+\x8a\xb9\xc7\xf6\x7a\x65\x49\x99\x63\x89\xbf\x34\xbd\x17\xda\x9a\
+\x83\xa7\xff\xec\x8c\xbe\x1f\x2f\x7b\x45\x89\x96\x04\x78\x0e\x22\
+\xd5\xbd\x7b\x99\x3d\x60\xa8\x5a\xa3\x73\xaf\x77\x26\xac\x7b\x6a\
+\xf0\x47\x8a\xbf\x38\x0e\x69\x6b\x0e\xb9\xf8\x8b\xd2\x3f\x96\x9e\
+\x33\xae\xee\x25\xea\x5e\xa2\x39\x09\x35\x87\x83\xf9\xbb\x17\x19\
+\xc4\xf5\x58\x70\xec\x89\x1a\xa8\x16\x7f\x4a\xe6\x6e\x24\xfd\xe3\
+\xed\xbd\xc8\xc5\x62\x94\xfe\x95\xce\x36\x3c\x8d\x63\x6f\xff\xd4\
+\x01\xf6\x48\xd7\x1b\x89\x7f\x87\xc1\x66\x61\x30\xd8\x43\xf5\x96\
+\x61\xf6\xa4\x71\x57\x2d\xfd\x83\x79\xe3\xed\x3f\xd3\xe4\x80\xb8\
+\xda\x97\xb6\xde\xc0\xd5\x1e\xc0\x68\xd8\x43\x69\x1f\x29\x0f\xbc\
+\x17\xec\xd6\x3c\x37\x93\x25\xe6\xaa\xa5\x7f\xb4\xf9\x9f\x94\x39\
+\xb9\xd8\xab\x24\xff\x63\x8d\xbf\x22\x4f\x35\x1f\xe0\xbf\x5f\x63\
+\x7f\xb2\x29\x91\x86\x39\xa9\xf6\xdd\x4b\xfc\xa1\xd6\x12\xc8\xc5\
+\x5c\xb5\xe3\x2f\xed\xec\x83\x25\xf7\x53\x33\xfe\x12\x19\xfc\x08\
+\xff\xbd\x42\x22\x7b\xb8\x35\xa8\xf7\xb2\xf6\xe1\xd6\xef\x49\xeb\
+\x5c\x39\x53\x3a\xfb\xc0\x31\xa8\x66\xed\x4b\xaa\x3d\xa4\x7d\x17\
+\x56\xfe\x6a\x3e\x30\xdf\x64\x61\x0f\x5e\x77\x0a\x33\x28\xfe\x4d\
+\xee\x05\x06\x71\xd7\x6b\x74\x16\x7a\xde\xd6\xbd\xeb\xcd\x4f\x10\
+\xf5\x4f\xad\xdc\x8f\xb5\xf7\xa7\x64\xfe\x41\x9b\xff\xc9\xf1\xd7\
+\xb4\xc8\x70\xa3\x99\xc4\xde\x34\x63\x12\x8d\xee\xe1\x18\x1c\x6c\
+\x3e\x9c\xcd\xde\x16\xc4\x67\x01\x75\x15\x79\x66\xa2\x98\x53\xa2\
+\x7f\x2c\xbd\x17\xde\xfe\x1f\x4e\xff\xa4\x8c\xd1\xc6\x5f\x9a\xf9\
+\x5b\xdd\x7c\xc3\xb7\x44\xdd\x43\xb0\x87\xd2\xbf\x7b\xb5\xfe\xdd\
+\x12\x61\x71\x60\xaf\x73\xbf\x67\x16\xcc\x1e\x7c\xdb\x19\xb9\x1f\
+\x4b\xfd\x4b\x9b\xfb\xf1\xd6\x1f\xb0\xee\xa1\xf8\x93\xd3\xbd\xa2\
+\x69\xa6\x04\xdc\xfa\x17\xd4\xb5\x47\xf7\x52\xef\x19\xbc\xb7\x6d\
+\x91\x96\x15\x24\xf6\xdc\x41\xff\x78\x72\x3f\x39\xe6\xd4\xa8\x3f\
+\x8e\x2c\x34\x5c\x27\xb2\x97\x62\x8c\x67\x61\xef\x5e\x9a\x7f\xf4\
+\xb3\x87\xf8\xac\xef\xce\x7d\x5e\xd9\x72\xba\xa7\xa4\xf6\x60\xd1\
+\x3f\xa5\xb9\x1f\xed\x0c\x84\x27\xee\x52\xb0\x37\x15\x9e\xc1\xc9\
+\x71\x78\xaf\xac\x3d\x00\xef\x67\xfb\x64\xcb\x32\xd8\x67\xc7\xf6\
+\x79\xad\x03\xac\x89\x46\xc3\x9b\x9a\xfa\x47\x9a\x7b\x90\x18\xa4\
+\xad\x3d\x48\xb3\x37\x98\x37\x52\xef\x19\xb0\xd7\xb4\x28\xe4\x61\
+\x1c\x7b\xfb\xa7\x19\x52\x70\x73\x60\xb9\xd8\x7b\x2f\xf0\x87\xfa\
+\x7e\x8d\xd6\xbd\x9e\xeb\xa5\xec\xd1\xc6\x5f\x67\xd4\xbf\x38\xe6\
+\x58\xf2\x40\x1e\x06\x61\x1e\x51\xb5\xaf\xac\xee\xcd\x30\x4c\x87\
+\x99\xa3\x61\xf0\x5e\xd0\x3f\xf0\x3e\x50\xdf\xaf\x71\x74\xb7\x57\
+\x1e\xcc\x1e\x6b\xde\xa7\x94\x3f\xd2\xdc\x43\xcd\xf8\xab\xa4\xf6\
+\x6d\x5e\x14\x74\x8d\x86\x3d\x78\x16\x42\x1b\x7b\x51\x2c\x8a\x7f\
+\xb7\xc1\x66\x47\x0d\xf6\x50\xf9\x5e\x5b\xa1\x67\x2e\x8a\x3d\x1a\
+\xfd\x83\xeb\x5f\xb5\xd7\x1d\xd0\xd6\x20\xce\xea\xfd\x49\x35\xb0\
+\x25\xcd\x70\x95\x14\x73\x4b\x3f\x30\xc6\xe1\xd6\x20\xa0\x58\x24\
+\xc5\xdd\xef\xda\xec\xa3\x5f\xf7\x26\x9b\x97\xc0\x3e\x3b\x5e\xe4\
+\xb5\x96\xc4\x1e\x6b\xfd\xa1\x66\xfd\xcb\xab\x81\x2c\xf5\x2f\xb5\
+\xee\xa5\x05\x5d\x6b\x4c\x33\xfd\x02\xc7\x5e\xcd\x3c\xe3\x64\xb9\
+\x7c\x8f\xb5\xf7\x2c\xd5\xbd\xbb\x9d\xc1\x2d\x11\x16\x87\x79\xee\
+\x37\xcd\x4f\xc7\xda\x4f\x3c\x76\xde\xde\xfd\xd8\x05\x7b\xcf\x63\
+\xbd\x82\x9d\xef\xb7\x93\xb7\x0c\x1c\xb7\x3d\xc1\x64\xdf\x1c\x7a\
+\xfa\xfc\xcd\xda\xa7\x7b\xef\xb4\x21\xe7\x25\xd6\x7b\xb3\x66\x48\
+\xef\xf5\xb2\x67\x7a\xaf\x97\x7a\x0a\x7b\xcf\xf3\xc2\x5e\xb4\x81\
+\x73\x25\x9e\xbd\x97\x0b\xbc\xcf\x5f\xde\xed\x7d\xfe\x52\x81\x77\
+\x6f\xbf\xed\xc2\xdb\x97\x1b\x74\xb7\xf7\x67\xd7\x0f\xd8\x99\x5c\
+\x61\x9f\xfb\xaf\x3d\xe2\xf8\x02\xb0\x9e\x35\xfe\x17\x7a\x56\x0b\
+\xf6\xb9\x7f\xaf\xb0\x1f\x30\xe1\xf8\x84\x70\xae\x7b\x95\xff\xc5\
+\xd6\x4f\x0c\x57\x7b\xd2\x8d\x27\xea\xfe\x11\x88\xbd\x5e\xa3\x35\
+\xcd\xf4\x87\xae\xa5\xc6\x33\xed\x8b\x83\x2e\x74\x2c\x31\x9c\xeb\
+\x5c\x2a\x18\xd8\x2f\x36\x7c\xd9\x9a\x1a\xfc\x65\xeb\xbc\xe0\x2f\
+\x5b\x3e\xb2\x9c\x93\xda\x51\x60\x73\x2d\xe7\x81\x35\xcf\x0b\xee\
+\x6d\x9c\x66\x1d\xb0\x64\xb0\xb7\x5d\x90\x5a\xc3\x2d\xab\x99\x82\
+\xb6\xda\x78\x5b\xaf\x2a\x36\xc5\x76\x5e\xb4\x43\x52\x8b\x0f\x3d\
+\xe7\x60\x09\x03\x76\xf8\x96\xd5\xc5\x87\x7e\x29\x5a\x7d\x82\xed\
+\x6c\x7d\xbc\xed\x0c\x78\x6c\x83\xf0\x7e\x8a\xe3\x2c\x73\x61\x9f\
+\xf5\x15\x7a\x3c\x70\xb1\xe1\xc9\x87\x2e\xd7\x3c\xfa\xb3\xcb\xcd\
+\x8f\x3d\x02\xcc\xde\xf4\xf8\xc3\x48\x13\xee\x27\x67\xe0\xb9\x2e\
+\x09\xf7\xbd\x54\x7e\xa7\x5d\x2c\x11\x7e\x26\x18\x7c\xfe\x52\x81\
+\x9f\xac\x9d\x80\x6d\x03\xa7\xad\x1a\xb0\x9e\x4c\x9f\x47\x80\x35\
+\xdf\xb2\x96\xe5\x5e\x3f\x6b\x59\x6e\x74\xb0\xb6\x4f\x83\x7e\x7e\
+\x68\x61\xd0\x90\x86\x34\xbd\x57\xfd\x02\x7f\xcf\xbe\x3e\x8f\xfb\
+\x70\xec\x81\x9f\xd5\x7d\x1a\xf8\x20\xc8\x09\x41\x6c\x6e\x48\xd5\
+\x3f\x04\xf6\xb7\x6d\xd6\xbf\xac\x21\x35\xf4\x21\x60\xe2\xed\x72\
+\xd1\xe2\x42\x1e\xae\x4a\xb6\x3c\x82\xb5\xc8\xc1\x37\xf0\x1a\x49\
+\x56\x12\x11\xfa\x10\xb0\xe2\xb8\x11\x0f\x02\x13\x6f\x37\x24\xeb\
+\xbf\x87\xf3\x9d\xb6\x69\x9b\xb6\x69\x9b\xb6\x69\x9b\xb6\x69\x9b\
+\xb6\x69\x9b\xb6\x69\x9b\xb6\x69\xdb\x77\x61\x6b\xd9\x11\xf2\xdb\
+\x3d\x99\xa6\xc2\xc2\x4c\xe3\x9e\xea\x7c\xe3\xc6\xba\xad\xc6\xec\
+\xa3\x05\xc6\xcf\x5b\xf7\x1a\x97\x77\xec\x0b\x4a\xef\xd8\x1f\xb4\
+\xac\x6b\xbf\x6f\xbf\x75\xec\xf3\x4d\xef\x28\xf4\xcd\x00\x7b\x70\
+\xfb\xf8\x7e\x9f\xa5\xe2\x5e\x3c\xee\x2c\x14\x8e\xf7\xf9\x2c\xee\
+\xde\xef\xfb\x69\x77\x91\x6f\xda\xc9\x62\x9f\x05\xa7\x0e\xf8\x7e\
+\x7c\xe6\xa0\x6f\xea\xd9\x12\x9f\x79\x17\xca\x7d\x66\x5d\xae\xf2\
+\x99\x7a\xad\xd6\x27\xe6\xec\x5e\xef\x89\xd7\xaa\x7c\xa3\xae\x55\
+\xfb\x44\xf6\x6c\xf7\x9e\x78\xe1\xa0\x4f\xec\xa5\x12\xdf\xe8\x13\
+\x5b\x7d\x22\x2f\x96\xfa\x26\x5e\x2e\xf3\x9b\x72\x62\x9b\x6f\xd4\
+\x97\x85\xba\x69\x67\xf6\xea\xa6\xf7\x16\xfb\x25\x1d\xcf\xd7\xc5\
+\xf4\x16\xe9\x12\x3a\x36\xf8\xc5\x09\xe7\x53\xce\xed\xf3\x9b\xda\
+\xbc\xda\x2f\xae\x7b\xb3\x2e\xe5\xec\x6e\xfd\xd4\x63\x39\xba\xe8\
+\xf3\x7b\xfd\x63\x4e\x6c\xd0\xbd\xd7\xb1\xd6\x6f\xdc\xb9\x9d\xba\
+\x89\xc7\xb2\xfd\xde\xe9\xc8\xd2\xbd\x7b\xbe\x40\x1f\xd9\x99\xa3\
+\x9b\x78\x76\x9b\xff\xa4\x63\x99\xfa\xbf\xb7\xaf\xd1\xbf\x7f\x7a\
+\x6b\x40\x64\x57\xb6\xfe\x4f\xc7\x57\x07\xbc\xd6\x93\xe9\x3f\xf6\
+\x54\x8e\xfe\xb9\xb3\x6b\x03\xc3\xce\xe6\x04\x8c\x3a\xb3\x36\x68\
+\x6c\xc7\x8a\xc0\xdf\x36\x2e\x09\x8c\x3e\xbc\x30\x30\xbe\x65\x81\
+\xd7\xf7\x71\x7e\x3c\x92\xe1\xfb\xa3\xea\xf9\x41\xef\x16\xcd\x0e\
+\x9c\x55\x3a\x2f\x20\xb6\x2a\xd5\x30\xa9\x7a\x9e\x21\xa2\xf2\xa3\
+\xa0\xc8\xaa\xb9\x41\x51\x95\x73\x0d\x31\xe5\x73\x83\xe2\x80\x95\
+\x7d\x18\x34\xa5\x6c\x4e\x60\x7c\xd9\x1c\x63\xbf\x95\xcc\x34\x4e\
+\x01\x73\x91\x83\xd3\x4d\xb1\xa2\x15\x4f\x37\x4f\x39\x30\xcd\x94\
+\x50\x9c\x62\x4a\xdc\x97\x60\x9e\x5a\x18\x6f\x49\x01\x9f\xb3\xb6\
+\x67\x8a\x79\xe6\xae\x38\xf3\xec\x5d\x31\xa6\xb9\x3b\xa2\xcd\xa9\
+\xdb\xa3\x4d\x1f\x6f\x8d\x36\x2d\xd8\x12\x65\x5e\xb4\x79\xb2\x29\
+\x6d\x73\xa4\xe9\x93\x4d\x93\x4d\x9f\x8a\x96\x1f\x69\x5c\x4c\x32\
+\xe9\x7d\xc1\x63\xc1\x73\x80\xe7\xda\x1a\x05\x9e\xd3\x34\x1f\x3c\
+\xff\xf6\x18\xf3\x3f\x76\xc6\x98\x3e\xda\x19\x6b\x99\xb7\x2b\xd6\
+\x3c\xa7\x20\xc6\xfc\xe1\x6e\xe1\x35\xf4\x5b\xac\x65\x96\x83\x81\
+\xd7\x27\xdc\x0f\x3c\x76\x73\xb4\x29\x4d\x78\x7d\xf3\x0a\xe2\x42\
+\x5f\x80\x7d\x76\xa2\xd4\xb6\xea\x5a\xe7\xcb\x7d\xd7\xdb\x6d\x68\
+\xc3\xcc\x3c\xd4\x98\x01\xab\xb5\x06\x8b\x75\x1d\x20\x6e\x06\xd7\
+\x95\xa5\xfb\x67\x57\x96\xfe\xc6\xf1\x6c\xfd\x75\x60\x6d\xcb\x03\
+\xae\xb7\xad\xd6\xdb\xc1\xcf\x7a\xd6\x04\x9c\xeb\x58\x69\xf8\x29\
+\x8e\xbd\xd6\xc5\xc6\x5f\x35\x2d\x34\xfc\x93\xf6\xba\x23\x25\xb3\
+\xdf\xbb\xcd\xca\xe2\xad\xf6\xbd\x02\xbf\xb0\xcf\x4e\x96\x5b\x56\
+\x28\x61\x0e\x9e\xb7\xe1\x18\x64\x5d\xf7\xa2\xc6\xfa\x17\x96\x35\
+\xa7\xf0\xfc\x0d\x5e\x77\xd0\xb5\x2a\xe0\xf2\xf1\x74\xfd\x43\x38\
+\xf6\xea\x16\x1a\xfe\x4e\x7b\xdd\x11\x6a\x9d\x0b\xcd\xec\xf7\x6e\
+\x5d\x77\x3f\xb0\x8e\xc5\xf2\x09\xec\xb3\x33\x95\x96\x65\x6a\x68\
+\x1e\xeb\xbc\xd7\x99\xeb\x9e\x79\xd7\xbe\x90\xd6\xbd\xf4\xb3\x97\
+\x83\x67\xef\xd0\xc7\x41\x13\x49\xeb\xff\x48\x1c\xf2\xcc\x7f\xe5\
+\x38\x74\x37\x2b\x10\xe2\x38\xec\xb3\xb3\xd5\xc1\x9f\x62\xd9\xe3\
+\xe4\x8f\x65\x0d\xbe\x33\xe2\x2e\xeb\x9a\x3f\x1a\xfd\xeb\xce\xd1\
+\x5d\x05\xf3\x38\x1c\x7b\x87\xe7\x07\x86\xd3\xae\x43\x95\x32\xa7\
+\x74\xfd\x81\x74\xcd\xbd\xb8\x77\x37\xfe\xc0\xeb\xd9\x1d\x6d\x5e\
+\x00\xfb\xec\xfc\xa1\x90\x34\xb5\xd9\x1b\x4c\xfd\xa3\xcd\xf9\x58\
+\xd7\x5e\x1d\x5b\xe9\xff\x55\x13\x81\xbd\xc6\xb4\xa0\xf7\x48\xcc\
+\xe1\x74\x10\x8e\xb7\xbc\xeb\xae\xc4\xdb\xee\xc8\x1f\x78\x2d\x7b\
+\x62\x2c\xf3\x1d\xd8\xab\x0d\x5e\x48\x64\x8f\xb3\xe6\xa0\x5d\xf7\
+\xa7\xe6\xba\x67\x67\xae\x3b\xed\xce\xd6\x5f\x23\xb1\x77\x64\x69\
+\xc0\x9f\x49\xd7\xbe\xc9\xc5\x5c\x5a\xdd\x63\x5d\xfb\x3c\xd8\xdc\
+\x89\xaf\x63\x57\x74\x30\xbb\xee\xa9\x50\xf3\xaa\x75\xed\x11\x0f\
+\x77\x4a\x72\xbf\x3b\x6e\xaf\x08\xb8\x4e\x62\xaf\x35\xc3\xff\x0f\
+\xa4\x6b\x8e\x68\x19\x94\xab\x3b\x68\xaf\xfb\x70\x37\xed\xdb\x85\
+\xa8\x35\x64\xf3\x3d\x27\xf6\x5c\xe0\x75\xcf\x6a\x5f\xf7\x41\xcb\
+\x20\x4d\xec\x05\x3d\x17\x52\xbe\xd7\x92\x1e\xf0\x7b\xd6\xeb\x2e\
+\x95\x68\x20\xae\xf6\x75\x47\x06\xfb\xeb\xdc\x68\xc7\x75\xcb\x67\
+\xaa\x42\x96\x3a\x8b\x3d\x96\x9a\xc3\x99\xeb\x9e\x79\xf5\x4f\xca\
+\xe1\xf1\x2c\xfd\x0d\xb0\xd6\x0f\xcb\xde\xb2\x80\xdf\xd1\x5c\x73\
+\xc9\xa2\x7f\x4a\xd6\xdd\x4b\x63\xee\x60\xf3\x07\x7e\x37\xea\x7a\
+\x8d\xd3\x55\xb6\x0c\x26\xf6\x14\xd4\x1f\xb4\xbd\x3f\xc0\x89\x1c\
+\x7b\xce\xa8\x41\x70\xf9\x1e\xb8\xcd\xcb\x1e\xad\xe6\x29\xd5\x3f\
+\x58\xf7\xa4\xf5\xef\x60\xe7\x7f\xe0\xf7\x6e\x89\x30\x2f\x87\x7d\
+\x76\xb2\x6a\xe4\x72\xe2\x5c\xc3\x45\xfc\xa9\xa9\x7f\x52\xdd\xe3\
+\x99\x7b\xe0\xe2\x2f\x91\x3d\x21\xe6\x92\xae\xfd\xe5\x89\xbd\x34\
+\xb9\x9f\x5c\xfc\x95\xf2\x37\x98\xda\xb7\x69\x92\x79\x95\x03\x7b\
+\x95\x23\x57\x70\xb3\xe7\xc4\xfc\x4f\x0d\xfd\xe3\xe9\xbd\x90\x72\
+\x3f\x12\x7b\x47\x97\x05\xbd\x4d\xba\xe6\x17\xc7\x1d\x89\x43\x14\
+\x73\x34\x0c\x92\xea\xde\xc1\xe0\x0f\xfc\x4e\xd4\x77\x98\x72\xb3\
+\xe7\xa4\xd9\x1b\x8f\xf6\xc9\xc5\x5f\x25\x0c\x4a\xf9\x23\xb1\x07\
+\xea\x5c\xda\xeb\xde\x78\xb4\x0f\x95\x03\xd2\xe4\x7e\x28\x16\x5d\
+\x1d\x7f\xc1\xef\x42\x7d\xde\xb2\x18\x73\x5d\xc1\x1f\x0b\x6f\x6a\
+\xf3\xa7\x46\xef\x45\x26\xe6\xfe\x1f\xe9\x9a\x5f\xd4\xcc\x83\xa7\
+\xf7\xcc\x5b\xff\x0e\xa6\xfe\x81\xdf\xb5\x31\xdc\x94\xe3\xc8\xde\
+\xa8\x0c\x91\x3d\xc5\xfc\x51\x70\xc8\xaa\x7f\xb4\xbd\x17\xd6\xfc\
+\x8f\x85\x3f\xf1\xb8\x25\xc7\x0b\xfb\x79\xcb\xcd\x2b\xfc\xff\x0a\
+\xcf\xe2\x68\xaf\xfd\xa5\xad\x3d\x58\xf3\x3f\x77\xd2\xbe\xdc\x89\
+\xe6\x2f\x60\x9f\x9d\xaa\x0e\x4b\x57\x85\x3d\xc6\xf8\x3b\x98\xbd\
+\x17\x9a\x18\x8c\x9a\x75\x90\xd8\x3b\x92\x11\xf0\x2e\xea\x9a\x73\
+\x67\xd4\x1f\x2c\x73\x0f\xd2\xec\xc3\x55\xec\x81\xdf\xb3\x3e\xdc\
+\x98\xeb\xc8\xde\xe8\x3b\xd8\x73\x15\x83\x2c\xcc\xa9\xdd\x7b\x46\
+\x71\x47\xa3\x81\xcd\x39\x3e\xd8\xef\x76\x69\xca\xf0\x1f\x87\x5a\
+\x07\xc3\x92\xfb\xd1\x70\xa8\x74\xfe\x81\x8a\xbd\xce\x66\x10\x3c\
+\x7f\x6e\xb8\x71\x03\x2d\x7b\x8a\xfa\x2e\x0c\xfc\xc9\xf5\x9f\xd5\
+\x9e\xfd\xca\xf5\x9d\x49\x0c\x12\xd9\x4b\x0f\x18\x2f\xf7\xb9\x1b\
+\xb4\xb5\xaf\x1a\x7d\x3f\xda\xf8\xeb\x8a\xfc\x0f\x3c\xf7\xba\x09\
+\xa6\x8d\xb0\xcf\x84\x7c\x6f\x39\x8e\x3d\x6e\xfd\x53\xb9\xf6\x70\
+\x55\xfc\x95\x9b\xbb\xb5\x64\x7b\x61\xbf\x3f\x57\xca\x9e\x52\xfd\
+\x23\xd5\x1f\x4a\x74\x4f\xae\xfe\x70\xa6\xf6\xe5\x8c\x37\xe5\x39\
+\xb0\x57\x19\xb6\x82\xc4\x9e\xab\xeb\x5f\x1a\xfd\x73\x56\xfc\x95\
+\xe3\x8f\xc4\x5e\x43\x46\xc0\x04\xd4\xba\x3f\xe9\xfa\x53\x35\x7a\
+\x2f\x24\xee\x78\x62\xaf\x2b\x72\x40\xf0\x9c\x39\x13\x8c\xf9\xb0\
+\xcf\x7a\x2a\x46\x7d\x26\xc7\x9e\x3b\xf5\x5f\xd4\xe4\x0f\x8e\xbf\
+\x72\xb1\xb7\x2d\xf7\x19\x6f\x1c\x7b\x8d\xe9\x01\x13\xe5\xd6\x3f\
+\x93\x62\xaf\x1a\xb3\x0f\x1c\x83\x34\xeb\x5e\xa4\xda\xa7\x36\x7f\
+\xfd\x31\x77\xa2\x71\x13\xec\xb3\x13\x15\xa3\x57\xd1\xb0\xe7\x8a\
+\xf8\xcb\x9a\xfb\xd1\xf4\x5d\xd4\xac\x7f\x79\xd8\xa3\xd5\x3d\x25\
+\xf9\x1f\x4b\x0d\x4c\xd3\x7f\x71\x06\x7b\x82\xee\x6d\x86\x7d\x76\
+\xbc\xf2\xc5\xcf\xaf\x75\xbf\xe5\x5c\xdd\x73\x72\x0e\xa8\x36\x7f\
+\xd8\xbe\x4b\xb6\x9f\x0f\x3e\xe6\xea\x27\xc8\xe9\x1e\x4a\x03\x95\
+\xea\x1f\x29\xf6\xd2\xe8\x1f\x3c\xf7\x75\x56\xed\x91\xfd\xbe\x69\
+\x8b\x23\x7b\x63\x56\xd3\xb0\xe7\xca\xd8\x4b\x53\x03\xc3\xf9\x9f\
+\x1a\xfc\xc9\xd5\x1e\xc7\x72\x7c\x7d\x71\xec\x1d\x11\xd8\x83\xfb\
+\x81\x72\xfa\xc7\xda\xfb\xa3\xad\x3d\x78\xf5\x0f\xe6\x4e\x2d\xfe\
+\xc0\xf3\xac\x9d\x40\x60\x8f\x92\x3f\x57\xb2\xe7\xea\xde\x1f\x8a\
+\x37\xe9\xed\x8e\x5c\x1f\x3f\x1c\x7b\x4d\x2b\xf4\xe3\x61\xde\x68\
+\x72\x3f\xb5\xea\x0f\x5c\x0f\x06\xc5\x23\xcb\xec\x57\x0d\xfe\xc0\
+\x73\x64\x8f\x37\x6d\x85\x7d\xd6\x55\x31\x76\xcd\x6d\xf6\x9c\xad\
+\x7f\x2a\xe6\x7e\xce\xea\xbd\x90\xf4\x8f\xa8\x7b\x9f\xe9\xc2\x71\
+\xf3\x10\x71\x2f\xd5\x3e\x54\x0e\x88\x9b\xff\x2a\xad\x7f\x59\xf4\
+\xcf\x19\xbd\x17\xf0\x1c\x99\xe3\x4c\xdb\x64\xd9\x73\x23\xfe\xa4\
+\x4c\xd1\x30\xe8\x2c\xfd\x13\x8f\xdb\x37\xe0\xf3\xbd\xa6\xcf\xf4\
+\x11\xb8\x79\x1c\x49\xfb\x68\xfb\x7f\xb4\xb5\x08\xad\xf6\xd1\xd6\
+\xbf\x6a\xe9\x5f\xe6\x7b\xc6\xed\x08\xf6\x32\x5d\xca\x1e\xcc\x20\
+\x05\x8f\xb4\xcc\xa9\x5d\x7f\xc0\xf1\x97\xc4\x5e\x7d\x86\x2e\x4a\
+\x8e\x3d\xd4\x39\x39\xfe\x68\x62\xad\x2b\xb4\x4f\x09\x7b\x03\x31\
+\xd7\xe0\xc0\x5e\x67\xf9\x98\x2c\x07\xf6\xdc\x4c\xff\x58\xe3\xaf\
+\xda\xfa\x47\xa3\x7b\xf5\xe9\xba\x18\xdc\xda\x2b\x9c\x06\xc2\x31\
+\x98\xb5\x07\x83\x63\x13\xd6\x3e\x58\x07\x49\xfc\xa1\x74\x50\xca\
+\x1f\x0f\x83\x58\xf6\xca\xc6\x64\x2b\x65\xcf\x95\xfc\xb1\xf4\xff\
+\x00\x33\x6a\xc6\xdf\xd6\x7c\x4f\x2f\x1c\x7b\x87\x33\x74\xf1\x28\
+\xdd\x23\xd5\xbe\x3c\xb3\x5f\x96\xdc\x8f\xd4\x77\x96\xab\x41\xd4\
+\xd4\x40\x70\xff\x35\x88\x98\xdb\x5e\xfa\x62\x8e\x1a\xec\xb9\x0b\
+\x7f\x3c\x3d\x68\xda\xd8\xdb\xb5\x01\x3f\x53\xab\x49\xf7\x9b\x8a\
+\x5b\x83\x85\xe3\x8f\x75\xee\x86\xcb\xf9\x68\x67\x20\xb4\xda\x47\
+\x3b\xff\x60\x31\x14\x7b\x6d\x25\x2f\xae\xc3\xb2\xe7\x86\xb1\xd7\
+\x19\xbd\x67\x51\x1f\xe5\xf8\xeb\xda\xe2\x8d\xfd\x7e\x8d\xaa\xc5\
+\x7e\x33\x70\x6b\x00\x59\x7a\x2f\xce\xea\x3b\xd3\xd4\x1e\x30\x87\
+\x6a\xcd\x7c\xc1\xfd\xb3\xde\x77\xac\x73\x5b\x0f\xbe\xb2\x5e\x96\
+\xbd\xbb\xbc\xf7\xac\xb4\xf6\x10\xe3\x6e\xe7\x4e\xfc\x1a\xaa\xe2\
+\x05\x7e\x73\x71\xeb\x5f\x68\xf5\x8f\xb5\x06\xa6\xd5\x3f\x52\xac\
+\xa5\x99\x7d\x28\xcd\xfd\x70\xfd\xbd\xd6\x83\xaf\xad\xbf\x76\x3a\
+\x5a\x9e\x3d\x57\xe9\x1f\x25\x87\xac\x7d\x67\x35\xf2\x3f\x12\x7b\
+\x3b\x52\x75\x2b\x59\xd8\x43\xd5\xbf\x38\xed\xa3\xc9\xfd\x68\xe3\
+\xae\xd2\xfa\x17\x35\xff\xa0\x62\x0f\x31\x53\x6b\x39\xf0\xda\x46\
+\x6a\xf6\xdc\x48\xff\xe4\x74\xcf\x19\xbd\x67\xa2\xee\x7d\xe6\x9f\
+\x87\x5b\x7b\xa5\xa4\xfe\x65\xcd\xfd\x68\xfb\x7f\x34\xf1\x97\x26\
+\xef\xa3\x65\x70\x2d\x82\xbd\xa3\xc5\xaf\xe5\x39\x83\x3d\x57\xf7\
+\x9e\x69\xeb\x0e\x25\xda\x47\x62\x6f\xcf\x72\xfd\x2e\x56\xf6\x48\
+\xf5\xaf\x92\xde\x33\x4f\xdd\x41\xd3\x7f\x26\xc5\x5f\x39\xdd\x43\
+\xcd\x73\x8f\x16\xbf\x3e\xc0\x9e\xca\x71\xd7\xd5\xfc\xb1\xd6\x20\
+\x3c\xfc\x75\xee\x7c\x0a\xcb\xde\xae\x74\xfd\x5e\x12\x7b\xb4\x31\
+\x18\x95\xef\xd1\xf6\x5e\x58\xeb\x5e\x9a\xf8\x0b\xf7\xfd\x48\xf1\
+\x17\xc7\x20\x6e\x0d\xd5\x6d\xf6\x00\x57\x4e\x62\xf0\xbb\xd2\x7b\
+\x39\xbd\x7b\xc8\xbf\xe3\xd8\x2b\xc8\xf0\xdf\x83\x5b\x8f\xc0\x52\
+\x7b\xf0\xcc\x3e\x78\x7a\x2f\x38\xfe\xe4\xfa\x7e\x3c\xf3\x0f\x3c\
+\x7b\xaf\xdd\xa9\x7b\x77\x69\xfc\x65\xd5\x40\x9e\xd9\xc7\xa9\x9d\
+\xcf\xfc\x1c\xc7\xde\xce\x65\xfa\x42\x56\xf6\x68\xe7\xbe\xce\xe2\
+\x8f\xa5\xf7\xc7\x92\x03\xa2\xd8\x43\xad\x5b\x3e\x5a\xfc\xdf\xf9\
+\x0e\xdc\xdd\x85\xb5\x07\x6d\x0e\x28\xd5\x3e\x5a\xfe\x44\x06\x4f\
+\x6e\xc3\x5f\x9f\xbb\x23\x5d\xbf\x8f\xb4\x0e\x81\x96\x45\x16\xfe\
+\x70\xf1\x97\x26\xef\x63\xad\x3b\x68\xe6\x1e\xb8\x1e\x20\x8e\xbd\
+\xe6\xa2\xd7\xf3\x6f\xeb\x1e\x1c\x7b\xdd\xa9\xf7\xc2\xd9\xfb\x53\
+\x33\xff\x3b\x59\x84\x67\x6f\xdb\x52\xff\x22\xdc\xda\x2b\x1c\x73\
+\x6a\xd6\xbe\x70\xbd\xc1\xca\xa1\xd2\xf9\x07\x49\xff\xc0\xf1\x17\
+\x88\x6b\x85\x8e\x16\x41\xba\xf7\x1d\x88\xbd\x34\xf1\x97\xa7\xf7\
+\x4c\x66\x4f\x7f\x00\xb5\xf6\x85\x46\xf7\x94\xd6\xbe\x72\xf5\x07\
+\x6f\xdc\xa5\xed\xbf\x48\x8f\x51\xb5\x07\x96\xbd\x62\x89\xee\xc1\
+\x71\x97\x85\x3f\x57\xc4\x5f\x27\xf4\x60\x68\xf9\x93\xd3\xbd\xad\
+\x4b\xf4\x07\xe5\xd6\x01\xb2\xd4\xc0\xa4\xda\x57\x2e\xff\x93\x6a\
+\x20\xad\x0e\xaa\xd9\x7b\x46\x31\x88\x61\x2f\xef\x8e\x18\xab\x84\
+\x41\xc0\x16\x05\x83\xae\x60\x0f\xd5\x7b\x46\xf1\xc8\xa2\x7f\x44\
+\xf6\x96\xea\x4b\x60\xdd\xe3\xad\x7b\x49\x1a\xc8\x33\xfb\xe0\xc9\
+\x01\x95\xf0\x87\xd2\x3d\xd4\xb5\xe1\x2d\x07\xfe\x67\x23\x91\x39\
+\x56\xed\xbb\x0b\xeb\x0f\x1a\xfd\x93\xd5\x3d\x09\x7b\x38\x06\x59\
+\x7b\x7f\x2c\x35\x88\x5a\xf5\x2f\xac\x7f\x34\x5a\x88\x8b\xbf\x52\
+\xfe\xd6\x21\xd8\x6b\x3d\xf8\xeb\xf5\x44\xcd\xe3\x89\xbf\xce\xcc\
+\xff\x9a\xe9\x67\xbe\x2c\x7d\x17\xb8\xfe\x45\x59\x4f\x21\xfe\xf3\
+\xf7\xb6\x21\x62\x2e\x2b\x7f\x38\xe6\x94\xf4\xfe\x58\x7b\x2e\xac\
+\x71\x57\xae\xff\x2c\xda\xfa\x89\x8e\x9f\xc7\xd2\x5a\xf2\xeb\x5c\
+\x87\x98\x8b\xaa\x79\x59\xeb\x0f\x67\xea\x1f\xcc\x1f\x05\x8b\x52\
+\xce\x68\xb5\x90\x85\xbd\xed\x92\x5a\x03\xb7\xee\x59\x49\xef\x99\
+\x46\xf7\x9c\x35\x7f\x93\xcb\x05\x71\x75\xaf\xf4\x18\xf5\x39\x54\
+\x58\xf6\x70\xba\xe7\x4e\xbd\x3f\x95\xf5\x0f\xce\xfd\x60\xfe\x48\
+\xec\xed\x48\xd7\x15\x93\xd6\x60\xf1\xe8\x1f\xcd\xec\x83\x14\x7b\
+\xa5\xe7\x50\x9a\xc7\x32\x7b\x53\xaa\x7f\xeb\x27\x19\xd7\xab\xa2\
+\x7b\xee\x12\x7f\x9d\x9c\xfb\xc1\xbd\x67\x39\xf6\xe0\x39\x88\x54\
+\xf7\x58\x63\x30\xad\xfe\xf1\xe4\x7f\xac\x7d\x3f\x35\x7a\x7f\x1b\
+\x22\x4c\x0e\x9f\x3b\x2a\xb0\xb7\x1e\xcb\x9e\x8b\xeb\x0f\x57\xd6\
+\x1e\x2c\xfa\x47\xc5\x5e\x86\xbe\x08\xb7\x06\x41\x2e\xf6\x4a\x39\
+\x84\x73\x3e\xd6\x9e\xb3\x1c\x7f\xac\xf9\x9f\x1a\xbd\x3f\x60\x79\
+\x11\x46\x87\xcf\x5b\x96\x65\x4f\xae\x0e\x71\x97\xf8\xeb\x82\xda\
+\x97\x55\xf7\x48\xfd\x3e\xde\xda\x57\xae\xe6\xa0\xa9\x3f\x58\x67\
+\x1f\xb8\x7c\x8f\x85\xbf\x4d\x91\xc6\x6c\x6e\xf6\x48\xfa\xe7\x0e\
+\xb3\x37\x05\xbd\x67\x1a\x0d\x04\xfb\xcb\x55\x8f\xe1\x6b\x8d\x65\
+\xba\x03\x34\xeb\x4f\x49\xfd\x3f\x1c\x8f\x2c\xb3\x0f\xde\xd8\xcb\
+\xcb\x1f\x6d\xfc\xdd\x12\xe3\xf8\xfd\x1a\xc4\x7c\x8f\x85\xc3\xbb\
+\x5c\xff\x68\xb4\xf0\x52\xf9\xe3\xd8\xef\xf2\xdb\x96\xae\x3b\x48\
+\xc3\x1e\x2e\xfe\xf2\xce\x3e\xc4\x63\xb9\xd8\x2b\x1e\x93\x66\x1e\
+\xbc\x0c\xd2\xd4\xbe\x5b\xa3\x4d\x9f\xc1\x3e\x6b\x2b\x63\x64\xcf\
+\x85\xfd\x3f\x55\xf8\x63\xec\xbf\x90\xb4\x8f\xa8\x7b\x19\xf4\xba\
+\x47\x93\xf7\xb1\xd6\x1e\xf0\x39\x9a\xf9\x07\x8b\xee\xf1\xce\x3d\
+\x44\xfe\xb6\xc7\x38\x7e\x9f\x5a\x5b\xe9\x1b\xeb\x98\x75\xcf\x45\
+\xb5\xaf\xab\x62\x2f\x4d\xfd\x21\xa7\x7b\x52\xf6\x58\x19\x94\x8b\
+\xb7\xae\xca\xfd\x78\xe3\x2f\x4d\x2c\xde\x95\x60\x5c\x0a\xfb\xec\
+\x58\x39\x27\x7b\x4a\xf2\x3e\x57\xf4\x5e\x38\x73\x3f\x12\x83\x24\
+\xf6\x76\x64\x0c\xd4\x1a\xac\xec\xb1\x6a\x20\x6f\xef\x8f\xa6\x07\
+\xcd\x12\x7f\x59\x7b\x7f\xbb\x13\x4d\x0e\xdf\xdd\xdc\x51\xf1\x9b\
+\x1c\x6e\xdd\x53\x1a\x7b\x5d\x39\xfb\x50\xa1\xfe\x25\xb1\x57\xb0\
+\x52\xbf\x8f\xe5\xba\x23\x54\xee\xa7\xb4\xf7\x2c\xd7\xfb\x53\xb3\
+\xf6\xc0\x31\x88\xe3\xb1\x70\xaa\xc9\xe1\x3b\xeb\x3b\xca\x7f\xb3\
+\x56\xd5\x98\xeb\x4e\xfc\x31\xea\x9f\x12\xdd\xdb\xb3\x52\xb7\x97\
+\xf5\xba\x37\xda\xfa\x97\x25\x16\xd3\xd4\x20\xce\xa8\x7f\xe5\x34\
+\x70\xff\x34\x63\x2a\xec\xb3\xce\xca\x37\xb3\x15\xe9\x1e\x2a\x06\
+\xdf\xc5\xf1\x97\x57\xf7\x0a\x57\xe9\x77\x93\xd6\x21\xf0\xd6\xbe\
+\x72\xfc\xc1\x1a\x48\xdb\x83\x66\xe1\x4e\x8e\x43\xb9\xda\x17\x1c\
+\x97\xce\x32\x7c\xe0\xc0\x5e\xd5\x9b\x59\x4e\xe1\x8e\x95\x41\x67\
+\xf2\x27\x8d\xbf\x94\x1c\xa2\xf4\x8f\xc8\xde\x6a\xfd\x2e\x12\x7b\
+\xb4\x7d\x3f\x25\x3d\x68\x35\x7b\x7f\x2c\xb1\x97\xa6\xf7\x57\x3a\
+\xdd\x9c\x04\xfb\xec\x78\xcd\x9b\xab\x55\xd1\x3d\x52\x0c\x76\x17\
+\xfd\x53\x90\xf7\x5d\xaf\x7f\xe2\xc6\xc5\x86\x27\x1f\xc2\xb1\x57\
+\xb4\x46\xb7\x53\x8e\x3d\x9e\xfe\x0b\x4d\x1d\xcc\x92\xff\xc1\xf5\
+\x87\x1a\x75\x07\x29\xfe\x8a\xc7\x95\xb3\x4c\x91\xb0\xcf\x4e\x1e\
+\xfe\xed\x72\xd5\xd9\xe3\xd5\x3f\x06\xf6\x5c\xc1\x9f\x94\xc1\x1b\
+\x0d\x4f\x5c\x27\xb2\x97\x49\xc7\x9e\x92\xfe\x1f\x4f\xfd\x41\xd2\
+\x3f\x98\x37\xd4\x39\xb5\x66\x1f\x0d\xa9\x86\xbf\xc1\x3e\xbb\xd8\
+\xf2\xc7\x54\xd5\xd8\x53\x43\xff\x5c\xc1\x1f\x87\x06\x0a\xec\x5d\
+\xbb\x58\xf7\xd4\x83\x38\xf6\x8a\xb3\x74\x3b\x50\x6b\x5f\x58\xf9\
+\xc3\xe5\x7e\xce\xa8\x7f\x59\xfb\x7f\xac\xbd\x17\xe9\xbe\x79\x61\
+\xd0\x9b\xb0\xcf\xec\x67\xde\x1b\xe7\x34\xf6\x50\xc7\xee\x10\x7b\
+\x39\xea\x8f\x7f\x36\xca\xb0\x97\x3d\xc0\x9e\x5a\xda\xc7\x12\x77\
+\x59\xf9\x93\xf2\x46\x5b\x7f\xa0\x98\xa3\x65\xb0\x61\x7e\xd0\x37\
+\x6d\x69\xa6\xe7\x61\x9f\x5d\x3b\x1d\x37\xf4\xc6\xd9\xe8\x9b\xaa\
+\xf3\x47\x8a\xbb\x2a\xc7\x5f\x57\xf0\xf7\x75\xd3\x93\x5f\xf5\xd5\
+\xfe\xe2\xa7\x38\xf6\x0e\xe6\xf8\x6d\xc3\xad\x39\xe5\x65\x50\xaa\
+\x81\xbc\x73\x37\x5a\x0e\xd5\xac\x3f\xe0\xbc\xef\xc8\x42\xc3\xf5\
+\xc6\x79\xa6\x5f\xc0\x3e\xbb\xdc\xfc\xce\x23\xf6\x8b\xb1\x97\x9d\
+\xca\x1e\x6f\x0c\x76\xa3\xd8\x7b\xb3\xf9\xc9\xab\x7d\x1d\x78\xf6\
+\x4a\xd6\xf9\x6e\xc5\xcd\x82\x5d\xad\x7f\x24\xe6\xa4\xb7\x95\xea\
+\x1f\xad\xee\x1d\x9b\x6f\xe9\x28\x49\x0d\xfd\x01\xca\x6f\xa7\xea\
+\xde\x9a\xef\x14\xf6\x60\xed\x63\xcd\xfd\xdc\xa8\xf6\xb5\x77\x3c\
+\x7e\x85\xc4\x5e\x59\xae\xef\x66\x1e\xf6\x94\xd6\xbf\x6a\xe6\x7f\
+\x30\x8b\x3c\x3d\x40\x14\x83\x25\xb3\x83\xa6\xe2\xfc\xd6\x77\x66\
+\xdc\xbf\xd9\xbf\x4d\xea\x70\x3a\x7f\xee\xd8\xfb\xa3\x64\xd0\xde\
+\xf9\xf8\xe5\xbe\xf6\x67\x7e\x82\xf3\x61\x79\xae\x5f\x3e\x6e\xed\
+\x33\x2d\x7b\xbc\x3d\x40\x39\xf6\x70\xf5\x2f\x6a\xe6\xc1\x3a\xf7\
+\x90\xb3\xee\xb9\xd6\x1a\x9c\xe6\x89\xdb\xc5\xae\x28\x4f\xfb\xd7\
+\x09\xdd\x6e\x97\xf7\x31\xf2\xe7\x34\xf6\xba\x1e\xbf\x44\x62\xaf\
+\x36\xcf\x2f\x97\x66\x2d\x96\x1a\xb9\x1f\x0f\x7f\x6a\x6b\x9f\x94\
+\x41\x1c\x8f\x1d\xf3\x83\x3b\xab\x11\x79\x1e\x92\xbf\xd6\x71\x5e\
+\x76\x7b\x52\xa3\xcb\xf4\x4f\xdc\x03\x6e\xdc\x41\xff\x48\xec\x1d\
+\x7b\xfc\x2b\x52\xcc\x6d\xdd\xe3\xb3\x86\x76\xed\xbd\x1a\xb1\x17\
+\x36\xd6\xd9\x1b\x6d\x1f\x9a\xc4\x20\x49\xef\x3a\xe6\x58\xeb\x4a\
+\xe7\x18\xb1\xdf\x37\x8c\xda\x40\xfc\xed\xad\xfb\xcb\x44\xfb\x37\
+\x09\x1d\xf6\x2b\x53\x7a\xbf\xe9\x8d\xbd\xe6\x34\x16\x51\x6c\xba\
+\x8b\x0e\x4a\x79\x14\xf6\xf6\xce\x27\x2e\xf5\x56\xe1\x75\xef\x5a\
+\xad\x77\x34\x6e\x16\xa7\x84\x43\x25\x3c\x92\x38\x54\xc2\x1c\xce\
+\xda\x17\x1b\x7a\xdb\x66\x59\xdb\x4a\xe7\x1a\x66\x1d\x99\xe3\xfb\
+\x23\x16\xee\x1c\x38\xec\x79\xe7\x87\x7d\x67\xa2\x1e\xb5\x9f\x8d\
+\x14\xfe\x61\x85\x1b\xed\xa7\xc6\x5b\xed\xa7\x27\x84\xda\x4f\x87\
+\x0f\xb5\xf7\x8c\x1f\xde\xd7\x33\x71\x84\xb0\x1f\x69\x3f\x19\x1e\
+\x06\xac\xef\xd4\xfb\xa3\xfb\xba\x07\xcc\xde\x3d\xe1\xd9\x3b\xed\
+\x3d\xc1\xc6\x3f\x67\xef\x7e\xf7\x39\xfb\x89\x71\xcf\xf7\xef\xfb\
+\xed\xaf\x03\xd6\xf9\xc7\xe7\xed\x5d\x6f\x8f\xb1\x1f\xfb\xcd\xd8\
+\x01\x7b\x7d\xac\xbd\xfd\xb5\x17\xfb\xda\x5f\x7f\x01\x18\x38\xb6\
+\x1f\xfb\xd5\x58\x7b\xeb\x6b\x2f\xd9\xdb\x5e\x7d\xf9\x66\xdb\x2b\
+\xbf\xbc\x79\x74\xec\x2b\x37\x5b\xc6\xbc\xea\x68\xcf\x0f\x58\xd3\
+\xa8\x57\x6f\x1e\x09\xfb\xcf\x9b\x47\x42\x07\xac\x29\x44\x38\x67\
+\x7d\xe5\x66\xa3\xed\x97\xc0\xec\xcd\x21\x2f\xd9\x5b\xac\x63\x84\
+\xfd\xf3\xf6\x56\xeb\xb3\x7d\xad\x96\xd1\xf6\xa3\xa6\x30\x7b\x9b\
+\x65\xb8\xfd\x68\x90\xcd\xde\x12\x18\x7a\xb3\xde\x77\xec\xe5\x4a\
+\xdf\xbf\x5f\x2d\xf3\x7e\xbb\xaf\x70\xd4\x03\x58\x5f\x09\x3f\xfb\
+\xba\xda\x73\xe8\xd5\xca\x21\xaf\x5c\xad\x1a\xf2\xea\x57\x65\x9e\
+\xbf\xfa\xaa\xd4\xfb\xf5\x2b\x25\x5e\x6f\x5c\x39\xe8\xfd\xbf\x17\
+\xf7\x7b\xfd\xee\x52\x91\xd7\xef\x7b\x8b\x3d\xdf\x3e\x57\xe8\xfd\
+\xa7\x73\x7b\xbc\xfe\x7c\x7a\x87\xf7\xdf\x4e\x6f\xf7\x7a\xf7\xc4\
+\x26\x9f\x71\x3d\xf9\xde\xe3\x3b\xf3\x7c\x27\x76\xe5\xf9\x86\x77\
+\xac\xf7\x99\x24\x58\x44\x7b\x8e\x9f\x68\x91\xad\x6b\x7d\x27\xdf\
+\xb6\x2c\xc1\x32\x85\x73\xb7\xac\x79\xb5\x5f\xe4\xd1\x35\xbe\x93\
+\x8f\x7c\xa6\x8b\x6a\x5c\xa9\x8b\xbe\xc3\x32\x44\xf3\x8f\x6e\xc8\
+\xd0\xc7\x1e\x5a\x1c\x30\xa5\x76\xb1\x7f\x42\x6d\x9a\x7f\x62\x4d\
+\x5a\x40\x52\xe5\xc2\x01\xab\x5e\x18\x98\x58\x9d\x26\xd8\xa2\xc0\
+\x04\x60\x35\x8b\x84\xfb\x2d\x0a\x88\xad\x5d\x18\x18\x73\x38\x2d\
+\x30\xa2\xe1\x53\xc3\x3b\xe5\x8b\x42\xfe\xd8\xba\x2c\xe8\xed\xf6\
+\x0c\xc3\xef\xaa\x17\xd9\xde\x6a\x4e\x37\xbd\xd9\xbe\xcc\xfc\x6a\
+\xd3\x12\xb3\x59\xb0\xc7\xaa\x96\x5a\x7e\xa8\x84\x37\x6d\xd3\x36\
+\x6d\xd3\xb6\xef\xea\xd6\xe7\xb8\xd9\x91\xe7\xf6\xdd\x7a\xc0\xfd\
+\x17\x6f\x1d\x7c\xdf\xfe\x8d\x07\x7c\xce\x63\xea\x0d\xc7\x73\x61\
+\x17\x1d\xcf\x3d\xd5\xe9\x78\xee\xc7\x94\xe7\xbe\xb7\x4f\x3b\xa7\
+\x9d\xd3\xce\x69\xe7\xb4\x73\x4e\x3b\x47\x1d\x17\x54\x3e\xe7\x4e\
+\x3e\xd0\xce\x69\xe7\xb4\x73\xda\xb9\xbb\xe5\x5c\xa7\xe3\x39\x64\
+\x4e\x7d\xd1\xf1\xdc\x53\xa8\xbc\x1d\x95\xdf\xf7\x4d\x83\xcf\xdd\
+\x4f\xad\xed\xff\x0f\x3f\xa9\x52\xf0\
+"
+
+qt_resource_name = b"\
+\x00\x08\
+\x0a\x61\x42\x7f\
+\x00\x69\
+\x00\x63\x00\x6f\x00\x6e\x00\x2e\x00\x69\x00\x63\x00\x6f\
+"
+
+qt_resource_struct_v1 = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x01\x00\x00\x00\x01\x00\x00\x00\x00\
+"
+
+qt_resource_struct_v2 = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x01\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x01\x99\x1e\x52\xe4\x88\
+"
+
+qt_version = [int(v) for v in QtCore.qVersion().split('.')]
+if qt_version < [5, 8, 0]:
+    rcc_version = 1
+    qt_resource_struct = qt_resource_struct_v1
+else:
+    rcc_version = 2
+    qt_resource_struct = qt_resource_struct_v2
+
+def qInitResources():
+    QtCore.qRegisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+def qCleanupResources():
+    QtCore.qUnregisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+qInitResources()
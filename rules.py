@@ -0,0 +1,470 @@
+"""Правила удержания: условия над батареей, временем, процессами и нагрузкой.
+
+Правила задаются в настройках (ключ "rules") списком:
+
+    [{"name": "presentation", "when": "process('POWERPNT') or process('soffice*')"},
+     {"when": "presentation or (not battery and window('mon-fri 09:00-18:00'))",
+      "hold": ["display"]},
+     {"when": "busy", "hold": ["system"]}]
+
+В условии - and, or, not, скобки, true и false, входы battery (питание от
+батареи), locked (сеанс заблокирован), busy (машина занята), процесс по
+шаблону имени process('...'), окно времени window('дни ЧЧ:ММ-ЧЧ:ММ') и имена
+других правил. Правило без hold только именует условие для других правил.
+
+Правила компилируются один раз в граф зависимостей: каждое условие - функция
+над массивом значений, у каждого входа и правила - список зависящих от него
+правил. При смене входа пересчитываются только достижимые из него правила, в
+топологическом порядке, и дальше изменение идет, только если значение правила
+поменялось. Решение - объединение флагов hold истинных правил; on_change
+вызывается, только когда оно меняется.
+"""
+import re
+import threading
+import time
+
+from metrics import registry
+from power import ES_SYSTEM_REQUIRED, ES_DISPLAY_REQUIRED
+
+RULE_EVALUATIONS = registry.counter("nosleep_rule_evaluations_total",
+                                    "Вычисления условий правил")
+
+# Входы, которые передает владелец правил (события питания, замеры нагрузки)
+INPUTS = ("battery", "locked", "busy")
+HOLD_FLAGS = {"system": ES_SYSTEM_REQUIRED, "display": ES_DISPLAY_REQUIRED}
+
+_TOKEN_RE = re.compile(r"\s*(?:([()])|'([^']*)'|\"([^\"]*)\"|([A-Za-z_]\w*)|(\S))")
+
+
+def input_key(kind, argument):
+    """Ключ входа process('...') или window('...')"""
+    return f"{kind}:{argument}"
+
+
+class _Parser:
+    """Разбор условия в выражение Python над массивом значений v"""
+
+    def __init__(self, text, resolve):
+        self.text = text
+        self.resolve = resolve  # Имя или ключ входа -> выражение его значения
+        self.tokens = []
+        for match in _TOKEN_RE.finditer(text):
+            paren, single, double, name, other = match.groups()
+            if other is not None:
+                raise self.error(f"неожиданный символ {other!r}")
+            if single is not None or double is not None:
+                self.tokens.append(("string", single if single is not None else double))
+            elif paren is not None:
+                self.tokens.append((paren, paren))
+            elif name is not None:
+                self.tokens.append(("name", name))
+        self.position = 0
+
+    def error(self, message):
+        return ValueError(f"условие {self.text!r}: {message}")
+
+    def parse(self):
+        source = self.parse_or()
+        if self.position != len(self.tokens):
+            raise self.error(f"лишнее {self.tokens[self.position][1]!r}")
+        return source
+
+    def peek(self):
+        return self.tokens[self.position] if self.position < len(self.tokens) else (None, None)
+
+    def take(self, kind):
+        token_kind, value = self.peek()
+        if token_kind != kind:
+            raise self.error("неожиданный конец" if token_kind is None else f"неожиданное {value!r}")
+        self.position += 1
+        return value
+
+    def keyword(self, word):
+        if self.peek() == ("name", word):
+            self.position += 1
+            return True
+        return False
+
+    def parse_or(self):
+        terms = [self.parse_and()]
+        while self.keyword("or"):
+            terms.append(self.parse_and())
+        return terms[0] if len(terms) == 1 else "(" + " or ".join(terms) + ")"
+
+    def parse_and(self):
+        terms = [self.parse_not()]
+        while self.keyword("and"):
+            terms.append(self.parse_not())
+        return terms[0] if len(terms) == 1 else "(" + " and ".join(terms) + ")"
+
+    def parse_not(self):
+        if self.keyword("not"):
+            return f"(not {self.parse_not()})"
+        return self.parse_atom()
+
+    def parse_atom(self):
+        if self.peek()[0] == "(":
+            self.position += 1
+            source = self.parse_or()
+            self.take(")")
+            return source
+        name = self.take("name")
+        if name in ("and", "or", "not"):
+            raise self.error(f"неожиданное {name!r}")
+        if name in ("true", "false"):
+            return "True" if name == "true" else "False"
+        if self.peek()[0] == "(":
+            if name not in ("process", "window"):
+                raise self.error(f"неизвестная функция {name!r}")
+            self.position += 1
+            argument = self.take("string").strip()
+            self.take(")")
+            if not argument:
+                raise self.error(f"пустой аргумент {name}()")
+            name = input_key(name, argument)
+        return self.resolve(name)
+
+
+class Rule:
+    """Скомпилированное правило"""
+
+    __slots__ = ("name", "when", "hold", "slot", "level", "function")
+
+    def __init__(self, name, when, hold):
+        self.name = name
+        self.when = when
+        self.hold = hold  # Флаги ES_SYSTEM/ES_DISPLAY, пока условие истинно
+        self.slot = 0  # Номер в массиве значений
+        self.level = 0  # На единицу больше наибольшего уровня правил, от которых зависит
+        self.function = None
+
+
+def parse_hold(value):
+    """Флаги из списка hold: ["system", "display"]"""
+    if isinstance(value, str):
+        value = [value]
+    if not isinstance(value, (list, tuple)):
+        raise ValueError(f"hold - список флагов, а не {value!r}")
+    flags = 0
+    for name in value:
+        if name not in HOLD_FLAGS:
+            raise ValueError(f"неизвестный флаг удержания {name!r} (system, display)")
+        flags |= HOLD_FLAGS[name]
+    return flags
+
+
+class RuleEngine:
+    """Инкрементальное вычисление правил удержания
+
+    on_change(flags) вызывается, только когда меняется объединение флагов
+    истинных правил (из потока, передавшего новое значение входа).
+    """
+
+    def __init__(self, rules=(), on_change=None):
+        self.on_change = on_change
+        self.evaluations = 0  # Вычислено условий
+        self._lock = threading.RLock()
+        self._inputs = {}  # Ключ входа -> последнее значение (переживает перекомпиляцию)
+        self._rules = []
+        self._names = {}
+        self._input_slots = {}
+        self._values = []
+        self._dependents = []  # Номер в массиве значений -> правила, зависящие от него
+        self._queued = []
+        self._levels = []  # Номер правила -> уровень
+        self._buckets = []  # Уровень -> правила, ждущие пересчета
+        self._counts = {ES_SYSTEM_REQUIRED: 0, ES_DISPLAY_REQUIRED: 0}
+        self._flags = 0
+        self.compile(rules)
+
+    @property
+    def flags(self):
+        """Объединение флагов истинных правил"""
+        return self._flags
+
+    @property
+    def inputs(self):
+        """Ключи входов, от которых зависят правила"""
+        return set(self._input_slots)
+
+    def __len__(self):
+        return len(self._rules)
+
+    def value(self, name):
+        """Текущее значение именованного правила"""
+        with self._lock:
+            return self._values[self._names[name].slot]
+
+    def compile(self, specs):
+        """Компиляция правил в граф зависимостей; значения входов сохраняются
+
+        При ошибке (синтаксис, неизвестное имя, цикл) - ValueError, а прежние
+        правила остаются в силе.
+        """
+        rules, names = [], {}
+        for index, spec in enumerate(specs):
+            if not isinstance(spec, dict) or not isinstance(spec.get("when"), str):
+                raise ValueError(f"правило {index + 1}: нужно условие when")
+            name = spec.get("name")
+            hold = parse_hold(spec.get("hold", ()))
+            if name is not None:
+                if not isinstance(name, str) or not re.fullmatch(r"[A-Za-z_]\w*", name) \
+                        or name in INPUTS or name in ("and", "or", "not", "true", "false"):
+                    raise ValueError(f"правило {index + 1}: недопустимое имя {name!r}")
+                if name in names:
+                    raise ValueError(f"правило {name!r} задано дважды")
+            elif not hold:
+                raise ValueError(f"правило {index + 1}: без имени нужен hold")
+            rule = Rule(name, spec["when"], hold)
+            rules.append(rule)
+            if name is not None:
+                names[name] = rule
+
+        # Разбор: условие - шаблон с местами под номера входов и правил
+        templates, references = [], []
+        for rule in rules:
+            keys = []
+
+            def resolve(key, rule=rule, keys=keys):
+                if key not in names and key not in INPUTS and ":" not in key:
+                    raise ValueError(f"условие {rule.when!r}: неизвестное имя {key!r}")
+                if key.startswith("window:"):
+                    from scheduler import parse_window
+                    parse_window(key[7:])
+                if key not in keys:
+                    keys.append(key)
+                return f"v[{{{keys.index(key)}}}]"
+            templates.append(_Parser(rule.when, resolve).parse())
+            references.append(keys)
+
+        # Топологический порядок (Кан): правило после всех, от которых зависит
+        users = {}  # Имя правила -> номера зависящих от него правил
+        waiting = [0] * len(rules)
+        for index, keys in enumerate(references):
+            for key in keys:
+                if key in names:
+                    users.setdefault(key, []).append(index)
+                    waiting[index] += 1
+        ready = [index for index in range(len(rules)) if not waiting[index]]
+        order = []
+        while ready:
+            index = ready.pop()
+            order.append(index)
+            for user in users.get(rules[index].name, ()):
+                waiting[user] -= 1
+                if not waiting[user]:
+                    ready.append(user)
+        if len(order) != len(rules):
+            cycle = [rule.name or f"#{index + 1}" for index, rule in enumerate(rules)
+                     if waiting[index]]
+            raise ValueError(f"правила ссылаются друг на друга по кругу: {', '.join(cycle)}")
+
+        # Правила нумеруются в топологическом порядке, входы - после них
+        input_slots = {}
+        for slot, index in enumerate(order):
+            rule = rules[index]
+            rule.slot = slot
+            rule.level = max((names[key].level + 1 for key in references[index] if key in names),
+                             default=0)
+        for keys in references:
+            for key in keys:
+                if key not in names and key not in input_slots:
+                    input_slots[key] = len(rules) + len(input_slots)
+        dependents = [[] for _ in range(len(rules) + len(input_slots))]
+        for rule, template, keys in zip(rules, templates, references):
+            slots = [names[key].slot if key in names else input_slots[key] for key in keys]
+            for slot in slots:
+                dependents[slot].append(rule.slot)
+            source = template.format(*slots)
+            rule.function = eval(f"lambda v: {source}", {"__builtins__": {}})
+        rules = sorted(rules, key=lambda rule: rule.slot)
+
+        with self._lock:
+            self._rules = rules
+            self._names = names
+            self._input_slots = input_slots
+            self._dependents = dependents
+            self._queued = [True] * len(rules)
+            self._levels = [rule.level for rule in rules]
+            self._buckets = [[] for _ in range(max(self._levels, default=-1) + 1)]
+            for rule in rules:
+                self._buckets[rule.level].append(rule.slot)
+            self._values = [False] * len(dependents)
+            for key, slot in input_slots.items():
+                self._values[slot] = self._inputs.get(key, False)
+            self._counts = dict.fromkeys(self._counts, 0)
+            self._evaluate()
+
+    def set_input(self, key, value):
+        """Новое значение входа"""
+        self.set_inputs({key: value})
+
+    def set_inputs(self, values):
+        """Новые значения нескольких входов: зависящие правила считаются один раз"""
+        with self._lock:
+            changed = False
+            for key, value in values.items():
+                value = bool(value)
+                self._inputs[key] = value
+                slot = self._input_slots.get(key)
+                if slot is None or self._values[slot] == value:
+                    continue
+                self._values[slot] = value
+                self._enqueue(slot)
+                changed = True
+            if changed:
+                self._evaluate()
+
+    def _enqueue(self, slot):
+        queued = self._queued
+        levels = self._levels
+        buckets = self._buckets
+        for dependent in self._dependents[slot]:
+            if not queued[dependent]:
+                queued[dependent] = True
+                buckets[levels[dependent]].append(dependent)
+
+    def _evaluate(self):
+        # Правило зависит только от правил меньших уровней: уровни проходятся
+        # по возрастанию, и каждое правило вычисляется не больше раза
+        values = self._values
+        rules = self._rules
+        queued = self._queued
+        levels = self._levels
+        buckets = self._buckets
+        dependents = self._dependents
+        counts = self._counts
+        evaluated = 0
+        for bucket in buckets:
+            if not bucket:
+                continue
+            for slot in bucket:
+                queued[slot] = False
+                rule = rules[slot]
+                value = bool(rule.function(values))
+                if value == values[slot]:
+                    continue
+                values[slot] = value
+                if rule.hold:
+                    for bit in counts:
+                        if rule.hold & bit:
+                            counts[bit] += 1 if value else -1
+                for dependent in dependents[slot]:
+                    if not queued[dependent]:
+                        queued[dependent] = True
+                        buckets[levels[dependent]].append(dependent)
+            evaluated += len(bucket)
+            bucket.clear()
+        self.evaluations += evaluated
+        RULE_EVALUATIONS.inc(evaluated)
+        self._publish()
+
+    def _publish(self):
+        flags = 0
+        for bit, count in self._counts.items():
+            if count:
+                flags |= bit
+        if flags != self._flags:
+            self._flags = flags
+            if self.on_change is not None:
+                self.on_change(flags)
+
+
+class RuleInputs:
+    """Источники входов process() и window() для RuleEngine
+
+    Окна времени ведет один Scheduler с потоком SchedulerThread, процессы -
+    один ProcessWatcher на все шаблоны: один поток ожидания и один просмотр
+    таблицы процессов. Таблица, как и в procwatch, читается только при
+    добавлении шаблона, при выходе найденного процесса и по rescan(), без
+    опроса по времени; запуск процесса в Linux приходит уведомлением ядра. battery, locked и busy владелец передает сам через
+    engine.set_input().
+    """
+
+    def __init__(self, engine, clock=time.time, watcher_factory=None):
+        from scheduler import Scheduler
+
+        self.engine = engine
+        self.scheduler = Scheduler(clock=clock, on_window=self._on_window)
+        self._watcher_factory = watcher_factory
+        # Блокировка соответствия окон входам; под ней же окно меняет вход,
+        # чтобы включение и выключение не переставились местами
+        self._keys_lock = threading.Lock()
+        self._windows = {}  # Ключ входа -> id окна в планировщике
+        self._window_keys = {}  # id окна -> ключ входа
+        self._early = {}  # id окна -> состояние, пришедшее до записи соответствия
+        self._patterns = set()  # Шаблоны process(), переданные наблюдателю
+        self._watcher = None
+        self._driver = None
+
+    def update(self):
+        """Источники под входы правил после engine.compile(); потоки
+        запускаются, только когда правилам нужны окна времени или процессы"""
+        from scheduler import SchedulerThread, parse_window
+
+        keys = self.engine.inputs
+        for key in [key for key in self._windows if key not in keys]:
+            window_id = self._windows.pop(key)
+            self.scheduler.remove(window_id)
+            with self._keys_lock:
+                del self._window_keys[window_id]
+        patterns = {key[8:] for key in keys if key.startswith("process:")}
+        for pattern in self._patterns - patterns:
+            self._watcher.unwatch_name(pattern)
+        for key in sorted(keys):
+            if key.startswith("window:") and key not in self._windows:
+                days, start, end = parse_window(key[7:])
+                window_id = self.scheduler.add_recurring(days, start, end, ES_SYSTEM_REQUIRED)
+                self._windows[key] = window_id
+                with self._keys_lock:
+                    self._window_keys[window_id] = key
+                    active = self._early.pop(window_id, None)
+                    if active is not None:
+                        self.engine.set_input(key, active)
+        if patterns - self._patterns:
+            self._watch(sorted(patterns - self._patterns))
+        self._patterns = patterns
+        if self._windows and self._driver is None:
+            self._driver = SchedulerThread(self.scheduler, name="no-sleep-rules-schedule")
+            self._driver.start()
+
+    def resync(self):
+        """Перепроверка окон времени (после выхода из сна)"""
+        self.scheduler.resync()
+
+    def rescan(self):
+        """Поиск новых процессов по шаблонам process()"""
+        if self._watcher is not None:
+            try:
+                self._watcher.rescan()
+            except OSError:
+                pass
+
+    def close(self):
+        if self._driver is not None:
+            self._driver.stop()
+        if self._watcher is not None:
+            self._watcher.close()
+        self._patterns.clear()
+
+    def _watch(self, patterns):
+        if self._watcher is None:
+            if self._watcher_factory is None:
+                from procwatch import ProcessWatcher
+                self._watcher_factory = ProcessWatcher
+            self._watcher = self._watcher_factory(on_pattern_change=self._on_process)
+        try:
+            self._watcher.watch_names(patterns)
+        except OSError:
+            pass  # Без ожидания процессов вход остается ложным
+
+    def _on_process(self, pattern, alive):
+        self.engine.set_input(input_key("process", pattern), alive)
+
+    def _on_window(self, window_id, active):
+        with self._keys_lock:
+            key = self._window_keys.get(window_id)
+            if key is None:
+                self._early[window_id] = active
+            else:
+                self.engine.set_input(key, active)
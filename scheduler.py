@@ -0,0 +1,351 @@
+"""Планировщик окон удержания: «до 18:30», «на 3 часа», «по будням 9-18».
+
+Переходы (начало и конец окна) лежат в куче по времени, поэтому ближайший
+переход находится за O(1), а добавление и обработка - за O(log n). Для
+ожидания нужен ровно один таймер на ближайший переход, без опроса.
+Повторяющееся окно держит в куче только свое ближайшее вхождение.
+
+Время - настенные часы (time.time()): расписание задается по часам на стене.
+После перевода часов или выхода из сна вызывается resync(). Без этого
+вызова ожидание, отмеренное по старым часам, разошлось бы с ними, поэтому
+и SchedulerThread, и таймер расписания GUI ждут не дольше MAX_WAIT и
+каждый раз сверяются с часами заново.
+"""
+import heapq
+import itertools
+import re
+import threading
+import time
+from datetime import datetime, timedelta
+
+from power import ES_SYSTEM_REQUIRED, ES_DISPLAY_REQUIRED
+
+BEGIN = 0
+END = 1
+
+# Наибольшее ожидание драйвера расписания (SchedulerThread, таймер GUI), с:
+# переход после перевода часов или сна без resync() наступит не позже
+MAX_WAIT = 60.0
+
+DAY_NAMES = ("mon", "tue", "wed", "thu", "fri", "sat", "sun")
+_DAY_GROUPS = {"daily": range(7), "weekdays": range(5), "weekends": range(5, 7)}
+_WINDOW_RE = re.compile(r"^\s*(\S+)\s+(\d{1,2}):(\d{2})\s*-\s*(\d{1,2}):(\d{2})\s*$")
+
+
+def parse_days(text):
+    """Дни недели: mon-fri, sat,sun, daily, weekdays, weekends (0 - понедельник)"""
+    text = text.lower()
+    if text in _DAY_GROUPS:
+        return frozenset(_DAY_GROUPS[text])
+    days = set()
+    for part in text.split(","):
+        first, _, last = part.partition("-")
+        if first not in DAY_NAMES or (last and last not in DAY_NAMES):
+            raise ValueError(f"неизвестный день недели: {part!r}")
+        start = DAY_NAMES.index(first)
+        stop = DAY_NAMES.index(last) if last else start
+        day = start
+        days.add(day)
+        while day != stop:
+            day = (day + 1) % 7
+            days.add(day)
+    return frozenset(days)
+
+
+def parse_window(text):
+    """Повторяющееся окно вида "mon-fri 09:00-18:00" -> (дни, начало, конец)
+
+    Начало и конец - секунды от полуночи; конец раньше начала означает окно
+    через полночь.
+    """
+    match = _WINDOW_RE.match(text)
+    if not match:
+        raise ValueError(f"неверное окно: {text!r} (пример: mon-fri 09:00-18:00)")
+    days = parse_days(match.group(1))
+    h1, m1, h2, m2 = (int(match.group(i)) for i in range(2, 6))
+    if h1 > 23 or h2 > 24 or m1 > 59 or m2 > 59:
+        raise ValueError(f"неверное время в окне: {text!r}")
+    return days, h1 * 3600 + m1 * 60, h2 * 3600 + m2 * 60
+
+
+def next_time_of_day(text, now=None):
+    """Ближайший момент времени "ЧЧ:ММ" после now (сегодня или завтра)"""
+    match = re.fullmatch(r"\s*(\d{1,2}):(\d{2})\s*", text)
+    if not match or int(match.group(1)) > 23 or int(match.group(2)) > 59:
+        raise ValueError(f"неверное время: {text!r} (пример: 18:30)")
+    now = time.time() if now is None else now
+    moment = datetime.fromtimestamp(now).replace(hour=int(match.group(1)),
+                                                 minute=int(match.group(2)),
+                                                 second=0, microsecond=0)
+    if moment.timestamp() <= now:
+        moment += timedelta(days=1)
+    return moment.timestamp()
+
+
+class Window:
+    """Окно удержания: однократное или повторяющееся по дням недели"""
+
+    __slots__ = ("id", "flags", "start", "end", "days", "cancelled")
+
+    def __init__(self, window_id, flags, start, end, days=None):
+        self.id = window_id
+        self.flags = flags
+        self.start = start  # Однократное: метка времени; повторяющееся: секунды от полуночи
+        self.end = end
+        self.days = days
+        self.cancelled = False
+
+    @property
+    def recurring(self):
+        return self.days is not None
+
+    def occurrence_after(self, after):
+        """Первое вхождение повторяющегося окна с концом позже after: (начало, конец)"""
+        length = (self.end - self.start) % 86400 or 86400
+        day = datetime.fromtimestamp(after).replace(hour=0, minute=0, second=0, microsecond=0)
+        day -= timedelta(days=1)  # Окно через полночь могло начаться вчера
+        for _ in range(9):
+            if day.weekday() in self.days:
+                start = (day + timedelta(seconds=self.start)).timestamp()
+                if start + length > after:
+                    return start, start + length
+            day += timedelta(days=1)
+        return None
+
+
+class Transition:
+    """Ближайший переход расписания"""
+
+    __slots__ = ("when", "kind", "window_id")
+
+    def __init__(self, when, kind, window_id):
+        self.when = when
+        self.kind = kind
+        self.window_id = window_id
+
+    def __repr__(self):
+        kind = "начало" if self.kind == BEGIN else "конец"
+        return f"Transition({self.when:.0f}, {kind}, окно {self.window_id})"
+
+
+class Scheduler:
+    """Расписание окон удержания с объединением флагов перекрывающихся окон
+
+    on_change(flags) вызывается, только когда меняется объединение флагов
+    активных окон; on_reschedule() - когда мог измениться ближайший переход
+    (драйвер должен перевзвести свой единственный таймер); on_window(id окна,
+    active) - когда окно становится активным или перестает быть им.
+    """
+
+    def __init__(self, on_change=None, on_reschedule=None, clock=time.time, on_window=None):
+        self.on_change = on_change
+        self.on_reschedule = on_reschedule
+        self.on_window = on_window
+        self.clock = clock
+        self.transitions = 0  # Обработано переходов
+        self._lock = threading.RLock()
+        self._heap = []  # (время, порядковый номер, BEGIN/END, окно, начало вхождения)
+        self._seq = itertools.count()
+        self._ids = itertools.count(1)
+        self._windows = {}
+        self._active = {}  # (id окна, начало вхождения) -> флаги
+        self._occurrences = {}  # id окна -> число активных вхождений
+        self._counts = {ES_SYSTEM_REQUIRED: 0, ES_DISPLAY_REQUIRED: 0}
+        self._flags = 0
+
+    @property
+    def flags(self):
+        """Объединение флагов активных окон"""
+        return self._flags
+
+    def __len__(self):
+        return len(self._windows)
+
+    def add_once(self, start, end, flags):
+        """Однократное окно [start, end) в метках time.time()"""
+        if end <= start:
+            raise ValueError("конец окна должен быть позже начала")
+        with self._lock:
+            window = Window(next(self._ids), flags, start, end)
+            self._windows[window.id] = window
+            self._push(start, BEGIN, window, start)
+        self._changed()
+        return window.id
+
+    def add_recurring(self, days, start, end, flags):
+        """Повторяющееся окно: дни недели (0 - понедельник), начало и конец
+        в секундах от полуночи"""
+        if not days:
+            raise ValueError("не указаны дни недели")
+        with self._lock:
+            window = Window(next(self._ids), flags, start, end, frozenset(days))
+            self._windows[window.id] = window
+            occurrence = window.occurrence_after(self.clock())
+            if occurrence is not None:
+                self._push(occurrence[0], BEGIN, window, occurrence[0])
+        self._changed()
+        return window.id
+
+    def remove(self, window_id):
+        """Удаление окна; если оно активно, его флаги снимаются сразу"""
+        with self._lock:
+            window = self._windows.pop(window_id, None)
+            if window is None:
+                return False
+            # Записи в куче удаляются лениво при извлечении
+            window.cancelled = True
+            for key in [key for key in self._active if key[0] == window_id]:
+                self._deactivate(key)
+            self._publish()
+        self._changed()
+        return True
+
+    def clear(self):
+        """Удаление всех окон"""
+        for window_id in list(self._windows):
+            self.remove(window_id)
+
+    def next_transition(self):
+        """Ближайший переход или None"""
+        with self._lock:
+            self._drop_cancelled()
+            if not self._heap:
+                return None
+            when, _, kind, window, _ = self._heap[0]
+            return Transition(when, kind, window.id)
+
+    def advance(self, now=None):
+        """Обработка всех переходов, наступивших к моменту now"""
+        with self._lock:
+            now = self.clock() if now is None else now
+            processed = 0
+            while self._heap and self._heap[0][0] <= now:
+                when, _, kind, window, occurrence = heapq.heappop(self._heap)
+                if window.cancelled:
+                    continue
+                processed += 1
+                key = (window.id, occurrence)
+                if kind == BEGIN:
+                    self._begin(window, occurrence, now)
+                else:
+                    self._deactivate(key)
+                    if not window.recurring:
+                        del self._windows[window.id]
+            self.transitions += processed
+            self._publish()
+            return processed
+
+    def resync(self):
+        """Перепроверка по настенным часам после их перевода или выхода из сна"""
+        self.advance()
+        self._changed()
+
+    def _begin(self, window, occurrence, now):
+        if window.recurring:
+            length = (window.end - window.start) % 86400 or 86400
+            end = occurrence + length
+            # Следующее вхождение ставится в кучу сразу, без опроса
+            following = window.occurrence_after(end)
+            if following is not None:
+                self._push(following[0], BEGIN, window, following[0])
+        else:
+            end = window.end
+        if end <= now:
+            return  # Окно целиком в прошлом (например, часы переведены вперед)
+        self._active[(window.id, occurrence)] = window.flags
+        for bit in self._counts:
+            if window.flags & bit:
+                self._counts[bit] += 1
+        self._push(end, END, window, occurrence)
+        # Окно на все сутки: следующее вхождение начинается до конца текущего
+        count = self._occurrences.get(window.id, 0)
+        self._occurrences[window.id] = count + 1
+        if not count and self.on_window is not None:
+            self.on_window(window.id, True)
+
+    def _deactivate(self, key):
+        flags = self._active.pop(key, None)
+        if flags is None:
+            return
+        for bit in self._counts:
+            if flags & bit:
+                self._counts[bit] -= 1
+        count = self._occurrences.pop(key[0]) - 1
+        if count:
+            self._occurrences[key[0]] = count
+        elif self.on_window is not None:
+            self.on_window(key[0], False)
+
+    def _publish(self):
+        flags = 0
+        for bit, count in self._counts.items():
+            if count:
+                flags |= bit
+        if flags != self._flags:
+            self._flags = flags
+            if self.on_change is not None:
+                self.on_change(flags)
+
+    def _push(self, when, kind, window, occurrence):
+        heapq.heappush(self._heap, (when, next(self._seq), kind, window, occurrence))
+
+    def _drop_cancelled(self):
+        while self._heap and self._heap[0][3].cancelled:
+            heapq.heappop(self._heap)
+
+    def _changed(self):
+        if self.on_reschedule is not None:
+            self.on_reschedule()
+
+
+class SchedulerThread:
+    """Драйвер расписания для режимов без GUI: один поток и одно ожидание
+    до ближайшего перехода
+
+    Так же ведутся сроки аренд leases.LeaseManager: у него тот же интерфейс.
+    max_wait ограничивает одно ожидание для настенных часов; для монотонных
+    (аренды) ограничение не нужно - None.
+    """
+
+    def __init__(self, scheduler, name="no-sleep-scheduler", max_wait=MAX_WAIT):
+        self.scheduler = scheduler
+        self.max_wait = max_wait
+        self._cond = threading.Condition()
+        self._dirty = False
+        self._stopped = False
+        self._thread = threading.Thread(target=self._loop, name=name, daemon=True)
+        scheduler.on_reschedule = self.wake
+
+    def start(self):
+        self._thread.start()
+
+    def wake(self):
+        """Перевзвод ожидания после изменения расписания"""
+        with self._cond:
+            self._dirty = True
+            self._cond.notify()
+
+    def stop(self):
+        with self._cond:
+            self._stopped = True
+            self._cond.notify()
+        self._thread.join()
+
+    def _loop(self):
+        # Расписание вызывается без блокировки драйвера, иначе wake() из
+        # обработчика on_change могло бы взаимно заблокироваться с потоком
+        while True:
+            with self._cond:
+                if self._stopped:
+                    return
+                self._dirty = False
+            self.scheduler.advance()
+            transition = self.scheduler.next_transition()
+            timeout = None
+            if transition is not None:
+                timeout = max(0.0, transition.when - self.scheduler.clock())
+                if self.max_wait is not None:
+                    timeout = min(timeout, self.max_wait)
+            with self._cond:
+                if not self._dirty and not self._stopped:
+                    self._cond.wait(timeout)
@@ -0,0 +1,305 @@
+"""Постоянные настройки No-Sleep: переключатели, активность, положение окна.
+
+Настройки лежат в маленьком JSON-файле и читаются синхронно при запуске.
+Частые изменения (переключения, перетаскивание окна) собираются в одну
+запись через delay секунд тишины; запись атомарна - временный файл и
+переименование. Файл отслеживается уведомлениями ОС (inotify в Linux,
+ReadDirectoryChangesW в Windows), без опроса: изменения, которые внешний
+инструмент развертывания вносит в файл, применяются сразу.
+"""
+import json
+import os
+import select
+import struct
+import sys
+import threading
+import time
+
+from metrics import registry
+
+SETTINGS_WRITES = registry.counter("nosleep_settings_writes_total", "Записи файла настроек")
+SETTINGS_RELOADS = registry.counter("nosleep_settings_reloads_total",
+                                    "Применения внешних изменений файла настроек")
+WATCHER_WAKEUPS = registry.counter("nosleep_thread_wakeups_total",
+                                   "Пробуждения фоновых потоков", thread="settings")
+
+DEFAULTS = {
+    "system": True,  # Предотвращать спящий режим
+    "display": True,  # Предотвращать отключение дисплея
+    "active": False,  # Удержание было включено вручную при выходе
+    "window": None,  # Положение окна [x, y]
+    "reduced_motion": False,  # Переходы виджетов без анимации
+    "rules": [],  # Правила удержания (см. rules.py)
+}
+
+# inotify: файл закрыт после записи или переименован в каталог
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+_EVENT = struct.Struct("iIII")
+
+
+def default_path():
+    """Путь к файлу настроек текущего пользователя"""
+    if sys.platform == "win32":
+        base = os.environ.get("APPDATA") or os.path.expanduser("~")
+        return os.path.join(base, "No-Sleep", "settings.json")
+    base = os.environ.get("XDG_CONFIG_HOME") or os.path.join(os.path.expanduser("~"), ".config")
+    return os.path.join(base, "no-sleep", "settings.json")
+
+
+def _valid(key, value):
+    if key == "window":
+        return value is None or (isinstance(value, list) and len(value) == 2
+                                 and all(type(item) is int for item in value))
+    if key == "rules":
+        return isinstance(value, list) and all(isinstance(item, dict) for item in value)
+    return type(value) is bool
+
+
+class Settings:
+    """Настройки с отложенной атомарной записью и живой перезагрузкой
+
+    on_change(changed) вызывается из потока наблюдения со словарем
+    настроек, измененных извне.
+    """
+
+    def __init__(self, path=None, delay=0.5, on_change=None):
+        self.path = path or default_path()
+        self.delay = delay
+        self.on_change = on_change
+        self._values = dict(DEFAULTS)
+        self._cond = threading.Condition()
+        self._io = threading.Lock()  # Запись файла: поток записи и flush()
+        self._dirty = False
+        self._deadline = 0.0
+        self._written = None  # Последнее записанное или прочитанное содержимое
+        self._closed = False
+        self._writer = None
+        self._watcher = None
+
+    def __getitem__(self, key):
+        return self._values[key]
+
+    def load(self):
+        """Синхронное чтение файла; неверные значения заменяются умолчаниями"""
+        try:
+            with open(self.path, "rb") as stream:
+                data = stream.read()
+        except OSError:
+            return dict(self._values)
+        values = self._parse(data)
+        if values is not None:
+            with self._cond:
+                self._values = values
+                self._written = data
+        return dict(self._values)
+
+    def update(self, **values):
+        """Изменение настроек; запись - после delay секунд без изменений"""
+        with self._cond:
+            changed = False
+            for key, value in values.items():
+                if key not in DEFAULTS:
+                    raise KeyError(key)
+                if isinstance(value, tuple):
+                    value = list(value)
+                if self._values[key] != value:
+                    self._values[key] = value
+                    changed = True
+            if not changed or self._closed:
+                return
+            self._dirty = True
+            self._deadline = time.monotonic() + self.delay
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._write_loop,
+                                                name="no-sleep-settings-writer", daemon=True)
+                self._writer.start()
+            self._cond.notify()
+
+    def flush(self):
+        """Немедленная запись отложенных изменений"""
+        # Снимок берется под блокировкой записи: более старый не перезапишет
+        # более новый, и два потока не пишут один временный файл
+        with self._io:
+            with self._cond:
+                if not self._dirty:
+                    return
+                self._dirty = False
+                data = self._serialize()
+            self._write(data)
+
+    def watch(self):
+        """Запуск наблюдения за файлом (без опроса)"""
+        if self._watcher is not None:
+            return
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self._watcher = (_DirectoryWatcherWindows if sys.platform == "win32"
+                         else _DirectoryWatcherLinux)(self.path, self._reload)
+        self._watcher.start()
+
+    def close(self):
+        """Запись отложенных изменений и остановка потоков"""
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        if self._writer is not None:
+            self._writer.join()
+        self.flush()
+        if self._watcher is not None:
+            self._watcher.stop()
+            self._watcher = None
+
+    def _serialize(self):
+        return json.dumps(self._values, separators=(",", ":"), sort_keys=True).encode("utf-8")
+
+    def _parse(self, data):
+        try:
+            loaded = json.loads(data)
+        except ValueError:
+            return None
+        if not isinstance(loaded, dict):
+            return None
+        return {key: loaded[key] if key in loaded and _valid(key, loaded[key]) else default
+                for key, default in DEFAULTS.items()}
+
+    def _write(self, data):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as stream:
+            stream.write(data)
+            stream.flush()
+            os.fsync(stream.fileno())
+        with self._cond:
+            self._written = data
+        os.replace(tmp_path, self.path)
+        SETTINGS_WRITES.inc()
+
+    def _write_loop(self):
+        while True:
+            with self._cond:
+                while not self._dirty and not self._closed:
+                    self._cond.wait()
+                if self._closed:
+                    return
+                remaining = self._deadline - time.monotonic()
+                if remaining > 0:
+                    # Новые изменения сдвигают срок записи
+                    self._cond.wait(remaining)
+                    continue
+            self.flush()
+
+    def _reload(self):
+        """Файл изменился: применяются только изменения, сделанные извне"""
+        try:
+            with open(self.path, "rb") as stream:
+                data = stream.read()
+        except OSError:
+            return
+        with self._cond:
+            if data == self._written:
+                return  # Собственная запись
+            values = self._parse(data)
+            if values is None:
+                return  # Недописанный или поврежденный файл - оставляем текущие
+            self._written = data
+            changed = {key: value for key, value in values.items() if self._values[key] != value}
+            self._values.update(changed)
+        if changed:
+            SETTINGS_RELOADS.inc()
+            if self.on_change is not None:
+                self.on_change(changed)
+
+
+class _DirectoryWatcherLinux:
+    """inotify на каталоге файла: замена файла переименованием - это
+    IN_MOVED_TO, запись на месте - IN_CLOSE_WRITE"""
+
+    def __init__(self, path, on_change):
+        import ctypes
+
+        self.directory, name = os.path.split(path)
+        self.name = name.encode()
+        self.on_change = on_change
+        libc = ctypes.CDLL(None, use_errno=True)
+        self._fd = libc.inotify_init1(os.O_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1")
+        if libc.inotify_add_watch(self._fd, os.fsencode(self.directory),
+                                  IN_CLOSE_WRITE | IN_MOVED_TO) < 0:
+            os.close(self._fd)
+            raise OSError(ctypes.get_errno(), "inotify_add_watch", self.directory)
+        self._wake_r, self._wake_w = os.pipe()
+        self._thread = threading.Thread(target=self._loop, name="no-sleep-settings", daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        os.write(self._wake_w, b"\0")
+        self._thread.join()
+
+    def _loop(self):
+        try:
+            while True:
+                ready, _, _ = select.select([self._fd, self._wake_r], [], [])
+                WATCHER_WAKEUPS.inc()
+                if self._wake_r in ready:
+                    return
+                data = os.read(self._fd, 65536)
+                offset, matched = 0, False
+                while offset < len(data):
+                    _, _, _, size = _EVENT.unpack_from(data, offset)
+                    offset += _EVENT.size
+                    matched |= data[offset:offset + size].rstrip(b"\0") == self.name
+                    offset += size
+                if matched:
+                    self.on_change()
+        finally:
+            for fd in (self._fd, self._wake_r, self._wake_w):
+                os.close(fd)
+
+
+class _DirectoryWatcherWindows:
+    """ReadDirectoryChangesW на каталоге файла (pywin32)
+
+    Синхронный вызов нельзя прервать из другого потока, поэтому после stop()
+    поток завершается при следующем изменении в каталоге; он фоновый и
+    выходу из программы не мешает.
+    """
+
+    def __init__(self, path, on_change):
+        import win32con
+        import win32file
+
+        self.directory, self.name = os.path.split(path)
+        self.on_change = on_change
+        self._stopped = False
+        self._handle = win32file.CreateFile(
+            self.directory, 0x0001,  # FILE_LIST_DIRECTORY
+            win32con.FILE_SHARE_READ | win32con.FILE_SHARE_WRITE | win32con.FILE_SHARE_DELETE,
+            None, win32con.OPEN_EXISTING, win32con.FILE_FLAG_BACKUP_SEMANTICS, None)
+        self._thread = threading.Thread(target=self._loop, name="no-sleep-settings", daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stopped = True
+
+    def _loop(self):
+        import win32con
+        import win32file
+
+        try:
+            while not self._stopped:
+                changes = win32file.ReadDirectoryChangesW(
+                    self._handle, 8192, False,
+                    win32con.FILE_NOTIFY_CHANGE_LAST_WRITE | win32con.FILE_NOTIFY_CHANGE_FILE_NAME,
+                    None, None)
+                WATCHER_WAKEUPS.inc()
+                if self._stopped:
+                    return
+                if any(name.lower() == self.name.lower() for _, name in changes):
+                    self.on_change()
+        finally:
+            win32file.CloseHandle(self._handle)
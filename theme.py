@@ -0,0 +1,155 @@
+"""Темная фиолетовая тема: шрифты и палитры по ролям виджетов.
+
+Цвет текста, шрифт и отступы каждой роли (заголовок, подпись настройки,
+статус...) вычисляются один раз и переиспользуются всеми виджетами роли.
+Таблица стилей осталась только для украшений, которые палитрой не
+передать (градиентные заголовки, рамки групп, полоса прокрутки), и
+адресуется точно по objectName - общего правила для всех QWidget больше
+нет, поэтому виджеты без своего фона не заливаются полупрозрачным цветом
+при каждой перерисовке. Смена состояния (статус активно/неактивно) - это
+замена готовой палитры, без разбора CSS и повторной полировки.
+"""
+from PyQt5.QtGui import QBrush, QColor, QFont, QGradient, QLinearGradient, QPalette
+
+TEXT = "#E0E0E0"
+ACCENT = "#BB86FC"
+
+# Роль: размер шрифта в пикселях, жирность, цвет текста, отступы (слева, сверху,
+# справа, снизу; None - не менять); None - роль оформляется только таблицей стилей
+ROLES = {
+    "titleLabel": (28, True, "white", (15, 15, 15, 15)),
+    "instructionsTitle": (20, True, "white", (15, 15, 15, 15)),
+    "descriptionLabel": (12, True, ACCENT, (10, 10, 10, 10)),
+    "settingsGroup": (12, True, TEXT, None),
+    "infoGroup": (12, True, TEXT, None),
+    "settingLabel": (12, True, TEXT, (0, 0, 0, 0)),
+    "infoLabel": (12, False, TEXT, (8, 8, 8, 8)),
+    "statusLabel": (12, True, "#E74C3C", (8, 8, 8, 8)),
+    "sectionTitle": (12, True, ACCENT, (0, 10, 0, 0)),
+    "sectionText": (12, False, TEXT, (0, 0, 0, 5)),
+    "scrollArea": None,
+    "instructionsContainer": None,
+    "separator": None,
+}
+
+# Цвет текста роли в именованных состояниях
+STATES = {
+    "statusLabel": {"active": "#27AE60", "inactive": "#E74C3C"},
+}
+
+# Только украшения; цвета текста и шрифты задаются палитрами и QFont
+STYLESHEET = """
+QLabel#titleLabel, QLabel#instructionsTitle {
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #6A0DAD, stop:1 #8A2BE2);
+    border-radius: 15px;
+}
+QGroupBox#settingsGroup, QGroupBox#infoGroup {
+    border: 2px solid #6A0DAD;
+    border-radius: 12px;
+    margin-top: 10px;
+    padding-top: 15px;
+    background: rgba(30, 30, 35, 200);
+}
+QGroupBox#settingsGroup::title, QGroupBox#infoGroup::title {
+    subcontrol-origin: margin;
+    left: 10px;
+    padding: 0 8px 0 8px;
+    color: #BB86FC;
+}
+QScrollArea#scrollArea, QScrollArea#scrollArea > QWidget {
+    border: none;
+    background: transparent;
+}
+QScrollBar:vertical {
+    border: none;
+    background: #1E1E23;
+    width: 12px;
+    margin: 0px;
+}
+QScrollBar::handle:vertical {
+    background: #6A0DAD;
+    min-height: 30px;
+    border-radius: 6px;
+}
+QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
+    height: 0px;
+}
+QFrame#separator {
+    background-color: #333;
+    margin: 15px 0;
+    max-height: 1px;
+}
+QWidget#instructionsContainer {
+    background-color: #1E1E1E;
+    border-radius: 8px;
+}
+"""
+
+
+class Theme:
+    """Готовые шрифты и палитры ролей; создаются при первом обращении"""
+
+    def __init__(self, roles=ROLES, states=STATES):
+        self.roles = roles
+        self.states = states
+        self._fonts = {}
+        self._palettes = {}
+        self._window_palette = None
+
+    def font(self, role):
+        font = self._fonts.get(role)
+        if font is None:
+            size, bold = self.roles[role][:2]
+            font = QFont("Segoe UI") if role in ("titleLabel", "instructionsTitle") else QFont()
+            font.setPixelSize(size)
+            font.setBold(bold)
+            self._fonts[role] = font
+        return font
+
+    def palette(self, role, state=None):
+        key = (role, state)
+        palette = self._palettes.get(key)
+        if palette is None:
+            color = self.states[role][state] if state is not None else self.roles[role][2]
+            palette = QPalette(self.window_palette())
+            palette.setColor(QPalette.WindowText, QColor(color))
+            self._palettes[key] = palette
+        return palette
+
+    def window_palette(self):
+        """Палитра окна: градиентный фон и светлый текст для всех потомков"""
+        if self._window_palette is None:
+            gradient = QLinearGradient(0, 0, 0, 1)
+            gradient.setCoordinateMode(QGradient.ObjectBoundingMode)
+            gradient.setColorAt(0, QColor("#0C0C0E"))
+            gradient.setColorAt(1, QColor("#1A1A1F"))
+            palette = QPalette()
+            palette.setBrush(QPalette.Window, QBrush(gradient))
+            for role, color in ((QPalette.WindowText, TEXT), (QPalette.Text, TEXT),
+                                (QPalette.ButtonText, TEXT), (QPalette.Base, "#1E1E23"),
+                                (QPalette.Button, "#2A2A31"), (QPalette.Highlight, "#6A0DAD")):
+                palette.setColor(role, QColor(color))
+            self._window_palette = palette
+        return self._window_palette
+
+    def apply(self, widget, role):
+        """Назначение роли виджету: имя для таблицы стилей, шрифт, палитра, отступы"""
+        widget.setObjectName(role)
+        spec = self.roles[role]
+        if spec is None:
+            return
+        widget.setFont(self.font(role))
+        widget.setPalette(self.palette(role))
+        if spec[3] is not None:
+            widget.setContentsMargins(*spec[3])
+
+    def set_state(self, widget, state):
+        """Смена состояния виджета заменой готовой палитры"""
+        widget.setPalette(self.palette(widget.objectName(), state))
+
+    def apply_window(self, window):
+        window.setPalette(self.window_palette())
+        window.setStyleSheet(STYLESHEET)
+
+
+theme = Theme()
@@ -0,0 +1,210 @@
+"""Трассировка горячих путей: отрезки времени в кольцевом буфере.
+
+Отмеченные @traced методы (отрисовка, переключение удержания, кадры
+анимаций) и блоки with tracer.span(...) (системный вызов в потоке питания)
+записываются в буфер фиксированного размера, выделенный при включении:
+начало, длительность, имя и поток - в массивах array, без создания
+объектов на каждый отрезок. Старые записи затираются новыми.
+
+По умолчанию трассировка выключена: обертка @traced проверяет один флаг
+и вызывает метод, span() возвращает пустой контекст. Включается флагом
+--trace; сохраняется по пункту меню трея или сигналу (SIGUSR1, в Windows -
+SIGBREAK) в формате trace-event JSON для chrome://tracing и Perfetto.
+"""
+import itertools
+import os
+import threading
+import time
+from array import array
+from functools import wraps
+
+DEFAULT_SIZE = 65536  # Отрезков в буфере (~1.6 МБ)
+
+
+class _NullSpan:
+    """Пустой отрезок для выключенной трассировки"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    """Отрезок блока with"""
+
+    __slots__ = ("_tracer", "_name", "_start")
+
+    def __init__(self, tracer, name):
+        self._tracer = tracer
+        self._name = name
+
+    def __enter__(self):
+        self._start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        end = time.perf_counter_ns()
+        self._tracer.add(self._name, self._start, end - self._start)
+        return False
+
+
+class Tracer:
+    """Кольцевой буфер отрезков времени"""
+
+    def __init__(self):
+        self.enabled = False
+        self.size = 0
+        self._names = []  # Номер имени -> имя
+        self._ids = {}  # Имя -> номер
+        self._lock = threading.Lock()
+        self._counter = itertools.count()
+        self._starts = self._durations = self._name_ids = self._threads = None
+
+    def enable(self, size=DEFAULT_SIZE):
+        """Включение с буфером на size отрезков; прежние записи теряются"""
+        size = max(2, size)
+        self._starts = array("q", bytes(8 * size))
+        self._durations = array("q", bytes(8 * size))
+        self._name_ids = array("L", bytes(array("L").itemsize * size))
+        self._threads = array("Q", bytes(8 * size))
+        self._counter = itertools.count()
+        self.size = size
+        self.enabled = True
+
+    def disable(self):
+        """Выключение; буфер освобождается"""
+        self.enabled = False
+        self.size = 0
+        self._starts = self._durations = self._name_ids = self._threads = None
+
+    def name_id(self, name):
+        """Номер имени отрезка (имена хранятся в буфере номерами)"""
+        name_id = self._ids.get(name)
+        if name_id is None:
+            with self._lock:
+                name_id = self._ids.get(name)
+                if name_id is None:
+                    name_id = self._ids[name] = len(self._names)
+                    self._names.append(name)
+        return name_id
+
+    def span(self, name):
+        """Контекст отрезка для блока with"""
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, self.name_id(name))
+
+    def add(self, name_id, start, duration):
+        """Запись отрезка: начало и длительность в наносекундах perf_counter_ns"""
+        starts = self._starts
+        if starts is None:
+            return
+        # next() у itertools.count атомарен, поэтому потоки не делят слот
+        slot = next(self._counter) % self.size
+        starts[slot] = start
+        self._durations[slot] = duration
+        self._name_ids[slot] = name_id
+        self._threads[slot] = threading.get_ident()
+
+    def events(self):
+        """Записанные отрезки от старых к новым в формате trace-event"""
+        if not self.enabled:
+            return []
+        size = self.size
+        # Номер, выданный здесь, остается пустым: в выгрузку идут size-1 записей
+        total = next(self._counter)
+        pid = os.getpid()
+        names = list(self._names)
+        events = []
+        threads = set()
+        for number in range(max(0, total - size + 1), total):
+            slot = number % size
+            start = self._starts[slot]
+            if not start:
+                continue
+            thread = self._threads[slot]
+            threads.add(thread)
+            events.append({"name": names[self._name_ids[slot]], "cat": "no-sleep", "ph": "X",
+                           "ts": start / 1000, "dur": self._durations[slot] / 1000,
+                           "pid": pid, "tid": thread})
+        thread_names = {thread.ident: thread.name for thread in threading.enumerate()}
+        for thread in threads:
+            events.append({"name": "thread_name", "ph": "M", "pid": pid, "tid": thread,
+                           "args": {"name": thread_names.get(thread, str(thread))}})
+        return events
+
+    def dump(self, path=None):
+        """Сохранение буфера в JSON для chrome://tracing; возвращает путь"""
+        if path is None:
+            directory = default_directory()
+            os.makedirs(directory, exist_ok=True)
+            path = os.path.join(directory, time.strftime("no-sleep-%Y%m%d-%H%M%S.json"))
+        import json
+
+        trace = {"traceEvents": self.events(), "displayTimeUnit": "ms"}
+        with open(path, "w", encoding="utf-8") as stream:
+            json.dump(trace, stream)
+        return path
+
+
+def default_directory():
+    """Каталог трассировок рядом с файлом настроек"""
+    from settings import default_path
+    return os.path.join(os.path.dirname(default_path()), "traces")
+
+
+def traced(name=None):
+    """Декоратор: вызов функции записывается отрезком name (по умолчанию -
+    полное имя функции)
+
+    Обертка принимает любые аргументы, поэтому PyQt не может отбросить
+    лишние аргументы сигнала: слот без параметров подключается к
+    clicked(bool) через lambda.
+    """
+    def decorate(func):
+        span_id = tracer.name_id(name or func.__qualname__)
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not tracer.enabled:
+                return func(*args, **kwargs)
+            start = time.perf_counter_ns()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                tracer.add(span_id, start, time.perf_counter_ns() - start)
+        return wrapper
+    return decorate
+
+
+def install_signal_handler(on_dump=None):
+    """Сохранение трассировки по SIGUSR1 (в Windows - по Ctrl+Break)
+
+    on_dump(path) вызывается после сохранения. Возвращает номер сигнала
+    или None, если подходящего сигнала нет.
+    """
+    import signal
+
+    signum = getattr(signal, "SIGUSR1", None) or getattr(signal, "SIGBREAK", None)
+    if signum is None:
+        return None
+
+    def on_signal(signum, frame):
+        try:
+            path = tracer.dump()
+        except OSError:
+            return  # Сигнал не должен ронять программу
+        if on_dump is not None:
+            on_dump(path)
+
+    signal.signal(signum, on_signal)
+    return signum
+
+
+# Общий буфер трассировки процесса
+tracer = Tracer()